@@ -0,0 +1,126 @@
+# adapters/api/idempotencia.py
+"""
+Soporte de la cabecera 'Idempotency-Key' para endpoints de escritura.
+
+Los clientes de caja y de lecturas reintentan ante la conectividad inestable del campo.
+Con el decorador @idempotente, la primera solicitud con una clave reserva esa clave, se
+ejecuta normalmente y guarda su respuesta exitosa (2xx). Un reintento con la misma clave
+recibe la respuesta guardada sin volver a ejecutar casos de uso, llamadas al SRI ni
+subidas de archivos. Sin la cabecera, el endpoint funciona igual que antes.
+"""
+import functools
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from adapters.infrastructure.models import SolicitudIdempotenteModel
+
+CABECERA = 'Idempotency-Key'
+LARGO_MAXIMO_CLAVE = 100
+
+
+def _huella(request) -> str:
+    """SHA-256 del cuerpo. De los archivos se toma nombre y tamaño (no se leen)."""
+    datos = request.data
+    if hasattr(datos, 'lists'):  # QueryDict (multipart / form)
+        datos = {clave: valores for clave, valores in datos.lists()}
+    contenido = json.dumps(
+        datos, sort_keys=True,
+        default=lambda v: f"{v.name}:{v.size}" if hasattr(v, 'size') else str(v)
+    )
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+
+def _reservar(alcance: str, usuario_id, clave: str, huella: str, reintento: bool = True):
+    """
+    Retorna (registro, None) si esta solicitud debe ejecutarse, o (None, Response) con la
+    respuesta guardada / el error para el reintento.
+    """
+    try:
+        # Savepoint: la reserva se confirma aunque la vista abra su propia transacción
+        with transaction.atomic():
+            return SolicitudIdempotenteModel.objects.create(
+                alcance=alcance, usuario_id=usuario_id, clave=clave, huella=huella
+            ), None
+    except IntegrityError:
+        pass
+
+    registro = SolicitudIdempotenteModel.objects.filter(alcance=alcance, usuario_id=usuario_id, clave=clave).first()
+    if registro is None:
+        if reintento:  # Se liberó entre el INSERT y esta lectura
+            return _reservar(alcance, usuario_id, clave, huella, reintento=False)
+        return None, Response(
+            {"error": "La solicitud original con esta clave aún se está procesando. Reintente en unos segundos."},
+            status=status.HTTP_409_CONFLICT
+        )
+
+    if registro.huella != huella:
+        return None, Response(
+            {"error": f"La cabecera {CABECERA} ya se usó con datos distintos."},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+
+    if registro.estado_http is not None:
+        respuesta = Response(registro.respuesta, status=registro.estado_http)
+        respuesta['Idempotent-Replayed'] = 'true'
+        return None, respuesta
+
+    # En proceso: si la solicitud original murió (reserva vencida) esta la retoma
+    vencida = timezone.now() - timedelta(seconds=settings.IDEMPOTENCIA_SEGUNDOS_EN_PROCESO)
+    retomada = SolicitudIdempotenteModel.objects.filter(
+        id=registro.id, estado_http__isnull=True, fecha_registro__lt=vencida
+    ).update(fecha_registro=timezone.now())
+    if retomada:
+        return registro, None
+    return None, Response(
+        {"error": "La solicitud original con esta clave aún se está procesando. Reintente en unos segundos."},
+        status=status.HTTP_409_CONFLICT
+    )
+
+
+def idempotente(alcance: str):
+    """
+    Decorador para acciones de ViewSet. Debe ir por ENCIMA de @transaction.atomic:
+    la reserva y la respuesta se guardan fuera de la transacción de la vista.
+    """
+    def decorador(vista):
+        @functools.wraps(vista)
+        def envoltura(self, request, *args, **kwargs):
+            clave = request.headers.get(CABECERA)
+            if not clave:
+                return vista(self, request, *args, **kwargs)
+            if len(clave) > LARGO_MAXIMO_CLAVE:
+                return Response(
+                    {"error": f"{CABECERA} admite hasta {LARGO_MAXIMO_CLAVE} caracteres."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            usuario_id = request.user.id if request.user and request.user.is_authenticated else 0
+            registro, respuesta_previa = _reservar(alcance, usuario_id, clave, _huella(request))
+            if respuesta_previa is not None:
+                return respuesta_previa
+
+            try:
+                respuesta = vista(self, request, *args, **kwargs)
+            except Exception:
+                registro.delete()  # Libera la clave: el cliente puede reintentar
+                raise
+
+            if status.is_success(respuesta.status_code):
+                registro.estado_http = respuesta.status_code
+                # Se guarda tal como se envió (mismo JSON que produce el renderer de DRF)
+                registro.respuesta = json.loads(JSONRenderer().render(respuesta.data))
+                registro.save(update_fields=['estado_http', 'respuesta'])
+            else:
+                # Los errores no se guardan: un reintento vuelve a ejecutar la solicitud
+                registro.delete()
+            return respuesta
+        return envoltura
+    return decorador
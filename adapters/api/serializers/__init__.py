@@ -6,7 +6,9 @@ from .comercial_serializers import (
     FacturaSerializer,
     DetalleFacturaSerializer,
     PagoSerializer,
-    DetallePagoSerializer
+    DetallePagoSerializer,
+    VentaMaterialesSerializer,
+    MovimientoInventarioSerializer
 )
 
 __all__ = [
@@ -17,4 +19,6 @@ __all__ = [
     'DetalleFacturaSerializer',
     'PagoSerializer',
     'DetallePagoSerializer',
+    'VentaMaterialesSerializer',
+    'MovimientoInventarioSerializer',
 ]
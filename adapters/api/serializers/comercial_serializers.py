@@ -10,6 +10,8 @@ from adapters.infrastructure.models import (
     CatalogoRubroModel,
     ProductoMaterial
 )
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+from adapters.infrastructure.repositories.django_inventario_repository import DjangoInventarioRepository
 
 # --- 1. Catálogos e Inventario ---
 class CatalogoRubroSerializer(serializers.ModelSerializer):
@@ -19,11 +21,49 @@ class CatalogoRubroSerializer(serializers.ModelSerializer):
 
 class ProductoMaterialSerializer(serializers.ModelSerializer):
     rubro_nombre = serializers.ReadOnlyField(source='rubro.nombre')
+    # stock_actual es de solo lectura: el saldo inicial entra como movimiento ENTRADA
+    stock_inicial = serializers.IntegerField(write_only=True, required=False, min_value=0, default=0)
     
     class Meta:
         model = ProductoMaterial
         fields = '__all__'
 
+    def create(self, validated_data):
+        stock_inicial = validated_data.pop('stock_inicial', 0)
+        with transaction.atomic():
+            producto = super().create(validated_data)
+            if stock_inicial:
+                producto.stock_actual = DjangoInventarioRepository().registrar_movimiento(
+                    producto.id, 'ENTRADA', stock_inicial, observacion="Stock inicial"
+                )
+        return producto
+
+    def update(self, instance, validated_data):
+        validated_data.pop('stock_inicial', None)
+        return super().update(instance, validated_data)
+
+class ItemVentaMaterialSerializer(serializers.Serializer):
+    producto_id = serializers.IntegerField()
+    cantidad = serializers.IntegerField(min_value=1)
+
+class VentaMaterialesSerializer(serializers.Serializer):
+    items = ItemVentaMaterialSerializer(many=True, allow_empty=False)
+    referencia = serializers.CharField(max_length=100, required=False, allow_blank=True, allow_null=True,
+                                       help_text="Recibo o factura de la venta")
+
+class MovimientoInventarioSerializer(serializers.Serializer):
+    tipo = serializers.ChoiceField(choices=['ENTRADA', 'AJUSTE'])
+    cantidad = serializers.IntegerField(help_text="ENTRADA: positiva. AJUSTE: con signo")
+    referencia = serializers.CharField(max_length=100, required=False, allow_blank=True, allow_null=True)
+    observacion = serializers.CharField(max_length=255, required=False, allow_blank=True, allow_null=True)
+
+    def validate(self, data):
+        if data['cantidad'] == 0:
+            raise serializers.ValidationError("La cantidad no puede ser cero.")
+        if data['tipo'] == 'ENTRADA' and data['cantidad'] < 0:
+            raise serializers.ValidationError("Una ENTRADA debe tener cantidad positiva.")
+        return data
+
 # --- 2. Socios ---
 class SocioSerializer(serializers.ModelSerializer):
     class Meta:
@@ -91,5 +131,9 @@ class PagoSerializer(serializers.ModelSerializer):
             # 3. Validación de consistencia (Se podría lanzar excepcion si no cuadra)
             # if pago.monto_total != total_calculado:
             #     raise serializers.ValidationError("El total del pago no coincide con la suma de los métodos.")
+
+            # 4. Libro de caja diario (misma transacción)
+            if pago.validado:
+                DjangoPagoRepository().registrar_en_caja([pago.id])
                 
         return pago
@@ -66,6 +66,19 @@ class RegistrarCobroSerializer(serializers.Serializer):
     factura_id = serializers.IntegerField()
     pagos = DetallePagoSerializer(many=True, allow_empty=False)
 
+# 2.1 DTO para el Cobro de varias facturas (se aplica a las más antiguas primero)
+class RegistrarCobroMultipleSerializer(serializers.Serializer):
+    """
+    Valida la recepción de pagos mixtos de un socio para saldar su deuda acumulada.
+    """
+    socio_id = serializers.IntegerField()
+    pagos = DetallePagoSerializer(many=True, allow_empty=False)
+
+    def validate_pagos(self, pagos):
+        if any(p['monto'] <= 0 for p in pagos):
+            raise serializers.ValidationError("Cada pago debe tener un monto mayor a 0.")
+        return pagos
+
 # 3. ✅ NUEVO: DTO para que el Socio suba la foto (App Móvil)
 class ReportarPagoSerializer(serializers.Serializer):
     factura_id = serializers.IntegerField()
@@ -79,6 +92,11 @@ class ValidarPagoSerializer(serializers.Serializer):
     accion = serializers.ChoiceField(choices=['APROBAR', 'RECHAZAR'])
     motivo_rechazo = serializers.CharField(required=False, allow_blank=True)
 
+# 5. DTO para conciliar el extracto bancario (Tesorero)
+class ConciliarExtractoSerializer(serializers.Serializer):
+    archivo = serializers.FileField(help_text="Extracto bancario CSV o XLSX (columnas referencia y monto)")
+    simulacion = serializers.BooleanField(default=False, help_text="Solo cruza, no valida pagos")
+
 # =============================================================================
 # 3. SERIALIZERS DE SALIDA (RESPUESTA AL FRONTEND)
 # =============================================================================
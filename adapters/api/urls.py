@@ -5,7 +5,13 @@ from .views import (
     FacturaViewSet, 
     PagoViewSet,
     CatalogoRubroViewSet,
-    ProductoMaterialViewSet
+    ProductoMaterialViewSet,
+    AnalyticsViewSet,
+    FacturacionViewSet,
+    CobranzaViewSet,
+    CobroViewSet,
+    ExportacionViewSet,
+    ReporteViewSet
 )
 
 router = DefaultRouter()
@@ -14,6 +20,12 @@ router.register(r'facturas', FacturaViewSet, basename='factura')
 router.register(r'pagos', PagoViewSet, basename='pago')
 router.register(r'rubros', CatalogoRubroViewSet, basename='rubro')
 router.register(r'inventario', ProductoMaterialViewSet, basename='inventario')
+router.register(r'analytics', AnalyticsViewSet, basename='analytics')
+router.register(r'facturacion', FacturacionViewSet, basename='facturacion')
+router.register(r'cobranza', CobranzaViewSet, basename='cobranza')
+router.register(r'cobros', CobroViewSet, basename='cobro')
+router.register(r'exportaciones', ExportacionViewSet, basename='exportacion')
+router.register(r'reportes', ReporteViewSet, basename='reporte')
 
 urlpatterns = [
     path('', include(router.urls)),
@@ -20,4 +20,8 @@ from .servicio_agua_views import ServicioAguaViewSet
 from .gobernanza_views import EventoViewSet
 from .analytics_views import AnalyticsViewSet
 from .usuario_views import UserProfileView
-from .cobro_views import CobroViewSet
\ No newline at end of file
+from .cobro_views import CobroViewSet
+from .facturacion_views import FacturacionViewSet
+from .cobranza_views import CobranzaViewSet
+from .exportacion_views import ExportacionViewSet
+from .reporte_views import ReporteViewSet
@@ -1,4 +1,9 @@
 # adapters/api/views/analytics_views.py
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -7,8 +12,10 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 
 from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
 from core.use_cases.reporting.generar_cierre_caja_uc import GenerarCierreCajaUseCase
-from adapters.infrastructure.models.factura_model import FacturaModel
-from core.shared.enums import EstadoFactura
+from core.use_cases.reporting.simular_tarifas_uc import SimularTarifasUseCase
+from core.use_cases.reporting.generar_tendencia_recaudacion_uc import GenerarTendenciaRecaudacionUseCase
+from core.shared.exceptions import BusinessRuleException
+from adapters.infrastructure.services.dashboard_kpis import obtener_kpis
 
 class AnalyticsViewSet(viewsets.ViewSet):
     """
@@ -21,16 +28,43 @@ class AnalyticsViewSet(viewsets.ViewSet):
     # y falle. Al poner None, le obligamos a mirar los @extend_schema.
     serializer_class = None 
 
+    LIMITE_CARTERA_DEFAULT = 100
+    LIMITE_CARTERA_MAXIMO = 500
+
     @extend_schema(
         summary="Reporte de Cartera Vencida (Aging Report)",
-        description="Retorna la lista de socios con deuda, clasificada por antigüedad (Corriente, 1-3 meses, >3 meses).",
+        description="Retorna la lista de socios con deuda, clasificada por antigüedad (Corriente, 1-3 meses, >3 meses), "
+                    "de mayor a menor deuda y paginada. La cabecera 'X-Siguiente-Pagina' indica la próxima página. "
+                    "Se lee del snapshot nocturno de cartera, ajustado durante el día con cada emisión o pago.",
+        parameters=[
+            OpenApiParameter('barrio_id', OpenApiTypes.INT, required=False),
+            OpenApiParameter('deuda_minima', OpenApiTypes.DECIMAL, description="Ej: 20.00", required=False),
+            OpenApiParameter('pagina', OpenApiTypes.INT, description="Desde 1 (por defecto 1)", required=False),
+            OpenApiParameter('limite', OpenApiTypes.INT, description="Máximo 500 (por defecto 100)", required=False),
+        ],
         responses={200: OpenApiTypes.OBJECT}
     )
     @action(detail=False, methods=['get'], url_path='cartera-vencida')
     def cartera_vencida(self, request):
+        params = request.query_params
+        try:
+            pagina = max(1, int(params.get('pagina') or 1))
+            limite = max(1, min(int(params.get('limite') or self.LIMITE_CARTERA_DEFAULT), self.LIMITE_CARTERA_MAXIMO))
+            barrio_id = int(params['barrio_id']) if params.get('barrio_id') else None
+            deuda_minima = Decimal(params['deuda_minima']) if params.get('deuda_minima') else None
+        except (ValueError, InvalidOperation):
+            return Response({"error": "Parámetros de filtro o paginación inválidos."}, status=status.HTTP_400_BAD_REQUEST)
+
         use_case = GenerarReporteCarteraUseCase()
-        data = use_case.execute()
-        return Response(data, status=status.HTTP_200_OK)
+        # Una fila extra indica si hay página siguiente
+        data = use_case.execute(
+            barrio_id=barrio_id, deuda_minima=deuda_minima,
+            limite=limite + 1, desplazamiento=(pagina - 1) * limite
+        )
+        respuesta = Response(data[:limite], status=status.HTTP_200_OK)
+        if len(data) > limite:
+            respuesta['X-Siguiente-Pagina'] = str(pagina + 1)
+        return respuesta
 
     @extend_schema(
         summary="Cierre de Caja Diario",
@@ -47,7 +81,6 @@ class AnalyticsViewSet(viewsets.ViewSet):
         fecha_fin = request.query_params.get('fecha_fin')
         
         # Simple conversión de strings a dates si existen
-        from datetime import datetime
         d_inicio = datetime.strptime(fecha_inicio, '%Y-%m-%d').date() if fecha_inicio else None
         d_fin = datetime.strptime(fecha_fin, '%Y-%m-%d').date() if fecha_fin else None
 
@@ -57,21 +90,92 @@ class AnalyticsViewSet(viewsets.ViewSet):
 
     @extend_schema(
         summary="Dashboard KPIs (Ejecutivo)",
-        description="Métricas rápidas para la pantalla de inicio del Tesorero.",
+        description="Métricas rápidas para la pantalla de inicio del Tesorero. Se sirven desde el cache "
+                    "y se recalculan solo cuando cambian facturas o pagos.",
         responses={200: OpenApiTypes.OBJECT}
     )
     @action(detail=False, methods=['get'], url_path='dashboard-kpis')
     def dashboard(self, request):
-        # Lógica ligera directamente aquí o en otro UC pequeño
-        from django.utils import timezone
-        now = timezone.now()
-        
-        total_facturado_mes = FacturaModel.objects.filter(anio=now.year, mes=now.month).count() 
-        facturas_pendientes = FacturaModel.objects.filter(estado=EstadoFactura.PENDIENTE.value).count()
-        
-        kpis = {
-            "facturas_emitidas_mes": total_facturado_mes,
-            "pendientes_cobro": facturas_pendientes,
-            "status": "online"
-        }
+        kpis = {**obtener_kpis(), "status": "online"}
         return Response(kpis, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Tendencia de Facturado vs Recaudado",
+        description="Series mensuales o semanales de facturado, recaudado, tasa de cobro y deuda nueva "
+                    "(saldo aún pendiente de lo facturado en el periodo), en total y por barrio. "
+                    "La respuesta se guarda en cache por combinación de parámetros.",
+        parameters=[
+            OpenApiParameter('granularidad', OpenApiTypes.STR, enum=['mes', 'semana'], description="Por defecto mes", required=False),
+            OpenApiParameter('fecha_inicio', OpenApiTypes.DATE, description="YYYY-MM-DD (por defecto 12 periodos atrás)", required=False),
+            OpenApiParameter('fecha_fin', OpenApiTypes.DATE, description="YYYY-MM-DD (por defecto hoy)", required=False),
+            OpenApiParameter('barrio_id', OpenApiTypes.INT, required=False),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='tendencia-recaudacion')
+    def tendencia_recaudacion(self, request):
+        params = request.query_params
+        try:
+            granularidad = (params.get('granularidad') or 'mes').lower()
+            fecha_inicio = datetime.strptime(params['fecha_inicio'], '%Y-%m-%d').date() if params.get('fecha_inicio') else None
+            fecha_fin = datetime.strptime(params['fecha_fin'], '%Y-%m-%d').date() if params.get('fecha_fin') else None
+            barrio_id = int(params['barrio_id']) if params.get('barrio_id') else None
+        except ValueError:
+            return Response({"error": "Fechas (YYYY-MM-DD) o barrio_id inválidos."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Sin fecha_fin la clave incluye el día: la tendencia "hasta hoy" no se arrastra al día siguiente
+        clave = "analytics:tendencia:{}:{}:{}:{}".format(
+            granularidad, fecha_inicio or '-', fecha_fin or timezone.localdate(), barrio_id or 'todos'
+        )
+        data = cache.get(clave)
+        if data is None:
+            try:
+                data = GenerarTendenciaRecaudacionUseCase().execute(
+                    granularidad=granularidad, fecha_inicio=fecha_inicio, fecha_fin=fecha_fin, barrio_id=barrio_id
+                )
+            except BusinessRuleException as e:
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            cache.set(clave, data, timeout=settings.TENDENCIA_RECAUDACION_TTL)
+        return Response(data, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Simulador de Tarifas (What-If)",
+        description="Recalcula todas las lecturas (o las de un periodo) con una tarifa hipotética "
+                    "y retorna la variación de recaudación por barrio frente a la tarifa vigente.",
+        parameters=[
+            OpenApiParameter('tarifa_base_m3', OpenApiTypes.INT, description="m³ incluidos en la base (Ej: 12)", required=True),
+            OpenApiParameter('tarifa_base_precio', OpenApiTypes.DECIMAL, description="Precio de la base (Ej: 3.00)", required=True),
+            OpenApiParameter('tarifa_excedente_precio', OpenApiTypes.DECIMAL, description="Precio por m³ excedente (Ej: 0.30)", required=True),
+            OpenApiParameter('anio', OpenApiTypes.INT, description="Año fiscal (opcional)", required=False),
+            OpenApiParameter('mes', OpenApiTypes.INT, description="Mes fiscal (opcional)", required=False),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='simulacion-tarifas')
+    def simulacion_tarifas(self, request):
+        params = request.query_params
+
+        try:
+            tarifa_base_m3 = int(params['tarifa_base_m3'])
+            tarifa_base_precio = Decimal(params['tarifa_base_precio'])
+            tarifa_excedente_precio = Decimal(params['tarifa_excedente_precio'])
+            anio = int(params['anio']) if params.get('anio') else None
+            mes = int(params['mes']) if params.get('mes') else None
+        except KeyError as e:
+            return Response({"error": f"Parámetro requerido: {e.args[0]}"}, status=status.HTTP_400_BAD_REQUEST)
+        except (ValueError, InvalidOperation):
+            return Response({"error": "Parámetros numéricos inválidos."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            use_case = SimularTarifasUseCase()
+            data = use_case.execute(
+                tarifa_base_m3=tarifa_base_m3,
+                tarifa_base_precio=tarifa_base_precio,
+                tarifa_excedente_precio=tarifa_excedente_precio,
+                anio=anio,
+                mes=mes
+            )
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(data, status=status.HTTP_200_OK)
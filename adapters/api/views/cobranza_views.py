@@ -0,0 +1,74 @@
+# adapters/api/views/cobranza_views.py
+from django.conf import settings
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+# Core
+from core.use_cases.cobranza.generar_ordenes_corte_uc import GenerarOrdenesCorteUseCase
+from core.shared.exceptions import BusinessRuleException
+
+# Infraestructura
+from adapters.infrastructure.repositories.django_cobranza_repository import DjangoCobranzaRepository
+
+
+class CobranzaViewSet(viewsets.ViewSet):
+    """
+    Gestión de Cartera Vencida: órdenes de corte por morosidad.
+    La hoja de ruta es visible para cualquier usuario autenticado (cuadrilla);
+    la generación de órdenes es solo para Administradores.
+    """
+    serializer_class = None
+
+    def get_permissions(self):
+        if self.action == 'hoja_ruta_cortes':
+            permission_classes = [IsAuthenticated]
+        else:
+            permission_classes = [IsAuthenticated, IsAdminUser]
+        return [permission() for permission in permission_classes]
+
+    @extend_schema(
+        summary="Generar Órdenes de Corte",
+        description="Crea en bloque una orden CORTE para cada servicio activo con meses_mora >= umbral "
+                    "que no tenga ya una orden en curso. Umbral por defecto: MESES_MORA_CORTE.",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {'meses_minimos': {'type': 'integer'}}
+            }
+        },
+        responses={201: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'], url_path='generar-cortes')
+    def generar_cortes(self, request):
+        try:
+            meses_minimos = int(request.data.get('meses_minimos') or settings.MESES_MORA_CORTE)
+        except (TypeError, ValueError):
+            return Response({"error": "meses_minimos debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            reporte = GenerarOrdenesCorteUseCase(DjangoCobranzaRepository()).ejecutar(meses_minimos)
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(reporte, status=status.HTTP_201_CREATED)
+
+    @extend_schema(
+        summary="Hoja de Ruta de Cortes",
+        description="Órdenes CORTE pendientes con socio, barrio, dirección y medidor, ordenadas por "
+                    "barrio y dirección para la cuadrilla. Una sola consulta.",
+        parameters=[OpenApiParameter('barrio_id', OpenApiTypes.INT, required=False)],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='hoja-ruta-cortes')
+    def hoja_ruta_cortes(self, request):
+        barrio_id = request.query_params.get('barrio_id')
+        try:
+            barrio_id = int(barrio_id) if barrio_id else None
+        except ValueError:
+            return Response({"error": "barrio_id debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+
+        ordenes = DjangoCobranzaRepository().listar_ordenes_corte_pendientes(barrio_id)
+        return Response({"total": len(ordenes), "ordenes": ordenes}, status=status.HTTP_200_OK)
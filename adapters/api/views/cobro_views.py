@@ -1,31 +1,48 @@
 # adapters/api/views/cobro_views.py
+import base64
+import binascii
+from datetime import date, datetime
+from decimal import Decimal
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from drf_spectacular.utils import extend_schema, OpenApiParameter
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
 from django.db import transaction
+from django.http import HttpResponse
+from rest_framework.reverse import reverse
 
 # Imports del Dominio
 from core.use_cases.registrar_cobro_uc import RegistrarCobroUseCase
+from core.use_cases.registrar_cobro_multiple_uc import RegistrarCobroMultipleUseCase
+from core.use_cases.conciliar_transferencias_uc import ConciliarTransferenciasUseCase
 from core.shared.enums import MetodoPagoEnum, EstadoFactura
-from core.shared.exceptions import BusinessRuleException, EntityNotFoundException
+from core.shared.exceptions import BusinessRuleException, EntityNotFoundException, ConflictoConcurrenciaError
 
 # Modelos (Para lectura/validación)
 from adapters.infrastructure.models.factura_model import FacturaModel
-from adapters.infrastructure.models.pago_model import PagoModel
+from adapters.infrastructure.models.pago_model import PagoModel, DetallePagoModel
 
 # Implementaciones Concretas (Infraestructura)
 from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
 from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
 from adapters.infrastructure.services.django_sri_service import DjangoSRIService
 from adapters.infrastructure.services.django_email_service import DjangoEmailService
+from adapters.infrastructure.services.celery_cola_sri import CeleryColaEmisionSRI
+from adapters.infrastructure.services.extracto_bancario_reader import leer_extracto
+from adapters.infrastructure.services.recibo_termico_service import ReciboTermicoService
+from adapters.infrastructure.tasks import procesar_comprobante_task
+
+from adapters.api.idempotencia import idempotente
 
 # ✅ IMPORTAMOS LOS SERIALIZERS (Asegúrate de que la ruta sea correcta)
 from adapters.api.serializers.factura_serializers import (
     RegistrarCobroSerializer,
+    RegistrarCobroMultipleSerializer,
     ReportarPagoSerializer,
-    ValidarPagoSerializer
+    ValidarPagoSerializer,
+    ConciliarExtractoSerializer
 )
 
 class CobroViewSet(viewsets.ViewSet):
@@ -38,7 +55,7 @@ class CobroViewSet(viewsets.ViewSet):
     # --------------------------------------------------------------------------
     @extend_schema(request=RegistrarCobroSerializer)
     @action(detail=False, methods=['post'], url_path='registrar')
-    @transaction.atomic # ✅ Transacción controlada en el Entry Point
+    @idempotente('cobros.registrar')
     def registrar_cobro(self, request):
         serializer = RegistrarCobroSerializer(data=request.data)
         if not serializer.is_valid():
@@ -56,7 +73,10 @@ class CobroViewSet(viewsets.ViewSet):
                 factura_repo=factura_repo,
                 pago_repo=pago_repo,
                 sri_service=sri_service,
-                email_service=email_service
+                email_service=email_service,
+                # ✅ Transacción corta controlada en el Entry Point: solo la escritura del cobro,
+                # el SRI se llama después del COMMIT (sin filas bloqueadas durante la red)
+                unidad_de_trabajo=transaction.atomic
             )
 
             # Pagos directos en ventanilla nacen validados
@@ -64,19 +84,101 @@ class CobroViewSet(viewsets.ViewSet):
                 factura_id=serializer.validated_data['factura_id'],
                 lista_pagos=serializer.validated_data['pagos']
             )
+            resultado["recibo_url"] = self._url_recibo(request, resultado.get("comprobante"))
             return Response(resultado, status=status.HTTP_200_OK)
 
+        except ConflictoConcurrenciaError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
         except (EntityNotFoundException, BusinessRuleException) as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             # Log de error crítico
             return Response({"error": "Error interno", "detalle": str(e)}, status=500)
 
+    @extend_schema(
+        request=RegistrarCobroMultipleSerializer,
+        description="Cobra varias facturas del socio en una transacción, de la más antigua a la más "
+                    "reciente. La emisión SRI de todas las facturas pagadas se encola en un solo lote."
+    )
+    @action(detail=False, methods=['post'], url_path='registrar-multiple')
+    def registrar_cobro_multiple(self, request):
+        serializer = RegistrarCobroMultipleSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            uc = RegistrarCobroMultipleUseCase(
+                factura_repo=DjangoFacturaRepository(),
+                pago_repo=DjangoPagoRepository(),
+                cola_sri=CeleryColaEmisionSRI()
+            )
+            # La excepción sale del bloque atómico antes de atraparse: el cobro se revierte
+            with transaction.atomic():
+                resultado = uc.ejecutar(
+                    socio_id=serializer.validated_data['socio_id'],
+                    lista_pagos=serializer.validated_data['pagos']
+                )
+            for pagada in resultado["facturas_pagadas"]:
+                pagada["recibo_url"] = self._url_recibo(request, pagada.get("comprobante"))
+            return Response(resultado, status=status.HTTP_200_OK)
+
+        except ConflictoConcurrenciaError as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        except (EntityNotFoundException, BusinessRuleException) as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    # --------------------------------------------------------------------------
+    # 1.1 RECIBO TÉRMICO (Impresión inmediata en ventanilla)
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def _url_recibo(request, numero):
+        if not numero:
+            return None
+        return reverse('cobro-recibo', kwargs={'numero': numero}, request=request)
+
+    @extend_schema(
+        summary="Recibo para impresora térmica",
+        description="Recibo liviano del cobro (sin WeasyPrint). formato=escpos retorna los bytes "
+                    "ESC/POS para enviar directo a la impresora; formato=pdf un PDF del ancho del papel "
+                    "(ReportLab); formato=texto (default) el texto plano.",
+        parameters=[
+            OpenApiParameter('formato', OpenApiTypes.STR, enum=['texto', 'escpos', 'pdf'], required=False),
+            OpenApiParameter('ancho', OpenApiTypes.INT, description="Columnas (32 = 58 mm, 48 = 80 mm)", required=False),
+        ],
+        responses={200: OpenApiTypes.BINARY}
+    )
+    @action(detail=False, methods=['get'], url_path=r'recibo/(?P<numero>[\w-]+)', url_name='recibo')
+    def recibo(self, request, numero=None):
+        datos = DjangoPagoRepository().obtener_recibo(numero)
+        if not datos:
+            return Response({"error": "Recibo no encontrado"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            ancho = int(request.query_params['ancho']) if request.query_params.get('ancho') else None
+        except ValueError:
+            return Response({"error": "ancho debe ser un entero."}, status=status.HTTP_400_BAD_REQUEST)
+        if ancho is not None and not 24 <= ancho <= 64:
+            return Response({"error": "ancho debe estar entre 24 y 64 columnas."}, status=status.HTTP_400_BAD_REQUEST)
+
+        servicio = ReciboTermicoService(ancho=ancho)
+        formato = request.query_params.get('formato')
+        if formato == 'escpos':
+            respuesta = HttpResponse(servicio.generar_escpos(datos), content_type='application/octet-stream')
+            respuesta['Content-Disposition'] = f'attachment; filename="{numero}.bin"'
+            return respuesta
+        if formato == 'pdf':
+            respuesta = HttpResponse(servicio.generar_pdf(datos), content_type='application/pdf')
+            respuesta['Content-Disposition'] = f'inline; filename="{numero}.pdf"'
+            return respuesta
+        return HttpResponse(servicio.generar_texto(datos), content_type='text/plain; charset=utf-8')
+
     # --------------------------------------------------------------------------
     # 2. SOCIO SUBE COMPROBANTE (Móvil)
     # --------------------------------------------------------------------------
     @extend_schema(request=ReportarPagoSerializer)
     @action(detail=False, methods=['post'], url_path='subir_comprobante', parser_classes=[MultiPartParser, FormParser])
+    @idempotente('cobros.subir_comprobante')
+    @transaction.atomic
     def subir_comprobante(self, request):
         serializer = ReportarPagoSerializer(data=request.data)
         if not serializer.is_valid():
@@ -84,62 +186,125 @@ class CobroViewSet(viewsets.ViewSet):
 
         try:
             data = serializer.validated_data
-            factura = FacturaModel.objects.get(pk=data['factura_id'])
+            factura = FacturaModel.objects.select_for_update().get(pk=data['factura_id'])
 
             if factura.estado == EstadoFactura.PAGADA.value:
                 return Response({"error": "Esta factura ya está pagada."}, status=400)
 
-            # Guardamos el pago como NO VALIDADO
-            pago = PagoModel.objects.create(
-                factura=factura,
-                metodo='TRANSFERENCIA',
+            # Guardamos el pago como NO VALIDADO (⏳ Requiere revisión del Tesorero)
+            pago = DjangoPagoRepository().reportar_transferencia(
+                factura_id=factura.id,
                 monto=data['monto'],
                 referencia=data['referencia'],
-                comprobante_imagen=data['comprobante'],
-                validado=False  # ⏳ Requiere revisión del Tesorero
+                comprobante=data['comprobante']
             )
 
             # Actualizamos estado de factura
+            if factura.estado == EstadoFactura.PENDIENTE.value:
+                DjangoCarteraRepository().ajustar([(factura.socio_id, factura.fecha_emision, factura.total)], signo=-1)
             factura.estado = EstadoFactura.POR_VALIDAR.value
-            factura.save()
+            factura.save(update_fields=['estado'])
+
+            # Reducción + limpieza EXIF + miniatura fuera del request (ver procesar_comprobante_task)
+            detalle_id = pago.pop('detalle_id')
+            transaction.on_commit(lambda: procesar_comprobante_task.delay(detalle_id))
 
             return Response({
                 "mensaje": "Comprobante recibido. Pendiente de aprobación.",
-                "pago_id": pago.id,
-                "foto_url": pago.comprobante_imagen.url if pago.comprobante_imagen else None
+                **pago
             }, status=status.HTTP_201_CREATED)
 
         except FacturaModel.DoesNotExist:
             return Response({"error": "Factura no encontrada"}, status=404)
-        except Exception as e:
-            return Response({"error": str(e)}, status=500)
 
     # --------------------------------------------------------------------------
     # 3. TESORERO VALIDA (Listar y Aprobar)
     # --------------------------------------------------------------------------
+    LIMITE_COLA_DEFAULT = 50
+    LIMITE_COLA_MAXIMO = 200
+
+    @staticmethod
+    def _codificar_cursor(fila) -> str:
+        valor = f"{fila['fecha_registro'].isoformat()}|{fila['id']}"
+        return base64.urlsafe_b64encode(valor.encode()).decode()
+
+    @staticmethod
+    def _decodificar_cursor(cursor: str):
+        fecha, pago_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+        return datetime.fromisoformat(fecha), int(pago_id)
+
+    @extend_schema(
+        summary="Cola de Transferencias por Validar",
+        description="Paginación por cursor (keyset) sobre (fecha_registro, id), de la más antigua a la "
+                    "más reciente. 'siguiente' es el cursor de la próxima página (null al final).",
+        parameters=[
+            OpenApiParameter('cursor', str, required=False),
+            OpenApiParameter('limite', int, required=False, description="Máximo 200 (por defecto 50)"),
+            OpenApiParameter('barrio_id', int, required=False),
+            OpenApiParameter('desde', OpenApiTypes.DATE, required=False),
+            OpenApiParameter('hasta', OpenApiTypes.DATE, required=False),
+            OpenApiParameter('monto_min', OpenApiTypes.DECIMAL, required=False),
+            OpenApiParameter('monto_max', OpenApiTypes.DECIMAL, required=False),
+        ]
+    )
     @action(detail=False, methods=['get'], url_path='pendientes-validacion')
     def listar_pendientes_validacion(self, request):
-        # Traemos pagos no validados con datos del socio para mostrar en tabla
-        pagos = PagoModel.objects.filter(validado=False).select_related('factura', 'factura__socio')
-
-        data = []
-        for p in pagos:
-            # Construimos la URL completa de la imagen
-            img_url = request.build_absolute_uri(p.comprobante_imagen.url) if p.comprobante_imagen else None
-
-            data.append({
-                "pago_id": p.id,
-                "factura_id": p.factura.id,
-                "socio": f"{p.factura.socio.nombres} {p.factura.socio.apellidos}",
-                "cedula": p.factura.socio.cedula,
-                "banco_fecha": p.fecha_registro.strftime("%Y-%m-%d %H:%M"),
-                "monto": p.monto,
-                "referencia": p.referencia,
-                "comprobante_url": img_url
-            })
-        return Response(data, status=200)
+        params = request.query_params
+        try:
+            limite = max(1, min(int(params.get('limite') or self.LIMITE_COLA_DEFAULT), self.LIMITE_COLA_MAXIMO))
+            filtros = {
+                "barrio_id": int(params['barrio_id']) if params.get('barrio_id') else None,
+                "desde": date.fromisoformat(params['desde']) if params.get('desde') else None,
+                "hasta": date.fromisoformat(params['hasta']) if params.get('hasta') else None,
+                "monto_min": Decimal(params['monto_min']) if params.get('monto_min') else None,
+                "monto_max": Decimal(params['monto_max']) if params.get('monto_max') else None,
+            }
+            despues_de = self._decodificar_cursor(params['cursor']) if params.get('cursor') else None
+        except (ValueError, ArithmeticError, UnicodeDecodeError, binascii.Error):
+            return Response({"error": "Parámetros de filtro o cursor inválidos."}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Una fila extra indica si hay página siguiente
+        filas = DjangoPagoRepository().listar_pendientes_validacion(
+            limite=limite + 1, despues_de=despues_de, **filtros
+        )
+        hay_mas = len(filas) > limite
+        filas = filas[:limite]
+
+        # URLs: el storage arma la ruta; el host se resuelve una sola vez por request
+        storage = DetallePagoModel._meta.get_field('comprobante_imagen').storage
+        host = request.build_absolute_uri('/').rstrip('/')
+
+        def _url(nombre):
+            if not nombre:
+                return None
+            url = storage.url(nombre)
+            return host + url if url.startswith('/') else url
+
+        data = [{
+            "pago_id": f['id'],
+            "factura_id": f['factura_id'],
+            "socio": f"{f['socio__nombres']} {f['socio__apellidos']}",
+            "cedula": f['socio__identificacion'],
+            "barrio_id": f['socio__barrio_id'],
+            "banco_fecha": f['fecha_registro'].strftime("%Y-%m-%d %H:%M"),
+            "monto": f['monto_total'],
+            "referencia": f['referencia'],
+            # Por defecto la miniatura; la imagen completa solo se descarga al ampliarla
+            "comprobante_url": _url(f['comprobante_miniatura'] or f['comprobante_imagen']),
+            "comprobante_original_url": _url(f['comprobante_imagen']),
+            "factura_total": f['factura__total'],
+            "factura_monto_validado": f['factura__monto_validado'],
+            "factura_monto_por_validar": f['factura__monto_por_validar']
+        } for f in filas]
+
+        return Response({
+            "resultados": data,
+            "siguiente": self._codificar_cursor(filas[-1]) if hay_mas and filas else None,
+            "limite": limite
+        }, status=200)
 
     @action(detail=False, methods=['post'], url_path='validar-transferencia')
+    @transaction.atomic
     def validar_transferencia(self, request):
         serializer = ValidarPagoSerializer(data=request.data)
         if not serializer.is_valid():
@@ -147,26 +312,50 @@ class CobroViewSet(viewsets.ViewSet):
 
         pago_id = serializer.validated_data['pago_id']
         accion = serializer.validated_data['accion']
+        pago_repo = DjangoPagoRepository()
 
         try:
-            pago = PagoModel.objects.get(id=pago_id)
-            factura = pago.factura
-
             if accion == 'RECHAZAR':
-                pago.delete() # O marcar como rechazado
+                factura_id, quedan_pendientes = pago_repo.rechazar_transferencia(pago_id)
                 # Si no hay más pagos pendientes, devolvemos a PENDIENTE
-                if not factura.pagos_registrados.filter(validado=False).exists():
-                    factura.estado = EstadoFactura.PENDIENTE.value
-                    factura.save()
+                if factura_id and not quedan_pendientes:
+                    factura = FacturaModel.objects.get(id=factura_id)
+                    if factura.estado == EstadoFactura.POR_VALIDAR.value:
+                        factura.estado = EstadoFactura.PENDIENTE.value
+                        factura.save(update_fields=['estado'])
+                        DjangoCarteraRepository().ajustar([(factura.socio_id, factura.fecha_emision, factura.total)])
                 return Response({"mensaje": "Pago rechazado."}, status=200)
 
             elif accion == 'APROBAR':
-                pago.validado = True
-                pago.save()
+                pago_repo.aprobar_transferencia(pago_id)
 
                 return Response({
                     "mensaje": "Transferencia VERIFICADA. Ya puede proceder al cobro en Caja."
                 }, status=200)
 
         except PagoModel.DoesNotExist:
-            return Response({"error": "Pago no encontrado"}, status=404)
\ No newline at end of file
+            return Response({"error": "Pago no encontrado"}, status=404)
+
+    @extend_schema(
+        request={'multipart/form-data': ConciliarExtractoSerializer},
+        description="Cruza el extracto bancario (CSV/XLSX) con las transferencias por validar "
+                    "(referencia + monto) y valida en bloque las conciliadas. Los movimientos sin "
+                    "pareja se devuelven para revisión manual."
+    )
+    @action(detail=False, methods=['post'], url_path='conciliar-extracto', parser_classes=[MultiPartParser, FormParser])
+    @transaction.atomic
+    def conciliar_extracto(self, request):
+        serializer = ConciliarExtractoSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        archivo = serializer.validated_data['archivo']
+        try:
+            resultado = ConciliarTransferenciasUseCase(DjangoPagoRepository()).ejecutar(
+                movimientos=leer_extracto(archivo, archivo.name),
+                simulacion=serializer.validated_data['simulacion']
+            )
+            return Response(resultado, status=status.HTTP_200_OK)
+
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
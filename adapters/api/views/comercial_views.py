@@ -1,14 +1,24 @@
 # adapters/api/views/comercial_views.py
-from rest_framework import viewsets, filters
+from datetime import date
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter, OpenApiTypes
 from adapters.api.serializers import (
     SocioSerializer, 
     FacturaSerializer, 
     PagoSerializer,
     CatalogoRubroSerializer,
-    ProductoMaterialSerializer
+    ProductoMaterialSerializer,
+    VentaMaterialesSerializer,
+    MovimientoInventarioSerializer
 )
+from adapters.infrastructure.repositories.django_inventario_repository import DjangoInventarioRepository
+from core.use_cases.inventario.registrar_venta_materiales_uc import RegistrarVentaMaterialesUseCase
+from core.shared.exceptions import BusinessRuleException, EntityNotFoundException
 from adapters.infrastructure.models import (
     SocioModel, 
     FacturaModel, 
@@ -70,8 +80,66 @@ class CatalogoRubroViewSet(viewsets.ReadOnlyModelViewSet):
     create=extend_schema(summary="Registrar nuevo material"),
 )
 class ProductoMaterialViewSet(viewsets.ModelViewSet):
+    """
+    Materiales del POS. El stock solo cambia por movimientos (venta, entrada, ajuste),
+    con UPDATE relativos seguros ante ventas simultáneas en varias ventanillas.
+    """
     queryset = ProductoMaterial.objects.filter(activo=True).order_by('nombre')
     serializer_class = ProductoMaterialSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter]
     search_fields = ['nombre', 'codigo']
+
+    @extend_schema(
+        summary="Venta de materiales (varios ítems)",
+        request=VentaMaterialesSerializer,
+        description="Descuenta el stock de todos los ítems en una sola transacción: si algún "
+                    "material no alcanza, no se descuenta ninguno (400)."
+    )
+    @action(detail=False, methods=['post'], url_path='venta')
+    def venta(self, request):
+        serializer = VentaMaterialesSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            with transaction.atomic():
+                resultado = RegistrarVentaMaterialesUseCase(DjangoInventarioRepository()).ejecutar(
+                    items=serializer.validated_data['items'],
+                    referencia=serializer.validated_data.get('referencia'),
+                    usuario_id=request.user.id
+                )
+            return Response(resultado, status=status.HTTP_201_CREATED)
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @extend_schema(summary="Entrada o ajuste de stock", request=MovimientoInventarioSerializer)
+    @action(detail=True, methods=['post'], url_path='movimiento')
+    def movimiento(self, request, pk=None):
+        serializer = MovimientoInventarioSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            stock = DjangoInventarioRepository().registrar_movimiento(
+                int(pk), usuario_id=request.user.id, **serializer.validated_data
+            )
+            return Response({"producto_id": int(pk), "stock_actual": stock}, status=status.HTTP_201_CREATED)
+        except EntityNotFoundException as e:
+            return Response({"error": str(e)}, status=status.HTTP_404_NOT_FOUND)
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    @extend_schema(
+        summary="Stock a una fecha",
+        description="Stock de cada material al cierre del día indicado (último corte diario + movimientos posteriores).",
+        parameters=[OpenApiParameter('fecha', OpenApiTypes.DATE, description="YYYY-MM-DD (default: hoy)", required=False)],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='stock-a-fecha')
+    def stock_a_fecha(self, request):
+        try:
+            fecha = date.fromisoformat(request.query_params['fecha']) if request.query_params.get('fecha') \
+                else timezone.localdate()
+        except ValueError:
+            return Response({"error": "Formato de fecha inválido (YYYY-MM-DD)."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            "fecha": fecha,
+            "materiales": DjangoInventarioRepository().stock_a_fecha(fecha)
+        }, status=status.HTTP_200_OK)
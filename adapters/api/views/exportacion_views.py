@@ -0,0 +1,96 @@
+# adapters/api/views/exportacion_views.py
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+from adapters.infrastructure.services import exportacion_service as exportacion
+
+PARAMETROS_EXPORTACION = [
+    OpenApiParameter('formato', OpenApiTypes.STR, required=False, enum=['csv', 'xlsx'], description="Por defecto csv"),
+    OpenApiParameter('anio', OpenApiTypes.INT, required=False),
+    OpenApiParameter('mes', OpenApiTypes.INT, required=False),
+    OpenApiParameter('barrio_id', OpenApiTypes.INT, required=False),
+    OpenApiParameter('estado', OpenApiTypes.STR, required=False),
+]
+
+
+class ExportacionViewSet(viewsets.ViewSet):
+    """
+    Descargas masivas para Tesorería (reemplazan el recorrido de los endpoints de listado).
+    La respuesta se transmite en streaming: la memoria del proceso no depende del número de filas.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    serializer_class = None
+
+    TIPOS_CONTENIDO = {
+        'csv': 'text/csv; charset=utf-8',
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    }
+
+    def _exportar(self, request, recurso: str):
+        params = request.query_params
+        formato = (params.get('formato') or 'csv').lower()
+        if formato not in self.TIPOS_CONTENIDO:
+            return Response({"error": "formato debe ser 'csv' o 'xlsx'."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            filtros = {
+                "anio": int(params['anio']) if params.get('anio') else None,
+                "mes": int(params['mes']) if params.get('mes') else None,
+                "barrio_id": int(params['barrio_id']) if params.get('barrio_id') else None,
+                "estado": params['estado'].upper() if params.get('estado') else None,
+            }
+        except ValueError:
+            return Response({"error": "anio, mes y barrio_id deben ser enteros."}, status=status.HTTP_400_BAD_REQUEST)
+        if filtros["mes"] and not 1 <= filtros["mes"] <= 12:
+            return Response({"error": "mes debe estar entre 1 y 12."}, status=status.HTTP_400_BAD_REQUEST)
+        if filtros["estado"] and filtros["estado"] not in exportacion.ESTADOS[recurso]:
+            return Response(
+                {"error": f"estado debe ser uno de: {', '.join(exportacion.ESTADOS[recurso])}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        cabecera = exportacion.encabezados(recurso)
+        filas = exportacion.filas(recurso, **filtros)
+        if formato == 'xlsx':
+            contenido = exportacion.generar_xlsx(cabecera, filas, titulo=recurso.capitalize())
+        else:
+            contenido = exportacion.generar_csv(cabecera, filas)
+
+        periodo = "_".join(str(filtros[c]) for c in ("anio", "mes") if filtros[c]) or timezone.localdate().isoformat()
+        response = StreamingHttpResponse(contenido, content_type=self.TIPOS_CONTENIDO[formato])
+        response['Content-Disposition'] = f'attachment; filename="{recurso}_{periodo}.{formato}"'
+        return response
+
+    @extend_schema(
+        summary="Exportar Facturas (CSV / XLSX)",
+        description="Filtros: anio/mes fiscal, barrio del socio y estado (PENDIENTE, POR_VALIDAR, PAGADA, ANULADA).",
+        parameters=PARAMETROS_EXPORTACION,
+        responses={200: OpenApiTypes.BINARY}
+    )
+    @action(detail=False, methods=['get'], url_path='facturas')
+    def facturas(self, request):
+        return self._exportar(request, 'facturas')
+
+    @extend_schema(
+        summary="Exportar Pagos (CSV / XLSX)",
+        description="Filtros: anio/mes de registro, barrio del socio y estado (VALIDADO, POR_VALIDAR).",
+        parameters=PARAMETROS_EXPORTACION,
+        responses={200: OpenApiTypes.BINARY}
+    )
+    @action(detail=False, methods=['get'], url_path='pagos')
+    def pagos(self, request):
+        return self._exportar(request, 'pagos')
+
+    @extend_schema(
+        summary="Exportar Lecturas (CSV / XLSX)",
+        description="Filtros: anio/mes fiscal, barrio del terreno y estado (FACTURADA, PENDIENTE).",
+        parameters=PARAMETROS_EXPORTACION,
+        responses={200: OpenApiTypes.BINARY}
+    )
+    @action(detail=False, methods=['get'], url_path='lecturas')
+    def lecturas(self, request):
+        return self._exportar(request, 'lecturas')
@@ -0,0 +1,228 @@
+# adapters/api/views/facturacion_views.py
+import csv
+import json
+from datetime import date
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse, HttpResponse
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiTypes
+
+# Core
+from core.use_cases.previsualizar_planilla_uc import PrevisualizarPlanillaUseCase
+from core.use_cases.generar_facturacion_medida_uc import GenerarFacturacionMedidaUseCase
+from core.use_cases.generar_factura_fija_uc import GenerarFacturaFijaUseCase
+from core.use_cases.simular_facturacion_uc import SimularFacturacionUseCase
+
+# Infraestructura
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_gobernanza_repository import DjangoGobernanzaRepository
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.repositories.django_servicio_repository import DjangoServicioRepository
+from adapters.infrastructure.tasks import despachar_facturacion_periodo
+from adapters.infrastructure.services.exportacion_service import escapar_formula
+
+
+class FacturacionViewSet(viewsets.ViewSet):
+    """
+    Operaciones masivas de Facturación (por barrio / periodo fiscal).
+    Solo accesible para Administradores y Tesoreros (IsAdminUser).
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    serializer_class = None
+
+    COLUMNAS_SIMULACION = [
+        'motor', 'accion', 'barrio', 'socio_identificacion', 'socio', 'servicio_id',
+        'lectura_id', 'consumo_m3', 'total', 'anomalia'
+    ]
+
+    def _leer_periodo(self, params):
+        """Valida barrio_id/anio/mes (query string o body). Retorna (datos, error)."""
+        try:
+            return {
+                "barrio_id": int(params['barrio_id']),
+                "anio": int(params['anio']),
+                "mes": int(params['mes']),
+            }, None
+        except KeyError as e:
+            return None, f"Parámetro requerido: {e.args[0]}"
+        except (TypeError, ValueError):
+            # TypeError: null o listas en un cuerpo JSON
+            return None, "barrio_id, anio y mes deben ser enteros."
+
+    # --------------------------------------------------------------------------
+    # 1. PRE-VISUALIZACIÓN MASIVA (Planilla del barrio)
+    # --------------------------------------------------------------------------
+    @extend_schema(
+        summary="Pre-visualizar Planilla de Facturación",
+        description="Calcula (sin guardar) agua + multas por socio para todas las lecturas pendientes "
+                    "de un barrio y periodo. La respuesta se transmite en streaming.",
+        parameters=[
+            OpenApiParameter('barrio_id', OpenApiTypes.INT, required=True),
+            OpenApiParameter('anio', OpenApiTypes.INT, required=True),
+            OpenApiParameter('mes', OpenApiTypes.INT, required=True),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='previsualizar-planilla')
+    def previsualizar_planilla(self, request):
+        periodo, error = self._leer_periodo(request.query_params)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = PrevisualizarPlanillaUseCase(
+            lectura_repo=DjangoLecturaRepository(),
+            gobernanza_repo=DjangoGobernanzaRepository()
+        )
+        socios = use_case.ejecutar(**periodo)
+
+        def _stream():
+            resumen = {"socios": 0, "monto_agua": 0, "multas_mingas": 0, "total_pagar": 0}
+            cabecera = json.dumps(periodo, cls=DjangoJSONEncoder)[:-1]
+            yield f'{cabecera}, "socios": ['
+
+            for i, item in enumerate(socios):
+                resumen["socios"] += 1
+                for campo in ("monto_agua", "multas_mingas", "total_pagar"):
+                    resumen[campo] += round(item[campo] * 100)
+                yield ("," if i else "") + json.dumps(item, cls=DjangoJSONEncoder)
+
+            for campo in ("monto_agua", "multas_mingas", "total_pagar"):
+                resumen[campo] /= 100
+            yield f'], "resumen": {json.dumps(resumen)}}}'
+
+        return StreamingHttpResponse(_stream(), content_type='application/json')
+
+    # --------------------------------------------------------------------------
+    # 2. EMISIÓN MASIVA (Tarifa Medida)
+    # --------------------------------------------------------------------------
+    @extend_schema(
+        summary="Emitir Planilla de Facturación (Tarifa Medida)",
+        description="Genera las facturas de todas las lecturas pendientes de un barrio y periodo, "
+                    "aplicando en bloque las multas de mingas pendientes de cada socio.",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'barrio_id': {'type': 'integer'},
+                    'anio': {'type': 'integer'},
+                    'mes': {'type': 'integer'},
+                    'fecha_emision': {'type': 'string', 'format': 'date'}
+                },
+                'required': ['barrio_id', 'anio', 'mes']
+            }
+        },
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'], url_path='emitir-planilla')
+    def emitir_planilla(self, request):
+        periodo, error = self._leer_periodo(request.data)
+        if error:
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            fecha_emision = date.fromisoformat(request.data['fecha_emision']) if request.data.get('fecha_emision') else None
+        except ValueError:
+            return Response({"error": "fecha_emision debe tener formato YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+
+        use_case = GenerarFacturacionMedidaUseCase(
+            factura_repo=DjangoFacturaRepository(),
+            lectura_repo=DjangoLecturaRepository(),
+            gobernanza_repo=DjangoGobernanzaRepository()
+        )
+        reporte = use_case.ejecutar(fecha_emision=fecha_emision, **periodo)
+        return Response(reporte, status=status.HTTP_200_OK)
+
+    @extend_schema(
+        summary="Emitir Periodo Completo en Paralelo (Celery)",
+        description="Despacha una tarea de facturación por barrio con lecturas pendientes. "
+                    "Cada partición confirma por lotes y puede re-ejecutarse sin duplicar facturas.",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'anio': {'type': 'integer'},
+                    'mes': {'type': 'integer'},
+                    'fecha_emision': {'type': 'string', 'format': 'date'}
+                },
+                'required': ['anio', 'mes']
+            }
+        },
+        responses={202: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['post'], url_path='emitir-periodo')
+    def emitir_periodo(self, request):
+        try:
+            anio = int(request.data['anio'])
+            mes = int(request.data['mes'])
+            fecha_emision = request.data.get('fecha_emision') or None
+            if fecha_emision:
+                date.fromisoformat(fecha_emision)
+        except KeyError as e:
+            return Response({"error": f"Parámetro requerido: {e.args[0]}"}, status=status.HTTP_400_BAD_REQUEST)
+        except (TypeError, ValueError):
+            return Response({"error": "anio/mes deben ser enteros y fecha_emision YYYY-MM-DD."}, status=status.HTTP_400_BAD_REQUEST)
+
+        resultado = despachar_facturacion_periodo(anio, mes, fecha_emision)
+        if resultado is None:
+            return Response({"mensaje": "No hay lecturas pendientes de facturar en el periodo."}, status=status.HTTP_200_OK)
+
+        return Response({
+            "grupo_id": resultado.id,
+            "particiones": len(resultado.results),
+            "tareas": [r.id for r in resultado.results]
+        }, status=status.HTTP_202_ACCEPTED)
+
+    # --------------------------------------------------------------------------
+    # 3. ENSAYO (DRY-RUN) CON INFORME DE DIFERENCIAS
+    # --------------------------------------------------------------------------
+    @extend_schema(
+        summary="Simular Facturación del Periodo (Dry-Run)",
+        description="Ejecuta los motores Fijo y Medido sin escribir en BD ni tomar bloqueos. "
+                    "Devuelve facturas nuevas, duplicados omitidos, totales por barrio y anomalías "
+                    "(consumo cero/negativo, lectura sin servicio). Con formato=csv se descarga el detalle.",
+        parameters=[
+            OpenApiParameter('anio', OpenApiTypes.INT, required=True),
+            OpenApiParameter('mes', OpenApiTypes.INT, required=True),
+            OpenApiParameter('barrio_id', OpenApiTypes.INT, required=False),
+            OpenApiParameter('formato', OpenApiTypes.STR, required=False, enum=['json', 'csv']),
+        ],
+        responses={200: OpenApiTypes.OBJECT}
+    )
+    @action(detail=False, methods=['get'], url_path='simulacion')
+    def simulacion(self, request):
+        try:
+            anio = int(request.query_params['anio'])
+            mes = int(request.query_params['mes'])
+            barrio_id = request.query_params.get('barrio_id')
+            barrio_id = int(barrio_id) if barrio_id else None
+        except KeyError as e:
+            return Response({"error": f"Parámetro requerido: {e.args[0]}"}, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError:
+            return Response({"error": "anio, mes y barrio_id deben ser enteros."}, status=status.HTTP_400_BAD_REQUEST)
+
+        factura_repo = DjangoFacturaRepository()
+        use_case = SimularFacturacionUseCase(
+            motor_fijo=GenerarFacturaFijaUseCase(factura_repo, DjangoServicioRepository()),
+            motor_medido=GenerarFacturacionMedidaUseCase(
+                factura_repo=factura_repo,
+                lectura_repo=DjangoLecturaRepository(),
+                gobernanza_repo=DjangoGobernanzaRepository()
+            )
+        )
+        informe = use_case.ejecutar(anio=anio, mes=mes, barrio_id=barrio_id)
+
+        if request.query_params.get('formato') == 'csv':
+            response = HttpResponse(content_type='text/csv; charset=utf-8')
+            response['Content-Disposition'] = f'attachment; filename="simulacion_facturacion_{anio}_{mes:02d}.csv"'
+            writer = csv.DictWriter(response, fieldnames=self.COLUMNAS_SIMULACION, extrasaction='ignore')
+            writer.writeheader()
+            # Nombres e identificaciones vienen del socio: sin fórmulas al abrir en Excel
+            writer.writerows(
+                {clave: escapar_formula(valor) for clave, valor in fila.items()} for fila in informe["filas"]
+            )
+            return response
+
+        return Response(informe, status=status.HTTP_200_OK)
@@ -19,6 +19,8 @@ from adapters.infrastructure.repositories.django_lectura_repository import Djang
 from adapters.infrastructure.repositories.django_medidor_repository import DjangoMedidorRepository
 from adapters.infrastructure.models import LecturaModel # Para listado eficiente
 
+from adapters.api.idempotencia import idempotente
+
 # Serializers
 from adapters.api.serializers.lectura_serializers import (
     RegistrarLecturaSerializer, 
@@ -51,6 +53,7 @@ class LecturaViewSet(viewsets.ViewSet):
         request=RegistrarLecturaSerializer, 
         responses={201: LecturaResponseSerializer}
     )
+    @idempotente('lecturas.create')
     def create(self, request):
         # 1. Validar entrada (JSON)
         input_serializer = RegistrarLecturaSerializer(data=request.data)
@@ -0,0 +1,111 @@
+# adapters/api/views/reporte_views.py
+import uuid
+
+from django.http import FileResponse
+from rest_framework import viewsets, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from drf_spectacular.utils import extend_schema, OpenApiTypes
+
+from core.shared.exceptions import BusinessRuleException
+from adapters.infrastructure.models import ReporteGeneradoModel
+from adapters.infrastructure.services import reportes_service
+
+
+class ReporteViewSet(viewsets.ViewSet):
+    """
+    Reportes pesados generados en segundo plano (Celery).
+    1. POST /reportes/ con tipo, formato y parámetros -> id del trabajo (202).
+    2. GET /reportes/{id}/ hasta que estado = LISTO.
+    3. GET /reportes/{id}/descargar/ -> archivo.
+    Una solicitud idéntica a otra en curso o vigente recibe el mismo trabajo.
+    """
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    serializer_class = None
+
+    def _representar(self, request, reporte: ReporteGeneradoModel, **extra):
+        data = {
+            "id": str(reporte.id),
+            "tipo": reporte.tipo,
+            "formato": reporte.formato,
+            "parametros": reporte.parametros,
+            "estado": reporte.estado,
+            "filas": reporte.filas,
+            "error": reporte.error,
+            "fecha_solicitud": reporte.fecha_solicitud,
+            "fecha_fin": reporte.fecha_fin,
+            "expira_en": reporte.expira_en,
+            "url_descarga": None,
+            **extra,
+        }
+        if reporte.estado == ReporteGeneradoModel.LISTO:
+            data["url_descarga"] = reverse('reporte-descargar', kwargs={'pk': str(reporte.id)}, request=request)
+        return data
+
+    def _obtener(self, pk):
+        try:
+            return ReporteGeneradoModel.objects.get(id=uuid.UUID(str(pk)))
+        except (ValueError, ReporteGeneradoModel.DoesNotExist):
+            return None
+
+    @extend_schema(
+        summary="Solicitar Reporte (asíncrono)",
+        description="Tipos: " + ", ".join(reportes_service.REPORTES) + ". Formatos: csv, xlsx. "
+                    "Parámetros por tipo: " + "; ".join(
+                        f"{tipo}: {', '.join(aceptados)}" for tipo, (aceptados, _) in reportes_service.REPORTES.items()
+                    ) + ". Si ya existe el mismo reporte en curso o vigente se retorna ese trabajo (reutilizado=true).",
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'tipo': {'type': 'string', 'enum': list(reportes_service.REPORTES)},
+                    'formato': {'type': 'string', 'enum': list(reportes_service.FORMATOS)},
+                    'parametros': {'type': 'object'},
+                },
+                'required': ['tipo']
+            }
+        },
+        responses={202: OpenApiTypes.OBJECT, 200: OpenApiTypes.OBJECT}
+    )
+    def create(self, request):
+        parametros = request.data.get('parametros') or {}
+        if not isinstance(parametros, dict):
+            return Response({"error": "parametros debe ser un objeto."}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            reporte, reutilizado = reportes_service.solicitar_reporte(
+                tipo=str(request.data.get('tipo') or ''),
+                formato=str(request.data.get('formato') or 'csv').lower(),
+                parametros=parametros,
+                usuario_id=request.user.id or 0,
+            )
+        except BusinessRuleException as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        listo = reporte.estado == ReporteGeneradoModel.LISTO
+        return Response(
+            self._representar(request, reporte, reutilizado=reutilizado),
+            status=status.HTTP_200_OK if listo else status.HTTP_202_ACCEPTED
+        )
+
+    @extend_schema(summary="Estado de un Reporte", responses={200: OpenApiTypes.OBJECT})
+    def retrieve(self, request, pk=None):
+        reporte = self._obtener(pk)
+        if reporte is None:
+            return Response({"error": "Reporte no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self._representar(request, reporte), status=status.HTTP_200_OK)
+
+    @extend_schema(summary="Descargar Reporte", responses={200: OpenApiTypes.BINARY})
+    @action(detail=True, methods=['get'], url_path='descargar')
+    def descargar(self, request, pk=None):
+        reporte = self._obtener(pk)
+        if reporte is None:
+            return Response({"error": "Reporte no encontrado."}, status=status.HTTP_404_NOT_FOUND)
+        if reporte.estado != ReporteGeneradoModel.LISTO or not reporte.archivo:
+            return Response(
+                {"error": f"El reporte aún no está disponible (estado {reporte.estado})."},
+                status=status.HTTP_409_CONFLICT
+            )
+        nombre = reporte.archivo.name.rsplit('/', 1)[-1]
+        return FileResponse(reporte.archivo.open('rb'), as_attachment=True, filename=nombre)
@@ -5,3 +5,7 @@ class InfrastructureConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'adapters.infrastructure'
     verbose_name = 'Infraestructura y Datos'
+
+    def ready(self):
+        # Registro de señales (invalidación de caches / snapshots)
+        from adapters.infrastructure import signals  # noqa: F401
@@ -0,0 +1,26 @@
+# adapters.infrastructure.management.commands.aplicar_mora.py
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.use_cases.cobranza.aplicar_recargos_mora_uc import AplicarRecargosMoraUseCase
+from adapters.infrastructure.repositories.django_cobranza_repository import DjangoCobranzaRepository
+
+
+class Command(BaseCommand):
+    help = 'Recalcula meses_mora de todos los servicios y genera los recargos por mora del mes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--fecha', default=None, help='Fecha de corte YYYY-MM-DD (por defecto: hoy)')
+
+    def handle(self, *args, **opts):
+        try:
+            fecha_corte = date.fromisoformat(opts['fecha']) if opts['fecha'] else None
+        except ValueError:
+            raise CommandError("La fecha debe tener formato YYYY-MM-DD.")
+
+        reporte = AplicarRecargosMoraUseCase(DjangoCobranzaRepository()).ejecutar(fecha_corte=fecha_corte)
+        self.stdout.write(self.style.SUCCESS(
+            f"Mora al {reporte['fecha_corte']}: {reporte['servicios_en_mora']} servicios en mora, "
+            f"{reporte['recargos_creados']} recargos creados ({reporte['recargos_existentes']} ya existían)."
+        ))
@@ -0,0 +1,81 @@
+# adapters.infrastructure.management.commands.facturar_periodo.py
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from core.use_cases.generar_facturacion_medida_uc import TAMANO_LOTE_DEFAULT
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.tasks import facturar_barrio, despachar_facturacion_periodo
+
+
+def _inicializar_proceso():
+    # Cada proceso del pool abre su propia conexión (nunca compartir el socket del padre)
+    import django
+    django.setup()
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Facturación (Tarifa Medida) de un periodo, particionada por barrio y en paralelo'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--anio', type=int, required=True)
+        parser.add_argument('--mes', type=int, required=True)
+        parser.add_argument('--fecha-emision', dest='fecha_emision', default=None, help='YYYY-MM-DD')
+        parser.add_argument('--procesos', type=int, default=os.cpu_count() or 1,
+                            help='Procesos locales (por defecto: núcleos disponibles)')
+        parser.add_argument('--lote', type=int, default=TAMANO_LOTE_DEFAULT, help='Lecturas por transacción')
+        parser.add_argument('--celery', action='store_true',
+                            help='Despachar una tarea por barrio a los workers de Celery en lugar del pool local')
+
+    def handle(self, *args, **opts):
+        anio, mes = opts['anio'], opts['mes']
+        if not 1 <= mes <= 12:
+            raise CommandError("El mes debe estar entre 1 y 12.")
+
+        barrio_ids = DjangoLecturaRepository().listar_barrios_pendientes(anio, mes)
+        if not barrio_ids:
+            self.stdout.write("No hay lecturas pendientes de facturar en el periodo.")
+            return
+
+        if opts['celery']:
+            resultado = despachar_facturacion_periodo(
+                anio, mes, opts['fecha_emision'], barrio_ids=barrio_ids, tamano_lote=opts['lote']
+            )
+            self.stdout.write(self.style.SUCCESS(
+                f"{len(barrio_ids)} barrios despachados a Celery (grupo {resultado.id})."
+            ))
+            return
+
+        self.stdout.write(f"--- Facturando {anio}-{mes}: {len(barrio_ids)} barrios en {opts['procesos']} procesos ---")
+        connections.close_all()  # Que los hijos no hereden la conexión abierta del padre
+
+        totales = {"creadas": 0, "omitidas": 0, "multas_aplicadas": 0, "errores": 0}
+        with ProcessPoolExecutor(max_workers=opts['procesos'], initializer=_inicializar_proceso) as pool:
+            futuros = {
+                pool.submit(facturar_barrio, barrio_id, anio, mes, opts['fecha_emision'], opts['lote']): barrio_id
+                for barrio_id in barrio_ids
+            }
+            for futuro in as_completed(futuros):
+                barrio_id = futuros[futuro]
+                try:
+                    reporte = futuro.result()
+                except Exception as e:
+                    totales["errores"] += 1
+                    self.stderr.write(f"Barrio {barrio_id}: FALLÓ ({e}). Puede re-ejecutarse sin duplicar.")
+                    continue
+
+                for clave in ("creadas", "omitidas", "multas_aplicadas"):
+                    totales[clave] += reporte[clave]
+                totales["errores"] += len(reporte["errores"])
+                self.stdout.write(
+                    f"Barrio {barrio_id}: {reporte['creadas']} creadas, {reporte['omitidas']} omitidas, "
+                    f"{len(reporte['errores'])} errores"
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Listo: {totales['creadas']} facturas creadas, {totales['omitidas']} omitidas, "
+            f"{totales['multas_aplicadas']} multas aplicadas, {totales['errores']} errores."
+        ))
@@ -0,0 +1,18 @@
+# adapters.infrastructure.management.commands.recalcular_caja_diaria.py
+from datetime import date
+
+from django.core.management.base import BaseCommand
+
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el libro de caja diario (total y recibos por día y método) desde los pagos validados'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--desde', type=date.fromisoformat, default=None, help='YYYY-MM-DD. Por defecto: todo el historial')
+        parser.add_argument('--hasta', type=date.fromisoformat, default=None, help='YYYY-MM-DD. Por defecto: hasta hoy')
+
+    def handle(self, *args, **opts):
+        filas = DjangoPagoRepository().recalcular_caja_diaria(opts['desde'], opts['hasta'])
+        self.stdout.write(self.style.SUCCESS(f"Libro de caja reconstruido: {filas} filas (día x método)."))
@@ -0,0 +1,16 @@
+# adapters.infrastructure.management.commands.recalcular_resumen_pagos.py
+from django.core.management.base import BaseCommand
+
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el resumen de pagos de las facturas (monto validado, por validar y cantidad) desde los pagos'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--factura', type=int, action='append', dest='facturas', default=None,
+                            help='Solo esta factura (repetible). Por defecto: todas')
+
+    def handle(self, *args, **opts):
+        actualizadas = DjangoPagoRepository().recalcular_resumen_pagos(opts['facturas'])
+        self.stdout.write(self.style.SUCCESS(f"Resumen de pagos recalculado en {actualizadas} facturas."))
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0002_historicalproductomaterial_productomaterial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='historicalpagomodel',
+            name='factura',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='infrastructure.facturamodel'),
+        ),
+        migrations.AddField(
+            model_name='pagomodel',
+            name='factura',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='pagos_registrados', to='infrastructure.facturamodel'),
+        ),
+    ]
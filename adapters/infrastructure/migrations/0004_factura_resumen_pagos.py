@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:33
+
+from decimal import Decimal
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0003_pago_factura'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='facturamodel',
+            name='cantidad_pagos',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='facturamodel',
+            name='monto_por_validar',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, max_digits=10),
+        ),
+        migrations.AddField(
+            model_name='facturamodel',
+            name='monto_validado',
+            field=models.DecimalField(decimal_places=2, default=Decimal('0.00'), editable=False, max_digits=10),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0004_factura_resumen_pagos'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='detallepagomodel',
+            name='comprobante_miniatura',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='comprobantes_pagos/miniaturas/%Y/%m/'),
+        ),
+        migrations.AddField(
+            model_name='detallepagomodel',
+            name='comprobante_procesado',
+            field=models.BooleanField(default=False, editable=False, help_text='Imagen reducida, sin EXIF y con miniatura'),
+        ),
+        migrations.AddField(
+            model_name='historicaldetallepagomodel',
+            name='comprobante_miniatura',
+            field=models.TextField(blank=True, editable=False, max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='historicaldetallepagomodel',
+            name='comprobante_procesado',
+            field=models.BooleanField(default=False, editable=False, help_text='Imagen reducida, sin EXIF y con miniatura'),
+        ),
+    ]
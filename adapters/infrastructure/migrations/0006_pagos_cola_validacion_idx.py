@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0005_comprobante_miniatura'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pagomodel',
+            index=models.Index(fields=['validado', 'fecha_registro', 'id'], name='pagos_cola_validacion_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0006_pagos_cola_validacion_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CajaDiariaModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('metodo', models.CharField(choices=[('EFECTIVO', 'EFECTIVO'), ('TRANSFERENCIA', 'TRANSFERENCIA'), ('CHEQUE', 'CHEQUE')], max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('cantidad', models.PositiveIntegerField(default=0)),
+                ('recibos', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Caja Diaria',
+                'verbose_name_plural': 'Caja Diaria',
+                'db_table': 'caja_diaria',
+                'ordering': ['-fecha', 'metodo'],
+                'constraints': [models.UniqueConstraint(fields=('fecha', 'metodo'), name='caja_diaria_fecha_metodo_uniq')],
+            },
+        ),
+    ]
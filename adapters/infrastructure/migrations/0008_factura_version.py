@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0007_caja_diaria'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='facturamodel',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
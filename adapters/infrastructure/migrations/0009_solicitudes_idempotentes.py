@@ -0,0 +1,33 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:45
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0008_factura_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SolicitudIdempotenteModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alcance', models.CharField(help_text="Endpoint (ej. 'cobros.registrar')", max_length=50)),
+                ('usuario_id', models.IntegerField(default=0)),
+                ('clave', models.CharField(max_length=100)),
+                ('huella', models.CharField(max_length=64)),
+                ('estado_http', models.PositiveSmallIntegerField(blank=True, null=True)),
+                ('respuesta', models.JSONField(blank=True, null=True)),
+                ('fecha_registro', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Solicitud Idempotente',
+                'verbose_name_plural': 'Solicitudes Idempotentes',
+                'db_table': 'solicitudes_idempotentes',
+                'constraints': [models.UniqueConstraint(fields=('alcance', 'usuario_id', 'clave'), name='idempotencia_clave_uniq')],
+            },
+        ),
+    ]
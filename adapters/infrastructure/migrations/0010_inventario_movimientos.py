@@ -0,0 +1,75 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:47
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def registrar_saldos_iniciales(apps, schema_editor):
+    """El stock existente entra al libro como un AJUSTE inicial por producto."""
+    ProductoMaterial = apps.get_model('infrastructure', 'ProductoMaterial')
+    Movimiento = apps.get_model('infrastructure', 'MovimientoInventarioModel')
+    Movimiento.objects.bulk_create([
+        Movimiento(
+            producto_id=producto_id, tipo='AJUSTE', cantidad=stock, stock_resultante=stock,
+            observacion='Saldo inicial (migración al libro de movimientos)'
+        )
+        for producto_id, stock in ProductoMaterial.objects.exclude(stock_actual=0).values_list('id', 'stock_actual')
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0009_solicitudes_idempotentes'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='historicalproductomaterial',
+            name='stock_actual',
+        ),
+        migrations.AlterField(
+            model_name='productomaterial',
+            name='stock_actual',
+            field=models.IntegerField(default=0, editable=False),
+        ),
+        migrations.CreateModel(
+            name='CorteStockModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('fecha', models.DateField()),
+                ('stock', models.IntegerField()),
+                ('producto', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='cortes_stock', to='infrastructure.productomaterial')),
+            ],
+            options={
+                'verbose_name': 'Corte de Stock',
+                'verbose_name_plural': 'Cortes de Stock',
+                'db_table': 'inventario_cortes_stock',
+                'constraints': [models.UniqueConstraint(fields=('producto', 'fecha'), name='inv_corte_producto_fecha_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='MovimientoInventarioModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tipo', models.CharField(choices=[('ENTRADA', 'Entrada / Compra'), ('VENTA', 'Venta en ventanilla'), ('AJUSTE', 'Ajuste de inventario')], max_length=10)),
+                ('cantidad', models.IntegerField()),
+                ('stock_resultante', models.IntegerField()),
+                ('referencia', models.CharField(blank=True, help_text='Recibo, factura o documento de soporte', max_length=100, null=True)),
+                ('observacion', models.CharField(blank=True, max_length=255, null=True)),
+                ('usuario_id', models.IntegerField(blank=True, null=True)),
+                ('fecha_registro', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha', models.DateField(default=django.utils.timezone.localdate)),
+                ('producto', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='movimientos', to='infrastructure.productomaterial')),
+            ],
+            options={
+                'verbose_name': 'Movimiento de Inventario',
+                'verbose_name_plural': 'Movimientos de Inventario',
+                'db_table': 'inventario_movimientos',
+                'ordering': ['-fecha_registro', '-id'],
+                'indexes': [models.Index(fields=['producto', 'fecha'], name='inv_mov_producto_fecha_idx')],
+            },
+        ),
+        migrations.RunPython(registrar_saldos_iniciales, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0010_inventario_movimientos'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='facturamodel',
+            index=models.Index(fields=['estado', 'socio', 'fecha_emision'], name='facturas_cartera_idx'),
+        ),
+    ]
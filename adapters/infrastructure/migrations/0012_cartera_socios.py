@@ -0,0 +1,61 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:51
+
+import django.db.models.deletion
+from datetime import timedelta
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+
+def cargar_cartera_inicial(apps, schema_editor):
+    """Primer snapshot (luego lo reconstruye la tarea nocturna)."""
+    Factura = apps.get_model('infrastructure', 'FacturaModel')
+    Cartera = apps.get_model('infrastructure', 'CarteraSocioModel')
+    hoy = timezone.localdate()
+    corte_corriente, corte_vencido = hoy - timedelta(days=30), hoy - timedelta(days=90)
+    filas = Factura.objects.filter(estado='PENDIENTE').order_by().values('socio_id').annotate(
+        total_deuda=Sum('total'),
+        corriente=Sum('total', filter=Q(fecha_emision__gte=corte_corriente)),
+        vencido_1_3=Sum('total', filter=Q(fecha_emision__lt=corte_corriente, fecha_emision__gte=corte_vencido)),
+        incobrable=Sum('total', filter=Q(fecha_emision__lt=corte_vencido)),
+        facturas_pendientes=Count('id'),
+    )
+    Cartera.objects.bulk_create([
+        Cartera(
+            socio_id=f['socio_id'], total_deuda=f['total_deuda'] or 0, corriente=f['corriente'] or 0,
+            vencido_1_3=f['vencido_1_3'] or 0, incobrable=f['incobrable'] or 0,
+            facturas_pendientes=f['facturas_pendientes'], fecha_corte=hoy
+        )
+        for f in filas
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0011_facturas_cartera_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CarteraSocioModel',
+            fields=[
+                ('socio', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='cartera', serialize=False, to='infrastructure.sociomodel')),
+                ('total_deuda', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('corriente', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('vencido_1_3', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('incobrable', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('facturas_pendientes', models.IntegerField(default=0)),
+                ('fecha_corte', models.DateField()),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Cartera por Socio',
+                'verbose_name_plural': 'Cartera por Socio',
+                'db_table': 'cartera_socios',
+                'indexes': [models.Index(fields=['-total_deuda', 'socio'], name='cartera_total_deuda_idx')],
+            },
+        ),
+        migrations.RunPython(cargar_cartera_inicial, migrations.RunPython.noop),
+    ]
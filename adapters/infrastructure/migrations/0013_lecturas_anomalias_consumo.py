@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-19 01:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0012_cartera_socios'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lecturamodel',
+            name='anomalia_consumo',
+            field=models.CharField(blank=True, editable=False, help_text='PICO_CONSUMO, CONSUMO_CERO_CONTINUO o LECTURA_REGRESIVA', max_length=30, null=True),
+        ),
+        migrations.AddField(
+            model_name='lecturamodel',
+            name='consumo_esperado',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, help_text='Mediana del consumo de los meses anteriores (m3)', max_digits=12, null=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.11 on 2026-10-19 02:00
+
+import django.utils.timezone
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0013_lecturas_anomalias_consumo'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReporteGeneradoModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('tipo', models.CharField(max_length=30)),
+                ('formato', models.CharField(max_length=10)),
+                ('parametros', models.JSONField(default=dict)),
+                ('huella', models.CharField(help_text='SHA-256 de tipo, formato y parámetros', max_length=64)),
+                ('estado', models.CharField(choices=[('PENDIENTE', 'Pendiente'), ('EN_PROCESO', 'En proceso'), ('LISTO', 'Listo'), ('ERROR', 'Error')], default='PENDIENTE', max_length=20)),
+                ('archivo', models.FileField(blank=True, null=True, upload_to='reportes/%Y/%m/')),
+                ('filas', models.PositiveIntegerField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('usuario_id', models.IntegerField(default=0)),
+                ('fecha_solicitud', models.DateTimeField(default=django.utils.timezone.now)),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True)),
+                ('expira_en', models.DateTimeField(blank=True, db_index=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Reporte Generado',
+                'verbose_name_plural': 'Reportes Generados',
+                'db_table': 'reportes_generados',
+                'indexes': [models.Index(fields=['huella', 'estado'], name='reportes_huella_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.11 on 2026-10-19 03:10
+
+from decimal import Decimal
+
+from django.db import migrations
+from django.db.models import Count, DecimalField, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def recalcular_resumen_pagos(apps, schema_editor):
+    """
+    0004 agregó el resumen con default 0: las facturas con pagos anteriores quedaron en
+    cero. Mismo UPDATE agregado que DjangoPagoRepository.recalcular_resumen_pagos.
+    """
+    Factura = apps.get_model('infrastructure', 'FacturaModel')
+    Pago = apps.get_model('infrastructure', 'PagoModel')
+
+    def _suma(validado):
+        return Coalesce(Subquery(
+            Pago.objects.filter(factura_id=OuterRef('pk'), validado=validado)
+            .order_by().values('factura_id').annotate(total=Sum('monto_total')).values('total'),
+            output_field=DecimalField(max_digits=10, decimal_places=2)
+        ), Value(Decimal("0.00")))
+
+    cantidad = Pago.objects.filter(factura_id=OuterRef('pk')).order_by() \
+        .values('factura_id').annotate(total=Count('id')).values('total')
+
+    # Solo las facturas que tienen pagos (las demás ya están correctas en cero)
+    Factura.objects.filter(id__in=Pago.objects.values('factura_id')).update(
+        monto_validado=_suma(True),
+        monto_por_validar=_suma(False),
+        cantidad_pagos=Coalesce(Subquery(cantidad, output_field=IntegerField()), Value(0))
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0014_reportes_generados'),
+    ]
+
+    operations = [
+        migrations.RunPython(recalcular_resumen_pagos, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.11 on 2026-10-19 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('infrastructure', '0015_factura_resumen_pagos_backfill'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReporteCandadoModel',
+            fields=[
+                ('huella', models.CharField(max_length=64, primary_key=True, serialize=False)),
+            ],
+            options={
+                'verbose_name': 'Candado de Reporte',
+                'verbose_name_plural': 'Candados de Reportes',
+                'db_table': 'reportes_candados',
+            },
+        ),
+    ]
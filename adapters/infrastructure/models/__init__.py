@@ -12,14 +12,17 @@ from .factura_model import FacturaModel, DetalleFacturaModel
 
 # 3. --- NUEVOS MODELOS (Multas, Pagos y Servicios) ---
 from .multa_model import MultaModel
-from .pago_model import PagoModel, DetallePagoModel
+from .pago_model import PagoModel, DetallePagoModel, CajaDiariaModel
 from .servicio_model import ServicioModel
 from .evento_models import EventoModel, AsistenciaModel, SolicitudJustificacionModel
 from .sri_models import SRISecuencialModel
 from .catalogo_models import CatalogoRubroModel
 from .cuenta_por_cobrar_model import CuentaPorCobrarModel
 from .orden_trabajo_model import OrdenTrabajoModel
-from .inventario_models import ProductoMaterial
+from .inventario_models import ProductoMaterial, MovimientoInventarioModel, CorteStockModel
+from .idempotencia_model import SolicitudIdempotenteModel
+from .cartera_model import CarteraSocioModel
+from .reporte_model import ReporteGeneradoModel, ReporteCandadoModel
 
 # 4. Actualizamos la lista __all__ para exportar todo limpiamente
 __all__ = [
@@ -33,6 +36,7 @@ __all__ = [
     'MultaModel',
     'PagoModel',
     'DetallePagoModel',
+    'CajaDiariaModel',
     'ServicioModel',
     'EventoModel', 
     'AsistenciaModel',
@@ -42,4 +46,10 @@ __all__ = [
     'CuentaPorCobrarModel',
     'OrdenTrabajoModel',
     'ProductoMaterial',
+    'MovimientoInventarioModel',
+    'CorteStockModel',
+    'SolicitudIdempotenteModel',
+    'CarteraSocioModel',
+    'ReporteGeneradoModel',
+    'ReporteCandadoModel',
 ]
\ No newline at end of file
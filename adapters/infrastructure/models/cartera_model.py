@@ -0,0 +1,35 @@
+# adapters/infrastructure/models/cartera_model.py
+from django.db import models
+
+from .socio_model import SocioModel
+
+
+class CarteraSocioModel(models.Model):
+    """
+    Snapshot de la cartera vencida (Aging Report) por socio.
+    Se reconstruye cada noche desde las facturas PENDIENTES con una sola sentencia
+    (DjangoCarteraRepository.reconstruir) y durante el día se ajusta con UPDATE relativos
+    cuando una factura se emite, se paga o cambia de estado. El reporte lee esta tabla
+    en lugar de agregar todas las facturas pendientes en cada carga del dashboard.
+    """
+    socio = models.OneToOneField(SocioModel, on_delete=models.CASCADE, primary_key=True, related_name='cartera')
+    total_deuda = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    corriente = models.DecimalField(max_digits=12, decimal_places=2, default=0)     # <= 30 días
+    vencido_1_3 = models.DecimalField(max_digits=12, decimal_places=2, default=0)   # 31 - 90 días
+    incobrable = models.DecimalField(max_digits=12, decimal_places=2, default=0)    # > 90 días
+    facturas_pendientes = models.IntegerField(default=0)
+    # Día contra el que se clasificaron los montos (última reconstrucción)
+    fecha_corte = models.DateField()
+    fecha_actualizacion = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'cartera_socios'
+        verbose_name = 'Cartera por Socio'
+        verbose_name_plural = 'Cartera por Socio'
+        indexes = [
+            # Reporte: ORDER BY total_deuda DESC con filtro de deuda mínima
+            models.Index(fields=['-total_deuda', 'socio'], name='cartera_total_deuda_idx'),
+        ]
+
+    def __str__(self):
+        return f"Socio {self.socio_id}: ${self.total_deuda}"
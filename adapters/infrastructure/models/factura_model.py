@@ -52,6 +52,16 @@ class FacturaModel(models.Model):
     impuestos = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
     total = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"))
 
+    # Resumen de pagos (desnormalizado). Lo mantiene DjangoPagoRepository en la misma
+    # transacción que crea/valida/rechaza cada pago; 'recalcular_resumen_pagos' lo repara.
+    monto_validado = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"), editable=False)
+    monto_por_validar = models.DecimalField(max_digits=10, decimal_places=2, default=Decimal("0.00"), editable=False)
+    cantidad_pagos = models.PositiveIntegerField(default=0, editable=False)
+
+    # Concurrencia optimista: sube en cada cambio de la factura. DjangoFacturaRepository.guardar
+    # solo escribe si la versión leída sigue vigente (compare-and-set), sin bloquear la fila.
+    version = models.PositiveIntegerField(default=0, editable=False)
+
     # --- CAMPOS SRI ---
     sri_ambiente = models.PositiveIntegerField(choices=AMBIENTE_CHOICES, default=1)
     sri_tipo_emision = models.PositiveIntegerField(choices=TIPO_EMISION_CHOICES, default=1)
@@ -82,8 +92,21 @@ class FacturaModel(models.Model):
         ordering = ['-fecha_registro']
         # Evita doble facturación del mismo servicio en el mismo mes
         unique_together = ['servicio', 'anio', 'mes']
-
-    history = HistoricalRecords()
+        indexes = [
+            # Reporte de cartera: pendientes agrupadas por socio y clasificadas por fecha de emisión
+            models.Index(fields=['estado', 'socio', 'fecha_emision'], name='facturas_cartera_idx'),
+        ]
+
+    def save(self, *args, **kwargs):
+        # Toda modificación invalida la versión que otras operaciones tengan en memoria
+        if not self._state.adding:
+            self.version += 1
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'version'}
+        super().save(*args, **kwargs)
+
+    # El resumen de pagos y la versión son derivados: no se auditan
+    history = HistoricalRecords(excluded_fields=['monto_validado', 'monto_por_validar', 'cantidad_pagos', 'version'])
 
 
 # El detalle se mantiene igual, está perfecto.
@@ -0,0 +1,33 @@
+# adapters/infrastructure/models/idempotencia_model.py
+from django.db import models
+from django.utils import timezone
+
+
+class SolicitudIdempotenteModel(models.Model):
+    """
+    Respuesta guardada de una solicitud de escritura enviada con cabecera 'Idempotency-Key'.
+    Un reintento con la misma clave (mismo usuario y endpoint) recibe esta respuesta sin
+    volver a ejecutar el caso de uso. Mientras estado_http es nulo la solicitud original
+    sigue en proceso.
+    """
+    alcance = models.CharField(max_length=50, help_text="Endpoint (ej. 'cobros.registrar')")
+    # 0 = anónimo (un NULL no participaría de la restricción única)
+    usuario_id = models.IntegerField(default=0)
+    clave = models.CharField(max_length=100)
+    # SHA-256 del cuerpo: la misma clave con otros datos es un error del cliente
+    huella = models.CharField(max_length=64)
+
+    estado_http = models.PositiveSmallIntegerField(null=True, blank=True)
+    respuesta = models.JSONField(null=True, blank=True)
+    fecha_registro = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = 'solicitudes_idempotentes'
+        verbose_name = 'Solicitud Idempotente'
+        verbose_name_plural = 'Solicitudes Idempotentes'
+        constraints = [
+            models.UniqueConstraint(fields=['alcance', 'usuario_id', 'clave'], name='idempotencia_clave_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.alcance} [{self.clave}] -> {self.estado_http or 'EN PROCESO'}"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 from simple_history.models import HistoricalRecords
 from .catalogo_models import CatalogoRubroModel
 
@@ -12,7 +13,9 @@ class ProductoMaterial(models.Model):
     codigo = models.CharField(max_length=50, unique=True, help_text="SKU o Código Auxiliar para SRI")
     
     precio_unitario = models.DecimalField(max_digits=10, decimal_places=4, help_text="Precio base sin impuestos")
-    stock_actual = models.IntegerField(default=0)
+    # Saldo mantenido con UPDATE relativos (F) en la misma transacción de cada movimiento.
+    # No se edita a mano: entradas, ventas y ajustes quedan en MovimientoInventarioModel.
+    stock_actual = models.IntegerField(default=0, editable=False)
     
     # Configuración SRI
     graba_iva = models.BooleanField(default=True, verbose_name="Graba IVA")
@@ -29,4 +32,62 @@ class ProductoMaterial(models.Model):
     def __str__(self):
         return f"{self.codigo} - {self.nombre} (${self.precio_unitario})"
 
-    history = HistoricalRecords()
+    # El stock se audita en el libro de movimientos
+    history = HistoricalRecords(excluded_fields=['stock_actual'])
+
+
+class MovimientoInventarioModel(models.Model):
+    """
+    Libro de movimientos de stock (kardex). Cantidad con signo: + entra, - sale.
+    stock_resultante es el saldo del producto inmediatamente después del movimiento.
+    """
+    TIPO_CHOICES = [
+        ('ENTRADA', 'Entrada / Compra'),
+        ('VENTA', 'Venta en ventanilla'),
+        ('AJUSTE', 'Ajuste de inventario'),
+    ]
+
+    producto = models.ForeignKey(ProductoMaterial, on_delete=models.PROTECT, related_name='movimientos')
+    tipo = models.CharField(max_length=10, choices=TIPO_CHOICES)
+    cantidad = models.IntegerField()
+    stock_resultante = models.IntegerField()
+    referencia = models.CharField(max_length=100, null=True, blank=True, help_text="Recibo, factura o documento de soporte")
+    observacion = models.CharField(max_length=255, null=True, blank=True)
+    usuario_id = models.IntegerField(null=True, blank=True)
+
+    fecha_registro = models.DateTimeField(default=timezone.now)
+    # Fecha local del movimiento: permite sumar por rango de días desde el último corte
+    fecha = models.DateField(default=timezone.localdate)
+
+    class Meta:
+        db_table = 'inventario_movimientos'
+        verbose_name = 'Movimiento de Inventario'
+        verbose_name_plural = 'Movimientos de Inventario'
+        ordering = ['-fecha_registro', '-id']
+        indexes = [
+            models.Index(fields=['producto', 'fecha'], name='inv_mov_producto_fecha_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo} {self.cantidad:+d} {self.producto_id} ({self.fecha})"
+
+
+class CorteStockModel(models.Model):
+    """
+    Foto del stock de cada producto al cierre de un día. El stock a una fecha se obtiene
+    del último corte anterior + los movimientos posteriores, sin recorrer todo el libro.
+    """
+    producto = models.ForeignKey(ProductoMaterial, on_delete=models.CASCADE, related_name='cortes_stock')
+    fecha = models.DateField()
+    stock = models.IntegerField()
+
+    class Meta:
+        db_table = 'inventario_cortes_stock'
+        verbose_name = 'Corte de Stock'
+        verbose_name_plural = 'Cortes de Stock'
+        constraints = [
+            models.UniqueConstraint(fields=['producto', 'fecha'], name='inv_corte_producto_fecha_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.producto_id} @ {self.fecha}: {self.stock}"
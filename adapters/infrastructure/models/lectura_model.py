@@ -55,6 +55,12 @@ class LecturaModel(models.Model):
     esta_facturada = models.BooleanField(default=False)
     fecha_registro = models.DateTimeField(auto_now_add=True)
 
+    # --- ANÁLISIS DE CONSUMO (proceso por lote, ver DetectarAnomaliasConsumoUseCase) ---
+    anomalia_consumo = models.CharField(max_length=30, null=True, blank=True, editable=False,
+                                        help_text="PICO_CONSUMO, CONSUMO_CERO_CONTINUO o LECTURA_REGRESIVA")
+    consumo_esperado = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True, editable=False,
+                                           help_text="Mediana del consumo de los meses anteriores (m3)")
+
     class Meta:
         db_table = 'lecturas'
         verbose_name = 'Lectura'
@@ -67,4 +73,5 @@ class LecturaModel(models.Model):
     def __str__(self):
         return f"Medidor {self.medidor_id} - {self.fecha}: {self.valor} m3"
         
-    history = HistoricalRecords()
\ No newline at end of file
+    # El resultado del análisis es derivado: no se audita
+    history = HistoricalRecords(excluded_fields=['anomalia_consumo', 'consumo_esperado'])
\ No newline at end of file
@@ -10,6 +10,10 @@ class PagoModel(models.Model):
     
     # Cabecera del Pago (Recibo)
     socio = models.ForeignKey(SocioModel, on_delete=models.PROTECT, related_name='pagos_realizados')
+    # Factura que cancela este recibo (nulo en recibos comerciales / sin factura)
+    factura = models.ForeignKey(
+        'FacturaModel', on_delete=models.PROTECT, null=True, blank=True, related_name='pagos_registrados'
+    )
     numero_comprobante_interno = models.CharField(max_length=50, unique=True, editable=False, help_text="Código autogenerado")
     monto_total = models.DecimalField(max_digits=10, decimal_places=2, default=0.00)
     
@@ -24,6 +28,10 @@ class PagoModel(models.Model):
         verbose_name = 'Recibo de Pago'
         verbose_name_plural = 'Recibos de Pago'
         ordering = ['-fecha_registro']
+        indexes = [
+            # Cola de validación de Tesorería: WHERE validado = false ORDER BY (fecha_registro, id)
+            models.Index(fields=['validado', 'fecha_registro', 'id'], name='pagos_cola_validacion_idx'),
+        ]
 
     def save(self, *args, **kwargs):
         if not self.numero_comprobante_interno:
@@ -49,6 +57,10 @@ class DetallePagoModel(models.Model):
     
     # Evidencia individual si se requiere (opcional)
     comprobante_imagen = models.ImageField(upload_to='comprobantes_pagos/%Y/%m/', null=True, blank=True)
+    # Versión liviana para la cola de validación (la genera una tarea en segundo plano)
+    comprobante_miniatura = models.ImageField(upload_to='comprobantes_pagos/miniaturas/%Y/%m/', null=True, blank=True, editable=False)
+    comprobante_procesado = models.BooleanField(default=False, editable=False,
+                                                help_text="Imagen reducida, sin EXIF y con miniatura")
 
     class Meta:
         db_table = 'pagos_detalles_metodos'
@@ -58,4 +70,30 @@ class DetallePagoModel(models.Model):
     def __str__(self):
         return f"{self.metodo}: ${self.monto}"
 
-    history = HistoricalRecords()
\ No newline at end of file
+    history = HistoricalRecords()
+
+class CajaDiariaModel(models.Model):
+    """
+    Libro de caja diario: lo recaudado (pagos validados) por fecha local y método.
+    Lo mantiene DjangoPagoRepository en la misma transacción de cada pago, así el cierre
+    de caja suma filas ya agregadas (una por día y método) en lugar de recorrer 'pagos'.
+    """
+    fecha = models.DateField()
+    metodo = models.CharField(max_length=20, choices=[(m.value, m.name) for m in MetodoPagoEnum])
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    # Líneas de pago con este método
+    cantidad = models.PositiveIntegerField(default=0)
+    # Recibos: cada recibo se cuenta una sola vez, en el método de su primera línea
+    recibos = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'caja_diaria'
+        verbose_name = 'Caja Diaria'
+        verbose_name_plural = 'Caja Diaria'
+        ordering = ['-fecha', 'metodo']
+        constraints = [
+            models.UniqueConstraint(fields=['fecha', 'metodo'], name='caja_diaria_fecha_metodo_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.fecha} {self.metodo}: ${self.total}"
@@ -0,0 +1,70 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+
+class ReporteGeneradoModel(models.Model):
+    """
+    Trabajo de generación de un reporte pesado (cartera, cierre, exportaciones...).
+    Se ejecuta en un worker de Celery y el archivo queda en el storage por defecto.
+    'huella' identifica el reporte (tipo + formato + parámetros normalizados): mientras
+    un trabajo con la misma huella esté en curso o vigente (expira_en), se reutiliza.
+    """
+    PENDIENTE = 'PENDIENTE'
+    EN_PROCESO = 'EN_PROCESO'
+    LISTO = 'LISTO'
+    ERROR = 'ERROR'
+    ESTADO_CHOICES = [
+        (PENDIENTE, 'Pendiente'),
+        (EN_PROCESO, 'En proceso'),
+        (LISTO, 'Listo'),
+        (ERROR, 'Error'),
+    ]
+
+    # UUID: el id se entrega al cliente para consultar el estado (no enumerable)
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    tipo = models.CharField(max_length=30)
+    formato = models.CharField(max_length=10)
+    parametros = models.JSONField(default=dict)
+    huella = models.CharField(max_length=64, help_text="SHA-256 de tipo, formato y parámetros")
+
+    estado = models.CharField(max_length=20, choices=ESTADO_CHOICES, default=PENDIENTE)
+    archivo = models.FileField(upload_to='reportes/%Y/%m/', null=True, blank=True)
+    filas = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+
+    # 0 = proceso del sistema (mismo criterio que las solicitudes idempotentes)
+    usuario_id = models.IntegerField(default=0)
+    fecha_solicitud = models.DateTimeField(default=timezone.now)
+    fecha_fin = models.DateTimeField(null=True, blank=True)
+    expira_en = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    class Meta:
+        db_table = 'reportes_generados'
+        verbose_name = 'Reporte Generado'
+        verbose_name_plural = 'Reportes Generados'
+        indexes = [
+            # Búsqueda de un reporte reutilizable con la misma huella
+            models.Index(fields=['huella', 'estado'], name='reportes_huella_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.tipo}.{self.formato} [{self.estado}]"
+
+
+class ReporteCandadoModel(models.Model):
+    """
+    Una fila por huella, solo para serializar solicitudes iguales: quien la bloquea
+    (SELECT ... FOR UPDATE) decide si reutiliza un trabajo o crea uno nuevo. MySQL no
+    admite una restricción única parcial (huella de trabajos activos) que lo resuelva.
+    """
+    huella = models.CharField(primary_key=True, max_length=64)
+
+    class Meta:
+        db_table = 'reportes_candados'
+        verbose_name = 'Candado de Reporte'
+        verbose_name_plural = 'Candados de Reportes'
+
+    def __str__(self):
+        return self.huella
@@ -0,0 +1,143 @@
+# adapters/infrastructure/repositories/django_cartera_repository.py
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import IntegrityError, connection, transaction
+from django.db.models import CharField, Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, Concat
+from django.utils import timezone
+
+from core.interfaces.repositories import ICarteraRepository
+from core.shared.enums import EstadoFactura
+from adapters.infrastructure.models import FacturaModel, CarteraSocioModel
+
+CERO = Value(Decimal('0.00'), output_field=DecimalField(max_digits=12, decimal_places=2))
+COLUMNAS_CARTERA = (
+    'socio_id', 'total_deuda', 'corriente', 'vencido_1_3', 'incobrable', 'facturas_pendientes', 'fecha_corte'
+)
+
+
+def _cortes(hoy: date) -> Tuple[date, date]:
+    # Días de mora = hoy - fecha_emision: <= 30 corriente, 31-90 vencido, > 90 incobrable
+    return hoy - timedelta(days=30), hoy - timedelta(days=90)
+
+
+class DjangoCarteraRepository(ICarteraRepository):
+
+    # ==========================================================================
+    # RECONSTRUCCIÓN NOCTURNA
+    # ==========================================================================
+    def reconstruir(self, fecha_corte: Optional[date] = None) -> int:
+        """
+        DELETE + un INSERT ... SELECT con el GROUP BY de las facturas PENDIENTES: la base de
+        datos clasifica y escribe el snapshot sin que las filas pasen por Python.
+        """
+        fecha_corte = fecha_corte or timezone.localdate()
+        corte_corriente, corte_vencido = _cortes(fecha_corte)
+
+        agregado = FacturaModel.objects.filter(
+            estado=EstadoFactura.PENDIENTE.value
+        ).order_by().values('socio_id').annotate(
+            total_deuda=Coalesce(Sum('total'), CERO),
+            corriente=Coalesce(Sum('total', filter=Q(fecha_emision__gte=corte_corriente)), CERO),
+            vencido_1_3=Coalesce(
+                Sum('total', filter=Q(fecha_emision__lt=corte_corriente, fecha_emision__gte=corte_vencido)), CERO
+            ),
+            incobrable=Coalesce(Sum('total', filter=Q(fecha_emision__lt=corte_vencido)), CERO),
+            facturas_pendientes=Count('id'),
+            fecha_corte=Value(fecha_corte),
+        ).values_list(*COLUMNAS_CARTERA)
+
+        sql, params = agregado.query.sql_with_params()
+        quote = connection.ops.quote_name
+        tabla = quote(CarteraSocioModel._meta.db_table)
+        # Destino y origen por nombre, en el mismo orden (COLUMNAS_CARTERA): no depende del
+        # orden en que Django emite campos y anotaciones ni del orden de la tabla
+        destino = ", ".join(
+            quote(CarteraSocioModel._meta.get_field(c.removesuffix('_id')).column)
+            for c in (*COLUMNAS_CARTERA, 'fecha_actualizacion')
+        )
+        origen = ", ".join(f"cartera.{quote(c)}" for c in COLUMNAS_CARTERA)
+        with transaction.atomic():
+            CarteraSocioModel.objects.all().delete()
+            with connection.cursor() as cursor:
+                # fecha_actualizacion va al final del SELECT externo, pero su parámetro primero
+                cursor.execute(f"INSERT INTO {tabla} ({destino}) SELECT {origen}, %s FROM ({sql}) AS cartera",
+                               (timezone.now(), *params))
+                return cursor.rowcount
+
+    # ==========================================================================
+    # AJUSTES DEL DÍA (misma transacción que el cambio de la factura)
+    # ==========================================================================
+    def ajustar(self, facturas: Iterable[Tuple[int, date, Decimal]], signo: int = 1) -> None:
+        """
+        'facturas': (socio_id, fecha_emision, total) que entran (signo=1) o salen (signo=-1)
+        del estado PENDIENTE. Un UPDATE relativo por socio; la fila se crea la primera vez
+        (con reintento si otra operación la creó al mismo tiempo).
+        El tramo se calcula contra la fecha_corte de la fila (no contra hoy): entre medianoche
+        y la reconstrucción la factura sale del mismo tramo en el que se clasificó.
+        """
+        facturas = list(facturas)
+        if not facturas:
+            return
+        hoy = timezone.localdate()
+        with transaction.atomic():
+            # Bloquea las filas afectadas: una reconstrucción concurrente no cambia el corte a medias
+            fechas_corte = dict(
+                CarteraSocioModel.objects.select_for_update()
+                .filter(socio_id__in={socio_id for socio_id, _, _ in facturas})
+                .values_list('socio_id', 'fecha_corte')
+            )
+            deltas: Dict[int, Dict[str, Any]] = {}
+            for socio_id, fecha_emision, total in facturas:
+                corte_corriente, corte_vencido = _cortes(fechas_corte.get(socio_id, hoy))
+                if fecha_emision >= corte_corriente:
+                    tramo = 'corriente'
+                elif fecha_emision >= corte_vencido:
+                    tramo = 'vencido_1_3'
+                else:
+                    tramo = 'incobrable'
+                delta = deltas.setdefault(socio_id, {
+                    'total_deuda': Decimal('0.00'), 'corriente': Decimal('0.00'), 'vencido_1_3': Decimal('0.00'),
+                    'incobrable': Decimal('0.00'), 'facturas_pendientes': 0,
+                })
+                delta['total_deuda'] += signo * total
+                delta[tramo] += signo * total
+                delta['facturas_pendientes'] += signo
+
+            for socio_id, delta in deltas.items():
+                incremento = {campo: F(campo) + valor for campo, valor in delta.items()}
+                fila = CarteraSocioModel.objects.filter(socio_id=socio_id)
+                if fila.update(**incremento):
+                    continue
+                try:
+                    with transaction.atomic():
+                        CarteraSocioModel.objects.create(socio_id=socio_id, fecha_corte=hoy, **delta)
+                except IntegrityError:
+                    fila.update(**incremento)
+
+    # ==========================================================================
+    # LECTURA DEL REPORTE
+    # ==========================================================================
+    def listar(self, barrio_id: Optional[int] = None, deuda_minima: Optional[Decimal] = None,
+               limite: Optional[int] = None, desplazamiento: int = 0) -> List[Dict[str, Any]]:
+        filas = CarteraSocioModel.objects.filter(total_deuda__gt=0)
+        if barrio_id:
+            filas = filas.filter(socio__barrio_id=barrio_id)
+        if deuda_minima is not None:
+            filas = filas.filter(total_deuda__gte=deuda_minima)
+
+        filas = filas.annotate(
+            nombre=Concat(F('socio__apellidos'), Value(' '), F('socio__nombres'), output_field=CharField()),
+            barrio=Coalesce(F('socio__barrio__nombre'), Value('Sin Barrio'), output_field=CharField()),
+            identificacion=F('socio__identificacion'),
+        ).order_by('-total_deuda', 'socio_id').values(
+            'socio_id', 'nombre', 'barrio', 'identificacion', 'total_deuda',
+            'corriente', 'vencido_1_3', 'incobrable', 'facturas_pendientes'
+        )
+        if limite is not None:
+            filas = filas[desplazamiento:desplazamiento + limite]
+        elif desplazamiento:
+            filas = filas[desplazamiento:]
+        return list(filas)
@@ -0,0 +1,120 @@
+# adapters/infrastructure/repositories/django_cobranza_repository.py
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from simple_history.utils import bulk_create_with_history
+
+from core.interfaces.repositories import ICobranzaRepository
+from core.shared.enums import EstadoFactura, TipoRubro
+from adapters.infrastructure.models import (
+    FacturaModel, ServicioModel, CuentaPorCobrarModel, CatalogoRubroModel, OrdenTrabajoModel
+)
+
+RUBRO_RECARGO_MORA = "RECARGO POR MORA"
+VALOR_RECARGO_MORA_DEFAULT = Decimal("1.00")
+ESTADOS_ORDEN_EN_CURSO = ['PENDIENTE', 'EN_PROCESO']
+
+
+class DjangoCobranzaRepository(ICobranzaRepository):
+
+    def recalcular_meses_mora(self, fecha_corte: date) -> int:
+        """
+        UN solo UPDATE ... SET meses_mora = (SELECT COUNT(*) ...) para todos los servicios.
+        Cada factura PENDIENTE y vencida cuenta como un mes (unique servicio/anio/mes).
+        El costo no depende del número de facturas sino de los índices de 'facturas'.
+        """
+        vencidas = FacturaModel.objects.filter(
+            servicio_id=OuterRef('pk'),
+            estado=EstadoFactura.PENDIENTE.value,
+            fecha_vencimiento__lt=fecha_corte
+        ).order_by().values('servicio_id').annotate(total=Count('id')).values('total')
+
+        actualizados = ServicioModel.objects.update(
+            meses_mora=Coalesce(Subquery(vencidas, output_field=IntegerField()), Value(0))
+        )
+        return actualizados
+
+    def listar_servicios_en_mora(self, meses_minimos: int = 1) -> List[Dict[str, Any]]:
+        return list(ServicioModel.objects.filter(
+            activo=True, meses_mora__gte=meses_minimos
+        ).order_by('id').values('id', 'socio_id', 'meses_mora'))
+
+    def obtener_rubro_recargo_mora(self) -> Tuple[int, Decimal]:
+        rubro, _ = CatalogoRubroModel.objects.get_or_create(
+            nombre=RUBRO_RECARGO_MORA,
+            defaults={
+                "descripcion": "Recargo mensual por servicio con facturas vencidas",
+                "tipo": TipoRubro.OTROS.value,
+                "valor_unitario": VALOR_RECARGO_MORA_DEFAULT,
+            }
+        )
+        return rubro.id, rubro.valor_unitario if rubro.activo else Decimal("0.00")
+
+    def referencias_existentes(self, rubro_id: int, referencias: List[str]) -> Set[str]:
+        if not referencias:
+            return set()
+        return set(CuentaPorCobrarModel.objects.filter(
+            rubro_id=rubro_id, origen_referencia__in=referencias
+        ).values_list('origen_referencia', flat=True))
+
+    def crear_cuentas_por_cobrar(self, cuentas: List[Dict[str, Any]]) -> int:
+        if not cuentas:
+            return 0
+        objs = [CuentaPorCobrarModel(**datos) for datos in cuentas]
+        bulk_create_with_history(objs, CuentaPorCobrarModel, batch_size=500)
+        return len(objs)
+
+    # =================================================================
+    # ÓRDENES DE CORTE
+    # =================================================================
+    def listar_servicios_para_corte(self, meses_minimos: int) -> List[int]:
+        # EXISTS en lugar de JOIN para poder bloquear (FOR UPDATE) sin outer join
+        orden_en_curso = OrdenTrabajoModel.objects.filter(
+            id=OuterRef('orden_trabajo_activa_id'),
+            estado__in=ESTADOS_ORDEN_EN_CURSO
+        )
+        return list(ServicioModel.objects.select_for_update().filter(
+            activo=True,
+            estado='ACTIVO',
+            meses_mora__gte=meses_minimos
+        ).exclude(
+            Exists(orden_en_curso)
+        ).order_by('id').values_list('id', flat=True))
+
+    def crear_ordenes_corte(self, servicio_ids: List[int]) -> int:
+        if not servicio_ids:
+            return 0
+
+        ordenes = [OrdenTrabajoModel(servicio_id=sid, tipo='CORTE', estado='PENDIENTE') for sid in servicio_ids]
+        bulk_create_with_history(ordenes, OrdenTrabajoModel, batch_size=500)
+
+        # Vinculación en UN solo UPDATE (no depende de que la BD devuelva los ids del INSERT)
+        ultima_orden_corte = OrdenTrabajoModel.objects.filter(
+            servicio_id=OuterRef('pk'), tipo='CORTE', estado='PENDIENTE'
+        ).order_by('-id').values('id')[:1]
+        ServicioModel.objects.filter(id__in=servicio_ids).update(
+            orden_trabajo_activa_id=Subquery(ultima_orden_corte)
+        )
+        return len(ordenes)
+
+    def listar_ordenes_corte_pendientes(self, barrio_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        qs = OrdenTrabajoModel.objects.filter(tipo='CORTE', estado='PENDIENTE')
+        if barrio_id is not None:
+            qs = qs.filter(servicio__terreno__barrio_id=barrio_id)
+
+        return list(qs.order_by(
+            'servicio__terreno__barrio__nombre', 'servicio__terreno__direccion', 'id'
+        ).values(
+            'id', 'fecha_generacion', 'servicio_id',
+            meses_mora=F('servicio__meses_mora'),
+            socio_identificacion=F('servicio__socio__identificacion'),
+            socio_nombres=F('servicio__socio__nombres'),
+            socio_apellidos=F('servicio__socio__apellidos'),
+            socio_telefono=F('servicio__socio__telefono'),
+            barrio=F('servicio__terreno__barrio__nombre'),
+            direccion=F('servicio__terreno__direccion'),
+            medidor_codigo=F('servicio__terreno__medidor__codigo'),
+        ))
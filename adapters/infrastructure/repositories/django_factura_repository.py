@@ -1,8 +1,12 @@
-from typing import Optional
+from typing import Optional, List, Set, Dict
+from django.db.models import F, Q
 from core.interfaces.repositories import IFacturaRepository
 from core.domain.factura import Factura as FacturaEntity, DetalleFactura, EstadoFactura
 from core.domain.socio import Socio as SocioEntity, RolUsuario
+from core.shared.exceptions import ConflictoConcurrenciaError
 from adapters.infrastructure.models import FacturaModel
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
+from adapters.infrastructure.services.dashboard_kpis import invalidar_kpis
 
 class DjangoFacturaRepository(IFacturaRepository):
     
@@ -41,6 +45,17 @@ class DjangoFacturaRepository(IFacturaRepository):
             estado__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.PAGADA.value]
         ).exists()
 
+    def obtener_servicios_facturados(self, servicio_ids: List[int], anio: int, mes: int) -> Set[int]:
+        # Mismo criterio que existe_factura_fija_mes, en una sola consulta para todo el lote
+        if not servicio_ids:
+            return set()
+        return set(FacturaModel.objects.filter(
+            servicio_id__in=servicio_ids,
+            anio=anio,
+            mes=mes,
+            estado__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.PAGADA.value]
+        ).values_list('servicio_id', flat=True))
+
     def guardar(self, factura: FacturaEntity) -> None:
         # Aquí actualizamos el registro en BD desde la Entidad
         # Asumimos que la entidad tiene ID (es update)
@@ -74,36 +89,63 @@ class DjangoFacturaRepository(IFacturaRepository):
                     precio_unitario=det.precio_unitario,
                     subtotal=det.subtotal
                 )
-            
+
+            if f_db.estado == EstadoFactura.PENDIENTE.value:
+                DjangoCarteraRepository().ajustar([(f_db.socio_id, f_db.fecha_emision, f_db.total)])
             return
 
         try:
             f_db = FacturaModel.objects.get(id=factura.id)
-            
-            # Actualizamos campos modificables por el Caso de Uso Concepto
-            f_db.estado = factura.estado.value if hasattr(factura.estado, 'value') else factura.estado
-            f_db.anio = factura.anio
-            f_db.mes = factura.mes
-            
-            # Asociaciones (Lectura, Servicio)
-            if factura.servicio_id:
-                f_db.servicio_id = factura.servicio_id
-            
-            # Campos SRI
-            f_db.sri_ambiente = factura.sri_ambiente
-            f_db.sri_tipo_emision = factura.sri_tipo_emision
-            f_db.clave_acceso_sri = factura.sri_clave_acceso
-            f_db.xml_autorizado_sri = factura.sri_xml_autorizado
-            f_db.mensaje_error_sri = factura.sri_mensaje_error
-            f_db.estado_sri = factura.estado_sri
-            if factura.sri_fecha_autorizacion:
-                f_db.fecha_autorizacion_sri = factura.sri_fecha_autorizacion
-
-            f_db.save()
-            
         except FacturaModel.DoesNotExist:
             raise ValueError(f"Factura {factura.id} no encontrada en DB para guardar.")
 
+        estado_anterior = f_db.estado
+        # Actualizamos campos modificables por el Caso de Uso Concepto
+        f_db.estado = factura.estado.value if hasattr(factura.estado, 'value') else factura.estado
+        f_db.anio = factura.anio
+        f_db.mes = factura.mes
+
+        # Asociaciones (Lectura, Servicio)
+        if factura.servicio_id:
+            f_db.servicio_id = factura.servicio_id
+
+        # Campos SRI
+        f_db.sri_ambiente = factura.sri_ambiente
+        f_db.sri_tipo_emision = factura.sri_tipo_emision
+        f_db.clave_acceso_sri = factura.sri_clave_acceso
+        f_db.xml_autorizado_sri = factura.sri_xml_autorizado
+        f_db.mensaje_error_sri = factura.sri_mensaje_error
+        f_db.estado_sri = factura.estado_sri
+        if factura.sri_fecha_autorizacion:
+            f_db.fecha_autorizacion_sri = factura.sri_fecha_autorizacion
+
+        # Compare-and-set: solo los campos del dominio (el resumen de pagos lo mantiene el
+        # repositorio de pagos) y solo si nadie cambió la factura desde que se leyó
+        actualizadas = FacturaModel.objects.filter(id=factura.id, version=factura.version).update(
+            estado=f_db.estado, anio=f_db.anio, mes=f_db.mes, servicio_id=f_db.servicio_id,
+            sri_ambiente=f_db.sri_ambiente, sri_tipo_emision=f_db.sri_tipo_emision,
+            clave_acceso_sri=f_db.clave_acceso_sri, xml_autorizado_sri=f_db.xml_autorizado_sri,
+            mensaje_error_sri=f_db.mensaje_error_sri, estado_sri=f_db.estado_sri,
+            fecha_autorizacion_sri=f_db.fecha_autorizacion_sri,
+            version=F('version') + 1
+        )
+        if not actualizadas:
+            raise ConflictoConcurrenciaError(
+                f"La factura {factura.id} fue modificada por otra operación. Recargue e intente nuevamente."
+            )
+
+        factura.version = f_db.version = factura.version + 1
+        # update() no pasa por save(): el historial y los KPIs se actualizan explícitamente
+        FacturaModel.history.bulk_history_create([f_db], update=True)
+        invalidar_kpis()
+
+        # Snapshot de cartera: la factura entra o sale de PENDIENTE
+        if (estado_anterior == EstadoFactura.PENDIENTE.value) != (f_db.estado == EstadoFactura.PENDIENTE.value):
+            DjangoCarteraRepository().ajustar(
+                [(f_db.socio_id, f_db.fecha_emision, f_db.total)],
+                signo=1 if f_db.estado == EstadoFactura.PENDIENTE.value else -1
+            )
+
     def _mapear_a_dominio(self, f_db: FacturaModel) -> FacturaEntity:
         detalles_dominio = []
         for det in f_db.detalles.all():
@@ -134,7 +176,8 @@ class DjangoFacturaRepository(IFacturaRepository):
             estado_sri=f_db.estado_sri,
             # Mapeo de archivos
             archivo_pdf=f_db.archivo_pdf.url if f_db.archivo_pdf else None,
-            archivo_xml_path=f_db.archivo_xml.url if f_db.archivo_xml else None
+            archivo_xml_path=f_db.archivo_xml.url if f_db.archivo_xml else None,
+            version=f_db.version
         )
 
     def obtener_pendientes_por_socio(self, socio_id: int) -> list[FacturaEntity]:
@@ -145,12 +188,67 @@ class DjangoFacturaRepository(IFacturaRepository):
         
         return [self._mapear_a_dominio(f) for f in f_dbs]
 
+    def obtener_pendientes_para_cobro(self, socio_id: int) -> list[FacturaEntity]:
+        # Lectura sin bloqueo: si otra caja cobra a la vez, marcar_como_pagadas detecta el
+        # conflicto por la versión
+        f_dbs = FacturaModel.objects.filter(
+            socio_id=socio_id,
+            estado__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.POR_VALIDAR.value]
+        ).order_by('anio', 'mes', 'fecha_emision', 'id')
+
+        return [
+            FacturaEntity(
+                id=f.id, socio_id=f.socio_id, servicio_id=f.servicio_id, medidor_id=f.medidor_id,
+                fecha_emision=f.fecha_emision, fecha_vencimiento=f.fecha_vencimiento,
+                anio=f.anio, mes=f.mes, estado=EstadoFactura(f.estado),
+                subtotal=f.subtotal, impuestos=f.impuestos, total=f.total, version=f.version
+            )
+            for f in f_dbs
+        ]
+
+    def marcar_como_pagadas(self, factura_ids: List[int], versiones: Optional[Dict[int, int]] = None) -> int:
+        """
+        Marca las facturas como PAGADAS con un UPDATE por lote + su historial. Con 'versiones'
+        ({factura_id: versión leída}) es un compare-and-set: si alguna factura cambió desde
+        su lectura se lanza ConflictoConcurrenciaError (la transacción del cobro se revierte).
+        """
+        if not factura_ids:
+            return 0
+        pendientes = FacturaModel.objects.filter(id__in=factura_ids).exclude(estado=EstadoFactura.PAGADA.value)
+        if versiones:
+            condicion = Q()
+            for factura_id in factura_ids:
+                condicion |= Q(id=factura_id, version=versiones[factura_id])
+            pendientes = pendientes.filter(condicion)
+
+        f_dbs = list(pendientes)
+        # El UPDATE repite la condición: cubre cambios entre esta lectura y la escritura
+        actualizadas = pendientes.update(estado=EstadoFactura.PAGADA.value, version=F('version') + 1)
+        if versiones and not (len(f_dbs) == actualizadas == len(factura_ids)):
+            raise ConflictoConcurrenciaError(
+                "Una o más facturas fueron modificadas por otra operación durante el cobro. Intente nuevamente."
+            )
+
+        DjangoCarteraRepository().ajustar(
+            [(f.socio_id, f.fecha_emision, f.total) for f in f_dbs if f.estado == EstadoFactura.PENDIENTE.value],
+            signo=-1
+        )
+
+        # Auditoría de cambios de estado (update() no pasa por save())
+        for f_db in f_dbs:
+            f_db.estado = EstadoFactura.PAGADA.value
+            f_db.version += 1
+        FacturaModel.history.bulk_history_create(f_dbs, update=True)
+        invalidar_kpis()
+        return actualizadas
+
     def _mapear_socio(self, socio_db) -> SocioEntity:
         # Mapper auxiliar para el socio
         direccion_safe = socio_db.direccion if socio_db.direccion else "S/N"
         return SocioEntity(
             id=socio_db.id,
-            cedula=socio_db.cedula,
+            identificacion=socio_db.identificacion,
+            tipo_identificacion=socio_db.tipo_identificacion,
             nombres=socio_db.nombres,
             apellidos=socio_db.apellidos,
             email=socio_db.email,
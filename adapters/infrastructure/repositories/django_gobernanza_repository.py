@@ -1,5 +1,7 @@
 # adapters/infrastructure/repositories/django_gobernanza_repository.py
-from typing import List, Any
+from typing import List, Any, Dict, Set
+from collections import defaultdict
+from simple_history.utils import bulk_update_with_history
 from core.interfaces.repositories import IGobernanzaRepository
 from core.domain.asistencia import EstadoAsistencia
 from adapters.infrastructure.models.evento_models import AsistenciaModel
@@ -16,3 +18,48 @@ class DjangoGobernanzaRepository(IGobernanzaRepository):
 
     def marcar_multa_como_facturada(self, asistencia_id: int, factura_id: int) -> None:
         AsistenciaModel.objects.filter(id=asistencia_id).update(multa_factura_id=factura_id)
+
+    def obtener_multas_pendientes_por_socios(self, socio_ids: List[int]) -> Dict[int, List[Any]]:
+        # Una sola consulta para todo el lote; la agrupación se hace en memoria
+        multas = defaultdict(list)
+        if not socio_ids:
+            return multas
+
+        qs = AsistenciaModel.objects.filter(
+            socio_id__in=socio_ids,
+            estado=EstadoAsistencia.FALTA.value,
+            multa_factura__isnull=True
+        ).select_related('evento').order_by('evento__fecha', 'id')
+
+        for asistencia in qs:
+            multas[asistencia.socio_id].append(asistencia)
+        return multas
+
+
+    def marcar_multas_como_facturadas(self, asignaciones: Dict[int, int]) -> int:
+        # 1 SELECT + 1 UPDATE (CASE WHEN) + 1 INSERT de historial, sin importar el tamaño del lote.
+        # Solo se vinculan las que siguen pendientes (evita cobrar dos veces la misma falta).
+        if not asignaciones:
+            return 0
+
+        asistencias = list(AsistenciaModel.objects.filter(
+            id__in=list(asignaciones.keys()),
+            multa_factura__isnull=True
+        ))
+
+        for asistencia in asistencias:
+            asistencia.multa_factura_id = asignaciones[asistencia.id]
+
+        bulk_update_with_history(asistencias, AsistenciaModel, ['multa_factura'], batch_size=500)
+        return len(asistencias)
+
+    def reservar_multas_pendientes(self, asistencia_ids: List[int]) -> Set[int]:
+        # SELECT ... FOR UPDATE: otra partición que factura al mismo socio (terreno en otro
+        # barrio) espera aquí hasta que esta transacción confirme y entonces ya las ve facturadas.
+        # ORDER BY id: todas las particiones bloquean en el mismo orden (sin interbloqueos).
+        if not asistencia_ids:
+            return set()
+        return set(AsistenciaModel.objects.select_for_update().filter(
+            id__in=asistencia_ids,
+            multa_factura__isnull=True
+        ).order_by('id').values_list('id', flat=True))
@@ -0,0 +1,158 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from django.db import connection, transaction
+from django.db.models import Case, F, IntegerField, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce
+
+from core.interfaces.repositories import IInventarioRepository
+from core.shared.exceptions import EntityNotFoundException, StockInsuficienteError
+from adapters.infrastructure.models import ProductoMaterial, MovimientoInventarioModel, CorteStockModel
+
+# Fecha anterior a cualquier movimiento (productos sin corte previo)
+FECHA_INICIAL = date(2000, 1, 1)
+
+
+class DjangoInventarioRepository(IInventarioRepository):
+
+    # ==========================================================================
+    # MOVIMIENTOS (saldo con UPDATE relativo + libro, en la misma transacción)
+    # ==========================================================================
+    def descontar_stock(self, cantidades: Dict[int, int], referencia: Optional[str] = None,
+                        usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Sentencias fijas sin importar cuántos ítems tenga la venta: 1 UPDATE condicionado
+        (stock = stock - CASE id ... WHERE stock >= cantidad), 1 SELECT de saldos y
+        1 INSERT en bloque de movimientos. Dos ventas simultáneas nunca dejan stock negativo.
+        """
+        if not cantidades:
+            return []
+
+        with transaction.atomic():
+            condicion = Q()
+            for producto_id, cantidad in cantidades.items():
+                condicion |= Q(id=producto_id, stock_actual__gte=cantidad)
+            descuento = Case(
+                *[When(id=producto_id, then=Value(cantidad)) for producto_id, cantidad in cantidades.items()],
+                default=Value(0), output_field=IntegerField()
+            )
+            actualizados = ProductoMaterial.objects.filter(condicion, activo=True).update(
+                stock_actual=F('stock_actual') - descuento
+            )
+
+            productos = {
+                p['id']: p for p in ProductoMaterial.objects.filter(id__in=list(cantidades)).values(
+                    'id', 'codigo', 'nombre', 'precio_unitario', 'stock_actual', 'activo'
+                )
+            }
+            if actualizados != len(cantidades):
+                # Sale del bloque atómico: se revierten los descuentos ya aplicados
+                raise StockInsuficienteError(self._detalle_faltantes(cantidades, productos))
+
+            MovimientoInventarioModel.objects.bulk_create([
+                MovimientoInventarioModel(
+                    producto_id=producto_id, tipo='VENTA', cantidad=-cantidad,
+                    stock_resultante=productos[producto_id]['stock_actual'],
+                    referencia=referencia, usuario_id=usuario_id
+                )
+                for producto_id, cantidad in cantidades.items()
+            ], batch_size=500)
+
+        return [
+            {
+                "producto_id": producto_id,
+                "codigo": productos[producto_id]['codigo'],
+                "nombre": productos[producto_id]['nombre'],
+                "cantidad": cantidad,
+                "precio_unitario": productos[producto_id]['precio_unitario'],
+                "stock_resultante": productos[producto_id]['stock_actual'],
+            }
+            for producto_id, cantidad in cantidades.items()
+        ]
+
+    @staticmethod
+    def _detalle_faltantes(cantidades: Dict[int, int], productos: Dict[int, Dict[str, Any]]) -> str:
+        errores = []
+        for producto_id, cantidad in cantidades.items():
+            producto = productos.get(producto_id)
+            if not producto or not producto['activo']:
+                errores.append(f"material {producto_id} no existe o está inactivo")
+            elif producto['stock_actual'] < cantidad:
+                errores.append(f"{producto['codigo']}: solicitado {cantidad}, disponible {producto['stock_actual']}")
+        return "Stock insuficiente: " + "; ".join(errores) + "."
+
+    def registrar_movimiento(self, producto_id: int, tipo: str, cantidad: int,
+                             referencia: Optional[str] = None, observacion: Optional[str] = None,
+                             usuario_id: Optional[int] = None) -> int:
+        with transaction.atomic():
+            productos = ProductoMaterial.objects.filter(id=producto_id)
+            if cantidad < 0:
+                productos = productos.filter(stock_actual__gte=-cantidad)
+            if not productos.update(stock_actual=F('stock_actual') + cantidad):
+                if not ProductoMaterial.objects.filter(id=producto_id).exists():
+                    raise EntityNotFoundException(f"El material {producto_id} no existe.")
+                raise StockInsuficienteError("El ajuste dejaría el stock en negativo.")
+
+            stock = ProductoMaterial.objects.values_list('stock_actual', flat=True).get(id=producto_id)
+            MovimientoInventarioModel.objects.create(
+                producto_id=producto_id, tipo=tipo, cantidad=cantidad, stock_resultante=stock,
+                referencia=referencia, observacion=observacion, usuario_id=usuario_id
+            )
+        return stock
+
+    # ==========================================================================
+    # CORTES Y STOCK A FECHA
+    # ==========================================================================
+    def generar_cortes_stock(self, fecha: date) -> int:
+        """
+        Stock al cierre de 'fecha' = saldo actual - movimientos posteriores (1 consulta
+        agregada) y 1 upsert: regenerar el corte de un día lo sobrescribe.
+        """
+        posteriores = MovimientoInventarioModel.objects.filter(producto_id=OuterRef('pk'), fecha__gt=fecha) \
+            .order_by().values('producto_id').annotate(total=Sum('cantidad')).values('total')
+        saldos = ProductoMaterial.objects.annotate(
+            posteriores=Coalesce(Subquery(posteriores, output_field=IntegerField()), Value(0))
+        ).values_list('id', 'stock_actual', 'posteriores')
+
+        cortes = CorteStockModel.objects.bulk_create(
+            [CorteStockModel(producto_id=pid, fecha=fecha, stock=stock - despues) for pid, stock, despues in saldos],
+            update_conflicts=True, update_fields=['stock'], batch_size=500, **self._destino_upsert_corte()
+        )
+        return len(cortes)
+
+    @staticmethod
+    def _destino_upsert_corte() -> Dict[str, Any]:
+        """
+        PostgreSQL/SQLite: ON CONFLICT (producto_id, fecha) DO UPDATE.
+        MySQL no acepta columnas de conflicto (ON DUPLICATE KEY UPDATE usa cualquier clave
+        única): basta porque inv_corte_producto_fecha_uniq es la única además del id.
+        """
+        if connection.features.supports_update_conflicts_with_target:
+            return {"unique_fields": ['producto', 'fecha']}
+        return {}
+
+    def stock_a_fecha(self, fecha: date, producto_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """
+        1 consulta: último corte <= fecha de cada producto + suma de sus movimientos entre
+        ese corte y 'fecha' (rango corto sobre inv_mov_producto_fecha_idx).
+        """
+        corte = CorteStockModel.objects.filter(producto_id=OuterRef('pk'), fecha__lte=fecha).order_by('-fecha')
+        desde_corte = MovimientoInventarioModel.objects.filter(
+            producto_id=OuterRef('pk'), fecha__gt=OuterRef('fecha_corte'), fecha__lte=fecha
+        ).order_by().values('producto_id').annotate(total=Sum('cantidad')).values('total')
+
+        productos = ProductoMaterial.objects.all()
+        if producto_ids:
+            productos = productos.filter(id__in=producto_ids)
+        filas = productos.annotate(
+            fecha_corte=Coalesce(Subquery(corte.values('fecha')[:1]), Value(FECHA_INICIAL)),
+            stock_corte=Coalesce(Subquery(corte.values('stock')[:1]), Value(0)),
+        ).annotate(
+            suma_movimientos=Coalesce(Subquery(desde_corte, output_field=IntegerField()), Value(0))
+        ).order_by('nombre').values('id', 'codigo', 'nombre', 'stock_corte', 'suma_movimientos')
+
+        return [
+            {"producto_id": f['id'], "codigo": f['codigo'], "nombre": f['nombre'],
+             "stock": f['stock_corte'] + f['suma_movimientos']}
+            for f in filas
+        ]
@@ -1,9 +1,13 @@
 # adapters/infrastructure/repositories/django_lectura_repository.py
 
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from django.db.models import F, OuterRef, Q, Subquery
+from simple_history.utils import bulk_update_with_history
 from core.interfaces.repositories import ILecturaRepository
 from core.domain.lectura import Lectura
-from adapters.infrastructure.models import LecturaModel
+from adapters.infrastructure.models import LecturaModel, MedidorModel, ServicioModel
+from adapters.infrastructure.services.catastro_snapshot import obtener_catastro
 
 class DjangoLecturaRepository(ILecturaRepository):
     """
@@ -85,4 +89,122 @@ class DjangoLecturaRepository(ILecturaRepository):
         Devuelve el historial de lecturas.
         """
         qs = LecturaModel.objects.filter(medidor_id=medidor_id).order_by('-fecha')
-        return [self._map_model_to_domain(m) for m in qs]
\ No newline at end of file
+        return [self._map_model_to_domain(m) for m in qs]
+
+    # =================================================================
+    # 4. CONSULTAS MASIVAS (PLANILLA / FACTURACIÓN POR LOTE)
+    # =================================================================
+    def listar_pendientes_facturacion(self, barrio_id: Optional[int], anio: int, mes: int) -> List[dict]:
+        """
+        Lecturas NO facturadas de un barrio (o de todos si barrio_id es None) y periodo.
+        La consulta solo trae columnas de la lectura; socio, barrio y tarifa del Servicio
+        MEDIDO activo se resuelven en O(1) contra el snapshot del catastro (sin JOINs ni
+        subconsultas por fila). Ordenadas por socio para poder agruparlas en streaming.
+        """
+        catastro = obtener_catastro()
+
+        qs = LecturaModel.objects.filter(anio=anio, mes=mes, esta_facturada=False)
+        if barrio_id is not None:
+            qs = qs.filter(medidor__terreno__barrio_id=barrio_id)
+
+        filas, sin_catastro = [], []
+        for fila in qs.values('id', 'fecha', 'valor', 'lectura_anterior', 'consumo_del_mes', 'medidor_id',
+                              'anomalia_consumo'):
+            medidor, terreno, socio, servicio = catastro.resolver_medidor(fila['medidor_id'])
+            if socio is None:
+                # Medidor/terreno dado de alta después de cargar el snapshot, o de inventario
+                sin_catastro.append(fila)
+                continue
+
+            fila.update({
+                'servicio_id': servicio.id if servicio else None,
+                'tarifa_base_m3': servicio.tarifa_basica_m3 if servicio else None,
+                'tarifa_base_precio': servicio.valor_tarifa if servicio else None,
+                'tarifa_excedente_precio': servicio.tarifa_excedente_precio if servicio else None,
+                'medidor_codigo': medidor.codigo,
+                'terreno_id': terreno.id,
+                'barrio_id': terreno.barrio_id,
+                'barrio_nombre': catastro.nombre_barrio(terreno.barrio_id),
+                'socio_id': socio.id,
+                'socio_nombres': socio.nombres,
+                'socio_apellidos': socio.apellidos,
+                'socio_identificacion': socio.identificacion,
+            })
+            filas.append(fila)
+
+        if sin_catastro:
+            datos = self._resolver_medidores_bd({f['medidor_id'] for f in sin_catastro})
+            for fila in sin_catastro:
+                if fila['medidor_id'] in datos:  # Sin terreno/socio (inventario): no facturable
+                    fila.update(datos[fila['medidor_id']])
+                    filas.append(fila)
+
+        filas.sort(key=lambda f: (f['socio_apellidos'], f['socio_id'], f['medidor_codigo']))
+        return filas
+
+    def _resolver_medidores_bd(self, medidor_ids) -> Dict[int, dict]:
+        """Lo mismo que resuelve el snapshot, en una consulta, para los medidores que no estaban en él."""
+        servicio = ServicioModel.objects.filter(
+            terreno_id=OuterRef('terreno_id'), tipo='MEDIDO', activo=True
+        ).order_by('id')
+        qs = MedidorModel.objects.filter(id__in=medidor_ids, terreno__socio__isnull=False).annotate(
+            servicio_id=Subquery(servicio.values('id')[:1]),
+            tarifa_base_m3=Subquery(servicio.values('tarifa_basica_m3')[:1]),
+            tarifa_base_precio=Subquery(servicio.values('valor_tarifa')[:1]),
+            tarifa_excedente_precio=Subquery(servicio.values('tarifa_excedente_precio')[:1]),
+        ).values(
+            'id', 'terreno_id', 'servicio_id', 'tarifa_base_m3', 'tarifa_base_precio', 'tarifa_excedente_precio',
+            medidor_codigo=F('codigo'),
+            barrio_id=F('terreno__barrio_id'),
+            barrio_nombre=F('terreno__barrio__nombre'),
+            socio_id=F('terreno__socio_id'),
+            socio_nombres=F('terreno__socio__nombres'),
+            socio_apellidos=F('terreno__socio__apellidos'),
+            socio_identificacion=F('terreno__socio__identificacion'),
+        )
+        return {datos.pop('id'): datos for datos in qs}
+
+    def listar_barrios_pendientes(self, anio: int, mes: int) -> List[int]:
+        return list(LecturaModel.objects.filter(
+            anio=anio, mes=mes, esta_facturada=False, medidor__terreno__barrio__isnull=False
+        ).values_list('medidor__terreno__barrio_id', flat=True).distinct().order_by('medidor__terreno__barrio_id'))
+
+    def marcar_como_facturadas(self, lectura_ids: List[int]) -> int:
+        if not lectura_ids:
+            return 0
+
+        lecturas = list(LecturaModel.objects.filter(
+            id__in=lectura_ids, esta_facturada=False
+        ))
+
+        for lectura in lecturas:
+            lectura.esta_facturada = True
+
+        bulk_update_with_history(lecturas, LecturaModel, ['esta_facturada'], batch_size=500)
+        return len(lecturas)
+
+    # =================================================================
+    # 5. ANÁLISIS DE CONSUMO (SERIES POR MEDIDOR)
+    # =================================================================
+    def obtener_series_consumo(self, anio: int, mes: int, meses: int) -> List[Tuple[int, int, int, int, float]]:
+        """
+        (lectura_id, medidor_id, anio, mes, consumo) de los 'meses' anteriores + el periodo,
+        solo de medidores con lectura en el periodo. Una consulta, sin instanciar modelos.
+        """
+        desde = anio * 12 + (mes - 1) - meses
+        anio_desde, mes_desde = divmod(desde, 12)
+        ventana = Q(anio__gt=anio_desde) | Q(anio=anio_desde, mes__gte=mes_desde + 1)
+        hasta = Q(anio__lt=anio) | Q(anio=anio, mes__lte=mes)
+
+        medidores = LecturaModel.objects.filter(anio=anio, mes=mes).values('medidor_id')
+        return list(LecturaModel.objects.filter(ventana, hasta, medidor_id__in=medidores).values_list(
+            'id', 'medidor_id', 'anio', 'mes', 'consumo_del_mes'
+        ))
+
+    def guardar_anomalias(self, resultados: Dict[int, Tuple[Optional[str], Optional[Decimal]]]) -> int:
+        """{lectura_id: (anomalia o None, consumo_esperado)} en UPDATE por lotes (sin historial: campos derivados)."""
+        lecturas = [
+            LecturaModel(id=lectura_id, anomalia_consumo=anomalia, consumo_esperado=esperado)
+            for lectura_id, (anomalia, esperado) in resultados.items()
+        ]
+        return LecturaModel.objects.bulk_update(lecturas, ['anomalia_consumo', 'consumo_esperado'], batch_size=1000)
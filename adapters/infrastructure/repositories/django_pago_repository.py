@@ -1,87 +1,412 @@
+import uuid
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
 from decimal import Decimal
-from typing import List
-from django.db.models import Sum
+from typing import Any, Dict, List, Optional, Tuple
+from django.db import IntegrityError, transaction
+from django.db.models import (
+    Sum, Count, F, Q, Case, When, Value, OuterRef, Subquery, DecimalField, IntegerField
+)
+from django.utils import timezone
+from django.db.models.functions import Coalesce, TruncDate
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
 from core.interfaces.repositories import IPagoRepository
-from adapters.infrastructure.models import PagoModel
+from adapters.infrastructure.models import PagoModel, DetallePagoModel, FacturaModel, CajaDiariaModel
+from adapters.infrastructure.services.dashboard_kpis import invalidar_kpis
 from core.shared.enums import MetodoPagoEnum
 
 class DjangoPagoRepository(IPagoRepository):
 
+    # ==========================================================================
+    # RESUMEN DE PAGOS POR FACTURA (columnas desnormalizadas en 'facturas')
+    # ==========================================================================
+    def obtener_resumen_pagos(self, factura_id: int) -> Dict[str, Any]:
+        return FacturaModel.objects.values('monto_validado', 'monto_por_validar', 'cantidad_pagos').get(id=factura_id)
+
     def obtener_sumatoria_validada(self, factura_id: int) -> float:
-        suma = PagoModel.objects.filter(
-            factura_id=factura_id,
-            metodo=MetodoPagoEnum.TRANSFERENCIA.value,
-            validado=True
-        ).aggregate(Sum('monto'))
-        
-        resultado = suma['monto__sum'] or Decimal("0.00")
-        return float(resultado)
+        return float(self.obtener_resumen_pagos(factura_id)['monto_validado'])
 
     def tiene_pagos_pendientes(self, factura_id: int) -> bool:
-        return PagoModel.objects.filter(
-            factura_id=factura_id,
-            metodo=MetodoPagoEnum.TRANSFERENCIA.value,
-            validado=False
-        ).exists()
+        return self.obtener_resumen_pagos(factura_id)['monto_por_validar'] > 0
+
+    def obtener_resumen_transferencias(self, factura_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        if not factura_ids:
+            return {}
+        filas = FacturaModel.objects.filter(id__in=factura_ids, cantidad_pagos__gt=0).values_list(
+            'id', 'monto_validado', 'monto_por_validar'
+        )
+        return {
+            factura_id: {"validado": validado, "pendientes": por_validar}
+            for factura_id, validado, por_validar in filas
+        }
+
+    def _acumular_resumen(self, deltas: Dict[int, Tuple[Decimal, Decimal, int]]) -> None:
+        """
+        Suma (validado, por_validar, cantidad) al resumen de cada factura con UN UPDATE
+        relativo (col = col + delta): no pisa cambios concurrentes de otras cajas.
+        """
+        deltas = {fid: d for fid, d in deltas.items() if fid}
+        if not deltas:
+            return
+
+        def _caso(posicion, campo):
+            return Case(
+                *[When(id=fid, then=Value(d[posicion])) for fid, d in deltas.items()],
+                default=Value(0), output_field=campo
+            )
+
+        FacturaModel.objects.filter(id__in=list(deltas)).update(
+            monto_validado=F('monto_validado') + _caso(0, DecimalField(max_digits=10, decimal_places=2)),
+            monto_por_validar=F('monto_por_validar') + _caso(1, DecimalField(max_digits=10, decimal_places=2)),
+            cantidad_pagos=F('cantidad_pagos') + _caso(2, IntegerField())
+        )
+        # Todo cambio de pagos pasa por aquí (también los que no disparan señales)
+        invalidar_kpis()
+
+    def recalcular_resumen_pagos(self, factura_ids: Optional[List[int]] = None) -> int:
+        """
+        Reparación: UN solo UPDATE ... SET col = (SELECT SUM/COUNT ...) recalculado desde
+        'pagos'. Sin factura_ids recorre todas las facturas.
+        """
+        def _suma(validado: bool):
+            return Coalesce(Subquery(
+                PagoModel.objects.filter(factura_id=OuterRef('pk'), validado=validado)
+                .order_by().values('factura_id').annotate(total=Sum('monto_total')).values('total'),
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            ), Value(Decimal("0.00")))
+
+        cantidad = PagoModel.objects.filter(factura_id=OuterRef('pk')).order_by() \
+            .values('factura_id').annotate(total=Count('id')).values('total')
+
+        facturas = FacturaModel.objects.all()
+        if factura_ids is not None:
+            facturas = facturas.filter(id__in=factura_ids)
+        return facturas.update(
+            monto_validado=_suma(True),
+            monto_por_validar=_suma(False),
+            cantidad_pagos=Coalesce(Subquery(cantidad, output_field=IntegerField()), Value(0))
+        )
+
+    # ==========================================================================
+    # LIBRO DE CAJA DIARIO (fecha x método, solo pagos validados)
+    # ==========================================================================
+    def _acumular_caja(self, movimientos: Dict[Tuple[date, str], Tuple[Decimal, int, int]]) -> None:
+        """
+        Suma (total, cantidad, recibos) a cada fila (fecha, método) del libro de caja con un
+        UPDATE relativo; la fila del día se crea la primera vez (con reintento si otra caja
+        la creó al mismo tiempo).
+        """
+        for (fecha, metodo), (total, cantidad, recibos) in movimientos.items():
+            incremento = dict(
+                total=F('total') + total, cantidad=F('cantidad') + cantidad, recibos=F('recibos') + recibos
+            )
+            fila = CajaDiariaModel.objects.filter(fecha=fecha, metodo=metodo)
+            if fila.update(**incremento):
+                continue
+            try:
+                with transaction.atomic():
+                    CajaDiariaModel.objects.create(
+                        fecha=fecha, metodo=metodo, total=total, cantidad=cantidad, recibos=recibos
+                    )
+            except IntegrityError:
+                fila.update(**incremento)
+        if movimientos:
+            invalidar_kpis()  # recaudado_hoy
+
+    @staticmethod
+    def _sumar_movimiento(movimientos, fecha_registro, metodo, monto, primera_linea: bool, signo: int = 1) -> None:
+        clave = (timezone.localdate(fecha_registro), metodo)
+        total, cantidad, recibos = movimientos.get(clave, (Decimal("0.00"), 0, 0))
+        movimientos[clave] = (total + signo * monto, cantidad + signo, recibos + (signo if primera_linea else 0))
+
+    def _movimientos_de_pagos(self, pago_ids: List[int], signo: int = 1) -> Dict[Tuple[date, str], Tuple[Decimal, int, int]]:
+        """Movimientos de caja de pagos ya guardados (1 consulta a sus líneas)."""
+        movimientos: Dict[Tuple[date, str], Tuple[Decimal, int, int]] = {}
+        if not pago_ids:
+            return movimientos
+        anterior = None
+        for pago_id, fecha_registro, metodo, monto in DetallePagoModel.objects.filter(pago_id__in=pago_ids) \
+                .order_by('pago_id', 'id').values_list('pago_id', 'pago__fecha_registro', 'metodo', 'monto'):
+            self._sumar_movimiento(movimientos, fecha_registro, metodo, monto, pago_id != anterior, signo)
+            anterior = pago_id
+        return movimientos
+
+    def registrar_en_caja(self, pago_ids: List[int]) -> None:
+        """Lleva al libro de caja pagos validados creados fuera de este repositorio (recibos comerciales)."""
+        self._acumular_caja(self._movimientos_de_pagos(pago_ids))
+
+    def recalcular_caja_diaria(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> int:
+        """
+        Reparación: reconstruye las filas del libro de caja del rango desde las líneas de
+        los pagos validados (1 agregación agrupada por fecha local y método). El DELETE y
+        el INSERT van en una transacción: un fallo a mitad no deja el rango vacío.
+        """
+        lineas = DetallePagoModel.objects.filter(pago__validado=True)
+        filas = CajaDiariaModel.objects.all()
+        if desde:
+            lineas = lineas.filter(pago__fecha_registro__gte=timezone.make_aware(datetime.combine(desde, time.min)))
+            filas = filas.filter(fecha__gte=desde)
+        if hasta:
+            lineas = lineas.filter(pago__fecha_registro__lt=timezone.make_aware(datetime.combine(hasta + timedelta(days=1), time.min)))
+            filas = filas.filter(fecha__lte=hasta)
+
+        primera_linea = DetallePagoModel.objects.filter(pago_id=OuterRef('pago_id')).order_by('id').values('id')[:1]
+        # Fecha local = UTC + desfase fijo (Ecuador no tiene horario de verano), truncada "en UTC":
+        # TruncDate con la zona activa usa CONVERT_TZ con nombre de zona en MySQL, que retorna
+        # NULL si el servidor no tiene cargadas las tablas de zonas horarias.
+        desfase = timezone.localtime().utcoffset()
+        agregados = lineas.annotate(
+            dia=TruncDate(F('pago__fecha_registro') + Value(desfase), tzinfo=dt_timezone.utc),
+            primera=Subquery(primera_linea)
+        ).values('dia', 'metodo').annotate(
+            suma_total=Sum('monto'),
+            suma_cantidad=Count('id'),
+            suma_recibos=Count(Case(When(id=F('primera'), then=Value(1))))
+        ).order_by()
+
+        with transaction.atomic():
+            nuevas = []
+            for a in agregados:
+                if a['dia'] is None:
+                    raise RuntimeError("La base de datos no pudo obtener la fecha local de los pagos.")
+                nuevas.append(CajaDiariaModel(
+                    fecha=a['dia'], metodo=a['metodo'], total=a['suma_total'],
+                    cantidad=a['suma_cantidad'], recibos=a['suma_recibos']
+                ))
+            filas.delete()
+            return len(CajaDiariaModel.objects.bulk_create(nuevas, batch_size=500))
 
-    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> None:
+    # ==========================================================================
+    # ESCRITURA DE PAGOS (cada operación ajusta el resumen en su transacción)
+    # ==========================================================================
+    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> List[str]:
         """
         Registra pagos provenientes de caja (Ventanilla).
         Soporta EFECTIVO y TRANSFERENCIA.
         Si viene transferencia por aquí (Mixto), se asume validada porque el cajero ya revisó.
+        Los reintentos del cliente se resuelven con Idempotency-Key en la API, y una factura
+        PAGADA no admite un segundo cobro: aquí no se borra nada.
         """
-        # Limpiamos solo pagos que podríamos estar reescribiendo en esta sesión de caja
-        # OJO: Si borramos transferencias anteriores validadas por tesorería sería un error.
-        # Pero aquí asumimos pagos "nuevos" de esta transacción.
-        # Para evitar duplicados en reintentos, podríamos borrar por 'origen' si tuviéramos ese campo.
-        # Por ahora, mantenemos la limpieza de EFECTIVO para idempotencia básica,
-        # y agregamos las transferencias nuevas.
-        
-        # Eliminar efectivo previo de esta factura (idempotencia simple)
-        PagoModel.objects.filter(
-            factura_id=factura_id,
-            metodo=MetodoPagoEnum.EFECTIVO.value
-        ).delete()
-        
-        pagos_a_crear = []
-        for p in pagos:
-            metodo = p.get('metodo')
-            monto = Decimal(str(p['monto']))
-            referencia = p.get('referencia')
-            observacion = p.get('observacion')
-            
-            if metodo == MetodoPagoEnum.EFECTIVO.value:
-                pagos_a_crear.append(PagoModel(
-                    factura_id=factura_id,
-                    metodo=MetodoPagoEnum.EFECTIVO.value,
-                    monto=monto,
-                    referencia=None, # Efectivo no tiene ref
-                    observacion=observacion,
-                    validado=True
-                ))
-            
-            elif metodo == MetodoPagoEnum.TRANSFERENCIA.value:
-                # Si es transferencia en Ventanilla (Mixto), nace validada.
-                pagos_a_crear.append(PagoModel(
-                    factura_id=factura_id,
-                    metodo=MetodoPagoEnum.TRANSFERENCIA.value,
+        socio_id = FacturaModel.objects.values_list('socio_id', flat=True).get(id=factura_id)
+        return self.registrar_cobro_multiple(socio_id, [{
+            "factura_id": factura_id,
+            "monto": sum(Decimal(str(p['monto'])) for p in pagos),
+            "detalles": pagos
+        }])
+
+    def registrar_cobro_multiple(self, socio_id: int, asignaciones: List[Dict[str, Any]]) -> List[str]:
+        """
+        Un recibo (PagoModel) por factura + sus líneas por método (DetallePagoModel),
+        con dos INSERT en bloque. Los recibos de caja nacen validados.
+        Retorna los números de comprobante en el orden de 'asignaciones'.
+        """
+        cabeceras = []
+        for asignacion in asignaciones:
+            observaciones = [d.get('observacion') for d in asignacion['detalles'] if d.get('observacion')]
+            if any(d.get('metodo') == MetodoPagoEnum.TRANSFERENCIA.value for d in asignacion['detalles']):
+                observaciones.append("(Val. Ventanilla)")
+            cabeceras.append(PagoModel(
+                socio_id=socio_id,
+                factura_id=asignacion['factura_id'],
+                # bulk_create no ejecuta save(): el número se genera aquí
+                numero_comprobante_interno=f"REC-{uuid.uuid4().hex[:8].upper()}",
+                monto_total=Decimal(str(asignacion['monto'])),
+                observacion=" ".join(observaciones) or None,
+                validado=True
+            ))
+
+        if not cabeceras:
+            return []
+        PagoModel.objects.bulk_create(cabeceras, batch_size=500)
+        if any(c.id is None for c in cabeceras):
+            # MySQL no devuelve los ids del INSERT en bloque: se recuperan por el número de
+            # comprobante (único y generado aquí), nunca por posición ni por los demás campos
+            ids = dict(PagoModel.objects.filter(
+                numero_comprobante_interno__in=[c.numero_comprobante_interno for c in cabeceras]
+            ).values_list('numero_comprobante_interno', 'id'))
+            for cabecera in cabeceras:
+                cabecera.id = ids[cabecera.numero_comprobante_interno]
+        PagoModel.history.bulk_history_create(cabeceras, batch_size=500)
+
+        detalles = []
+        movimientos: Dict[Tuple[date, str], Tuple[Decimal, int, int]] = {}
+        for cabecera, asignacion in zip(cabeceras, asignaciones):
+            for i, d in enumerate(asignacion['detalles']):
+                metodo = d.get('metodo')
+                monto = Decimal(str(d['monto']))
+                detalles.append(DetallePagoModel(
+                    pago_id=cabecera.id,
+                    metodo=metodo,
                     monto=monto,
-                    referencia=referencia,
-                    observacion=f"{observacion or ''} (Val. Ventanilla)",
-                    validado=True 
+                    referencia=None if metodo == MetodoPagoEnum.EFECTIVO.value else d.get('referencia')
                 ))
+                self._sumar_movimiento(movimientos, cabecera.fecha_registro, metodo, monto, i == 0)
+        bulk_create_with_history(detalles, DetallePagoModel, batch_size=500)
 
-        if pagos_a_crear:
-            PagoModel.objects.bulk_create(pagos_a_crear)
+        self._acumular_resumen({
+            c.factura_id: (c.monto_total, Decimal("0.00"), 1) for c in cabeceras
+        })
+        self._acumular_caja(movimientos)
+        return [c.numero_comprobante_interno for c in cabeceras]
+
+    def reportar_transferencia(self, factura_id: int, monto: Decimal, referencia: str, comprobante: Any = None) -> Dict[str, Any]:
+        """Transferencia subida por el socio: nace NO validada (requiere revisión de Tesorería)."""
+        socio_id = FacturaModel.objects.values_list('socio_id', flat=True).get(id=factura_id)
+        pago = PagoModel(
+            socio_id=socio_id,
+            factura_id=factura_id,
+            monto_total=monto,
+            validado=False
+        )
+        pago.save()
+        detalle = DetallePagoModel.objects.create(
+            pago=pago,
+            metodo=MetodoPagoEnum.TRANSFERENCIA.value,
+            monto=monto,
+            referencia=referencia,
+            comprobante_imagen=comprobante
+        )
+        self._acumular_resumen({factura_id: (Decimal("0.00"), monto, 1)})
+        return {
+            "pago_id": pago.id,
+            "detalle_id": detalle.id,
+            "foto_url": detalle.comprobante_imagen.url if detalle.comprobante_imagen else None
+        }
+
+    def aprobar_transferencia(self, pago_id: int) -> Optional[int]:
+        """Marca el pago como validado y mueve su monto de 'por validar' a 'validado'. Retorna la factura."""
+        pago = PagoModel.objects.select_for_update().get(id=pago_id)
+        if not pago.validado:
+            pago.validado = True
+            pago.save(update_fields=['validado'])
+            self._acumular_resumen({pago.factura_id: (pago.monto_total, -pago.monto_total, 0)})
+            self._acumular_caja(self._movimientos_de_pagos([pago.id]))
+        return pago.factura_id
+
+    def listar_pendientes_validacion(
+        self, limite: int, despues_de: Optional[Tuple[datetime, int]] = None,
+        barrio_id: Optional[int] = None, desde: Optional[date] = None, hasta: Optional[date] = None,
+        monto_min: Optional[Decimal] = None, monto_max: Optional[Decimal] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Página de la cola de validación ordenada por (fecha_registro, id), por keyset:
+        'despues_de' es la última fila de la página anterior (usa pagos_cola_validacion_idx,
+        el costo no crece con el número de página). 2 consultas: pagos + sus detalles.
+        """
+        pagos = PagoModel.objects.filter(validado=False, factura__isnull=False)
+        if barrio_id:
+            pagos = pagos.filter(socio__barrio_id=barrio_id)
+        # Rangos sobre la columna (no __date) para que el índice siga siendo utilizable
+        if desde:
+            pagos = pagos.filter(fecha_registro__gte=timezone.make_aware(datetime.combine(desde, time.min)))
+        if hasta:
+            pagos = pagos.filter(fecha_registro__lt=timezone.make_aware(datetime.combine(hasta + timedelta(days=1), time.min)))
+        if monto_min is not None:
+            pagos = pagos.filter(monto_total__gte=monto_min)
+        if monto_max is not None:
+            pagos = pagos.filter(monto_total__lte=monto_max)
+        if despues_de:
+            fecha, pago_id = despues_de
+            pagos = pagos.filter(Q(fecha_registro__gt=fecha) | Q(fecha_registro=fecha, id__gt=pago_id))
+
+        filas = list(pagos.order_by('fecha_registro', 'id').values(
+            'id', 'factura_id', 'fecha_registro', 'monto_total',
+            'socio__nombres', 'socio__apellidos', 'socio__identificacion', 'socio__barrio_id',
+            'factura__total', 'factura__monto_validado', 'factura__monto_por_validar'
+        )[:limite])
+        if not filas:
+            return filas
+
+        # Primer detalle de cada pago (la transferencia subida tiene uno solo)
+        detalles: Dict[int, Tuple] = {}
+        for pago_id, *datos in DetallePagoModel.objects.filter(pago_id__in=[f['id'] for f in filas]).order_by('-id') \
+                .values_list('pago_id', 'referencia', 'comprobante_imagen', 'comprobante_miniatura'):
+            detalles[pago_id] = datos
+        for fila in filas:
+            fila['referencia'], fila['comprobante_imagen'], fila['comprobante_miniatura'] = \
+                detalles.get(fila['id'], (None, None, None))
+        return filas
+
+    def listar_transferencias_por_validar(self) -> List[Tuple[int, str, Decimal]]:
+        return list(DetallePagoModel.objects.filter(
+            pago__validado=False,
+            metodo=MetodoPagoEnum.TRANSFERENCIA.value
+        ).order_by('pago_id').values_list('pago_id', 'referencia', 'monto'))
+
+    def aprobar_transferencias(self, pago_ids: List[int]) -> int:
+        """Versión en bloque de aprobar_transferencia: 1 UPDATE (+ historial) y 1 UPDATE de resumen."""
+        if not pago_ids:
+            return 0
+        pagos = list(PagoModel.objects.select_for_update().filter(id__in=pago_ids, validado=False))
+        deltas: Dict[int, Tuple[Decimal, Decimal, int]] = {}
+        for pago in pagos:
+            pago.validado = True
+            validado, por_validar, _ = deltas.get(pago.factura_id, (Decimal("0.00"), Decimal("0.00"), 0))
+            deltas[pago.factura_id] = (validado + pago.monto_total, por_validar - pago.monto_total, 0)
+
+        bulk_update_with_history(pagos, PagoModel, ['validado'], batch_size=500)
+        self._acumular_resumen(deltas)
+        self._acumular_caja(self._movimientos_de_pagos([p.id for p in pagos]))
+        return len(pagos)
+
+    def rechazar_transferencia(self, pago_id: int) -> Tuple[Optional[int], bool]:
+        """Elimina el pago. Retorna (factura_id, ¿quedan pagos por validar en la factura?)."""
+        pago = PagoModel.objects.select_for_update().get(id=pago_id)
+        factura_id = pago.factura_id
+        if pago.validado:
+            delta = (-pago.monto_total, Decimal("0.00"), -1)
+            # Ya estaba en la caja del día de su registro: se descuenta
+            self._acumular_caja(self._movimientos_de_pagos([pago.id], signo=-1))
+        else:
+            delta = (Decimal("0.00"), -pago.monto_total, -1)
+        pago.delete()
+        self._acumular_resumen({factura_id: delta})
+
+        if not factura_id:
+            return None, False
+        return factura_id, self.obtener_resumen_pagos(factura_id)['monto_por_validar'] > 0
+
+    def obtener_recibo(self, numero_comprobante: str) -> Optional[Dict[str, Any]]:
+        """Datos del recibo para impresión en ventanilla: 2 consultas (recibo + sus métodos)."""
+        pago = PagoModel.objects.filter(numero_comprobante_interno=numero_comprobante).values(
+            'id', 'numero_comprobante_interno', 'fecha_registro', 'monto_total', 'observacion', 'validado',
+            'socio__nombres', 'socio__apellidos', 'socio__identificacion',
+            'factura_id', 'factura__anio', 'factura__mes', 'factura__total', 'factura__monto_validado'
+        ).first()
+        if not pago:
+            return None
+
+        factura = None
+        if pago['factura_id']:
+            factura = {
+                "id": pago['factura_id'],
+                "periodo": f"{pago['factura__anio']}-{pago['factura__mes']:02d}",
+                "total": pago['factura__total'],
+                "pagado": pago['factura__monto_validado'],
+                "saldo": max(pago['factura__total'] - pago['factura__monto_validado'], Decimal("0.00")),
+            }
+        return {
+            "numero": pago['numero_comprobante_interno'],
+            "fecha": timezone.localtime(pago['fecha_registro']),
+            "socio": f"{pago['socio__nombres']} {pago['socio__apellidos']}",
+            "identificacion": pago['socio__identificacion'],
+            "monto_total": pago['monto_total'],
+            "observacion": pago['observacion'],
+            "validado": pago['validado'],
+            "factura": factura,
+            "detalles": [
+                {"metodo": metodo, "monto": monto, "referencia": referencia}
+                for metodo, monto, referencia in DetallePagoModel.objects.filter(pago_id=pago['id'])
+                .order_by('id').values_list('metodo', 'monto', 'referencia')
+            ],
+        }
 
     def obtener_ultimos_pagos(self, socio_id: int, limite: int = 5) -> List[dict]:
         """
         Retorna los últimos pagos realizados por el socio.
         Incluye el link al PDF de la factura pagada si existe.
         """
-        # Obtenemos los pagos a través de la relación con Factura -> Socio
         pagos = PagoModel.objects.filter(
-            factura__socio_id=socio_id,
+            socio_id=socio_id,
             validado=True
         ).select_related('factura').order_by('-fecha_registro')[:limite]
 
@@ -89,16 +414,16 @@ class DjangoPagoRepository(IPagoRepository):
         for p in pagos:
             # Construimos la URL del PDF si existe en la factura
             pdf_url = None
-            if p.factura.archivo_pdf:
+            if p.factura and p.factura.archivo_pdf:
                 pdf_url = p.factura.archivo_pdf.url
-            
+
             # Formato simple para cumplir contrato
             item = {
                 "fecha": p.fecha_registro.date(),
-                "monto": p.monto,
-                "recibo_nro": f"PAG-{p.id}", # Generamos un ID de recibo virtual
+                "monto": p.monto_total,
+                "recibo_nro": p.numero_comprobante_interno,
                 "archivo_pdf": pdf_url
             }
             resultado.append(item)
-            
+
         return resultado
@@ -9,7 +9,7 @@ class DjangoServicioRepository(IServicioRepository):
         return ServicioModel.objects.filter(
             tipo='FIJO',
             activo=True
-        ).select_related('socio', 'terreno')
+        ).select_related('socio', 'terreno', 'terreno__barrio')
 
     def create_automatico(self, terreno_id: int, socio_id: int, tipo: str, valor: float) -> Any:
         return ServicioModel.objects.create(
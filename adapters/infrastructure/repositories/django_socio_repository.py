@@ -2,6 +2,7 @@ from typing import List, Optional
 from core.domain.socio import Socio
 from core.interfaces.repositories import ISocioRepository
 from adapters.infrastructure.models import SocioModel
+from adapters.infrastructure.services.catastro_snapshot import invalidar_catastro
 
 # Manejo robusto de Enums para evitar errores de importación
 try:
@@ -121,6 +122,7 @@ class DjangoSocioRepository(ISocioRepository):
         if socio.id:
             # Update
             SocioModel.objects.filter(pk=socio.id).update(**data_db)
+            invalidar_catastro()  # QuerySet.update no dispara post_save
             # Recargamos para devolver el objeto fresco
             model = SocioModel.objects.get(pk=socio.id)
         else:
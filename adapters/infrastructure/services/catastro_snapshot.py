@@ -0,0 +1,257 @@
+# adapters/infrastructure/services/catastro_snapshot.py
+"""
+Snapshot en memoria del Catastro (Socio -> Terreno -> Medidor -> Servicio).
+
+Pensado para procesos masivos (facturación, previsualización, reportes, estados de
+cuenta): en lugar de recorrer el grafo con un repositorio/consulta por entidad, se carga
+TODO con 5 consultas values_list y se resuelve en memoria con búsquedas O(1).
+
+- Registros con __slots__ (sin __dict__) guardados en listas: el registro i de cada
+  lista es la fila i. Las relaciones se guardan como ÍNDICES enteros (-1 = sin relación).
+- Mapas id -> índice para ubicar cualquier entidad por su id.
+- Invalidación versionada: cada cambio de Socio/Terreno/Medidor/Servicio incrementa la
+  versión en el cache compartido (señales en adapters/infrastructure/signals.py y, para
+  los UPDATE en bloque que no disparan señales, llamadas explícitas desde los
+  repositorios). Cada proceso conserva su propio snapshot y lo reconstruye solo si la
+  versión cambió.
+- Con un cache local al proceso (LocMem/Dummy, sin REDIS_URL) la versión no se comparte
+  entre gunicorn y los workers de Celery: en ese caso no se reutiliza el snapshot y cada
+  uso carga uno nuevo (5 consultas).
+- Un id ausente del snapshot (alta confirmada después de la carga) no es prueba de que
+  no exista: los consumidores deben resolver esos casos contra la BD.
+"""
+import sys
+import threading
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from adapters.infrastructure.models import (
+    BarrioModel, SocioModel, TerrenoModel, MedidorModel, ServicioModel
+)
+
+CLAVE_VERSION_CATASTRO = "catastro:version"
+# Backends cuyo contenido no ven los demás procesos
+CACHES_LOCALES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+SIN_RELACION = -1
+
+
+class SocioReg:
+    __slots__ = ('id', 'identificacion', 'nombres', 'apellidos', 'barrio_id', 'terrenos')
+
+    def __init__(self, id, identificacion, nombres, apellidos, barrio_id):
+        self.id = id
+        self.identificacion = identificacion
+        self.nombres = nombres
+        self.apellidos = apellidos
+        self.barrio_id = barrio_id
+        self.terrenos: Tuple[int, ...] = ()
+
+
+class TerrenoReg:
+    __slots__ = ('id', 'socio', 'barrio_id', 'direccion', 'medidor', 'servicio_medido', 'servicios')
+
+    def __init__(self, id, socio, barrio_id, direccion):
+        self.id = id
+        self.socio = socio
+        self.barrio_id = barrio_id
+        self.direccion = direccion
+        self.medidor = SIN_RELACION
+        self.servicio_medido = SIN_RELACION   # Primer Servicio MEDIDO activo (menor id)
+        self.servicios: Tuple[int, ...] = ()
+
+
+class MedidorReg:
+    __slots__ = ('id', 'codigo', 'terreno')
+
+    def __init__(self, id, codigo, terreno):
+        self.id = id
+        self.codigo = codigo
+        self.terreno = terreno
+
+
+class ServicioReg:
+    __slots__ = ('id', 'socio', 'terreno', 'tipo', 'activo',
+                 'tarifa_basica_m3', 'valor_tarifa', 'tarifa_excedente_precio')
+
+    def __init__(self, id, socio, terreno, tipo, activo, tarifa_basica_m3, valor_tarifa, tarifa_excedente_precio):
+        self.id = id
+        self.socio = socio
+        self.terreno = terreno
+        self.tipo = tipo
+        self.activo = activo
+        self.tarifa_basica_m3 = tarifa_basica_m3
+        self.valor_tarifa = valor_tarifa
+        self.tarifa_excedente_precio = tarifa_excedente_precio
+
+
+class CatastroSnapshot:
+    __slots__ = ('version', 'barrios', 'socios', 'terrenos', 'medidores', 'servicios',
+                 '_idx_socio', '_idx_terreno', '_idx_medidor', '_idx_servicio')
+
+    def __init__(self, version: int):
+        self.version = version
+        self.barrios: Dict[int, str] = {}
+        self.socios: List[SocioReg] = []
+        self.terrenos: List[TerrenoReg] = []
+        self.medidores: List[MedidorReg] = []
+        self.servicios: List[ServicioReg] = []
+        self._idx_socio: Dict[int, int] = {}
+        self._idx_terreno: Dict[int, int] = {}
+        self._idx_medidor: Dict[int, int] = {}
+        self._idx_servicio: Dict[int, int] = {}
+
+    # =================================================================
+    # CARGA (5 consultas, sin instanciar modelos del ORM)
+    # =================================================================
+    @classmethod
+    def cargar(cls, version: int = 0) -> 'CatastroSnapshot':
+        snap = cls(version)
+        snap.barrios = dict(BarrioModel.objects.values_list('id', 'nombre'))
+
+        for fila in SocioModel.objects.order_by('id').values_list(
+                'id', 'identificacion', 'nombres', 'apellidos', 'barrio_id').iterator(chunk_size=5000):
+            snap._idx_socio[fila[0]] = len(snap.socios)
+            snap.socios.append(SocioReg(*fila))
+
+        terrenos_por_socio: Dict[int, List[int]] = {}
+        for t_id, socio_id, barrio_id, direccion in TerrenoModel.objects.order_by('id').values_list(
+                'id', 'socio_id', 'barrio_id', 'direccion').iterator(chunk_size=5000):
+            socio_idx = snap._idx_socio.get(socio_id, SIN_RELACION)
+            snap._idx_terreno[t_id] = len(snap.terrenos)
+            terrenos_por_socio.setdefault(socio_idx, []).append(len(snap.terrenos))
+            snap.terrenos.append(TerrenoReg(t_id, socio_idx, barrio_id, direccion))
+
+        for socio_idx, indices in terrenos_por_socio.items():
+            if socio_idx != SIN_RELACION:
+                snap.socios[socio_idx].terrenos = tuple(indices)
+
+        for m_id, codigo, terreno_id in MedidorModel.objects.order_by('id').values_list(
+                'id', 'codigo', 'terreno_id').iterator(chunk_size=5000):
+            terreno_idx = snap._idx_terreno.get(terreno_id, SIN_RELACION)
+            snap._idx_medidor[m_id] = len(snap.medidores)
+            if terreno_idx != SIN_RELACION:
+                snap.terrenos[terreno_idx].medidor = len(snap.medidores)
+            snap.medidores.append(MedidorReg(m_id, codigo, terreno_idx))
+
+        servicios_por_terreno: Dict[int, List[int]] = {}
+        # Las tarifas se repiten entre miles de servicios: un solo objeto por valor distinto
+        tarifas: Dict[Decimal, Decimal] = {}
+        for fila in ServicioModel.objects.order_by('id').values_list(
+                'id', 'socio_id', 'terreno_id', 'tipo', 'activo',
+                'tarifa_basica_m3', 'valor_tarifa', 'tarifa_excedente_precio').iterator(chunk_size=5000):
+            s_id, socio_id, terreno_id, tipo, activo, base_m3, valor, excedente = fila
+            terreno_idx = snap._idx_terreno.get(terreno_id, SIN_RELACION)
+            idx = len(snap.servicios)
+            snap._idx_servicio[s_id] = idx
+            snap.servicios.append(ServicioReg(
+                s_id, snap._idx_socio.get(socio_id, SIN_RELACION), terreno_idx,
+                sys.intern(tipo), activo, base_m3,
+                tarifas.setdefault(Decimal(valor), Decimal(valor)),
+                tarifas.setdefault(Decimal(excedente), Decimal(excedente))
+            ))
+            if terreno_idx != SIN_RELACION:
+                servicios_por_terreno.setdefault(terreno_idx, []).append(idx)
+                terreno = snap.terrenos[terreno_idx]
+                # Igual que get_active_by_terreno_and_type(...).first(): menor id
+                if tipo == 'MEDIDO' and activo and terreno.servicio_medido == SIN_RELACION:
+                    terreno.servicio_medido = idx
+
+        for terreno_idx, indices in servicios_por_terreno.items():
+            snap.terrenos[terreno_idx].servicios = tuple(indices)
+
+        return snap
+
+    # =================================================================
+    # BÚSQUEDAS O(1)
+    # =================================================================
+    def socio(self, socio_id: int) -> Optional[SocioReg]:
+        idx = self._idx_socio.get(socio_id)
+        return self.socios[idx] if idx is not None else None
+
+    def terreno(self, terreno_id: int) -> Optional[TerrenoReg]:
+        idx = self._idx_terreno.get(terreno_id)
+        return self.terrenos[idx] if idx is not None else None
+
+    def medidor(self, medidor_id: int) -> Optional[MedidorReg]:
+        idx = self._idx_medidor.get(medidor_id)
+        return self.medidores[idx] if idx is not None else None
+
+    def servicio(self, servicio_id: int) -> Optional[ServicioReg]:
+        idx = self._idx_servicio.get(servicio_id)
+        return self.servicios[idx] if idx is not None else None
+
+    def nombre_barrio(self, barrio_id: Optional[int]) -> Optional[str]:
+        return self.barrios.get(barrio_id)
+
+    def resolver_medidor(self, medidor_id: int) -> Tuple[Optional[MedidorReg], Optional[TerrenoReg],
+                                                        Optional[SocioReg], Optional[ServicioReg]]:
+        """medidor -> (medidor, terreno, socio, servicio MEDIDO activo) sin tocar la BD."""
+        medidor = self.medidor(medidor_id)
+        if medidor is None or medidor.terreno == SIN_RELACION:
+            return medidor, None, None, None
+        terreno = self.terrenos[medidor.terreno]
+        socio = self.socios[terreno.socio] if terreno.socio != SIN_RELACION else None
+        servicio = self.servicios[terreno.servicio_medido] if terreno.servicio_medido != SIN_RELACION else None
+        return medidor, terreno, socio, servicio
+
+    def __len__(self) -> int:
+        return len(self.socios)
+
+
+# =====================================================================
+# SNAPSHOT COMPARTIDO (por proceso) CON INVALIDACIÓN VERSIONADA
+# =====================================================================
+_snapshot: Optional[CatastroSnapshot] = None
+_lock = threading.Lock()
+
+
+def version_catastro() -> int:
+    version = cache.get(CLAVE_VERSION_CATASTRO)
+    if version is None:
+        cache.add(CLAVE_VERSION_CATASTRO, 1, timeout=None)
+        version = cache.get(CLAVE_VERSION_CATASTRO, 1)
+    return version
+
+
+def _incrementar_version() -> None:
+    try:
+        cache.incr(CLAVE_VERSION_CATASTRO)
+    except ValueError:
+        cache.add(CLAVE_VERSION_CATASTRO, 2, timeout=None)
+
+
+def invalidar_catastro() -> None:
+    """
+    Incrementa la versión cuando la transacción en curso se confirme (de inmediato si no
+    hay una): los otros procesos no deben recargar antes de que el cambio sea visible.
+    """
+    transaction.on_commit(_incrementar_version)
+
+
+def cache_compartido() -> bool:
+    return settings.CACHES['default']['BACKEND'] not in CACHES_LOCALES
+
+
+def obtener_catastro() -> CatastroSnapshot:
+    """Snapshot vigente del proceso; solo consulta la BD si la versión cambió."""
+    global _snapshot
+    if not cache_compartido():
+        # Sin versión compartida no hay forma de saber si otro proceso cambió el catastro
+        return CatastroSnapshot.cargar()
+
+    version = version_catastro()
+    snap = _snapshot
+    if snap is not None and snap.version == version:
+        return snap
+
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = CatastroSnapshot.cargar(version)
+        return _snapshot
@@ -0,0 +1,22 @@
+# adapters/infrastructure/services/celery_cola_sri.py
+from typing import List
+
+from django.db import transaction
+
+from core.interfaces.services import IColaEmisionSRI
+
+
+class CeleryColaEmisionSRI(IColaEmisionSRI):
+    """
+    Encola la emisión SRI de un lote de facturas como UNA tarea de Celery.
+    Se despacha en on_commit: si el cobro se revierte, no se emite nada, y el
+    worker nunca lee facturas que aún no están confirmadas como PAGADAS.
+    """
+
+    def encolar(self, factura_ids: List[int]) -> None:
+        if not factura_ids:
+            return
+        from adapters.infrastructure.tasks import emitir_facturas_sri_task
+
+        ids = list(factura_ids)
+        transaction.on_commit(lambda: emitir_facturas_sri_task.delay(ids))
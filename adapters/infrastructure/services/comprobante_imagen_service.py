@@ -0,0 +1,67 @@
+# adapters/infrastructure/services/comprobante_imagen_service.py
+"""
+Optimización de las fotos de comprobantes de pago subidas desde el celular.
+
+La subida solo guarda el archivo original; una tarea de Celery (procesar_comprobante_task)
+llama a optimizar_comprobante() para:
+- aplicar la orientación EXIF y descartar TODOS los metadatos (GPS, modelo del equipo),
+- reducir la imagen a un lado máximo legible y re-codificarla como JPEG,
+- generar la miniatura que muestra la cola de validación de Tesorería.
+Funciona con cualquier backend de STORAGES (disco local o S3).
+"""
+import logging
+import os
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from adapters.infrastructure.models import DetallePagoModel
+
+logger = logging.getLogger(__name__)
+
+LADO_MAXIMO = 1600          # px: suficiente para leer montos y referencias
+LADO_MINIATURA = 320        # px: vista previa en la cola de validación
+CALIDAD_JPEG = 80
+CALIDAD_MINIATURA = 70
+
+
+def _recodificar(imagen: Image.Image, lado: int, calidad: int) -> ContentFile:
+    copia = imagen.copy()
+    copia.thumbnail((lado, lado), Image.Resampling.LANCZOS)
+    salida = BytesIO()
+    # Sin 'exif=': Pillow no copia los metadatos al re-codificar
+    copia.save(salida, format="JPEG", quality=calidad, optimize=True, progressive=True)
+    return ContentFile(salida.getvalue())
+
+
+def optimizar_comprobante(detalle_id: int) -> bool:
+    """Procesa la imagen del detalle. Retorna False si no hay nada que procesar (idempotente)."""
+    detalle = DetallePagoModel.objects.filter(id=detalle_id).first()
+    if not detalle or not detalle.comprobante_imagen or detalle.comprobante_procesado:
+        return False
+
+    original = detalle.comprobante_imagen
+    with original.open("rb") as archivo:
+        imagen = Image.open(archivo)
+        # JPEG: decodifica directamente a escala reducida (fotos de 12 MP -> mucho menos memoria)
+        imagen.draft("RGB", (LADO_MAXIMO, LADO_MAXIMO))
+        imagen = ImageOps.exif_transpose(imagen)  # Fotos de celular rotadas por EXIF
+        if imagen.mode not in ("RGB", "L"):
+            imagen = imagen.convert("RGB")
+        imagen.load()
+
+    nombre_base = os.path.splitext(os.path.basename(original.name))[0]
+    nombre_anterior = original.name
+
+    detalle.comprobante_imagen.save(f"{nombre_base}.jpg", _recodificar(imagen, LADO_MAXIMO, CALIDAD_JPEG), save=False)
+    detalle.comprobante_miniatura.save(
+        f"{nombre_base}_min.jpg", _recodificar(imagen, LADO_MINIATURA, CALIDAD_MINIATURA), save=False
+    )
+    detalle.comprobante_procesado = True
+    detalle.save(update_fields=["comprobante_imagen", "comprobante_miniatura", "comprobante_procesado"])
+
+    if nombre_anterior != detalle.comprobante_imagen.name:
+        original.storage.delete(nombre_anterior)
+    logger.info(f"🖼️ Comprobante {detalle_id} optimizado ({detalle.comprobante_imagen.name}).")
+    return True
@@ -0,0 +1,64 @@
+# adapters/infrastructure/services/dashboard_kpis.py
+"""
+KPIs del dashboard de Tesorería en el cache compartido.
+
+Cada pantalla de tesorero consulta los KPIs cada pocos segundos: se calculan una sola vez
+y se sirven desde el cache hasta que una escritura de facturas o pagos los invalida
+(señales en adapters/infrastructure/signals.py y, para los UPDATE en bloque que no
+disparan señales, llamadas explícitas desde los repositorios). La invalidación se
+ejecuta con on_commit: ningún proceso recalcula antes de que el cambio sea visible.
+El TTL (DASHBOARD_KPIS_TTL) solo acota cuánto dura un valor si algo escapara a la
+invalidación, por ejemplo el cambio de mes o de día.
+Sin REDIS_URL el respaldo LocMem es por proceso: la invalidación solo alcanza al proceso
+que escribió y los demás workers pueden mostrar valores de hasta DASHBOARD_KPIS_TTL.
+"""
+from decimal import Decimal
+from typing import Any, Dict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from core.shared.enums import EstadoFactura
+from adapters.infrastructure.models import FacturaModel, PagoModel, CajaDiariaModel
+
+CLAVE_KPIS = "dashboard:kpis"
+
+
+def _calcular_kpis() -> Dict[str, Any]:
+    """3 consultas: un solo recorrido agregado de facturas, la cola de validación y el libro de caja."""
+    hoy = timezone.localdate()
+    facturas = FacturaModel.objects.aggregate(
+        emitidas_mes=Count('id', filter=Q(anio=hoy.year, mes=hoy.month)),
+        pendientes=Count('id', filter=Q(estado=EstadoFactura.PENDIENTE.value)),
+        # Cobradas que aún no tienen autorización del SRI
+        pendientes_sri=Count('id', filter=Q(estado=EstadoFactura.PAGADA.value) & ~Q(estado_sri='AUTORIZADO')),
+    )
+    # Misma condición que la cola de validación (pagos_cola_validacion_idx)
+    transferencias = PagoModel.objects.filter(validado=False, factura__isnull=False).count()
+    recaudado = CajaDiariaModel.objects.filter(fecha=hoy).aggregate(total=Sum('total'))['total']
+
+    return {
+        "facturas_emitidas_mes": facturas['emitidas_mes'],
+        "pendientes_cobro": facturas['pendientes'],
+        "pendientes_sri": facturas['pendientes_sri'],
+        "transferencias_por_validar": transferencias,
+        "recaudado_hoy": recaudado or Decimal("0.00"),
+        "fecha": hoy.isoformat(),
+    }
+
+
+def obtener_kpis() -> Dict[str, Any]:
+    kpis = cache.get(CLAVE_KPIS)
+    # Un valor calculado ayer (o el mes pasado) no se reutiliza
+    if kpis is None or kpis["fecha"] != timezone.localdate().isoformat():
+        kpis = _calcular_kpis()
+        cache.set(CLAVE_KPIS, kpis, timeout=settings.DASHBOARD_KPIS_TTL)
+    return kpis
+
+
+def invalidar_kpis() -> None:
+    """Descarta los KPIs cuando la transacción en curso se confirme (de inmediato si no hay una)."""
+    transaction.on_commit(lambda: cache.delete(CLAVE_KPIS))
@@ -0,0 +1,186 @@
+# adapters/infrastructure/services/exportacion_service.py
+"""
+Exportación en streaming (CSV o XLSX) de facturas, pagos y lecturas para Tesorería.
+
+Las filas se leen con values_list() (sin instancias de modelo) por bloques de clave
+(WHERE id > último ORDER BY id LIMIT n): mysqlclient carga el resultado completo de cada
+consulta en memoria, así que la memoria queda acotada por el bloque y no por el total
+de filas. El recorrido por id usa la clave primaria y sale en orden de registro.
+- CSV: cada bloque de filas se envía apenas se lee (la descarga empieza de inmediato).
+- XLSX: openpyxl en modo write-only vuelca las filas a un archivo temporal (no arma la
+  hoja en memoria); el libro terminado se envía por partes.
+
+Los textos que empiezan con =, +, -, @ (o tabulador/retorno) se anteponen con ' para que
+Excel no los evalúe como fórmulas (inyección de fórmulas en CSV/XLSX).
+"""
+import csv
+import tempfile
+from datetime import date, datetime, time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db.models import QuerySet
+from django.utils import timezone
+from openpyxl import Workbook
+
+from core.shared.enums import EstadoFactura
+from adapters.infrastructure.models import FacturaModel, PagoModel, LecturaModel
+
+TAMANO_BLOQUE = 2000          # Filas por viaje a la BD
+TAMANO_PARTE_XLSX = 64 * 1024  # Bytes por parte al enviar el libro
+INICIO_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+# (encabezado, campo de values_list) por recurso
+COLUMNAS: Dict[str, List[Tuple[str, str]]] = {
+    "facturas": [
+        ("id", "id"), ("anio", "anio"), ("mes", "mes"), ("fecha_emision", "fecha_emision"),
+        ("fecha_vencimiento", "fecha_vencimiento"), ("identificacion", "socio__identificacion"),
+        ("apellidos", "socio__apellidos"), ("nombres", "socio__nombres"), ("barrio", "socio__barrio__nombre"),
+        ("estado", "estado"), ("subtotal", "subtotal"), ("impuestos", "impuestos"), ("total", "total"),
+        ("monto_validado", "monto_validado"), ("monto_por_validar", "monto_por_validar"),
+        ("estado_sri", "estado_sri"), ("clave_acceso_sri", "clave_acceso_sri"),
+    ],
+    "pagos": [
+        ("id", "id"), ("comprobante", "numero_comprobante_interno"), ("fecha_registro", "fecha_registro"),
+        ("identificacion", "socio__identificacion"), ("apellidos", "socio__apellidos"),
+        ("nombres", "socio__nombres"), ("barrio", "socio__barrio__nombre"), ("factura_id", "factura_id"),
+        ("monto_total", "monto_total"), ("validado", "validado"), ("observacion", "observacion"),
+    ],
+    "lecturas": [
+        ("id", "id"), ("anio", "anio"), ("mes", "mes"), ("fecha", "fecha"), ("medidor", "medidor__codigo"),
+        ("identificacion", "medidor__terreno__socio__identificacion"),
+        ("apellidos", "medidor__terreno__socio__apellidos"), ("nombres", "medidor__terreno__socio__nombres"),
+        ("barrio", "medidor__terreno__barrio__nombre"), ("lectura_anterior", "lectura_anterior"),
+        ("valor", "valor"), ("consumo_m3", "consumo_del_mes"), ("facturada", "esta_facturada"),
+        ("observacion", "observacion"),
+    ],
+}
+
+# Valores aceptados en el filtro 'estado' de cada recurso
+ESTADOS: Dict[str, Tuple[str, ...]] = {
+    "facturas": tuple(e.value for e in EstadoFactura),
+    "pagos": ("VALIDADO", "POR_VALIDAR"),
+    "lecturas": ("FACTURADA", "PENDIENTE"),
+}
+
+
+def _rango_mes(anio: int, mes: int) -> Tuple[datetime, datetime]:
+    inicio = date(anio, mes, 1)
+    fin = date(anio + (mes == 12), mes % 12 + 1, 1)
+    return (timezone.make_aware(datetime.combine(inicio, time.min)),
+            timezone.make_aware(datetime.combine(fin, time.min)))
+
+
+def _facturas(anio, mes, barrio_id, estado) -> QuerySet:
+    filas = FacturaModel.objects.all()
+    if anio:
+        filas = filas.filter(anio=anio)
+    if mes:
+        filas = filas.filter(mes=mes)
+    if barrio_id:
+        filas = filas.filter(socio__barrio_id=barrio_id)
+    if estado:
+        filas = filas.filter(estado=estado)
+    return filas
+
+
+def _pagos(anio, mes, barrio_id, estado) -> QuerySet:
+    filas = PagoModel.objects.all()
+    # Periodo = mes de registro; rango sobre la columna para que aplique el índice
+    if anio and mes:
+        desde, hasta = _rango_mes(anio, mes)
+        filas = filas.filter(fecha_registro__gte=desde, fecha_registro__lt=hasta)
+    elif anio:
+        filas = filas.filter(fecha_registro__gte=_rango_mes(anio, 1)[0], fecha_registro__lt=_rango_mes(anio, 12)[1])
+    if barrio_id:
+        filas = filas.filter(socio__barrio_id=barrio_id)
+    if estado:
+        filas = filas.filter(validado=(estado == "VALIDADO"))
+    return filas
+
+
+def _lecturas(anio, mes, barrio_id, estado) -> QuerySet:
+    filas = LecturaModel.objects.all()
+    if anio:
+        filas = filas.filter(anio=anio)
+    if mes:
+        filas = filas.filter(mes=mes)
+    if barrio_id:
+        filas = filas.filter(medidor__terreno__barrio_id=barrio_id)
+    if estado:
+        filas = filas.filter(esta_facturada=(estado == "FACTURADA"))
+    return filas
+
+
+CONSULTAS: Dict[str, Callable[..., QuerySet]] = {
+    "facturas": _facturas,
+    "pagos": _pagos,
+    "lecturas": _lecturas,
+}
+
+
+def encabezados(recurso: str) -> List[str]:
+    return [encabezado for encabezado, _ in COLUMNAS[recurso]]
+
+
+def filas(recurso: str, anio: Optional[int] = None, mes: Optional[int] = None,
+          barrio_id: Optional[int] = None, estado: Optional[str] = None) -> Iterator[tuple]:
+    """Tuplas en el orden de encabezados(recurso), leídas por bloques de TAMANO_BLOQUE ids."""
+    consulta = CONSULTAS[recurso](anio, mes, barrio_id, estado).order_by('id')
+    campos = [campo for _, campo in COLUMNAS[recurso]]
+    ultimo_id = 0
+    while True:
+        # El id va al final: es la clave desde la que continúa el siguiente bloque
+        bloque = list(consulta.filter(id__gt=ultimo_id).values_list(*campos, 'id')[:TAMANO_BLOQUE])
+        for fila in bloque:
+            # Excel no admite fechas con zona horaria: se exporta la hora local
+            yield tuple(
+                timezone.localtime(v).replace(tzinfo=None) if isinstance(v, datetime) and timezone.is_aware(v) else v
+                for v in fila[:-1]
+            )
+        if len(bloque) < TAMANO_BLOQUE:
+            return
+        ultimo_id = bloque[-1][-1]
+
+
+# ==============================================================================
+# FORMATOS
+# ==============================================================================
+def escapar_formula(valor):
+    """Texto que Excel interpretaría como fórmula: se antepone ' para que quede como texto."""
+    if isinstance(valor, str) and valor.startswith(INICIO_FORMULA):
+        return "'" + valor
+    return valor
+
+
+class _Eco:
+    """Pseudo-archivo para csv.writer: write() retorna la línea en lugar de guardarla."""
+    def write(self, valor: str) -> str:
+        return valor
+
+
+def generar_csv(cabecera: List[str], datos: Iterable[tuple]) -> Iterator[str]:
+    escritor = csv.writer(_Eco())
+    # BOM: Excel abre el CSV como UTF-8 (tildes y ñ)
+    yield "\ufeff" + escritor.writerow(cabecera)
+    bloque: List[str] = []
+    for fila in datos:
+        bloque.append(escritor.writerow([escapar_formula(v) for v in fila]))
+        if len(bloque) >= TAMANO_BLOQUE:
+            yield "".join(bloque)
+            bloque = []
+    if bloque:
+        yield "".join(bloque)
+
+
+def generar_xlsx(cabecera: List[str], datos: Iterable[tuple], titulo: str = "Datos") -> Iterator[bytes]:
+    libro = Workbook(write_only=True)
+    hoja = libro.create_sheet(title=titulo[:31])
+    hoja.append(cabecera)
+    for fila in datos:
+        hoja.append([escapar_formula(v) for v in fila])
+
+    with tempfile.TemporaryFile() as archivo:
+        libro.save(archivo)
+        archivo.seek(0)
+        while parte := archivo.read(TAMANO_PARTE_XLSX):
+            yield parte
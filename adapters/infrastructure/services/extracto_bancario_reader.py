@@ -0,0 +1,160 @@
+# adapters/infrastructure/services/extracto_bancario_reader.py
+"""
+Lectura en streaming de extractos bancarios (CSV o XLSX) para la conciliación de
+transferencias. Las filas se entregan una a una (generador): un extracto de un mes
+completo nunca se carga entero en memoria.
+
+Las columnas se ubican por su encabezado (acepta los nombres usuales de los bancos);
+los montos aceptan formato "1.234,56" o "1,234.56".
+"""
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+from core.shared.exceptions import ValidacionError
+
+# Encabezados aceptados por columna (normalizados: minúsculas, sin tildes ni espacios extra)
+ALIAS_COLUMNAS = {
+    "referencia": ("referencia", "ref", "nro referencia", "documento", "nro documento",
+                   "numero documento", "comprobante", "nro comprobante"),
+    "monto": ("monto", "valor", "importe", "credito", "creditos", "abono", "deposito"),
+    "fecha": ("fecha", "fecha transaccion", "fecha movimiento"),
+    "descripcion": ("descripcion", "concepto", "detalle", "glosa"),
+}
+
+# Filas iniciales donde se busca el encabezado (los bancos suelen anteponer datos de la cuenta)
+MAX_FILAS_ENCABEZADO = 15
+
+_TILDES = str.maketrans("áéíóúÁÉÍÓÚñÑ", "aeiouAEIOUnN")
+
+
+def _normalizar_encabezado(valor: Any) -> str:
+    texto = str(valor or "").translate(_TILDES).lower().replace(".", " ").replace("_", " ")
+    return " ".join(texto.split())
+
+
+def a_decimal(valor: Any) -> Optional[Decimal]:
+    """Convierte montos de extracto ('$1.234,56', '1,234.56', 12.5) a Decimal con 2 decimales."""
+    if valor is None or valor == "":
+        return None
+    if isinstance(valor, (int, float, Decimal)):
+        return Decimal(str(valor)).quantize(Decimal("0.01"))
+
+    texto = re.sub(r"[^\d,.\-]", "", str(valor))
+    if "," in texto and "." in texto:
+        # El último separador es el decimal
+        if texto.rfind(",") > texto.rfind("."):
+            texto = texto.replace(".", "").replace(",", ".")
+        else:
+            texto = texto.replace(",", "")
+    elif "," in texto:
+        texto = texto.replace(",", ".")
+    try:
+        return Decimal(texto).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+
+
+def _a_fecha(valor: Any) -> Optional[date]:
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    texto = str(valor or "").strip()
+    for formato in ("%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d"):
+        try:
+            return datetime.strptime(texto[:10], formato).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _ubicar_columnas(fila: List[Any]) -> Optional[Dict[str, int]]:
+    encabezados = [_normalizar_encabezado(c) for c in fila]
+    columnas = {}
+    for campo, alias in ALIAS_COLUMNAS.items():
+        for i, encabezado in enumerate(encabezados):
+            if encabezado in alias:
+                columnas[campo] = i
+                break
+    if "referencia" in columnas and "monto" in columnas:
+        return columnas
+    return None
+
+
+def _filas_csv(archivo) -> Iterator[List[Any]]:
+    texto = io.TextIOWrapper(archivo, encoding="utf-8-sig", errors="replace", newline="")
+    muestra = texto.read(4096)
+    texto.seek(0)
+    # El Sniffer falla con las filas de cabecera del banco: se elige el separador presente
+    # en más líneas (la coma decimal de "5,00" no aparece en las filas de texto)
+    lineas = [l for l in muestra.splitlines() if l.strip()]
+    separador = max(",;\t|", key=lambda c: (sum(c in l for l in lineas), muestra.count(c)))
+    yield from csv.reader(texto, delimiter=separador)
+
+
+def _filas_xlsx(archivo) -> Iterator[List[Any]]:
+    # read_only: openpyxl recorre la hoja en streaming sin construir el modelo completo
+    try:
+        libro = load_workbook(archivo, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError):
+        # Un .xlsx es un ZIP: archivo dañado, renombrado o de otro formato (.xls)
+        raise ValidacionError("El archivo no es un XLSX válido (está dañado o tiene otro formato).")
+    try:
+        for fila in libro.active.iter_rows(values_only=True):
+            yield list(fila)
+    finally:
+        libro.close()
+
+
+def leer_extracto(archivo, nombre: str) -> Iterator[Dict[str, Any]]:
+    """
+    Genera un dict por movimiento: {"linea", "referencia", "monto", "fecha", "descripcion"}.
+    Las filas sin referencia o sin monto positivo (débitos, saldos, totales) se omiten.
+    """
+    archivo = getattr(archivo, "file", archivo)  # UploadedFile de Django -> archivo binario
+    extension = nombre.rsplit(".", 1)[-1].lower() if "." in nombre else ""
+    if extension == "xlsx":
+        filas = _filas_xlsx(archivo)
+    elif extension in ("csv", "txt"):
+        filas = _filas_csv(archivo)
+    else:
+        raise ValidacionError("Formato de extracto no soportado. Use CSV o XLSX.")
+
+    columnas = None
+    for numero, fila in enumerate(filas, start=1):
+        if columnas is None:
+            columnas = _ubicar_columnas(fila)
+            if columnas is None and numero >= MAX_FILAS_ENCABEZADO:
+                raise ValidacionError("No se encontraron las columnas 'referencia' y 'monto' en el extracto.")
+            continue
+
+        def _celda(campo):
+            i = columnas.get(campo)
+            return fila[i] if i is not None and i < len(fila) else None
+
+        referencia = _celda("referencia")
+        if isinstance(referencia, float) and referencia.is_integer():
+            referencia = int(referencia)  # Celdas numéricas de Excel: 123456.0 -> '123456'
+        referencia = str(referencia or "").strip()
+        monto = a_decimal(_celda("monto"))
+        if not referencia or monto is None or monto <= 0:
+            continue
+
+        yield {
+            "linea": numero,
+            "referencia": referencia,
+            "monto": monto,
+            "fecha": _a_fecha(_celda("fecha")),
+            "descripcion": str(_celda("descripcion") or "").strip() or None,
+        }
+
+    if columnas is None:
+        raise ValidacionError("No se encontraron las columnas 'referencia' y 'monto' en el extracto.")
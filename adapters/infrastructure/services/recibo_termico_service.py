@@ -0,0 +1,154 @@
+# adapters/infrastructure/services/recibo_termico_service.py
+"""
+Recibo de ventanilla para impresoras térmicas (58/80 mm).
+
+Alternativa liviana al RIDE de WeasyPrint: arma el recibo como texto de ancho fijo y,
+para impresión directa, lo envuelve en comandos ESC/POS (negrita, centrado y corte).
+Para impresoras sin modo RAW (o para guardar/enviar el recibo) la misma maquetación se
+dibuja en un PDF de una página del ancho del papel con ReportLab (fuente Courier, sin
+plantillas HTML). Todo se genera en milisegundos a partir de
+DjangoPagoRepository.obtener_recibo().
+"""
+from decimal import Decimal
+from io import BytesIO
+from typing import Any, Dict, List
+
+from django.conf import settings
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+# --- Comandos ESC/POS ---
+ESC = b"\x1b"
+GS = b"\x1d"
+INICIALIZAR = ESC + b"@"
+PAGINA_CODIGOS_PC850 = ESC + b"t\x02"   # Tildes y ñ
+CENTRAR = ESC + b"a\x01"
+IZQUIERDA = ESC + b"a\x00"
+NEGRITA_ON = ESC + b"E\x01"
+NEGRITA_OFF = ESC + b"E\x00"
+DOBLE_ALTO = GS + b"!\x01"
+TAMANO_NORMAL = GS + b"!\x00"
+AVANZAR_Y_CORTAR = GS + b"V\x42\x03"     # Avanza 3 líneas y corte parcial
+CODIFICACION = "cp850"
+
+# --- PDF ---
+MARGEN_PDF = 3 * mm
+ANCHO_CARACTER_COURIER = 0.6   # Courier: cada carácter mide 0.6 x el tamaño de fuente
+
+
+class ReciboTermicoService:
+    """
+    Patrón: Facade (igual que DjangoPDFService), con dos salidas:
+    - generar_texto(): texto plano de ancho fijo (vista previa / impresión del navegador).
+    - generar_escpos(): bytes listos para enviar a la impresora (RAW).
+    - generar_pdf(): PDF de una página con el ancho del papel (58/80 mm).
+    """
+
+    def __init__(self, ancho: int = None):
+        self.ancho = ancho or settings.RECIBO_ANCHO_COLUMNAS
+
+    # ------------------------------------------------------------------
+    # Salidas
+    # ------------------------------------------------------------------
+    def generar_texto(self, recibo: Dict[str, Any]) -> str:
+        return "\n".join(texto for _, texto in self._lineas(recibo)) + "\n"
+
+    def generar_escpos(self, recibo: Dict[str, Any]) -> bytes:
+        estilos = {
+            "titulo": CENTRAR + NEGRITA_ON + DOBLE_ALTO,
+            "centro": CENTRAR,
+            "total": IZQUIERDA + NEGRITA_ON,
+        }
+        salida = bytearray(INICIALIZAR + PAGINA_CODIGOS_PC850)
+        for estilo, texto in self._lineas(recibo):
+            salida += estilos.get(estilo, IZQUIERDA)
+            salida += texto.strip().encode(CODIFICACION, errors="replace") if estilo in ("titulo", "centro") \
+                else texto.encode(CODIFICACION, errors="replace")
+            salida += NEGRITA_OFF + TAMANO_NORMAL + b"\n"
+        salida += AVANZAR_Y_CORTAR
+        return bytes(salida)
+
+    def generar_pdf(self, recibo: Dict[str, Any]) -> bytes:
+        lineas = self._lineas(recibo)
+        ancho_papel = (80 if self.ancho > 32 else 58) * mm
+        # Fuente ajustada para que 'ancho' columnas ocupen el área imprimible
+        tamano = (ancho_papel - 2 * MARGEN_PDF) / (self.ancho * ANCHO_CARACTER_COURIER)
+        interlineado = tamano * 1.25
+        alto = 2 * MARGEN_PDF + interlineado * (len(lineas) + 1)
+
+        salida = BytesIO()
+        pdf = canvas.Canvas(salida, pagesize=(ancho_papel, alto))
+        pdf.setTitle(f"Recibo {recibo['numero']}")
+        y = alto - MARGEN_PDF - interlineado
+        for estilo, texto in lineas:
+            pdf.setFont("Courier-Bold" if estilo in ("titulo", "total") else "Courier", tamano)
+            pdf.drawString(MARGEN_PDF, y, texto)
+            y -= interlineado
+        pdf.showPage()
+        pdf.save()
+        return salida.getvalue()
+
+    # ------------------------------------------------------------------
+    # Maquetación (común a todas las salidas)
+    # ------------------------------------------------------------------
+    def _lineas(self, recibo: Dict[str, Any]) -> List[tuple]:
+        separador = ("normal", "-" * self.ancho)
+        lineas = [
+            ("titulo", self._centrar(settings.SRI_EMISOR_RAZON_SOCIAL or "JUNTA DE AGUA")),
+        ]
+        if settings.SRI_EMISOR_RUC:
+            lineas.append(("centro", self._centrar(f"RUC: {settings.SRI_EMISOR_RUC}")))
+        lineas += [
+            ("centro", self._centrar("RECIBO DE PAGO")),
+            separador,
+            ("normal", self._par("Recibo:", recibo["numero"])),
+            ("normal", self._par("Fecha:", recibo["fecha"].strftime("%d/%m/%Y %H:%M"))),
+            ("normal", self._recortar(f"Socio: {recibo['socio']}")),
+            ("normal", self._par("C.I./RUC:", recibo["identificacion"] or "")),
+        ]
+
+        factura = recibo.get("factura")
+        if factura:
+            lineas.append(("normal", self._par("Factura:", f"#{factura['id']} ({factura['periodo']})")))
+        lineas.append(separador)
+
+        for detalle in recibo["detalles"]:
+            lineas.append(("normal", self._par(detalle["metodo"], self._moneda(detalle["monto"]))))
+            if detalle.get("referencia"):
+                lineas.append(("normal", self._recortar(f"  Ref: {detalle['referencia']}")))
+        lineas += [
+            separador,
+            ("total", self._par("TOTAL PAGADO:", self._moneda(recibo["monto_total"]))),
+        ]
+
+        if factura:
+            lineas += [
+                ("normal", self._par("Total factura:", self._moneda(factura["total"]))),
+                ("normal", self._par("Saldo pendiente:", self._moneda(factura["saldo"]))),
+            ]
+        if not recibo.get("validado", True):
+            lineas.append(("centro", self._centrar("*** PENDIENTE DE VALIDACION ***")))
+        if recibo.get("observacion"):
+            lineas.append(("normal", self._recortar(recibo["observacion"])))
+
+        lineas += [
+            separador,
+            ("centro", self._centrar("Gracias por su pago")),
+            ("centro", self._centrar("La factura electronica llegara a su correo")),
+        ]
+        return lineas
+
+    def _par(self, izquierda: str, derecha: str) -> str:
+        """'Etiqueta ........ valor' alineado al ancho del papel."""
+        izquierda = izquierda[: max(self.ancho - len(derecha) - 1, 0)]
+        return izquierda + " " * (self.ancho - len(izquierda) - len(derecha)) + derecha
+
+    def _centrar(self, texto: str) -> str:
+        return self._recortar(texto).center(self.ancho)
+
+    def _recortar(self, texto: str) -> str:
+        return str(texto)[: self.ancho]
+
+    @staticmethod
+    def _moneda(valor: Any) -> str:
+        return f"${Decimal(valor):,.2f}"
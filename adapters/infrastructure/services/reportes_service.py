@@ -0,0 +1,271 @@
+# adapters/infrastructure/services/reportes_service.py
+"""
+Cola de reportes pesados (cartera, cierre de caja, tendencia y exportaciones).
+
+La solicitud solo registra el trabajo y lo encola; un worker de Celery genera el archivo
+(CSV o XLSX, con los mismos generadores en streaming de las exportaciones) y lo guarda en
+el storage por defecto. El cliente consulta el estado con el id y descarga el archivo.
+
+Deduplicación: los parámetros se normalizan y se resumen en una huella SHA-256. Una
+solicitud igual a otra en curso o ya generada y vigente (REPORTES_TTL_MINUTOS) recibe ese
+mismo trabajo: un segundo clic no vuelve a calcular el reporte. Las solicitudes con la
+misma huella se serializan con un bloqueo sobre su fila en reportes_candados, así dos
+clics simultáneos no crean dos trabajos.
+"""
+import hashlib
+import json
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.shared.exceptions import ValidacionError
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+from core.use_cases.reporting.generar_cierre_caja_uc import GenerarCierreCajaUseCase
+from core.use_cases.reporting.generar_tendencia_recaudacion_uc import GenerarTendenciaRecaudacionUseCase
+from adapters.infrastructure.models import ReporteGeneradoModel, ReporteCandadoModel
+from adapters.infrastructure.services import exportacion_service as exportacion
+
+FORMATOS = ('csv', 'xlsx')
+# Un trabajo en curso con más de N veces el TTL se da por perdido (su worker murió)
+FACTOR_TRABAJO_PERDIDO = 4
+
+
+def _fecha(valor) -> str:
+    return date.fromisoformat(str(valor)).isoformat()
+
+
+def _decimal(valor) -> str:
+    return str(Decimal(str(valor)))
+
+
+def _mes(valor) -> int:
+    mes = int(valor)
+    if not 1 <= mes <= 12:
+        raise ValueError("mes fuera de rango")
+    return mes
+
+
+# Parámetro -> normalizador (valor JSON estable: la huella no cambia por "5" vs 5)
+NORMALIZADORES: Dict[str, Callable[[Any], Any]] = {
+    'anio': int,
+    'mes': _mes,
+    'barrio_id': int,
+    'estado': lambda v: str(v).upper(),
+    'deuda_minima': _decimal,
+    'fecha_inicio': _fecha,
+    'fecha_fin': _fecha,
+    'granularidad': lambda v: str(v).lower(),
+}
+
+
+# ==============================================================================
+# GENERADORES: parámetros normalizados -> (encabezados, filas)
+# ==============================================================================
+def _exportacion(recurso: str):
+    def generar(p: Dict[str, Any]) -> Tuple[List[str], Iterable[tuple]]:
+        return exportacion.encabezados(recurso), exportacion.filas(recurso, **p)
+    return generar
+
+
+def _cartera(p: Dict[str, Any]) -> Tuple[List[str], Iterable[tuple]]:
+    deuda_minima = Decimal(p['deuda_minima']) if p.get('deuda_minima') else None
+    filas = GenerarReporteCarteraUseCase().execute(barrio_id=p.get('barrio_id'), deuda_minima=deuda_minima)
+    columnas = ["socio_id", "identificacion", "nombre", "barrio", "total_deuda", "corriente",
+                "vencido_1_3", "incobrable", "facturas_pendientes"]
+    return columnas, (tuple(f[c] for c in columnas) for f in filas)
+
+
+def _cierre_caja(p: Dict[str, Any]) -> Tuple[List[str], Iterable[tuple]]:
+    cierre = GenerarCierreCajaUseCase().execute(
+        fecha_inicio=date.fromisoformat(p['fecha_inicio']) if p.get('fecha_inicio') else None,
+        fecha_fin=date.fromisoformat(p['fecha_fin']) if p.get('fecha_fin') else None,
+    )
+    rango = (cierre['rango']['inicio'], cierre['rango']['fin'])
+    filas = [(*rango, metodo, total) for metodo, total in cierre['desglose_medios'].items()]
+    filas.append((*rango, "TOTAL", cierre['total_general']))
+    return ["fecha_inicio", "fecha_fin", "metodo", "total"], filas
+
+
+def _tendencia(p: Dict[str, Any]) -> Tuple[List[str], Iterable[tuple]]:
+    tendencia = GenerarTendenciaRecaudacionUseCase().execute(
+        granularidad=p.get('granularidad') or 'mes',
+        fecha_inicio=date.fromisoformat(p['fecha_inicio']) if p.get('fecha_inicio') else None,
+        fecha_fin=date.fromisoformat(p['fecha_fin']) if p.get('fecha_fin') else None,
+        barrio_id=p.get('barrio_id'),
+    )
+    columnas = ["periodo", "facturado", "recaudado", "tasa_cobro", "deuda_nueva"]
+    filas = [("TODOS", *(punto[c] for c in columnas)) for punto in tendencia['series']]
+    for barrio in tendencia['barrios']:
+        filas.extend((barrio['barrio'], *(punto[c] for c in columnas)) for punto in barrio['series'])
+    return ["barrio", *columnas], filas
+
+
+# tipo -> (parámetros aceptados, generador)
+REPORTES: Dict[str, Tuple[Tuple[str, ...], Callable[[Dict[str, Any]], Tuple[List[str], Iterable[tuple]]]]] = {
+    'cartera': (('barrio_id', 'deuda_minima'), _cartera),
+    'cierre_caja': (('fecha_inicio', 'fecha_fin'), _cierre_caja),
+    'tendencia': (('granularidad', 'fecha_inicio', 'fecha_fin', 'barrio_id'), _tendencia),
+    'facturas': (('anio', 'mes', 'barrio_id', 'estado'), _exportacion('facturas')),
+    'pagos': (('anio', 'mes', 'barrio_id', 'estado'), _exportacion('pagos')),
+    'lecturas': (('anio', 'mes', 'barrio_id', 'estado'), _exportacion('lecturas')),
+}
+
+
+# ==============================================================================
+# SOLICITUD (petición HTTP)
+# ==============================================================================
+def normalizar_parametros(tipo: str, formato: str, parametros: Dict[str, Any]) -> Dict[str, Any]:
+    if tipo not in REPORTES:
+        raise ValidacionError(f"tipo debe ser uno de: {', '.join(REPORTES)}.")
+    if formato not in FORMATOS:
+        raise ValidacionError("formato debe ser 'csv' o 'xlsx'.")
+    aceptados, _ = REPORTES[tipo]
+    desconocidos = set(parametros) - set(aceptados)
+    if desconocidos:
+        raise ValidacionError(f"Parámetros no admitidos para '{tipo}': {', '.join(sorted(desconocidos))}.")
+    try:
+        # Vacíos/nulos se omiten: equivalen a no enviar el filtro
+        normalizados = {
+            nombre: NORMALIZADORES[nombre](valor)
+            for nombre, valor in parametros.items() if valor not in (None, '')
+        }
+    except (TypeError, ValueError, InvalidOperation):
+        raise ValidacionError("Parámetros del reporte inválidos.")
+
+    estados = exportacion.ESTADOS.get(tipo)
+    if estados and normalizados.get('estado') and normalizados['estado'] not in estados:
+        raise ValidacionError(f"estado debe ser uno de: {', '.join(estados)}.")
+    # 'Hasta hoy' se fija en la fecha de la solicitud: mañana es otro reporte (otra huella)
+    if 'fecha_fin' in aceptados and 'fecha_fin' not in normalizados:
+        normalizados['fecha_fin'] = timezone.localdate().isoformat()
+    return normalizados
+
+
+def calcular_huella(tipo: str, formato: str, parametros: Dict[str, Any]) -> str:
+    contenido = json.dumps({"tipo": tipo, "formato": formato, "parametros": parametros}, sort_keys=True)
+    return hashlib.sha256(contenido.encode()).hexdigest()
+
+
+def solicitar_reporte(tipo: str, formato: str, parametros: Dict[str, Any],
+                      usuario_id: int = 0) -> Tuple[ReporteGeneradoModel, bool]:
+    """Retorna (trabajo, reutilizado). Un trabajo nuevo se encola al confirmar la transacción."""
+    parametros = normalizar_parametros(tipo, formato, parametros)
+    huella = calcular_huella(tipo, formato, parametros)
+    ahora = timezone.now()
+    ttl = timedelta(minutes=settings.REPORTES_TTL_MINUTOS)
+
+    with transaction.atomic():
+        # INSERT ... ON CONFLICT DO NOTHING / INSERT IGNORE: la primera solicitud crea el
+        # candado y las concurrentes no fallan con IntegrityError; luego todas lo bloquean
+        ReporteCandadoModel.objects.bulk_create([ReporteCandadoModel(huella=huella)], ignore_conflicts=True)
+        ReporteCandadoModel.objects.select_for_update().get(huella=huella)
+
+        # También con bloqueo: una lectura con bloqueo ve el último trabajo confirmado aunque
+        # la transacción ya tenga su instantánea (REPEATABLE READ en MySQL)
+        existente = ReporteGeneradoModel.objects.select_for_update().filter(huella=huella).filter(
+            Q(estado=ReporteGeneradoModel.LISTO, expira_en__gt=ahora)
+            # Un trabajo en curso más antiguo que el TTL se considera perdido (worker caído)
+            | Q(estado__in=[ReporteGeneradoModel.PENDIENTE, ReporteGeneradoModel.EN_PROCESO],
+                fecha_solicitud__gt=ahora - ttl)
+        ).order_by('-fecha_solicitud').first()
+        if existente:
+            return existente, True
+
+        reporte = ReporteGeneradoModel.objects.create(
+            tipo=tipo, formato=formato, parametros=parametros, huella=huella, usuario_id=usuario_id
+        )
+
+    from adapters.infrastructure.tasks import generar_reporte_task
+
+    reporte_id = str(reporte.id)
+    transaction.on_commit(lambda: generar_reporte_task.delay(reporte_id))
+    return reporte, False
+
+
+# ==============================================================================
+# GENERACIÓN (worker)
+# ==============================================================================
+def _contar(filas: Iterable[tuple], contador: List[int]) -> Iterator[tuple]:
+    for fila in filas:
+        contador[0] += 1
+        yield fila
+
+
+def generar_reporte(reporte_id: str) -> Dict[str, Any]:
+    # Tomar el trabajo; uno ya terminado (entrega repetida de la tarea) se ignora
+    tomados = ReporteGeneradoModel.objects.filter(
+        id=reporte_id, estado__in=[ReporteGeneradoModel.PENDIENTE, ReporteGeneradoModel.EN_PROCESO]
+    ).update(estado=ReporteGeneradoModel.EN_PROCESO)
+    if not tomados:
+        return {"id": reporte_id, "omitido": True}
+
+    reporte = ReporteGeneradoModel.objects.get(id=reporte_id)
+    contador = [0]
+    try:
+        _, generador = REPORTES[reporte.tipo]
+        cabecera, filas = generador(reporte.parametros)
+        filas = _contar(filas, contador)
+        with tempfile.TemporaryFile() as archivo:
+            if reporte.formato == 'xlsx':
+                for parte in exportacion.generar_xlsx(cabecera, filas, titulo=reporte.tipo.capitalize()):
+                    archivo.write(parte)
+            else:
+                for bloque in exportacion.generar_csv(cabecera, filas):
+                    archivo.write(bloque.encode('utf-8'))
+            archivo.seek(0)
+            nombre = f"{reporte.tipo}_{timezone.localdate().isoformat()}_{reporte.id.hex[:8]}.{reporte.formato}"
+            reporte.archivo.save(nombre, File(archivo), save=False)
+    except Exception as e:
+        reporte.estado = ReporteGeneradoModel.ERROR
+        reporte.error = str(e)[:1000]
+        reporte.fecha_fin = timezone.now()
+        reporte.save(update_fields=['estado', 'error', 'fecha_fin'])
+        return {"id": reporte_id, "estado": reporte.estado, "error": reporte.error}
+
+    reporte.estado = ReporteGeneradoModel.LISTO
+    reporte.filas = contador[0]
+    reporte.fecha_fin = timezone.now()
+    reporte.expira_en = reporte.fecha_fin + timedelta(minutes=settings.REPORTES_TTL_MINUTOS)
+    # Solo si sigue EN_PROCESO: la purga pudo darlo por perdido mientras se generaba
+    guardados = ReporteGeneradoModel.objects.filter(id=reporte_id, estado=ReporteGeneradoModel.EN_PROCESO).update(
+        estado=reporte.estado, archivo=reporte.archivo.name, filas=reporte.filas,
+        fecha_fin=reporte.fecha_fin, expira_en=reporte.expira_en
+    )
+    if not guardados:
+        reporte.archivo.delete(save=False)
+        return {"id": reporte_id, "omitido": True}
+    return {"id": reporte_id, "estado": reporte.estado, "filas": reporte.filas}
+
+
+def purgar_reportes_vencidos() -> int:
+    """
+    Borra archivos y registros vencidos: reportes LISTOS expirados y errores más antiguos
+    que el TTL. Un trabajo PENDIENTE o EN_PROCESO no se borra mientras su worker pueda
+    seguir generándolo; pasado FACTOR_TRABAJO_PERDIDO veces el TTL se marca ERROR
+    (solicitar_reporte ya lo trataba como perdido) y se purga como los demás errores.
+    """
+    ahora = timezone.now()
+    ttl = timedelta(minutes=settings.REPORTES_TTL_MINUTOS)
+    ReporteGeneradoModel.objects.filter(
+        estado__in=[ReporteGeneradoModel.PENDIENTE, ReporteGeneradoModel.EN_PROCESO],
+        fecha_solicitud__lt=ahora - ttl * FACTOR_TRABAJO_PERDIDO
+    ).update(estado=ReporteGeneradoModel.ERROR, error="Trabajo perdido: el worker no terminó.", fecha_fin=ahora)
+
+    vencidos = ReporteGeneradoModel.objects.filter(
+        estado__in=[ReporteGeneradoModel.LISTO, ReporteGeneradoModel.ERROR]
+    ).filter(
+        Q(expira_en__lt=ahora) | Q(expira_en__isnull=True, fecha_solicitud__lt=ahora - ttl)
+    )
+    for reporte in vencidos.exclude(archivo='').exclude(archivo__isnull=True).only('id', 'archivo'):
+        reporte.archivo.delete(save=False)
+    eliminados, _ = vencidos.delete()
+    # Candados de huellas que ya no tienen trabajos
+    ReporteCandadoModel.objects.exclude(huella__in=ReporteGeneradoModel.objects.values('huella')).delete()
+    return eliminados
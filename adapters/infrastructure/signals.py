@@ -0,0 +1,31 @@
+# adapters/infrastructure/signals.py
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from adapters.infrastructure.models import (
+    SocioModel, TerrenoModel, MedidorModel, ServicioModel, FacturaModel, PagoModel
+)
+from adapters.infrastructure.services.catastro_snapshot import invalidar_catastro
+from adapters.infrastructure.services.dashboard_kpis import invalidar_kpis
+
+
+# ==============================================================================
+# CATASTRO: cualquier alta/cambio/baja invalida el snapshot en memoria
+# (los UPDATE en bloque de los repositorios llaman a invalidar_catastro directamente)
+# ==============================================================================
+@receiver([post_save, post_delete], sender=SocioModel)
+@receiver([post_save, post_delete], sender=TerrenoModel)
+@receiver([post_save, post_delete], sender=MedidorModel)
+@receiver([post_save, post_delete], sender=ServicioModel)
+def invalidar_catastro_al_cambiar(sender, **kwargs):
+    invalidar_catastro()
+
+
+# ==============================================================================
+# DASHBOARD: escrituras de facturas y pagos invalidan los KPIs en cache
+# (los UPDATE en bloque de los repositorios llaman a invalidar_kpis directamente)
+# ==============================================================================
+@receiver([post_save, post_delete], sender=FacturaModel)
+@receiver([post_save, post_delete], sender=PagoModel)
+def invalidar_kpis_al_cambiar(sender, **kwargs):
+    invalidar_kpis()
@@ -0,0 +1,184 @@
+# adapters/infrastructure/tasks.py
+"""
+Tareas asíncronas (Celery). Descubiertas por app.autodiscover_tasks() en config/celery.py.
+"""
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from celery import shared_task, group
+from django.conf import settings
+from django.utils import timezone
+from PIL import UnidentifiedImageError
+
+from core.use_cases.generar_facturacion_medida_uc import GenerarFacturacionMedidaUseCase, TAMANO_LOTE_DEFAULT
+from core.use_cases.cobranza.aplicar_recargos_mora_uc import AplicarRecargosMoraUseCase
+from core.use_cases.cobranza.generar_ordenes_corte_uc import GenerarOrdenesCorteUseCase
+from core.use_cases.emitir_facturas_sri_uc import EmitirFacturasSRIUseCase
+from core.use_cases.reporting.detectar_anomalias_consumo_uc import DetectarAnomaliasConsumoUseCase
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_gobernanza_repository import DjangoGobernanzaRepository
+from adapters.infrastructure.repositories.django_cobranza_repository import DjangoCobranzaRepository
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
+from adapters.infrastructure.repositories.django_inventario_repository import DjangoInventarioRepository
+from adapters.infrastructure.services.django_sri_service import DjangoSRIService
+from adapters.infrastructure.services.django_email_service import DjangoEmailService
+from adapters.infrastructure.services.comprobante_imagen_service import optimizar_comprobante
+from adapters.infrastructure.services.reportes_service import generar_reporte, purgar_reportes_vencidos
+from adapters.infrastructure.models import SolicitudIdempotenteModel
+
+
+# ==============================================================================
+# FACTURACIÓN PARTICIONADA POR BARRIO
+# ==============================================================================
+def facturar_barrio(
+    barrio_id: int, anio: int, mes: int,
+    fecha_emision: Optional[str] = None, tamano_lote: int = TAMANO_LOTE_DEFAULT
+) -> Dict[str, Any]:
+    """
+    Factura una partición (barrio). Usa la conexión a BD del proceso que la ejecuta
+    (worker de Celery o proceso del pool) y confirma por lotes.
+    Solo recibe tipos primitivos para poder serializarse (JSON / pickle).
+    """
+    use_case = GenerarFacturacionMedidaUseCase(
+        factura_repo=DjangoFacturaRepository(),
+        lectura_repo=DjangoLecturaRepository(),
+        gobernanza_repo=DjangoGobernanzaRepository()
+    )
+    return use_case.ejecutar(
+        barrio_id=barrio_id,
+        anio=anio,
+        mes=mes,
+        fecha_emision=date.fromisoformat(fecha_emision) if fecha_emision else None,
+        tamano_lote=tamano_lote
+    )
+
+
+@shared_task(bind=True, acks_late=True, max_retries=3, default_retry_delay=30)
+def facturar_barrio_task(self, barrio_id: int, anio: int, mes: int,
+                         fecha_emision: Optional[str] = None, tamano_lote: int = TAMANO_LOTE_DEFAULT):
+    # acks_late + reintentos: re-ejecutar una partición es idempotente
+    # (lecturas cerradas no se recargan y el unique (servicio, anio, mes) descarta duplicados)
+    try:
+        return facturar_barrio(barrio_id, anio, mes, fecha_emision, tamano_lote)
+    except Exception as exc:
+        raise self.retry(exc=exc)
+
+
+def despachar_facturacion_periodo(
+    anio: int, mes: int, fecha_emision: Optional[str] = None,
+    barrio_ids: Optional[List[int]] = None, tamano_lote: int = TAMANO_LOTE_DEFAULT
+):
+    """
+    Reparte el periodo en una tarea por barrio (grupo de Celery) para que los workers
+    disponibles las procesen en paralelo. Retorna el GroupResult (persistido en el backend),
+    o None si no hay lecturas pendientes.
+    """
+    if barrio_ids is None:
+        barrio_ids = DjangoLecturaRepository().listar_barrios_pendientes(anio, mes)
+    if not barrio_ids:
+        return None
+
+    resultado = group(
+        facturar_barrio_task.s(barrio_id, anio, mes, fecha_emision, tamano_lote)
+        for barrio_id in barrio_ids
+    ).apply_async()
+    resultado.save()
+    return resultado
+
+
+# ==============================================================================
+# ANÁLISIS DE CONSUMO
+# ==============================================================================
+@shared_task
+def detectar_anomalias_consumo_task(anio: Optional[int] = None, mes: Optional[int] = None):
+    # Por defecto el periodo en curso: las lecturas nuevas del día quedan marcadas
+    hoy = timezone.localdate()
+    use_case = DetectarAnomaliasConsumoUseCase(DjangoLecturaRepository())
+    return use_case.ejecutar(anio or hoy.year, mes or hoy.month)
+
+
+# ==============================================================================
+# COBRANZA (PROCESOS NOCTURNOS)
+# ==============================================================================
+@shared_task
+def aplicar_recargos_mora_task(fecha_corte: Optional[str] = None):
+    use_case = AplicarRecargosMoraUseCase(DjangoCobranzaRepository())
+    return use_case.ejecutar(fecha_corte=date.fromisoformat(fecha_corte) if fecha_corte else None)
+
+
+@shared_task
+def generar_ordenes_corte_task(meses_minimos: Optional[int] = None):
+    use_case = GenerarOrdenesCorteUseCase(DjangoCobranzaRepository())
+    reporte = use_case.ejecutar(meses_minimos or settings.MESES_MORA_CORTE)
+    reporte.pop("servicio_ids")  # El resultado de la tarea solo guarda el resumen
+    return reporte
+
+
+@shared_task
+def reconstruir_cartera_task():
+    # Reclasifica por antigüedad (las facturas cambian de tramo con los días) y corrige
+    # cualquier desvío de los ajustes del día
+    return DjangoCarteraRepository().reconstruir()
+
+
+@shared_task
+def purgar_solicitudes_idempotentes_task():
+    # Pasada la retención, un reintento con la misma Idempotency-Key se ejecuta de nuevo
+    limite = timezone.now() - timedelta(hours=settings.IDEMPOTENCIA_HORAS_RETENCION)
+    eliminadas, _ = SolicitudIdempotenteModel.objects.filter(fecha_registro__lt=limite).delete()
+    return eliminadas
+
+
+# ==============================================================================
+# EMISIÓN ELECTRÓNICA (SRI) POR LOTE
+# ==============================================================================
+@shared_task(acks_late=True)
+def emitir_facturas_sri_task(factura_ids: List[int]):
+    # Cada factura registra su propio resultado (estado_sri); un fallo no detiene el lote
+    use_case = EmitirFacturasSRIUseCase(
+        factura_repo=DjangoFacturaRepository(),
+        sri_service=DjangoSRIService(),
+        email_service=DjangoEmailService()
+    )
+    resultados = use_case.ejecutar(factura_ids)
+    return {str(factura_id): r["estado"] for factura_id, r in resultados.items()}
+
+
+# ==============================================================================
+# COMPROBANTES DE PAGO (IMÁGENES)
+# ==============================================================================
+@shared_task(bind=True, acks_late=True, max_retries=3, default_retry_delay=60)
+def procesar_comprobante_task(self, detalle_id: int):
+    # Idempotente: un detalle ya procesado se ignora
+    try:
+        return optimizar_comprobante(detalle_id)
+    except UnidentifiedImageError:
+        # El archivo no es una imagen: reintentar no lo arregla (hereda de OSError, va primero)
+        raise
+    except OSError as exc:  # Storage no disponible / archivo aún no replicado
+        raise self.retry(exc=exc)
+
+
+# ==============================================================================
+# REPORTES A PEDIDO
+# ==============================================================================
+@shared_task(acks_late=True)
+def generar_reporte_task(reporte_id: str):
+    # Una entrega repetida de un trabajo ya terminado se omite (ver generar_reporte)
+    return generar_reporte(reporte_id)
+
+
+@shared_task
+def purgar_reportes_task():
+    return purgar_reportes_vencidos()
+
+
+# ==============================================================================
+# INVENTARIO
+# ==============================================================================
+@shared_task
+def generar_cortes_stock_task(fecha: Optional[str] = None):
+    # Por defecto el corte del día anterior (el proceso corre pasada la medianoche)
+    fecha_corte = date.fromisoformat(fecha) if fecha else timezone.localdate() - timedelta(days=1)
+    return DjangoInventarioRepository().generar_cortes_stock(fecha_corte)
@@ -11,6 +11,7 @@ from pathlib import Path
 from datetime import timedelta
 import dotenv  # pip install python-dotenv
 import dj_database_url  # pip install dj-database-url
+from celery.schedules import crontab
 
 # ==============================================================================
 # 0. CONFIGURACIÓN COMPATIBILIDAD WINDOWS (WeasyPrint/GTK3) - DIAGNÓSTICO
@@ -303,6 +304,9 @@ SRI_EMISOR_RAZON_SOCIAL = os.getenv('SRI_EMISOR_RAZON_SOCIAL')
 SRI_EMISOR_DIRECCION_MATRIZ = os.getenv('SRI_EMISOR_DIRECCION_MATRIZ')
 SRI_NOMBRE_COMERCIAL = os.getenv('SRI_NOMBRE_COMERCIAL')
 
+# Recibo térmico de ventanilla: 48 columnas = papel de 80 mm (usar 32 para 58 mm)
+RECIBO_ANCHO_COLUMNAS = int(os.getenv('RECIBO_ANCHO_COLUMNAS', '48'))
+
 # Configuración Técnica
 SRI_SERIE_ESTABLECIMIENTO = os.getenv('SRI_SERIE_ESTABLECIMIENTO')
 SRI_SERIE_PUNTO_EMISION = os.getenv('SRI_SERIE_PUNTO_EMISION')
@@ -338,6 +342,71 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 
+# Procesos programados (celery beat)
+CELERY_BEAT_SCHEDULE = {
+    'recargos-mora-nocturno': {
+        'task': 'adapters.infrastructure.tasks.aplicar_recargos_mora_task',
+        'schedule': crontab(hour=2, minute=0),
+    },
+    'ordenes-corte-nocturno': {
+        'task': 'adapters.infrastructure.tasks.generar_ordenes_corte_task',
+        'schedule': crontab(hour=2, minute=30),  # Después de recalcular meses_mora
+    },
+    'cortes-stock-nocturno': {
+        'task': 'adapters.infrastructure.tasks.generar_cortes_stock_task',
+        'schedule': crontab(hour=0, minute=15),  # Corte del día que acaba de cerrar
+    },
+    'cartera-nocturno': {
+        'task': 'adapters.infrastructure.tasks.reconstruir_cartera_task',
+        'schedule': crontab(hour=0, minute=30),
+    },
+    'anomalias-consumo-nocturno': {
+        'task': 'adapters.infrastructure.tasks.detectar_anomalias_consumo_task',
+        'schedule': crontab(hour=1, minute=0),
+    },
+    'purgar-idempotencia-nocturno': {
+        'task': 'adapters.infrastructure.tasks.purgar_solicitudes_idempotentes_task',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'purgar-reportes': {
+        'task': 'adapters.infrastructure.tasks.purgar_reportes_task',
+        'schedule': crontab(minute=15),
+    },
+}
+
+# Idempotency-Key: cuánto se guardan las respuestas y cuándo se retoma una solicitud colgada
+IDEMPOTENCIA_HORAS_RETENCION = int(os.getenv('IDEMPOTENCIA_HORAS_RETENCION', '48'))
+IDEMPOTENCIA_SEGUNDOS_EN_PROCESO = int(os.getenv('IDEMPOTENCIA_SEGUNDOS_EN_PROCESO', '300'))
+
+# KPIs del dashboard: se invalidan con cada escritura; el TTL es solo un respaldo
+DASHBOARD_KPIS_TTL = int(os.getenv('DASHBOARD_KPIS_TTL', '300'))
+
+# Tendencia facturado vs recaudado: cache por parámetros (los pagos del periodo en curso
+# aparecen a lo sumo con este retraso)
+TENDENCIA_RECAUDACION_TTL = int(os.getenv('TENDENCIA_RECAUDACION_TTL', '600'))
+
+# Reportes a pedido: minutos que un archivo generado se reutiliza para la misma solicitud
+REPORTES_TTL_MINUTOS = int(os.getenv('REPORTES_TTL_MINUTOS', '60'))
+
+# Meses de mora a partir de los cuales se genera la orden de CORTE automática
+MESES_MORA_CORTE = int(os.getenv('MESES_MORA_CORTE', '3'))
+
+# Cache compartido entre procesos (gunicorn/celery) si hay Redis; si no, memoria local
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+            'KEY_PREFIX': 'junta',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # ==============================================================================
 # 14. LOGGING (Optimizado)
 # ==============================================================================
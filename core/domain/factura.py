@@ -63,6 +63,9 @@ class Factura:
     archivo_pdf: Optional[str] = None
     archivo_xml_path: Optional[str] = None
 
+    # Concurrencia optimista: versión leída de la BD (el repositorio la compara al guardar)
+    version: int = 0
+
     # --- LÓGICA DE NEGOCIO (CORREGIDA) ---
 
     def calcular_total_con_medidor(self, 
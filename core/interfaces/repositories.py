@@ -1,6 +1,7 @@
 # core/interfaces/repositories.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Dict, Iterable, Set, Tuple
+from datetime import date
 from decimal import Decimal
 from core.domain.factura import Factura
 from core.domain.socio import Socio
@@ -33,9 +34,17 @@ class IFacturaRepository(ABC):
         """Verifica si ya existe factura para un servicio fijo en ese mes/año"""
         pass
 
+    @abstractmethod
+    def obtener_servicios_facturados(self, servicio_ids: List[int], anio: int, mes: int) -> Set[int]:
+        """Versión en bloque de existe_factura_fija_mes: ids de servicios ya facturados en el periodo"""
+        pass
+
     @abstractmethod
     def guardar(self, factura: Factura) -> Factura:
-        """Persiste los cambios de la factura. Retorna la factura guardada (o None)"""
+        """
+        Persiste los cambios de la factura. Retorna la factura guardada (o None).
+        Si la factura cambió desde que se leyó (factura.version) lanza ConflictoConcurrenciaError.
+        """
         pass
     
     # Alias para compatibilidad con código legacy
@@ -52,6 +61,23 @@ class IFacturaRepository(ABC):
         """Retorna todas las facturas pendientes de un socio (Agua, Riego, Multas)"""
         pass
 
+    @abstractmethod
+    def obtener_pendientes_para_cobro(self, socio_id: int) -> List[Factura]:
+        """
+        Facturas PENDIENTE/POR_VALIDAR del socio, de la más antigua a la más reciente,
+        con su versión. Una sola consulta (sin detalles) y SIN bloqueo: la consistencia
+        depende del compare-and-set por versión de marcar_como_pagadas.
+        """
+        pass
+
+    @abstractmethod
+    def marcar_como_pagadas(self, factura_ids: List[int], versiones: Optional[Dict[int, int]] = None) -> int:
+        """
+        Pasa a PAGADA todas las facturas indicadas en bloque. Retorna cuántas se actualizaron.
+        Con versiones ({factura_id: versión leída}) lanza ConflictoConcurrenciaError si alguna cambió.
+        """
+        pass
+
 class IPagoRepository(ABC):
     @abstractmethod
     def obtener_sumatoria_validada(self, factura_id: int) -> float:
@@ -62,13 +88,88 @@ class IPagoRepository(ABC):
         pass
 
     @abstractmethod
-    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> None:
+    def registrar_pagos(self, factura_id: int, pagos: List[dict]) -> List[str]:
+        """Registra los pagos de caja de la factura. Retorna los números de comprobante generados"""
         pass
 
     @abstractmethod
     def obtener_ultimos_pagos(self, socio_id: int, limite: int = 5) -> List[Any]:
         pass
 
+    @abstractmethod
+    def obtener_resumen_pagos(self, factura_id: int) -> Dict[str, Any]:
+        """
+        Resumen mantenido de la factura (lectura de una fila):
+        {"monto_validado", "monto_por_validar", "cantidad_pagos"}
+        """
+        pass
+
+    @abstractmethod
+    def obtener_resumen_transferencias(self, factura_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Versión en bloque de obtener_resumen_pagos (1 consulta):
+        {factura_id: {"validado": Decimal, "pendientes": Decimal por validar}}. Solo facturas con pagos.
+        """
+        pass
+
+    @abstractmethod
+    def registrar_cobro_multiple(self, socio_id: int, asignaciones: List[Dict[str, Any]]) -> List[str]:
+        """
+        Registra en bloque un recibo por factura cobrada en ventanilla:
+        [{"factura_id", "monto", "detalles": [{"metodo", "monto", "referencia", "observacion"}]}].
+        Retorna los números de comprobante generados (mismo orden).
+        """
+        pass
+
+    @abstractmethod
+    def reportar_transferencia(self, factura_id: int, monto: Decimal, referencia: str, comprobante: Any = None) -> Dict[str, Any]:
+        """Registra una transferencia NO validada subida por el socio. Retorna {"pago_id", "detalle_id", "foto_url"}"""
+        pass
+
+    @abstractmethod
+    def aprobar_transferencia(self, pago_id: int) -> Optional[int]:
+        """Valida la transferencia. Retorna el id de su factura"""
+        pass
+
+    @abstractmethod
+    def listar_pendientes_validacion(
+        self, limite: int, despues_de: Optional[Tuple[Any, int]] = None,
+        barrio_id: Optional[int] = None, desde: Optional[date] = None, hasta: Optional[date] = None,
+        monto_min: Optional[Decimal] = None, monto_max: Optional[Decimal] = None
+    ) -> List[Dict[str, Any]]:
+        """Página de transferencias por validar, por keyset sobre (fecha_registro, id)"""
+        pass
+
+    @abstractmethod
+    def listar_transferencias_por_validar(self) -> List[Tuple[int, str, Decimal]]:
+        """(pago_id, referencia, monto) de cada línea de transferencia aún no validada (1 consulta)"""
+        pass
+
+    @abstractmethod
+    def aprobar_transferencias(self, pago_ids: List[int]) -> int:
+        """Valida en bloque las transferencias indicadas. Retorna cuántas se validaron"""
+        pass
+
+    @abstractmethod
+    def rechazar_transferencia(self, pago_id: int) -> Tuple[Optional[int], bool]:
+        """Elimina la transferencia. Retorna (factura_id, ¿quedan pagos por validar?)"""
+        pass
+
+    @abstractmethod
+    def recalcular_resumen_pagos(self, factura_ids: Optional[List[int]] = None) -> int:
+        """Reconstruye el resumen de pagos de las facturas desde los pagos (reparación)"""
+        pass
+
+    @abstractmethod
+    def obtener_recibo(self, numero_comprobante: str) -> Optional[Dict[str, Any]]:
+        """Datos del recibo para impresión (cabecera, socio, métodos y resumen de la factura)"""
+        pass
+
+    @abstractmethod
+    def recalcular_caja_diaria(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> int:
+        """Reconstruye el libro de caja diario del rango desde los pagos validados. Retorna las filas creadas"""
+        pass
+
 class IAuthRepository(ABC):
     @abstractmethod
     def crear_usuario(self, username: str, password: str, email: str = None, rol: Any = None) -> int:
@@ -129,6 +230,31 @@ class ILecturaRepository(ABC):
     def save(self, lectura: Lectura) -> Lectura:
         pass
 
+    @abstractmethod
+    def listar_pendientes_facturacion(self, barrio_id: Optional[int], anio: int, mes: int) -> List[dict]:
+        """Lecturas no facturadas del periodo con socio y tarifa del servicio (una sola consulta)"""
+        pass
+
+    @abstractmethod
+    def listar_barrios_pendientes(self, anio: int, mes: int) -> List[int]:
+        """Barrios con lecturas sin facturar en el periodo (particiones de la facturación)"""
+        pass
+
+    @abstractmethod
+    def marcar_como_facturadas(self, lectura_ids: List[int]) -> int:
+        """Cierra en bloque las lecturas ya facturadas. Retorna cuántas se cerraron"""
+        pass
+
+    @abstractmethod
+    def obtener_series_consumo(self, anio: int, mes: int, meses: int) -> List[Tuple[int, int, int, int, float]]:
+        """(lectura_id, medidor_id, anio, mes, consumo) del periodo y los 'meses' previos (medidores leídos en el periodo)"""
+        pass
+
+    @abstractmethod
+    def guardar_anomalias(self, resultados: Dict[int, Tuple[Optional[str], Optional[Decimal]]]) -> int:
+        """Guarda en bloque {lectura_id: (anomalia, consumo_esperado)}. Retorna lecturas actualizadas"""
+        pass
+
 class IServicioRepository(ABC):
     @abstractmethod
     def obtener_servicios_fijos_activos(self) -> List[Any]:
@@ -224,3 +350,116 @@ class IGobernanzaRepository(ABC):
     @abstractmethod
     def marcar_multa_como_facturada(self, asistencia_id: int, factura_id: int) -> None:
         pass
+
+    @abstractmethod
+    def obtener_multas_pendientes_por_socios(self, socio_ids: List[int]) -> Dict[int, List[Any]]:
+        """Multas pendientes de varios socios en una sola consulta, agrupadas por socio_id"""
+        pass
+
+    @abstractmethod
+    def marcar_multas_como_facturadas(self, asignaciones: Dict[int, int]) -> int:
+        """Vincula en bloque {asistencia_id: factura_id}. Retorna cuántas multas se vincularon"""
+        pass
+
+    @abstractmethod
+    def reservar_multas_pendientes(self, asistencia_ids: List[int]) -> Set[int]:
+        """Bloquea (hasta el fin de la transacción) las multas aún sin factura. Retorna sus ids"""
+        pass
+
+class ICobranzaRepository(ABC):
+    """
+    Puerto para la gestión de cartera vencida (mora, recargos) con operaciones en bloque.
+    """
+    @abstractmethod
+    def recalcular_meses_mora(self, fecha_corte: date) -> int:
+        """Recalcula meses_mora de TODOS los servicios con una sola sentencia. Retorna filas procesadas"""
+        pass
+
+    @abstractmethod
+    def listar_servicios_en_mora(self, meses_minimos: int = 1) -> List[Dict[str, Any]]:
+        """Servicios activos con meses_mora >= meses_minimos (id, socio_id, meses_mora)"""
+        pass
+
+    @abstractmethod
+    def obtener_rubro_recargo_mora(self) -> Tuple[int, Decimal]:
+        """(rubro_id, valor) del rubro 'RECARGO POR MORA'; se crea si no existe"""
+        pass
+
+    @abstractmethod
+    def referencias_existentes(self, rubro_id: int, referencias: List[str]) -> Set[str]:
+        """Referencias de origen ya registradas para el rubro (idempotencia)"""
+        pass
+
+    @abstractmethod
+    def crear_cuentas_por_cobrar(self, cuentas: List[Dict[str, Any]]) -> int:
+        """Inserta en bloque cuentas por cobrar. Retorna cuántas se crearon"""
+        pass
+
+    @abstractmethod
+    def listar_servicios_para_corte(self, meses_minimos: int) -> List[int]:
+        """Servicios activos con meses_mora >= umbral y sin orden de trabajo en curso (bloqueados)"""
+        pass
+
+    @abstractmethod
+    def crear_ordenes_corte(self, servicio_ids: List[int]) -> int:
+        """Crea en bloque las órdenes CORTE y las vincula como orden_trabajo_activa"""
+        pass
+
+    @abstractmethod
+    def listar_ordenes_corte_pendientes(self, barrio_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Hoja de ruta de la cuadrilla: órdenes CORTE pendientes con socio y ubicación"""
+        pass
+
+
+class IInventarioRepository(ABC):
+    """
+    Puerto del inventario de materiales (POS): saldo mantenido + libro de movimientos.
+    """
+    @abstractmethod
+    def descontar_stock(self, cantidades: Dict[int, int], referencia: Optional[str] = None,
+                        usuario_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Venta en bloque {producto_id: cantidad}: descuenta todos los productos con UN UPDATE
+        condicionado (stock suficiente) y registra sus movimientos. Si algún producto no
+        alcanza lanza StockInsuficienteError. Retorna por producto:
+        {"producto_id", "codigo", "nombre", "cantidad", "precio_unitario", "stock_resultante"}
+        """
+        pass
+
+    @abstractmethod
+    def registrar_movimiento(self, producto_id: int, tipo: str, cantidad: int,
+                             referencia: Optional[str] = None, observacion: Optional[str] = None,
+                             usuario_id: Optional[int] = None) -> int:
+        """Entrada o ajuste (cantidad con signo) de un producto. Retorna el stock resultante"""
+        pass
+
+    @abstractmethod
+    def generar_cortes_stock(self, fecha: date) -> int:
+        """Guarda el stock de cada producto al cierre de 'fecha'. Retorna los cortes guardados"""
+        pass
+
+    @abstractmethod
+    def stock_a_fecha(self, fecha: date, producto_ids: Optional[List[int]] = None) -> List[Dict[str, Any]]:
+        """Stock de cada producto al cierre de 'fecha' (último corte + movimientos posteriores)"""
+        pass
+
+
+class ICarteraRepository(ABC):
+    """
+    Puerto del snapshot de cartera vencida por socio (reconstrucción nocturna + ajustes del día).
+    """
+    @abstractmethod
+    def reconstruir(self, fecha_corte: Optional[date] = None) -> int:
+        """Reconstruye el snapshot desde las facturas PENDIENTES (una sentencia). Retorna socios con deuda"""
+        pass
+
+    @abstractmethod
+    def ajustar(self, facturas: Iterable[Tuple[int, date, Decimal]], signo: int = 1) -> None:
+        """Suma (signo=1) o resta (signo=-1) facturas (socio_id, fecha_emision, total) que entran/salen de PENDIENTE"""
+        pass
+
+    @abstractmethod
+    def listar(self, barrio_id: Optional[int] = None, deuda_minima: Optional[Decimal] = None,
+               limite: Optional[int] = None, desplazamiento: int = 0) -> List[Dict[str, Any]]:
+        """Socios con deuda, de mayor a menor: socio_id, nombre, barrio, identificacion y montos por antigüedad"""
+        pass
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from core.domain.factura import Factura
 from core.domain.socio import Socio
@@ -47,3 +47,9 @@ class IEmailService(ABC):
     def enviar_notificacion_multa(self, email_destinatario: str, nombre_socio: str, evento_nombre: str, valor_multa: float) -> bool:
         """Envía notificación de multa por inasistencia"""
         pass
+
+class IColaEmisionSRI(ABC):
+    @abstractmethod
+    def encolar(self, factura_ids: List[int]) -> None:
+        """Programa la emisión SRI (y notificación) de un lote de facturas, fuera de la transacción de cobro"""
+        pass
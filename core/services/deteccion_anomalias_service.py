@@ -0,0 +1,65 @@
+import warnings
+from typing import Dict
+
+import numpy as np
+
+# Códigos guardados en la lectura (de mayor a menor prioridad)
+LECTURA_REGRESIVA = "LECTURA_REGRESIVA"          # valor < lectura anterior (consumo negativo)
+PICO_CONSUMO = "PICO_CONSUMO"                    # muy por encima de la línea base del medidor
+CONSUMO_CERO_CONTINUO = "CONSUMO_CERO_CONTINUO"  # medidor detenido / vivienda desocupada
+
+# Factor que hace al MAD comparable con la desviación estándar (distribución normal)
+FACTOR_MAD = 1.4826
+
+
+class DeteccionAnomaliasService:
+    """
+    Servicio de Dominio puro (NumPy) para analizar el consumo de TODA la red a la vez.
+    Recibe una matriz (medidores x meses) de consumos en m³, con NaN donde no hay lectura;
+    la última columna es el periodo analizado y las anteriores forman la historia.
+
+    Línea base robusta por medidor: mediana y MAD de su historia (un pico aislado o un
+    mes en cero no la mueven, como sí lo harían la media y la desviación estándar).
+    """
+
+    def __init__(self, umbral_z: float = 3.5, escala_minima_m3: float = 2.0,
+                 meses_minimos_base: int = 3, meses_cero: int = 3):
+        self.umbral_z = umbral_z
+        # Piso de la escala: medidores muy estables (MAD ~ 0) no se marcan por 1-2 m³ extra
+        self.escala_minima_m3 = escala_minima_m3
+        self.meses_minimos_base = meses_minimos_base
+        self.meses_cero = meses_cero
+
+    def analizar(self, consumos: np.ndarray) -> Dict[str, np.ndarray]:
+        consumos = np.asarray(consumos, dtype=np.float64)
+        historia = consumos[:, :-1]
+        actual = consumos[:, -1]
+
+        muestras = np.count_nonzero(~np.isnan(historia), axis=1)
+        with warnings.catch_warnings():
+            # Medidores sin historia: la mediana es NaN (se filtran con 'muestras')
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            mediana = np.nanmedian(historia, axis=1)
+            mad = np.nanmedian(np.abs(historia - mediana[:, None]), axis=1)
+
+        escala = np.maximum(FACTOR_MAD * np.nan_to_num(mad), self.escala_minima_m3)
+        puntaje_z = (actual - mediana) / escala
+
+        pico = (muestras >= self.meses_minimos_base) & (np.nan_to_num(puntaje_z, nan=0.0) > self.umbral_z)
+        # Racha de ceros que termina en el periodo: producto acumulado desde la última columna
+        racha_ceros = np.cumprod(consumos[:, ::-1] == 0, axis=1).sum(axis=1)
+        cero_continuo = racha_ceros >= self.meses_cero
+        regresiva = actual < 0
+
+        anomalia = np.select(
+            [regresiva, pico, cero_continuo],
+            [LECTURA_REGRESIVA, PICO_CONSUMO, CONSUMO_CERO_CONTINUO],
+            default=""
+        )
+        return {
+            "mediana": mediana,
+            "mad": mad,
+            "puntaje_z": puntaje_z,
+            "racha_ceros": racha_ceros,
+            "anomalia": anomalia,
+        }
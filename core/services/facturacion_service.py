@@ -1,12 +1,20 @@
 
-from typing import List, Dict
+from typing import Any, List, Dict, Iterator, Optional
 from decimal import Decimal
 from datetime import date
+from itertools import groupby
 
 # Imports de tus Entidades de Dominio
 from core.domain.factura import Factura
+from core.shared.enums import EstadoFactura
 from core.domain.lectura import Lectura
 from core.domain.socio import Socio
+from core.services.tarifa_vectorizada_service import (
+    TarifaVectorizadaService,
+    TARIFA_BASE_M3_DEFAULT,
+    TARIFA_BASE_PRECIO_DEFAULT,
+    TARIFA_EXCEDENTE_PRECIO_DEFAULT
+)
 
 class FacturacionService:
     """
@@ -15,6 +23,49 @@ class FacturacionService:
     No guarda en base de datos, solo calcula.
     """
 
+    @staticmethod
+    def concepto_multa(multa: Any) -> str:
+        """Texto de una multa de minga (detalle de la factura, planilla y estado de cuenta)."""
+        return f"Multa: {multa.evento.nombre} ({multa.evento.fecha})"
+
+    @staticmethod
+    def construir_factura_medida(
+        socio_id: int, medidor_id: int, lectura: Lectura,
+        fecha_emision: date, fecha_vencimiento: date,
+        tarifa_base_m3: int, tarifa_base_precio: Decimal, tarifa_excedente_precio: Decimal,
+        multas: List[Any], servicio_id: Optional[int] = None,
+        anio: Optional[int] = None, mes: Optional[int] = None
+    ) -> Factura:
+        """
+        Factura PENDIENTE de Tarifa Medida (agua + multas de minga), en memoria.
+        La usan la facturación de una lectura y la masiva por barrio: ambas producen
+        los mismos detalles y quedan marcadas para el envío al SRI.
+        """
+        periodo = {"anio": anio, "mes": mes} if anio and mes else {}
+        factura = Factura(
+            id=None,
+            socio_id=socio_id,
+            servicio_id=servicio_id,
+            medidor_id=medidor_id,
+            lectura=lectura,
+            fecha_emision=fecha_emision,
+            fecha_vencimiento=fecha_vencimiento,
+            estado=EstadoFactura.PENDIENTE,  # Nace debiendo
+            sri_ambiente=1,
+            sri_tipo_emision=1,
+            estado_sri="PENDIENTE_ENVIO",    # Indicador para el cajero
+            **periodo
+        )
+        factura.calcular_total_con_medidor(
+            consumo_m3=int(float(lectura.consumo_del_mes_m3)),
+            tarifa_base_m3=tarifa_base_m3,
+            tarifa_base_precio=tarifa_base_precio,
+            tarifa_excedente_precio=tarifa_excedente_precio
+        )
+        for multa in multas:
+            factura.agregar_multa(FacturacionService.concepto_multa(multa), multa.evento.valor_multa)
+        return factura
+
     def previsualizar_factura(self, lectura: Lectura, socio: Socio, multas_pendientes: List[Dict]) -> Dict:
         """
         Genera el DTO (Diccionario) plano que necesita el Frontend.
@@ -70,4 +121,58 @@ class FacturacionService:
             "detalle_multas": nombres_multas, # Array de strings
             
             "total_pagar": float(factura_temp.total)
-        }
\ No newline at end of file
+        }
+
+    def previsualizar_planilla(self, filas: List[Dict], multas_por_socio: Dict[int, List[Dict]]) -> Iterator[Dict]:
+        """
+        Pre-visualización masiva (Planilla de un barrio).
+        'filas' son lecturas planas ordenadas por socio (ver listar_pendientes_facturacion).
+        El agua se calcula para todo el lote de una vez (motor vectorizado, centavos enteros)
+        y se emite un resumen POR SOCIO. Las multas se cuentan una sola vez por socio,
+        igual que en la facturación real (se cargan a la primera factura generada).
+        """
+        if not filas:
+            return
+
+        motor = TarifaVectorizadaService()
+        agua = motor.calcular(
+            [f['consumo_del_mes'] or 0 for f in filas],
+            [f['tarifa_base_m3'] if f['tarifa_base_m3'] is not None else TARIFA_BASE_M3_DEFAULT for f in filas],
+            [motor.a_centavos(f['tarifa_base_precio'] if f['tarifa_base_precio'] is not None else TARIFA_BASE_PRECIO_DEFAULT) for f in filas],
+            [motor.a_centavos(f['tarifa_excedente_precio'] if f['tarifa_excedente_precio'] is not None else TARIFA_EXCEDENTE_PRECIO_DEFAULT) for f in filas],
+        )["total"].tolist()
+
+        indices = range(len(filas))
+        for socio_id, grupo in groupby(indices, key=lambda i: filas[i]['socio_id']):
+            grupo = list(grupo)
+            primera = filas[grupo[0]]
+
+            lecturas = []
+            centavos_agua = 0
+            for i in grupo:
+                f = filas[i]
+                centavos_agua += agua[i]
+                lecturas.append({
+                    "id": f['id'],
+                    "fecha_lectura": f['fecha'],
+                    "medidor_codigo": f['medidor_codigo'],
+                    "lectura_anterior": float(f['lectura_anterior'] or 0),
+                    "lectura_actual": float(f['valor']),
+                    "consumo": float(f['consumo_del_mes'] or 0),
+                    "monto_agua": agua[i] / 100,
+                    "anomalia": f.get('anomalia_consumo'),
+                })
+
+            multas = multas_por_socio.get(socio_id, [])
+            centavos_multas = sum(TarifaVectorizadaService.a_centavos(m['valor']) for m in multas)
+
+            yield {
+                "socio_id": socio_id,
+                "socio_nombre": f"{primera['socio_nombres']} {primera['socio_apellidos']}",
+                "cedula": primera['socio_identificacion'],
+                "lecturas": lecturas,
+                "monto_agua": centavos_agua / 100,
+                "multas_mingas": centavos_multas / 100,
+                "detalle_multas": [m['motivo'] for m in multas],
+                "total_pagar": (centavos_agua + centavos_multas) / 100,
+            }
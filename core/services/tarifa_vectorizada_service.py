@@ -0,0 +1,66 @@
+from decimal import Decimal
+from typing import Dict, Union
+
+import numpy as np
+
+ArrayOEscalar = Union[np.ndarray, int]
+
+# Defaults de Respaldo cuando el terreno no tiene Servicio MEDIDO activo
+# (mismos que GenerarFacturaDesdeLecturaUseCase)
+TARIFA_BASE_M3_DEFAULT = 15
+TARIFA_BASE_PRECIO_DEFAULT = Decimal("3.00")
+TARIFA_EXCEDENTE_PRECIO_DEFAULT = Decimal("0.25")
+
+
+class TarifaVectorizadaService:
+    """
+    Servicio de Dominio puro (versión vectorizada de la Tarifa Medida).
+    Responsabilidad: Calcular Base + Excedente para miles de consumos a la vez.
+    Trabaja en CENTAVOS ENTEROS (int64) para que el resultado coincida exactamente
+    con Factura.calcular_total_con_medidor (que opera con Decimal).
+    """
+
+    @staticmethod
+    def a_centavos(valor: Union[Decimal, float, str, int]) -> int:
+        """Convierte un monto monetario a centavos enteros sin errores de coma flotante."""
+        return int((Decimal(str(valor)) * 100).to_integral_value())
+
+    @staticmethod
+    def consumos_enteros(consumos_m3) -> np.ndarray:
+        """
+        Normaliza los consumos igual que el Caso de Uso de facturación:
+        int(float(consumo)) -> truncamiento hacia cero.
+        """
+        return np.trunc(np.asarray(consumos_m3, dtype=np.float64)).astype(np.int64)
+
+    def calcular(
+        self,
+        consumos_m3,
+        tarifa_base_m3: ArrayOEscalar,
+        tarifa_base_centavos: ArrayOEscalar,
+        tarifa_excedente_centavos: ArrayOEscalar
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula los arreglos de base, excedente y total (en centavos).
+        Los parámetros tarifarios pueden ser escalares (simulación) o arreglos
+        alineados con 'consumos_m3' (tarifa propia de cada servicio).
+        """
+        consumos = self.consumos_enteros(consumos_m3)
+        base_m3 = np.asarray(tarifa_base_m3, dtype=np.int64)
+        base_centavos = np.asarray(tarifa_base_centavos, dtype=np.int64)
+        excedente_centavos = np.asarray(tarifa_excedente_centavos, dtype=np.int64)
+
+        # CASO A (consumo <= base) -> excedente 0 | CASO B -> (consumo - base) m³
+        m3_excedente = np.maximum(consumos - base_m3, 0)
+
+        base = np.broadcast_to(base_centavos, consumos.shape).astype(np.int64)
+        excedente = m3_excedente * excedente_centavos
+        total = base + excedente
+
+        return {
+            "consumo_m3": consumos,
+            "m3_excedente": m3_excedente,
+            "base": base,
+            "excedente": excedente,
+            "total": total,
+        }
@@ -30,6 +30,13 @@ class BusinessRuleException(BaseExcepcionDeNegocio):
     """
     pass
 
+class ConflictoConcurrenciaError(BaseExcepcionDeNegocio):
+    """
+    Otra operación modificó el registro entre su lectura y su escritura.
+    Equivalente a HTTP 409 Conflict (el cliente debe recargar y reintentar).
+    """
+    pass
+
 
 # =============================================================================
 # 2. EXCEPCIONES ESPECÍFICAS (Para granularidad y logs detallados)
@@ -69,4 +76,8 @@ class ValidacionError(BusinessRuleException):
 
 class MedidorDuplicadoError(BusinessRuleException):
     """[NUEVO] Cuando se intenta registrar un código de medidor que ya existe."""
+    pass
+
+class StockInsuficienteError(BusinessRuleException):
+    """Venta o ajuste que dejaría el stock de un material en negativo."""
     pass
\ No newline at end of file
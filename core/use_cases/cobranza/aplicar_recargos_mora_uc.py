@@ -0,0 +1,75 @@
+# core/use_cases/cobranza/aplicar_recargos_mora_uc.py
+from datetime import date, timedelta
+from typing import Dict, Any
+
+from django.db import transaction
+
+from core.interfaces.repositories import ICobranzaRepository
+from core.shared.enums import EstadoCuentaPorCobrar
+
+
+class AplicarRecargosMoraUseCase:
+    """
+    Caso de Uso: Proceso nocturno de Mora.
+    1. Recalcula 'meses_mora' de todos los servicios (una sentencia UPDATE agregada).
+    2. Genera UN recargo por mes calendario para cada servicio en mora, como Cuenta por
+       Cobrar (rubro 'RECARGO POR MORA'), insertados en bloque.
+
+    Idempotente: la referencia MORA-{servicio}-{anio}-{mes} evita duplicar el recargo
+    si el proceso se ejecuta varias veces en el mismo mes.
+    Número de consultas constante (no depende de cuántas facturas o servicios haya).
+    """
+
+    def __init__(self, cobranza_repo: ICobranzaRepository):
+        self.cobranza_repo = cobranza_repo
+
+    @staticmethod
+    def referencia(servicio_id: int, fecha: date) -> str:
+        return f"MORA-{servicio_id}-{fecha.year}-{fecha.month:02d}"
+
+    @transaction.atomic
+    def ejecutar(self, fecha_corte: date = None, meses_minimos: int = 1) -> Dict[str, Any]:
+        if not fecha_corte:
+            fecha_corte = date.today()
+
+        # 1. Recalcular mora (set-based)
+        procesados = self.cobranza_repo.recalcular_meses_mora(fecha_corte)
+
+        # 2. Servicios que generan recargo este mes
+        servicios = self.cobranza_repo.listar_servicios_en_mora(meses_minimos)
+        rubro_id, valor_recargo = self.cobranza_repo.obtener_rubro_recargo_mora()
+
+        reporte = {
+            "fecha_corte": str(fecha_corte),
+            "servicios_procesados": procesados,
+            "servicios_en_mora": len(servicios),
+            "recargos_creados": 0,
+            "recargos_existentes": 0,
+            "valor_recargo": float(valor_recargo),
+        }
+
+        if valor_recargo <= 0 or not servicios:
+            # Recargo desactivado desde el Catálogo de Rubros (valor 0 o inactivo)
+            return reporte
+
+        referencias = {s['id']: self.referencia(s['id'], fecha_corte) for s in servicios}
+        existentes = self.cobranza_repo.referencias_existentes(rubro_id, list(referencias.values()))
+
+        fecha_vencimiento = fecha_corte + timedelta(days=15)
+        nuevas = [
+            {
+                "socio_id": s['socio_id'],
+                "rubro_id": rubro_id,
+                "monto_inicial": valor_recargo,
+                "saldo_pendiente": valor_recargo,
+                "fecha_vencimiento": fecha_vencimiento,
+                "estado": EstadoCuentaPorCobrar.PENDIENTE.value,
+                "origen_referencia": referencias[s['id']],
+            }
+            for s in servicios
+            if referencias[s['id']] not in existentes
+        ]
+
+        reporte["recargos_existentes"] = len(existentes)
+        reporte["recargos_creados"] = self.cobranza_repo.crear_cuentas_por_cobrar(nuevas)
+        return reporte
@@ -0,0 +1,34 @@
+# core/use_cases/cobranza/generar_ordenes_corte_uc.py
+from typing import Dict, Any
+
+from django.db import transaction
+
+from core.interfaces.repositories import ICobranzaRepository
+from core.shared.exceptions import ValidacionError
+
+
+class GenerarOrdenesCorteUseCase:
+    """
+    Caso de Uso: Generación automática de Órdenes de CORTE por morosidad.
+    Selecciona (1 consulta) los servicios con meses_mora >= umbral que no tienen una
+    orden en curso, crea las órdenes en bloque y las vincula con un único UPDATE.
+    Los servicios quedan bloqueados durante la transacción para que dos ejecuciones
+    simultáneas no dupliquen órdenes.
+    """
+
+    def __init__(self, cobranza_repo: ICobranzaRepository):
+        self.cobranza_repo = cobranza_repo
+
+    @transaction.atomic
+    def ejecutar(self, meses_minimos: int) -> Dict[str, Any]:
+        if meses_minimos < 1:
+            raise ValidacionError("El umbral de meses de mora debe ser al menos 1.")
+
+        servicio_ids = self.cobranza_repo.listar_servicios_para_corte(meses_minimos)
+        creadas = self.cobranza_repo.crear_ordenes_corte(servicio_ids)
+
+        return {
+            "umbral_meses_mora": meses_minimos,
+            "ordenes_creadas": creadas,
+            "servicio_ids": servicio_ids,
+        }
@@ -0,0 +1,72 @@
+# core/use_cases/conciliar_transferencias_uc.py
+import re
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Tuple
+
+from core.interfaces.repositories import IPagoRepository
+
+
+def normalizar_referencia(referencia: Any) -> str:
+    """Los bancos anteponen ceros o separadores: '00-123 456' y '123456' son la misma referencia."""
+    return re.sub(r"[^0-9A-Z]", "", str(referencia or "").upper()).lstrip("0")
+
+
+class ConciliarTransferenciasUseCase:
+    """
+    Caso de Uso: Conciliación del extracto bancario contra las transferencias subidas
+    por los socios y aún no verificadas por Tesorería.
+
+    1. Índice hash (referencia normalizada, monto) -> pagos, construido con UNA consulta.
+    2. Cada movimiento del extracto (iterable en streaming) se busca en O(1); cada pago
+       se concilia con un solo movimiento.
+    3. Los pagos conciliados se validan en bloque. Los movimientos sin pareja se
+       devuelven para revisión manual (validar-transferencia).
+    """
+
+    def __init__(self, pago_repo: IPagoRepository):
+        self.pago_repo = pago_repo
+
+    def ejecutar(self, movimientos: Iterable[Dict[str, Any]], simulacion: bool = False) -> Dict[str, Any]:
+        # 1. Índice de transferencias por validar
+        indice: Dict[Tuple[str, Decimal], List[int]] = {}
+        por_validar = set()
+        for pago_id, referencia, monto in self.pago_repo.listar_transferencias_por_validar():
+            por_validar.add(pago_id)
+            clave = normalizar_referencia(referencia)
+            # Sin referencia ('', None, '000'): no hay con qué cruzar, queda para revisión manual
+            if clave:
+                indice.setdefault((clave, monto), []).append(pago_id)
+        total_por_validar = len(por_validar)
+
+        # 2. Cruce con el extracto
+        conciliados: List[Dict[str, Any]] = []
+        no_conciliados: List[Dict[str, Any]] = []
+        pago_ids = set()
+        movimientos_leidos = 0
+
+        for mov in movimientos:
+            movimientos_leidos += 1
+            clave = normalizar_referencia(mov["referencia"])
+            candidatos = indice.get((clave, mov["monto"])) if clave else None
+            # Un pago puede tener varias líneas: se salta el que ya fue conciliado
+            while candidatos and candidatos[-1] in pago_ids:
+                candidatos.pop()
+            if candidatos:
+                pago_id = candidatos.pop()
+                pago_ids.add(pago_id)
+                conciliados.append({**mov, "pago_id": pago_id})
+            else:
+                no_conciliados.append(mov)
+
+        # 3. Validación en bloque
+        validados = 0 if simulacion else self.pago_repo.aprobar_transferencias(sorted(pago_ids))
+
+        return {
+            "simulacion": simulacion,
+            "movimientos_leidos": movimientos_leidos,
+            "conciliados": len(conciliados),
+            "pagos_validados": validados,
+            "transferencias_sin_movimiento": total_por_validar - len(pago_ids),
+            "detalle_conciliados": conciliados,
+            "no_conciliados": no_conciliados,
+        }
@@ -0,0 +1,123 @@
+# core/use_cases/emitir_facturas_sri_uc.py
+from datetime import datetime
+from typing import Dict, List
+
+from core.interfaces.repositories import IFacturaRepository
+from core.interfaces.services import ISRIService, IEmailService
+from core.domain.factura import Factura
+from core.shared.exceptions import ConflictoConcurrenciaError
+
+# Campos que escribe este caso de uso (el resto de la factura pertenece a otras operaciones)
+CAMPOS_SRI = ("sri_clave_acceso", "estado_sri", "sri_xml_autorizado", "sri_fecha_autorizacion", "sri_mensaje_error")
+INTENTOS_GUARDADO = 3
+
+
+class EmitirFacturasSRIUseCase:
+    """
+    Emisión Electrónica (SRI) + Notificación por correo de facturas ya cobradas.
+    Se usa por factura desde la ventanilla y por lote desde la cola (cobro múltiple).
+    Un fallo del SRI nunca revierte el cobro: queda registrado en estado_sri.
+    """
+
+    def __init__(
+        self,
+        factura_repo: IFacturaRepository,
+        sri_service: ISRIService,
+        email_service: IEmailService
+    ):
+        self.factura_repo = factura_repo
+        self.sri_service = sri_service
+        self.email_service = email_service
+
+    def ejecutar(self, factura_ids: List[int]) -> Dict[int, Dict]:
+        resultados = {}
+        for factura_id in factura_ids:
+            factura = self.factura_repo.obtener_por_id(factura_id)
+            if not factura:
+                resultados[factura_id] = {"enviado": False, "estado": "NO_ENCONTRADA", "mensaje": ""}
+                continue
+            resultados[factura_id] = self.procesar(factura)
+        return resultados
+
+    def procesar(self, factura: Factura) -> Dict:
+        """
+        Intenta autorizar en el SRI y enviar correo.
+        Maneja fallos de conexión sin tumbar la transacción principal.
+        """
+        sri_resultado = {
+            "enviado": False,
+            "estado": "PENDIENTE_ENVIO",
+            "mensaje": ""
+        }
+
+        try:
+            # El repositorio inyecta el Socio en 'socio_obj' (obtener_por_id)
+            socio = getattr(factura, 'socio_obj', None)
+            if not socio:
+                sri_resultado["mensaje"] = "No se pudo cargar datos del socio para SRI."
+                return sri_resultado
+
+            # 1. Generar Clave (si falta)
+            if not factura.sri_clave_acceso:
+                factura.sri_clave_acceso = self.sri_service.generar_clave_acceso(
+                    fecha_emision=factura.fecha_emision,
+                    nro_factura=str(factura.id)
+                )
+                factura = self._guardar_estado_sri(factura)
+
+            # 2. Enviar al SRI
+            respuesta = self.sri_service.enviar_factura(factura, socio)
+
+            if respuesta.exito:
+                factura.estado_sri = "AUTORIZADO"
+                factura.sri_xml_autorizado = respuesta.xml_respuesta
+                factura.sri_fecha_autorizacion = datetime.now()
+
+                sri_resultado["enviado"] = True
+                sri_resultado["estado"] = "AUTORIZADO"
+                sri_resultado["mensaje"] = str(respuesta.autorizacion_id)
+
+                # 3. Notificar Email
+                self.email_service.enviar_notificacion_factura(
+                    email_destinatario=socio.email,
+                    nombre_socio=f"{socio.nombres} {socio.apellidos}",
+                    numero_factura=factura.id,
+                    xml_autorizado=respuesta.xml_respuesta
+                )
+            else:
+                factura.estado_sri = respuesta.estado
+                factura.sri_mensaje_error = respuesta.mensaje_error
+                sri_resultado["estado"] = respuesta.estado
+                sri_resultado["mensaje"] = respuesta.mensaje_error
+
+            # Guardamos estado SRI final
+            self._guardar_estado_sri(factura)
+
+        except ConflictoConcurrenciaError as e:
+            # La respuesta del SRI (y el correo) ya ocurrieron: no se reporta como fallo del SRI
+            sri_resultado["estado"] = "CONFLICTO_CONCURRENCIA"
+            sri_resultado["mensaje"] = f"No se pudo guardar el estado SRI: {str(e)}"
+
+        except Exception as e:
+            sri_resultado["estado"] = "ERROR_SISTEMA"
+            sri_resultado["mensaje"] = f"Fallo proceso SRI: {str(e)}"
+
+        return sri_resultado
+
+    def _guardar_estado_sri(self, factura: Factura) -> Factura:
+        """
+        Guarda los campos SRI. Si otra operación cambió la factura desde que se leyó
+        (conflicto de versión), se relee y se aplican solo los campos SRI sobre la versión
+        vigente. Retorna la factura guardada.
+        """
+        for intento in range(1, INTENTOS_GUARDADO + 1):
+            try:
+                self.factura_repo.guardar(factura)
+                return factura
+            except ConflictoConcurrenciaError:
+                if intento == INTENTOS_GUARDADO:
+                    raise
+                vigente = self.factura_repo.obtener_por_id(factura.id)
+                for campo in CAMPOS_SRI:
+                    setattr(vigente, campo, getattr(factura, campo))
+                factura = vigente
@@ -16,10 +16,12 @@ class GenerarFacturaFijaUseCase:
         self.factura_repo = factura_repo
         self.servicio_repo = servicio_repo
 
-    def ejecutar(self, anio: int = None, mes: int = None, fecha_emision: date = None) -> Dict[str, Any]:
+    def ejecutar(self, anio: int = None, mes: int = None, fecha_emision: date = None, simulacion: bool = False) -> Dict[str, Any]:
         """
         Genera facturas para un PERIODO FISCAL específico (anio/mes).
         Si no se especifican, se asume el mes actual.
+        Con simulacion=True todo se calcula en memoria (no escribe ni bloquea filas)
+        y el reporte incluye el 'detalle' por servicio para el informe de diferencias.
         """
         if not fecha_emision:
             fecha_emision = date.today()
@@ -31,24 +33,32 @@ class GenerarFacturaFijaUseCase:
         fecha_vencimiento = fecha_emision + timedelta(days=15)
 
         # 1. Obtener servicios fijos activos para procesar (Delegado al repositorio)
-        servicios_fijos = self.servicio_repo.obtener_servicios_fijos_activos()
+        servicios_fijos = list(self.servicio_repo.obtener_servicios_fijos_activos())
+
+        # 2. Evitar duplicados: una sola consulta para todo el lote (periodo estricto)
+        ya_facturados = self.factura_repo.obtener_servicios_facturados(
+            [servicio.id for servicio in servicios_fijos], anio, mes
+        )
 
         reporte = {
             "periodo_fiscal": f"{anio}-{mes}",
             "fecha_emision": str(fecha_emision),
+            "simulacion": simulacion,
             "total_servicios": len(servicios_fijos),
             "creadas": 0,
             "omitidas": 0,   # Ya existían
-            "errores": []    # Fallos técnicos
+            "errores": [],   # Fallos técnicos
+            "detalle": []    # Solo en simulación
         }
 
         for servicio in servicios_fijos:
-            try:
-                # 2. Evitar duplicados (Delegado al repositorio usando el periodo estricto)
-                if self.factura_repo.existe_factura_fija_mes(servicio.id, anio, mes):
-                    reporte["omitidas"] += 1
-                    continue
+            if servicio.id in ya_facturados:
+                reporte["omitidas"] += 1
+                if simulacion:
+                    reporte["detalle"].append(self._fila_detalle(servicio, "OMITIDA", None))
+                continue
 
+            try:
                 # 3. Construir Agregado de Factura (Dominio Puro)
                 nuev_factura = Factura(
                     id=None,
@@ -69,8 +79,11 @@ class GenerarFacturaFijaUseCase:
                 # 4. Calcular Totales (Lógica de Negocio del Dominio)
                 nuev_factura.calcular_total_sin_medidor()
 
-                # 5. Persistencia (Repositorio)
-                self.factura_repo.guardar(nuev_factura)
+                # 5. Persistencia (Repositorio) - nunca en simulación
+                if simulacion:
+                    reporte["detalle"].append(self._fila_detalle(servicio, "NUEVA", nuev_factura.total))
+                else:
+                    self.factura_repo.guardar(nuev_factura)
 
                 reporte["creadas"] += 1
 
@@ -80,4 +93,24 @@ class GenerarFacturaFijaUseCase:
                 msg_error = f"Servicio ID {servicio.id} (Socio: {identificacion}): {str(e)}"
                 reporte["errores"].append(msg_error)
 
-        return reporte
\ No newline at end of file
+        if not simulacion:
+            del reporte["detalle"]
+        return reporte
+
+    @staticmethod
+    def _fila_detalle(servicio, accion: str, total) -> Dict[str, Any]:
+        barrio = getattr(servicio.terreno, 'barrio', None)
+        return {
+            "motor": "FIJA",
+            "accion": accion,
+            "barrio_id": barrio.id if barrio else None,
+            "barrio": barrio.nombre if barrio else "Sin Barrio",
+            "socio_id": servicio.socio.id,
+            "socio_identificacion": servicio.socio.identificacion,
+            "socio": f"{servicio.socio.nombres} {servicio.socio.apellidos}",
+            "servicio_id": servicio.id,
+            "lectura_id": None,
+            "consumo_m3": None,
+            "total": total,
+            "anomalia": None,
+        }
@@ -1,7 +1,6 @@
 # core/use_cases/generar_factura_uc.py
 
 from datetime import date
-from decimal import Decimal
 from typing import Optional
 from django.utils import timezone
 
@@ -10,7 +9,12 @@ from django.db import transaction
 
 # Dominio
 from core.domain.factura import Factura
-from core.shared.enums import EstadoFactura
+from core.services.facturacion_service import FacturacionService
+from core.services.tarifa_vectorizada_service import (
+    TARIFA_BASE_M3_DEFAULT,
+    TARIFA_BASE_PRECIO_DEFAULT,
+    TARIFA_EXCEDENTE_PRECIO_DEFAULT
+)
 from core.shared.exceptions import (
     LecturaNoEncontradaError,
     MedidorNoEncontradoError,
@@ -77,70 +81,36 @@ class GenerarFacturaDesdeLecturaUseCase:
         socio = self.socio_repo.get_by_id(terreno.socio_id)
         if not socio: raise ValidacionError("Socio no encontrado.")
 
-        # 3. INSTANCIAR FACTURA (ESTADO PENDIENTE)
-        factura = Factura(
-            id=None,
+        # 3. TARIFAS: Contrato de Servicio (Tarifas Dinámicas) o defaults de respaldo
+        servicio = self.servicio_repo.get_active_by_terreno_and_type(terreno.id, 'MEDIDO')
+        tarifa_base_m3 = servicio.tarifa_basica_m3 if servicio else TARIFA_BASE_M3_DEFAULT
+        tarifa_base_precio = servicio.valor_tarifa if servicio else TARIFA_BASE_PRECIO_DEFAULT
+        tarifa_excedente_precio = servicio.tarifa_excedente_precio if servicio else TARIFA_EXCEDENTE_PRECIO_DEFAULT
+
+        # 4. MULTAS PENDIENTES (FASE 3) + FACTURA PENDIENTE (mismo armado que la facturación masiva)
+        multas_pendientes = self.gobernanza_repo.obtener_multas_pendientes(socio.id)
+        factura = FacturacionService.construir_factura_medida(
             socio_id=socio.id,
             medidor_id=medidor.id,
             lectura=lectura,
             fecha_emision=input_dto.fecha_emision,
             fecha_vencimiento=input_dto.fecha_vencimiento,
-            estado=EstadoFactura.PENDIENTE, # Nace debiendo
-
-            # SRI: Limpios
-            sri_ambiente=1,
-            sri_tipo_emision=1,
-            sri_clave_acceso=None,
-            sri_xml_autorizado=None,
-            sri_mensaje_error=None,
-            estado_sri="PENDIENTE_ENVIO" # Indicador para el cajero
-        )
-
-        # 4. CÁLCULOS
-        # 4.1 Obtener Contrato de Servicio (Tarifas Dinámicas)
-        servicio = self.servicio_repo.get_active_by_terreno_and_type(terreno.id, 'MEDIDO')
-        
-        # Defaults de Respaldo
-        tarifa_base_m3 = 15
-        tarifa_base_precio = Decimal("3.00")
-        tarifa_excedente_precio = Decimal("0.25")
-        
-        if servicio:
-            # Factura Enlazada al Servicio (Para reportes)
-            factura.servicio_id = servicio.id
-            
-            # Usar valores de la DB
-            tarifa_base_m3 = servicio.tarifa_basica_m3
-            tarifa_base_precio = servicio.valor_tarifa 
-            tarifa_excedente_precio = servicio.tarifa_excedente_precio
-
-        consumo_entero = int(float(lectura.consumo_del_mes_m3))
-        
-        # 4.2 Calcular usando parámetros
-        factura.calcular_total_con_medidor(
-            consumo_m3=consumo_entero,
             tarifa_base_m3=tarifa_base_m3,
             tarifa_base_precio=tarifa_base_precio,
-            tarifa_excedente_precio=tarifa_excedente_precio
+            tarifa_excedente_precio=tarifa_excedente_precio,
+            multas=multas_pendientes or [],
+            # Factura Enlazada al Servicio (Para reportes)
+            servicio_id=servicio.id if servicio else None
         )
 
-        # 4.3 PROCESAR MULTAS PENDIENTES (FASE 3)
-        multas_pendientes = self.gobernanza_repo.obtener_multas_pendientes(socio.id)
-        if multas_pendientes:
-            for multa in multas_pendientes:
-                # Agregar al detalle de la factura
-                concepto = f"Multa: {multa.evento.nombre} ({multa.evento.fecha})"
-                valor = multa.evento.valor_multa
-                
-                factura.agregar_multa(concepto, valor)
-
-        # 5. GUARDAR
-        factura = self.factura_repo.save(factura)
+        # 5. GUARDAR (el repositorio asigna factura.id)
+        self.factura_repo.save(factura)
 
-        # 5.1 VINCULAR MULTAS A LA FACTURA CREADA
+        # 5.1 VINCULAR MULTAS A LA FACTURA CREADA (un solo UPDATE en bloque)
         if multas_pendientes:
-            for multa in multas_pendientes:
-                self.gobernanza_repo.marcar_multa_como_facturada(multa.id, factura.id)
+            self.gobernanza_repo.marcar_multas_como_facturadas(
+                {multa.id: factura.id for multa in multas_pendientes}
+            )
 
         # 6. CERRAR LECTURA
         lectura.esta_facturada = True
@@ -0,0 +1,244 @@
+# core/use_cases/generar_facturacion_medida_uc.py
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, List, Any, Optional, Set
+
+from django.db import transaction, IntegrityError
+
+# Dominio
+from core.domain.factura import Factura
+from core.domain.lectura import Lectura
+from core.services.facturacion_service import FacturacionService
+from core.services.tarifa_vectorizada_service import (
+    TARIFA_BASE_M3_DEFAULT,
+    TARIFA_BASE_PRECIO_DEFAULT,
+    TARIFA_EXCEDENTE_PRECIO_DEFAULT
+)
+
+# Interfaces
+from core.interfaces.repositories import (
+    IFacturaRepository,
+    ILecturaRepository,
+    IGobernanzaRepository
+)
+
+# Lecturas por transacción en la corrida real
+TAMANO_LOTE_DEFAULT = 500
+
+
+class GenerarFacturacionMedidaUseCase:
+    """
+    Generador Masivo de Facturas para Tarifa Medida (por barrio y periodo fiscal).
+
+    Las lecturas (con socio y tarifa) y las multas pendientes de TODOS los socios se
+    cargan en bloque; al final las multas y las lecturas se cierran con un UPDATE en
+    bloque cada una, en lugar de una sentencia por multa/lectura.
+    Las multas de un socio se cargan una sola vez, en su primera factura: antes de armarla se
+    reservan con bloqueo, así dos particiones paralelas no cobran la misma multa.
+    Los servicios que ya tienen factura en el periodo se omiten (no se intenta el INSERT).
+    """
+
+    def __init__(
+        self,
+        factura_repo: IFacturaRepository,
+        lectura_repo: ILecturaRepository,
+        gobernanza_repo: IGobernanzaRepository
+    ):
+        self.factura_repo = factura_repo
+        self.lectura_repo = lectura_repo
+        self.gobernanza_repo = gobernanza_repo
+
+    def ejecutar(
+        self, barrio_id: Optional[int], anio: int, mes: int,
+        fecha_emision: date = None, simulacion: bool = False,
+        tamano_lote: int = TAMANO_LOTE_DEFAULT
+    ) -> Dict[str, Any]:
+        """
+        Con simulacion=True recorre exactamente el mismo camino de carga y cálculo pero
+        sin transacción ni escrituras (no toma bloqueos) y agrega el 'detalle' por
+        lectura para el informe de diferencias. barrio_id=None procesa todos los barrios.
+
+        En la corrida real cada lote de 'tamano_lote' lecturas se confirma en su propia
+        transacción (facturas + multas + cierre de lecturas), para no retener bloqueos
+        durante todo el barrio. Re-ejecutar un barrio es seguro: las lecturas ya cerradas
+        no se vuelven a cargar y el unique (servicio, anio, mes) descarta duplicados.
+        """
+        if not fecha_emision:
+            fecha_emision = date.today()
+        fecha_vencimiento = fecha_emision + timedelta(days=15)
+
+        # 1. CARGA EN BLOQUE (3 consultas)
+        filas = self.lectura_repo.listar_pendientes_facturacion(barrio_id, anio, mes)
+        multas_por_socio = self.gobernanza_repo.obtener_multas_pendientes_por_socios(
+            list({f['socio_id'] for f in filas})
+        )
+        ya_facturados = self.factura_repo.obtener_servicios_facturados(
+            list({f['servicio_id'] for f in filas if f['servicio_id']}), anio, mes
+        )
+
+        reporte = {
+            "periodo_fiscal": f"{anio}-{mes}",
+            "barrio_id": barrio_id,
+            "fecha_emision": str(fecha_emision),
+            "simulacion": simulacion,
+            "total_lecturas": len(filas),
+            "creadas": 0,
+            "omitidas": 0,   # El servicio ya tiene factura en el periodo
+            "multas_aplicadas": 0,
+            "monto_total": Decimal("0.00"),
+            "errores": [],
+            "detalle": []    # Solo en simulación
+        }
+        contexto = {
+            "multas_por_socio": multas_por_socio,
+            "ya_facturados": ya_facturados,
+            "socios_con_multa_aplicada": set(),
+            "anio": anio, "mes": mes,
+            "fecha_emision": fecha_emision, "fecha_vencimiento": fecha_vencimiento,
+        }
+
+        # 2. PROCESAMIENTO POR LOTES (una transacción por lote en la corrida real)
+        tamano_lote = max(1, tamano_lote)
+        for inicio in range(0, len(filas), tamano_lote):
+            lote = filas[inicio:inicio + tamano_lote]
+            if simulacion:
+                self._procesar_lote(lote, contexto, reporte, simulacion=True)
+            else:
+                with transaction.atomic():
+                    self._procesar_lote(lote, contexto, reporte, simulacion=False)
+
+        if not simulacion:
+            del reporte["detalle"]
+        reporte["monto_total"] = float(reporte["monto_total"])
+        return reporte
+
+    def _procesar_lote(
+        self, lote: List[Dict[str, Any]], contexto: Dict[str, Any],
+        reporte: Dict[str, Any], simulacion: bool
+    ) -> None:
+        ya_facturados = contexto["ya_facturados"]
+        socios_con_multa_aplicada = contexto["socios_con_multa_aplicada"]
+        asignaciones_multas: Dict[int, int] = {}
+        lecturas_facturadas: List[int] = []
+
+        # Las particiones son por barrio del terreno: un socio con terrenos en dos barrios
+        # aparece en dos particiones paralelas. Solo se cargan las multas reservadas aquí: un
+        # solo SELECT ... FOR UPDATE por lote, en orden de id (sin interbloqueos entre
+        # particiones), que las bloquea hasta que el lote confirme y las vincule.
+        reservadas: Optional[Set[int]] = None
+        if not simulacion:
+            reservadas = self.gobernanza_repo.reservar_multas_pendientes(sorted({
+                multa.id
+                for fila in lote if fila['socio_id'] not in socios_con_multa_aplicada
+                for multa in contexto["multas_por_socio"].get(fila['socio_id'], [])
+            }))
+
+        for fila in lote:
+            if fila['servicio_id'] in ya_facturados:
+                reporte["omitidas"] += 1
+                if simulacion:
+                    reporte["detalle"].append(self._fila_detalle(fila, "OMITIDA", None))
+                continue
+
+            socio_id = fila['socio_id']
+            multas = []
+            if socio_id not in socios_con_multa_aplicada:
+                multas = contexto["multas_por_socio"].get(socio_id, [])
+                if reservadas is not None:
+                    multas = [m for m in multas if m.id in reservadas]
+
+            try:
+                factura = self._construir_factura(
+                    fila, multas, contexto["anio"], contexto["mes"],
+                    contexto["fecha_emision"], contexto["fecha_vencimiento"]
+                )
+                if simulacion:
+                    reporte["detalle"].append(self._fila_detalle(fila, "NUEVA", factura.total))
+                else:
+                    # Savepoint por lectura: un fallo no aborta el resto del lote
+                    with transaction.atomic():
+                        self.factura_repo.guardar(factura)
+            except IntegrityError:
+                # Otra partición/corrida ya facturó este servicio en el periodo
+                reporte["omitidas"] += 1
+                ya_facturados.add(fila['servicio_id'])
+                continue
+            except Exception as e:
+                reporte["errores"].append(
+                    f"Lectura ID {fila['id']} (Socio: {fila['socio_identificacion']}): {str(e)}"
+                )
+                continue
+
+            socios_con_multa_aplicada.add(socio_id)
+            if fila['servicio_id']:
+                ya_facturados.add(fila['servicio_id'])  # unique (servicio, anio, mes)
+            for multa in multas:
+                asignaciones_multas[multa.id] = factura.id
+            lecturas_facturadas.append(fila['id'])
+
+            reporte["creadas"] += 1
+            reporte["monto_total"] += factura.total
+
+        # 3. CIERRE EN BLOQUE DEL LOTE (multas vinculadas + lecturas facturadas)
+        if simulacion:
+            reporte["multas_aplicadas"] += len(asignaciones_multas)
+        else:
+            reporte["multas_aplicadas"] += self.gobernanza_repo.marcar_multas_como_facturadas(asignaciones_multas)
+            self.lectura_repo.marcar_como_facturadas(lecturas_facturadas)
+
+    @staticmethod
+    def _fila_detalle(fila: Dict[str, Any], accion: str, total) -> Dict[str, Any]:
+        consumo = fila['consumo_del_mes'] if fila['consumo_del_mes'] is not None else 0
+        if fila['servicio_id'] is None:
+            anomalia = "SIN_SERVICIO_MEDIDO"
+        elif consumo < 0:
+            anomalia = "CONSUMO_NEGATIVO"
+        elif consumo == 0:
+            anomalia = "CONSUMO_CERO"
+        else:
+            # Marca del análisis de la serie del medidor (pico, ceros continuos)
+            anomalia = fila.get('anomalia_consumo')
+
+        return {
+            "motor": "MEDIDA",
+            "accion": accion,
+            "barrio_id": fila['barrio_id'],
+            "barrio": fila['barrio_nombre'] or "Sin Barrio",
+            "socio_id": fila['socio_id'],
+            "socio_identificacion": fila['socio_identificacion'],
+            "socio": f"{fila['socio_nombres']} {fila['socio_apellidos']}",
+            "servicio_id": fila['servicio_id'],
+            "lectura_id": fila['id'],
+            "consumo_m3": consumo,
+            "total": total,
+            "anomalia": anomalia,
+        }
+
+    def _construir_factura(
+        self, fila: Dict[str, Any], multas: List[Any], anio: int, mes: int,
+        fecha_emision: date, fecha_vencimiento: date
+    ) -> Factura:
+        lectura = Lectura(
+            id=fila['id'],
+            medidor_id=fila['medidor_id'],
+            fecha=fila['fecha'],
+            valor=float(fila['valor']),
+            lectura_anterior=float(fila['lectura_anterior'] or 0),
+            consumo_del_mes_m3=float(fila['consumo_del_mes'] or 0)
+        )
+
+        # Tarifa del Servicio MEDIDO (o defaults de respaldo si el terreno no tiene contrato)
+        return FacturacionService.construir_factura_medida(
+            socio_id=fila['socio_id'],
+            medidor_id=fila['medidor_id'],
+            lectura=lectura,
+            fecha_emision=fecha_emision,
+            fecha_vencimiento=fecha_vencimiento,
+            tarifa_base_m3=fila['tarifa_base_m3'] if fila['tarifa_base_m3'] is not None else TARIFA_BASE_M3_DEFAULT,
+            tarifa_base_precio=fila['tarifa_base_precio'] if fila['tarifa_base_precio'] is not None else TARIFA_BASE_PRECIO_DEFAULT,
+            tarifa_excedente_precio=fila['tarifa_excedente_precio'] if fila['tarifa_excedente_precio'] is not None else TARIFA_EXCEDENTE_PRECIO_DEFAULT,
+            multas=multas,
+            servicio_id=fila['servicio_id'],
+            anio=anio,
+            mes=mes
+        )
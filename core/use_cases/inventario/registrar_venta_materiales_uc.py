@@ -0,0 +1,40 @@
+# core/use_cases/inventario/registrar_venta_materiales_uc.py
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List, Optional
+
+from core.interfaces.repositories import IInventarioRepository
+from core.shared.exceptions import ValidacionError
+
+
+class RegistrarVentaMaterialesUseCase:
+    """
+    Caso de Uso: Venta de materiales en ventanilla (POS) con varios ítems.
+
+    Las líneas repetidas del mismo material se agrupan y todo el stock se descuenta en un
+    solo conjunto de sentencias (ver IInventarioRepository.descontar_stock): o se vende
+    todo o no se vende nada. La transacción la controla el Entry Point.
+    """
+
+    def __init__(self, inventario_repo: IInventarioRepository):
+        self.inventario_repo = inventario_repo
+
+    def ejecutar(self, items: List[Dict[str, Any]], referencia: Optional[str] = None,
+                 usuario_id: Optional[int] = None) -> Dict[str, Any]:
+        cantidades: Dict[int, int] = {}
+        for item in items:
+            if item['cantidad'] <= 0:
+                raise ValidacionError("La cantidad de cada material debe ser mayor a cero.")
+            cantidades[item['producto_id']] = cantidades.get(item['producto_id'], 0) + item['cantidad']
+        if not cantidades:
+            raise ValidacionError("La venta no tiene materiales.")
+
+        lineas = self.inventario_repo.descontar_stock(cantidades, referencia=referencia, usuario_id=usuario_id)
+        for linea in lineas:
+            linea["subtotal"] = (Decimal(linea["precio_unitario"]) * linea["cantidad"]) \
+                .quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+        return {
+            "referencia": referencia,
+            "items": lineas,
+            "subtotal": sum((l["subtotal"] for l in lineas), Decimal("0.00")),
+        }
@@ -0,0 +1,45 @@
+# core/use_cases/previsualizar_planilla_uc.py
+from typing import Dict, Iterator, List
+
+from core.interfaces.repositories import ILecturaRepository, IGobernanzaRepository
+from core.services.facturacion_service import FacturacionService
+
+
+class PrevisualizarPlanillaUseCase:
+    """
+    Caso de Uso: Pre-visualización masiva de la facturación de un barrio.
+    Permite al Tesorero revisar TODAS las facturas pendientes de un periodo
+    (agua + multas) antes de ejecutar la facturación real. No escribe en BD.
+
+    Costo fijo: 1 consulta de lecturas (con socio y tarifa) + 1 consulta de multas.
+    """
+
+    def __init__(
+        self,
+        lectura_repo: ILecturaRepository,
+        gobernanza_repo: IGobernanzaRepository,
+        facturacion_service: FacturacionService = None
+    ):
+        self.lectura_repo = lectura_repo
+        self.gobernanza_repo = gobernanza_repo
+        self.facturacion_service = facturacion_service or FacturacionService()
+
+    def ejecutar(self, barrio_id: int, anio: int, mes: int) -> Iterator[Dict]:
+        """
+        Retorna un generador (un item por socio) para poder transmitir la
+        respuesta en streaming en barrios grandes.
+        """
+        filas = self.lectura_repo.listar_pendientes_facturacion(barrio_id, anio, mes)
+
+        socio_ids = list({f['socio_id'] for f in filas})
+        multas_raw = self.gobernanza_repo.obtener_multas_pendientes_por_socios(socio_ids)
+
+        multas_por_socio: Dict[int, List[Dict]] = {
+            socio_id: [
+                {"motivo": FacturacionService.concepto_multa(m), "valor": m.evento.valor_multa}
+                for m in multas
+            ]
+            for socio_id, multas in multas_raw.items()
+        }
+
+        return self.facturacion_service.previsualizar_planilla(filas, multas_por_socio)
@@ -0,0 +1,140 @@
+# core/use_cases/registrar_cobro_multiple_uc.py
+from decimal import Decimal
+from typing import Any, Dict, List
+
+# Interfaces (Puertos)
+from core.interfaces.repositories import IFacturaRepository, IPagoRepository
+from core.interfaces.services import IColaEmisionSRI
+
+# Dominio
+from core.shared.enums import MetodoPagoEnum
+from core.shared.exceptions import BusinessRuleException
+
+# Margen de error de 1 centavo (igual que RegistrarCobroUseCase)
+TOLERANCIA = Decimal("0.01")
+
+
+class RegistrarCobroMultipleUseCase:
+    """
+    Cobro en ventanilla de VARIAS facturas de un socio en una sola transacción
+    (controlada en el Entry Point, igual que el cobro individual).
+
+    Los fondos recibidos se aplican a las facturas pendientes de la más antigua a la más
+    reciente (FIFO); solo se cancelan facturas completas. Las transferencias ya validadas
+    por Tesorería se descuentan del saldo de su factura; las facturas con transferencias
+    aún sin validar se omiten (mismo 'Candado' que el cobro individual).
+
+    Costo fijo: 1 consulta de facturas + 1 del resumen de pagos + inserción en bloque de
+    recibos y métodos + 1 UPDATE de estados. Las facturas se leen sin bloqueo: el UPDATE de
+    estados compara la versión leída y, si otra caja cobró primero, lanza
+    ConflictoConcurrenciaError (el Entry Point revierte todo). La emisión SRI de todas las
+    facturas cobradas se encola en un solo lote al confirmar la transacción.
+    """
+
+    def __init__(
+        self,
+        factura_repo: IFacturaRepository,
+        pago_repo: IPagoRepository,
+        cola_sri: IColaEmisionSRI
+    ):
+        self.factura_repo = factura_repo
+        self.pago_repo = pago_repo
+        self.cola_sri = cola_sri
+
+    def ejecutar(self, socio_id: int, lista_pagos: List[Dict]) -> Dict[str, Any]:
+        # 1. Carga en bloque (facturas con su versión, sin bloqueo + resumen de pagos)
+        facturas = self.factura_repo.obtener_pendientes_para_cobro(socio_id)
+        if not facturas:
+            raise BusinessRuleException("El socio no tiene facturas pendientes de pago.")
+        transferencias = self.pago_repo.obtener_resumen_transferencias([f.id for f in facturas])
+
+        # Efectivo al final: lo que sobre es el vuelto
+        fondos = sorted(
+            ({**p, "monto": Decimal(str(p['monto']))} for p in lista_pagos),
+            key=lambda p: p.get('metodo') == MetodoPagoEnum.EFECTIVO.value
+        )
+        total_recibido = sum((p['monto'] for p in fondos), Decimal("0.00"))
+        disponible = total_recibido
+
+        pagadas: List[Dict[str, Any]] = []
+        omitidas: List[Dict[str, Any]] = []
+        asignaciones: List[Dict[str, Any]] = []
+        primera_impaga = None
+
+        # 2. Asignación FIFO
+        for factura in facturas:
+            resumen = transferencias.get(factura.id, {"validado": Decimal("0.00"), "pendientes": Decimal("0.00")})
+            if resumen["pendientes"]:
+                omitidas.append({
+                    "factura_id": factura.id,
+                    "motivo": "Tiene transferencias sin verificar por Tesorería."
+                })
+                continue
+
+            saldo = max(factura.total - resumen["validado"], Decimal("0.00"))
+            if saldo - disponible > TOLERANCIA:
+                primera_impaga = factura
+                break  # No se salta una factura antigua para pagar una más reciente
+
+            aplicado = min(saldo, disponible)
+            disponible -= aplicado
+            if aplicado > 0:
+                asignaciones.append({
+                    "factura_id": factura.id,
+                    "monto": aplicado,
+                    "detalles": self._tomar_fondos(fondos, aplicado)
+                })
+            pagadas.append({
+                "factura_id": factura.id,
+                "periodo": f"{factura.anio}-{factura.mes:02d}",
+                "total": factura.total,
+                "previo_validado": resumen["validado"],
+                "monto_aplicado": aplicado
+            })
+
+        if not pagadas:
+            detalle = f" La factura más antigua requiere ${primera_impaga.total}." if primera_impaga else ""
+            raise BusinessRuleException(
+                f"Monto insuficiente para cancelar alguna factura (Recibido: ${total_recibido}).{detalle}"
+            )
+
+        # 3. Persistencia en bloque
+        comprobantes = self.pago_repo.registrar_cobro_multiple(socio_id, asignaciones)
+        por_factura = {a["factura_id"]: c for a, c in zip(asignaciones, comprobantes)}
+        for item in pagadas:
+            item["comprobante"] = por_factura.get(item["factura_id"])
+
+        # Compare-and-set por versión: si otra caja cobró alguna factura, se lanza conflicto
+        versiones = {f.id: f.version for f in facturas}
+        factura_ids = [p["factura_id"] for p in pagadas]
+        self.factura_repo.marcar_como_pagadas(factura_ids, {fid: versiones[fid] for fid in factura_ids})
+
+        # 4. SRI + correo en un solo lote, después del COMMIT
+        self.cola_sri.encolar(factura_ids)
+
+        return {
+            "mensaje": f"Cobro registrado: {len(pagadas)} factura(s) pagada(s).",
+            "socio_id": socio_id,
+            "facturas_pagadas": pagadas,
+            "facturas_omitidas": omitidas,
+            "facturas_pendientes": len(facturas) - len(pagadas) - len(omitidas),
+            "total_recibido": total_recibido,
+            "total_aplicado": total_recibido - disponible,
+            "saldo_no_aplicado": disponible,
+            "sri": {"estado": "ENCOLADO", "facturas": len(factura_ids)}
+        }
+
+    @staticmethod
+    def _tomar_fondos(fondos: List[Dict], monto: Decimal) -> List[Dict]:
+        """Consume 'monto' de los pagos recibidos (en orden) y retorna las porciones usadas."""
+        porciones = []
+        for pago in fondos:
+            if monto <= 0:
+                break
+            if pago['monto'] <= 0:
+                continue
+            parte = min(pago['monto'], monto)
+            pago['monto'] -= parte
+            monto -= parte
+            porciones.append({**pago, "monto": parte})
+        return porciones
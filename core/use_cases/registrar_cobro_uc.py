@@ -1,11 +1,12 @@
 # core/use_cases/registrar_cobro_uc.py
+from contextlib import nullcontext
 from decimal import Decimal
-from typing import List, Dict, Tuple
-from datetime import datetime
+from typing import Callable, ContextManager, List, Dict, Tuple
 
 # Interfaces (Puertos)
 from core.interfaces.repositories import IFacturaRepository, IPagoRepository
 from core.interfaces.services import ISRIService, IEmailService
+from core.use_cases.emitir_facturas_sri_uc import EmitirFacturasSRIUseCase
 
 # Dominio
 from core.domain.factura import Factura, DetalleFactura, EstadoFactura
@@ -16,6 +17,12 @@ class RegistrarCobroUseCase:
     """
     Gestiona la Recaudación, la Emisión Electrónica (SRI), Notificación y genera el Comprobante.
     Implementa el 'Candado de Seguridad' para validar transferencias previas.
+
+    Concurrencia optimista: la factura se lee sin bloqueo y solo la escritura (pagos +
+    estado) corre dentro de 'unidad_de_trabajo' (la transacción corta que provee el Entry
+    Point). Si otra ventanilla cobró la factura primero, guardar() lanza
+    ConflictoConcurrenciaError y se revierten los pagos. El SRI se contacta después,
+    sin transacción ni filas bloqueadas.
     """
 
     def __init__(
@@ -23,13 +30,15 @@ class RegistrarCobroUseCase:
         factura_repo: IFacturaRepository, 
         pago_repo: IPagoRepository,
         sri_service: ISRIService,
-        email_service: IEmailService
+        email_service: IEmailService,
+        unidad_de_trabajo: Callable[[], ContextManager] = nullcontext
     ):
         # Inyección de Dependencias (DIP)
         self.factura_repo = factura_repo
         self.pago_repo = pago_repo
         self.sri_service = sri_service
         self.email_service = email_service
+        self.unidad_de_trabajo = unidad_de_trabajo
 
     def ejecutar(self, factura_id: int, lista_pagos: List[Dict]) -> Dict:
         # 1. Obtener Entidad (Agnóstico de la BD)
@@ -43,11 +52,12 @@ class RegistrarCobroUseCase:
         
         # (Asumimos que la validación de ANULADA se maneja igual si existiera el estado)
 
-        # 3. Lógica del "Candado" (Delegada al repositorio)
-        if self.pago_repo.tiene_pagos_pendientes(factura.id):
+        # 3. Lógica del "Candado" (resumen de pagos mantenido en la factura: una sola lectura)
+        resumen = self.pago_repo.obtener_resumen_pagos(factura.id)
+        if resumen["monto_por_validar"] > 0:
              raise BusinessRuleException("Error: Existen transferencias subidas pero NO verificadas por Tesorería. Vaya al módulo de validación primero.")
 
-        monto_transferencias = Decimal(self.pago_repo.obtener_sumatoria_validada(factura.id))
+        monto_transferencias = Decimal(resumen["monto_validado"])
         
         # 4. Calcular Total Recibido (Efectivo + Transferencias Nuevas)
         # Refactor Clean Architecture: El caso de uso debe agnóstico al método.
@@ -69,16 +79,17 @@ class RegistrarCobroUseCase:
                 f"(Previo Validado: ${monto_transferencias} + Recibido Caja: ${total_recibido_caja})"
             )
 
-        # 6. Persistencia
-        # Registramos los nuevos pagos (Efectivo, Transferencia, Cheque, etc.)
-        # El repositorio ya sabe cómo guardarlos y marcarlos como válidos si vienen de caja.
-        self.pago_repo.registrar_pagos(factura.id, lista_pagos)
-        
-        # Actualizamos estado de la factura
-        factura.estado = EstadoFactura.PAGADA
-        self.factura_repo.guardar(factura) 
+        # 6. Persistencia (única parte transaccional)
+        with self.unidad_de_trabajo():
+            # Registramos los nuevos pagos (Efectivo, Transferencia, Cheque, etc.)
+            # El repositorio ya sabe cómo guardarlos y marcarlos como válidos si vienen de caja.
+            comprobantes = self.pago_repo.registrar_pagos(factura.id, lista_pagos)
+
+            # Actualizamos estado de la factura (compare-and-set por versión)
+            factura.estado = EstadoFactura.PAGADA
+            self.factura_repo.guardar(factura)
 
-        # 7. Orquestación SRI + Email
+        # 7. Orquestación SRI + Email (fuera de la transacción)
         resultado_sri = self._procesar_sri_y_notificar(factura)
 
         # 8. Construcción de respuesta (Podría ser un DTO, pero mantenemos compatibilidad Dict)
@@ -86,6 +97,7 @@ class RegistrarCobroUseCase:
             "mensaje": "Cobro registrado correctamente.",
             "factura_id": factura.id,
             "nuevo_estado": "PAGADA",
+            "comprobante": comprobantes[0] if comprobantes else None,
             "sri": resultado_sri,
             # El comprobante completo se podría construir aquí o solicitar aparte
             "comprobante_preview": {
@@ -96,101 +108,11 @@ class RegistrarCobroUseCase:
 
     def _procesar_sri_y_notificar(self, factura: Factura) -> Dict:
         """
-        Intenta autorizar en el SRI y enviar correo. 
+        Intenta autorizar en el SRI y enviar correo (ver EmitirFacturasSRIUseCase).
         Maneja fallos de conexión sin tumbar la transacción principal.
         """
-        sri_resultado = {
-            "enviado": False,
-            "estado": "PENDIENTE_ENVIO",
-            "mensaje": ""
-        }
-
-        try:
-            # A. Obtener datos necesarios para soc
-            # Nota: Factura ya tiene socio_id, pero necesitamos el objeto Socio completo.
-            # En obtener_por_id, el repo ya debería haber poblado factura.socio (si modificamos la entidad para tenerlo)
-            # O asumimos que self.factura_repo.obtener_por_id retorna un objeto que tiene acceso al socio.
-            # Para Clean Architecture estricto, Factura debería tener un campo 'socio' tipo Socio entity, no solo ID.
-            # Asumiremos que factura tiene el atributo 'socio_obj' o similar poblado por el repo, 
-            # O hacemos un fetch extra si es necesario. Por ahora usamos la relación que existía.
-            
-            # Como la entidad definida en el paso 1 tiene 'socio_id', pero necesitamos los datos del socio,
-            # vamos a asumir que el repositorio nos devuelve una Factura enriquecida o consultamos el socio.
-            # Para simplificar y dado que 'Factura' es DataClass, asumiremos que el repo inyectó el objeto socio 
-            # en un campo o que pasamos el objeto socio necesario.
-            
-            # SOLUCIÓN PRAGMÁTICA: Usar la entidad Factura que tiene los datos necesarios.
-            # Si la entidad Factura solo tiene ID, estamos limitados.
-            # Revisando factura.py anterior: tenia socio_id.
-            # Vamos a asumir que el repositorio inyectó el socio en factura.socio_obj (atributo dinámico o modificado)
-            # O mejor, pasamos factura y su socio_id.
-            
-            # Revisando 'core/domain/factura.py', no tiene campo 'socio', solo 'socio_id'.
-            # Necesitamos el socio.
-            # OPCIÓN: Agregar metodo al repositorio 'obtener_socio(id)'.
-            # Pero para no complicar las interfaces ahora, asumiremos que 'Factura' tiene un campo opcional 'socio_data'
-            # o que el repositorio maneja la lógica.
-            
-            # Vamos a intentar enviar con lo que tenemos.
-            # El servicio SRI necesita objeto Socio.
-            # Haremos un pequeño hack temporal o asumiremos que Factura tiene atributo .socio inyectado.
-            
-            # Supuesto: El Repository de Factura devuelve una entidad con el atributo .socio cargado
-            # aunque no esté en el dataclass original (Python permite esto dinamicamente)
-            # o modificamos el Dataclass.
-            
-            # Para este código:
-            socio = getattr(factura, 'socio_obj', None) 
-            # Si es None, no podemos enviar al SRI.
-            
-            if not socio:
-                # Fallback: Intentar construirlo o saltar SRI
-                sri_resultado["mensaje"] = "No se pudo cargar datos del socio para SRI."
-                return sri_resultado
-
-                # 1. Generar Clave (si falta)
-            if not factura.sri_clave_acceso:
-                # Necesitamos RUC emisor y fecha. 
-                # Refactor Clean Architecture: El servicio SRI encapsula el RUC del emisor.
-                # Ya no necesitamos pasarlo desde el Caso de Uso.
-                clave = self.sri_service.generar_clave_acceso(
-                    fecha_emision=factura.fecha_emision,
-                    nro_factura=str(factura.id)
-                )
-                factura.sri_clave_acceso = clave
-                # Guardamos la clave generada
-                self.factura_repo.guardar(factura)
-
-            # 2. Enviar al SRI
-            respuesta = self.sri_service.enviar_factura(factura, socio)
-
-            if respuesta.exito:
-                factura.estado_sri = "AUTORIZADO"
-                factura.sri_xml_autorizado = respuesta.xml_respuesta
-                factura.sri_fecha_autorizacion = datetime.now() # Usar servicio de tiempo si fuera estricto
-                
-                sri_resultado["enviado"] = True
-                sri_resultado["estado"] = "AUTORIZADO"
-                sri_resultado["mensaje"] = str(respuesta.autorizacion_id)
-
-                # 3. Notificar Email
-                self.email_service.enviar_notificacion_factura(
-                    email_destinatario=socio.email,
-                    nombre_socio=f"{socio.nombres} {socio.apellidos}",
-                    numero_factura=factura.id,
-                    xml_autorizado=respuesta.xml_respuesta
-                )
-            else:
-                factura.estado_sri = respuesta.estado
-                factura.sri_mensaje_error = respuesta.mensaje_error
-                sri_resultado["estado"] = respuesta.estado
-                sri_resultado["mensaje"] = respuesta.mensaje_error
-
-            # Guardamos estado SRI final
-            self.factura_repo.guardar(factura)
-
-        except Exception as e:
-            sri_resultado["estado"] = "ERROR_SISTEMA"
-            sri_resultado["mensaje"] = f"Fallo proceso SRI: {str(e)}"
-        
-        return sri_resultado
+        return EmitirFacturasSRIUseCase(
+            factura_repo=self.factura_repo,
+            sri_service=self.sri_service,
+            email_service=self.email_service
+        ).procesar(factura)
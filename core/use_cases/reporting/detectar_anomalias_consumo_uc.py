@@ -0,0 +1,74 @@
+# core/use_cases/reporting/detectar_anomalias_consumo_uc.py
+from typing import Dict, Any, Optional
+from decimal import Decimal
+
+import numpy as np
+
+from core.interfaces.repositories import ILecturaRepository
+from core.services.deteccion_anomalias_service import DeteccionAnomaliasService
+from core.shared.exceptions import ValidacionError
+
+MESES_HISTORIA_DEFAULT = 12
+
+
+class DetectarAnomaliasConsumoUseCase:
+    """
+    Caso de Uso (proceso por lote): marca las lecturas de un periodo con posibles fugas o
+    errores de lectura (pico sobre la línea base, ceros consecutivos, lectura regresiva).
+    Toda la red se analiza en una sola pasada: 1 consulta -> matriz medidores x meses ->
+    cálculo vectorizado -> 1 UPDATE por lotes. La planilla y la simulación de facturación
+    muestran la marca guardada en cada lectura.
+    """
+
+    def __init__(self, lectura_repo: ILecturaRepository, servicio: Optional[DeteccionAnomaliasService] = None):
+        self.lectura_repo = lectura_repo
+        self.servicio = servicio or DeteccionAnomaliasService()
+
+    def ejecutar(self, anio: int, mes: int, meses: int = MESES_HISTORIA_DEFAULT) -> Dict[str, Any]:
+        if not 1 <= mes <= 12 or meses < 1:
+            raise ValidacionError("Periodo o número de meses de historia inválido.")
+
+        filas = self.lectura_repo.obtener_series_consumo(anio, mes, meses)
+        reporte: Dict[str, Any] = {
+            "periodo": {"anio": anio, "mes": mes},
+            "meses_historia": meses,
+            "medidores": 0,
+            "anomalias": {},
+        }
+        if not filas:
+            return reporte
+
+        total = len(filas)
+        lectura_ids = np.fromiter((f[0] for f in filas), dtype=np.int64, count=total)
+        medidor_ids = np.fromiter((f[1] for f in filas), dtype=np.int64, count=total)
+        periodos = np.fromiter((f[2] * 12 + f[3] - 1 for f in filas), dtype=np.int64, count=total)
+        consumos = np.fromiter((float(f[4] if f[4] is not None else np.nan) for f in filas), dtype=np.float64, count=total)
+
+        # Matriz (medidor, mes): columna 0 = mes más antiguo, última = periodo analizado
+        medidores, fila_de = np.unique(medidor_ids, return_inverse=True)
+        columna_de = periodos - (anio * 12 + mes - 1 - meses)
+        matriz = np.full((len(medidores), meses + 1), np.nan)
+        matriz[fila_de, columna_de] = consumos
+
+        resultado = self.servicio.analizar(matriz)
+
+        # Lectura del periodo de cada medidor (última columna)
+        del_periodo = columna_de == meses
+        lecturas_periodo = np.empty(len(medidores), dtype=np.int64)
+        lecturas_periodo[fila_de[del_periodo]] = lectura_ids[del_periodo]
+
+        anomalias = resultado["anomalia"].tolist()
+        medianas = resultado["mediana"].tolist()
+        guardar = {
+            lectura_id: (
+                anomalias[i] or None,
+                None if np.isnan(medianas[i]) else Decimal(str(round(medianas[i], 2)))
+            )
+            for i, lectura_id in enumerate(lecturas_periodo.tolist())
+        }
+        self.lectura_repo.guardar_anomalias(guardar)
+
+        codigos, cantidades = np.unique(resultado["anomalia"][resultado["anomalia"] != ""], return_counts=True)
+        reporte["medidores"] = len(medidores)
+        reporte["anomalias"] = dict(zip(codigos.tolist(), cantidades.tolist()))
+        return reporte
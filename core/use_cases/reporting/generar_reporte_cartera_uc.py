@@ -1,15 +1,10 @@
 # core/use_cases/reporting/generar_reporte_cartera_uc.py
-from typing import List, Dict, Any
-from datetime import date
-from django.db.models import Sum, Q, F
-from django.utils import timezone
-from core.interfaces.repositories import IFacturaRepository, ISocioRepository
-# Importamos el modelo concreto solo para type hinting si es necesario, 
-# pero idealmente deberíamos usar repositorios. 
-# Para reportes complejos, a veces es aceptable usar el ORM directo para agregaciones 
-# si el repositorio es muy genérico, pero intentaremos mantenerlo limpio.
-from adapters.infrastructure.models.factura_model import FacturaModel 
-from core.shared.enums import EstadoFactura
+from typing import List, Dict, Any, Optional
+from decimal import Decimal
+from core.interfaces.repositories import ICarteraRepository
+# Para reportes es aceptable usar la infraestructura directa si no se inyecta un repositorio
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
+
 
 class GenerarReporteCarteraUseCase:
     """
@@ -18,58 +13,35 @@ class GenerarReporteCarteraUseCase:
     - Corriente (Mes actual)
     - Vencida 1-3 Meses
     - Incobrable (> 3 Meses)
+
+    Lee el snapshot por socio (cartera_socios), que se reconstruye cada noche y se ajusta
+    durante el día al emitir, pagar o cambiar de estado una factura: cargar el dashboard
+    ya no recorre todas las facturas pendientes.
     """
 
-    def execute(self) -> List[Dict[str, Any]]:
+    def __init__(self, cartera_repo: Optional[ICarteraRepository] = None):
+        self.cartera_repo = cartera_repo or DjangoCarteraRepository()
+
+    def execute(self, barrio_id: Optional[int] = None, deuda_minima: Optional[Decimal] = None,
+                limite: Optional[int] = None, desplazamiento: int = 0) -> List[Dict[str, Any]]:
         """
-        Retorna una lista de diccionarios con el resumen de deuda por socio.
+        Retorna una lista de diccionarios con el resumen de deuda por socio,
+        de mayor a menor deuda. 'limite'/'desplazamiento' acotan la página.
         """
-        hoy = timezone.now().date()
-        
-        # 1. Obtener todas las facturas pendientes
-        # Nota: Idealmente esto iría en un metría específica del Repositorio,
-        # pero para analytics usamos ORM para optimizar agregaciones.
-        facturas_pendientes = FacturaModel.objects.filter(
-            estado=EstadoFactura.PENDIENTE.value
-        ).select_related('socio__barrio', 'medidor')
-
-        reporte = {}
-
-        for factura in facturas_pendientes:
-            socio_id = factura.socio.id
-            nombre_socio = f"{factura.socio.apellidos} {factura.socio.nombres}"
-            
-            if socio_id not in reporte:
-                reporte[socio_id] = {
-                    "socio_id": socio_id,
-                    "nombre": nombre_socio,
-                    "barrio": factura.socio.barrio.nombre if factura.socio.barrio else "Sin Barrio",
-                    "identificacion": factura.socio.identificacion,
-                    "total_deuda": 0.00,
-                    "corriente": 0.00,      # < 30 días
-                    "vencido_1_3": 0.00,    # 30 - 90 días
-                    "incobrable": 0.00,     # > 90 días
-                    "facturas_pendientes": 0
-                }
-
-            # Calcular días de mora
-            dias_mora = (hoy - factura.fecha_emision).days
-            monto = float(factura.total)
-
-            # Acumular
-            reporte[socio_id]["total_deuda"] += monto
-            reporte[socio_id]["facturas_pendientes"] += 1
-
-            # Clasificar
-            if dias_mora <= 30:
-                reporte[socio_id]["corriente"] += monto
-            elif 30 < dias_mora <= 90:
-                reporte[socio_id]["vencido_1_3"] += monto
-            else:
-                reporte[socio_id]["incobrable"] += monto
-
-        # Convertir a lista y ordenar por deuda (Mayor a menor)
-        lista_reporte = list(reporte.values())
-        lista_reporte.sort(key=lambda x: x["total_deuda"], reverse=True)
-
-        return lista_reporte
+        filas = self.cartera_repo.listar(
+            barrio_id=barrio_id, deuda_minima=deuda_minima, limite=limite, desplazamiento=desplazamiento
+        )
+        return [
+            {
+                "socio_id": f['socio_id'],
+                "nombre": f['nombre'],
+                "barrio": f['barrio'],
+                "identificacion": f['identificacion'],
+                "total_deuda": float(f['total_deuda']),
+                "corriente": float(f['corriente']),          # < 30 días
+                "vencido_1_3": float(f['vencido_1_3']),      # 30 - 90 días
+                "incobrable": float(f['incobrable']),        # > 90 días
+                "facturas_pendientes": f['facturas_pendientes'],
+            }
+            for f in filas
+        ]
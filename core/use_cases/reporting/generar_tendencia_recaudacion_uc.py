@@ -0,0 +1,202 @@
+# core/use_cases/reporting/generar_tendencia_recaudacion_uc.py
+from typing import Dict, Any, List, Optional
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+
+from django.db.models import F, Q, Sum, Value
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from adapters.infrastructure.models.factura_model import FacturaModel
+from adapters.infrastructure.models.pago_model import PagoModel
+from core.shared.enums import EstadoFactura
+from core.shared.exceptions import ValidacionError
+
+MES = "mes"
+SEMANA = "semana"
+
+# Periodos por defecto y máximos (acotan el tamaño de la respuesta)
+PERIODOS_DEFAULT = {MES: 12, SEMANA: 12}
+PERIODOS_MAXIMO = {MES: 60, SEMANA: 156}
+
+CERO = Decimal("0.00")
+
+
+class GenerarTendenciaRecaudacionUseCase:
+    """
+    Caso de Uso: Tendencia de Facturado vs Recaudado (mensual o semanal).
+
+    Cada serie sale de UNA consulta agrupada por (periodo, barrio) en la base de datos:
+    - Facturado: total de facturas no anuladas por año/mes fiscal (semanal: por semana de emisión).
+      En la misma consulta, la deuda nueva = saldo aún no cobrado de lo facturado en el periodo.
+    - Recaudado: pagos validados agrupados con TruncMonth/TruncWeek de fecha_registro en hora local.
+    La tasa de cobro del periodo es recaudado / facturado.
+    """
+
+    def execute(self, granularidad: str = MES, fecha_inicio: Optional[date] = None,
+                fecha_fin: Optional[date] = None, barrio_id: Optional[int] = None) -> Dict[str, Any]:
+        if granularidad not in PERIODOS_DEFAULT:
+            raise ValidacionError("La granularidad debe ser 'mes' o 'semana'.")
+
+        fecha_fin = fecha_fin or timezone.localdate()
+        periodos = self._periodos(granularidad, fecha_inicio, fecha_fin)
+        inicio, fin = periodos[0], self._siguiente(granularidad, periodos[-1])
+
+        facturado = self._facturado(granularidad, inicio, fin, barrio_id)
+        recaudado = self._recaudado(granularidad, inicio, fin, barrio_id)
+
+        # (periodo, barrio_id) -> montos; se completan con cero los periodos sin movimiento
+        nombres: Dict[Optional[int], str] = {}
+        por_barrio: Dict[Optional[int], Dict[date, Dict[str, Decimal]]] = {}
+
+        def celda(barrio: Optional[int], periodo: date) -> Dict[str, Decimal]:
+            serie = por_barrio.setdefault(barrio, {})
+            return serie.setdefault(periodo, {"facturado": CERO, "recaudado": CERO, "deuda_nueva": CERO})
+
+        for fila in facturado:
+            nombres[fila['barrio_id']] = fila['barrio']
+            valores = celda(fila['barrio_id'], fila['periodo'])
+            valores["facturado"] = fila['facturado'] or CERO
+            valores["deuda_nueva"] = fila['deuda_nueva'] or CERO
+        for fila in recaudado:
+            nombres[fila['barrio_id']] = fila['barrio']
+            celda(fila['barrio_id'], fila['periodo'])["recaudado"] = fila['recaudado'] or CERO
+
+        series = []
+        for periodo in periodos:
+            totales = {
+                clave: sum((serie.get(periodo, {}).get(clave, CERO) for serie in por_barrio.values()), CERO)
+                for clave in ("facturado", "recaudado", "deuda_nueva")
+            }
+            series.append(self._punto(granularidad, periodo, totales))
+
+        barrios = [
+            {
+                "barrio_id": barrio,
+                "barrio": nombres.get(barrio) or "Sin Barrio",
+                "series": [
+                    self._punto(granularidad, periodo, serie.get(periodo, {}))
+                    for periodo in periodos
+                ],
+            }
+            for barrio, serie in sorted(por_barrio.items(), key=lambda item: nombres.get(item[0]) or "")
+        ]
+
+        return {
+            "granularidad": granularidad,
+            "rango": {"inicio": inicio, "fin": fin - timedelta(days=1)},
+            "barrio_id": barrio_id,
+            "series": series,
+            "barrios": barrios,
+        }
+
+    # ------------------------------------------------------------------
+    # CONSULTAS (una por serie)
+    # ------------------------------------------------------------------
+    def _facturado(self, granularidad: str, inicio: date, fin: date, barrio_id: Optional[int]):
+        facturas = FacturaModel.objects.exclude(estado=EstadoFactura.ANULADA.value)
+        if granularidad == MES:
+            # Periodo fiscal (anio, mes): puede diferir de la fecha de emisión
+            facturas = facturas.filter(
+                Q(anio__gt=inicio.year) | Q(anio=inicio.year, mes__gte=inicio.month),
+                Q(anio__lt=fin.year) | Q(anio=fin.year, mes__lt=fin.month),
+            )
+            agrupacion = ('anio', 'mes')
+        else:
+            facturas = facturas.filter(fecha_emision__gte=inicio, fecha_emision__lt=fin).annotate(
+                periodo=TruncWeek('fecha_emision')
+            )
+            agrupacion = ('periodo',)
+        if barrio_id:
+            facturas = facturas.filter(socio__barrio_id=barrio_id)
+
+        pendiente = Q(estado__in=[EstadoFactura.PENDIENTE.value, EstadoFactura.POR_VALIDAR.value])
+        filas = facturas.values(
+            *agrupacion, barrio_id=F('socio__barrio_id'), barrio=F('socio__barrio__nombre')
+        ).annotate(
+            facturado=Sum('total'),
+            deuda_nueva=Sum(F('total') - F('monto_validado'), filter=pendiente),
+        ).order_by()
+
+        for fila in filas:
+            if granularidad == MES:
+                fila['periodo'] = date(fila.pop('anio'), fila.pop('mes'), 1)
+            elif isinstance(fila['periodo'], datetime):
+                fila['periodo'] = fila['periodo'].date()
+            yield fila
+
+    def _recaudado(self, granularidad: str, inicio: date, fin: date, barrio_id: Optional[int]):
+        truncar = TruncMonth if granularidad == MES else TruncWeek
+        pagos = PagoModel.objects.filter(
+            validado=True,
+            fecha_registro__gte=timezone.make_aware(datetime.combine(inicio, time.min)),
+            fecha_registro__lt=timezone.make_aware(datetime.combine(fin, time.min)),
+        )
+        if barrio_id:
+            pagos = pagos.filter(socio__barrio_id=barrio_id)
+
+        # Hora local = UTC + desfase fijo (Ecuador no tiene horario de verano), truncada "en UTC".
+        # Trunc* con la zona activa usa CONVERT_TZ con nombre de zona en MySQL, que retorna NULL
+        # si el servidor no tiene cargadas las tablas de zonas horarias.
+        desfase = timezone.localtime().utcoffset()
+        filas = pagos.annotate(
+            periodo=truncar(F('fecha_registro') + Value(desfase), tzinfo=dt_timezone.utc)
+        ).values(
+            'periodo', barrio_id=F('socio__barrio_id'), barrio=F('socio__barrio__nombre')
+        ).annotate(recaudado=Sum('monto_total')).order_by()
+
+        for fila in filas:
+            if fila['periodo'] is None:
+                # Un periodo nulo se sumaría en silencio a otro mes: mejor fallar
+                raise RuntimeError("La base de datos no pudo truncar fecha_registro al periodo de recaudación.")
+            fila['periodo'] = fila['periodo'].date()
+            yield fila
+
+    # ------------------------------------------------------------------
+    # PERIODOS
+    # ------------------------------------------------------------------
+    def _inicio_periodo(self, granularidad: str, fecha: date) -> date:
+        if granularidad == MES:
+            return fecha.replace(day=1)
+        return fecha - timedelta(days=fecha.weekday())
+
+    def _siguiente(self, granularidad: str, periodo: date) -> date:
+        if granularidad == MES:
+            return date(periodo.year + (periodo.month == 12), periodo.month % 12 + 1, 1)
+        return periodo + timedelta(weeks=1)
+
+    def _anterior(self, granularidad: str, periodo: date) -> date:
+        if granularidad == MES:
+            return date(periodo.year - (periodo.month == 1), (periodo.month - 2) % 12 + 1, 1)
+        return periodo - timedelta(weeks=1)
+
+    def _periodos(self, granularidad: str, fecha_inicio: Optional[date], fecha_fin: date) -> List[date]:
+        ultimo = self._inicio_periodo(granularidad, fecha_fin)
+        if fecha_inicio:
+            if fecha_inicio > fecha_fin:
+                raise ValidacionError("La fecha de inicio no puede ser posterior a la fecha de fin.")
+            primero = self._inicio_periodo(granularidad, fecha_inicio)
+        else:
+            primero = ultimo
+            for _ in range(PERIODOS_DEFAULT[granularidad] - 1):
+                primero = self._anterior(granularidad, primero)
+
+        periodos = [primero]
+        while periodos[-1] < ultimo:
+            periodos.append(self._siguiente(granularidad, periodos[-1]))
+            if len(periodos) > PERIODOS_MAXIMO[granularidad]:
+                raise ValidacionError(
+                    f"El rango supera el máximo de {PERIODOS_MAXIMO[granularidad]} periodos ({granularidad})."
+                )
+        return periodos
+
+    def _punto(self, granularidad: str, periodo: date, valores: Dict[str, Decimal]) -> Dict[str, Any]:
+        facturado = valores.get("facturado", CERO)
+        recaudado = valores.get("recaudado", CERO)
+        return {
+            "periodo": periodo.strftime("%Y-%m") if granularidad == MES else periodo.isoformat(),
+            "facturado": float(facturado),
+            "recaudado": float(recaudado),
+            "tasa_cobro": round(float(recaudado / facturado), 4) if facturado else None,
+            "deuda_nueva": float(valores.get("deuda_nueva", CERO)),
+        }
@@ -0,0 +1,155 @@
+# core/use_cases/reporting/simular_tarifas_uc.py
+from typing import Dict, Any, Optional
+from decimal import Decimal
+
+import numpy as np
+
+from adapters.infrastructure.models.lectura_model import LecturaModel
+from adapters.infrastructure.models.servicio_model import ServicioModel
+from adapters.infrastructure.models.barrio_model import BarrioModel
+from core.services.tarifa_vectorizada_service import (
+    TarifaVectorizadaService,
+    TARIFA_BASE_M3_DEFAULT,
+    TARIFA_BASE_PRECIO_DEFAULT,
+    TARIFA_EXCEDENTE_PRECIO_DEFAULT
+)
+from core.shared.exceptions import ValidacionError
+
+
+class SimularTarifasUseCase:
+    """
+    Caso de Uso: Simulación "¿Qué pasaría si...?" de la Tarifa Medida.
+    Recalcula TODAS las lecturas (o las de un periodo) con una tarifa hipotética
+    y la compara con la tarifa vigente de cada servicio, agrupando por barrio.
+    Todo el cálculo es vectorizado (NumPy) y en centavos enteros.
+    """
+
+    def __init__(self, motor: Optional[TarifaVectorizadaService] = None):
+        self.motor = motor or TarifaVectorizadaService()
+
+    def execute(
+        self,
+        tarifa_base_m3: int,
+        tarifa_base_precio: Decimal,
+        tarifa_excedente_precio: Decimal,
+        anio: Optional[int] = None,
+        mes: Optional[int] = None
+    ) -> Dict[str, Any]:
+        for precio in (tarifa_base_precio, tarifa_excedente_precio):
+            # NaN/Infinity fallarían en a_centavos (500) y un precio de fracción de centavo se
+            # redondearía en silencio: la simulación ya no coincidiría con la tarifa real
+            if not precio.is_finite() or precio.normalize().as_tuple().exponent < -2:
+                raise ValidacionError("Los precios deben ser montos válidos con máximo 2 decimales.")
+        if tarifa_base_m3 < 0 or tarifa_base_precio < 0 or tarifa_excedente_precio < 0:
+            raise ValidacionError("Los parámetros tarifarios no pueden ser negativos.")
+
+        # 1. Carga plana (values_list -> sin instanciar objetos ORM)
+        lecturas = LecturaModel.objects.filter(medidor__terreno__isnull=False)
+        if anio:
+            lecturas = lecturas.filter(anio=anio)
+        if mes:
+            lecturas = lecturas.filter(mes=mes)
+
+        filas = list(lecturas.values_list(
+            'consumo_del_mes', 'medidor__terreno_id', 'medidor__terreno__barrio_id'
+        ))
+        total_lecturas = len(filas)
+
+        reporte = {
+            "periodo": {"anio": anio, "mes": mes},
+            "parametros": {
+                "tarifa_base_m3": tarifa_base_m3,
+                "tarifa_base_precio": float(tarifa_base_precio),
+                "tarifa_excedente_precio": float(tarifa_excedente_precio),
+            },
+            "total_lecturas": total_lecturas,
+            "totales": {"recaudacion_actual": 0.0, "recaudacion_simulada": 0.0, "delta": 0.0},
+            "barrios": []
+        }
+        if not filas:
+            return reporte
+
+        consumos = np.fromiter((float(f[0] or 0) for f in filas), dtype=np.float64, count=total_lecturas)
+        terrenos = np.fromiter((f[1] for f in filas), dtype=np.int64, count=total_lecturas)
+        barrios = np.fromiter((f[2] for f in filas), dtype=np.int64, count=total_lecturas)
+
+        # 2. Tarifa vigente de cada lectura (Servicio MEDIDO activo del terreno)
+        base_m3_actual, base_cent_actual, exced_cent_actual = self._tarifas_vigentes(terrenos)
+
+        # 3. Cálculo vectorizado (vigente vs simulada)
+        actual = self.motor.calcular(consumos, base_m3_actual, base_cent_actual, exced_cent_actual)
+        simulada = self.motor.calcular(
+            consumos,
+            tarifa_base_m3,
+            self.motor.a_centavos(tarifa_base_precio),
+            self.motor.a_centavos(tarifa_excedente_precio)
+        )
+
+        # 4. Agrupación por barrio (enteros, sin pérdida de precisión)
+        barrio_ids, indice = np.unique(barrios, return_inverse=True)
+        conteo = np.bincount(indice, minlength=len(barrio_ids))
+        suma_actual = np.zeros(len(barrio_ids), dtype=np.int64)
+        suma_simulada = np.zeros(len(barrio_ids), dtype=np.int64)
+        np.add.at(suma_actual, indice, actual["total"])
+        np.add.at(suma_simulada, indice, simulada["total"])
+
+        nombres = dict(BarrioModel.objects.filter(id__in=barrio_ids.tolist()).values_list('id', 'nombre'))
+
+        for i, barrio_id in enumerate(barrio_ids.tolist()):
+            cent_actual = int(suma_actual[i])
+            cent_simulado = int(suma_simulada[i])
+            reporte["barrios"].append({
+                "barrio_id": barrio_id,
+                "barrio": nombres.get(barrio_id, "Sin Barrio"),
+                "lecturas": int(conteo[i]),
+                "recaudacion_actual": cent_actual / 100,
+                "recaudacion_simulada": cent_simulado / 100,
+                "delta": (cent_simulado - cent_actual) / 100,
+                "delta_porcentual": round((cent_simulado - cent_actual) * 100 / cent_actual, 2) if cent_actual else None
+            })
+
+        total_actual = int(suma_actual.sum())
+        total_simulado = int(suma_simulada.sum())
+        reporte["totales"] = {
+            "recaudacion_actual": total_actual / 100,
+            "recaudacion_simulada": total_simulado / 100,
+            "delta": (total_simulado - total_actual) / 100,
+        }
+        # Mayor impacto primero
+        reporte["barrios"].sort(key=lambda x: x["delta"], reverse=True)
+
+        return reporte
+
+    def _tarifas_vigentes(self, terrenos: np.ndarray):
+        """
+        Resuelve la tarifa de cada lectura con un solo query + búsqueda binaria.
+        Si un terreno no tiene servicio MEDIDO activo se usan los defaults de respaldo.
+        """
+        servicios = list(ServicioModel.objects.filter(tipo='MEDIDO', activo=True)
+                         .order_by('terreno_id', 'id')
+                         .values_list('terreno_id', 'tarifa_basica_m3', 'valor_tarifa', 'tarifa_excedente_precio'))
+
+        n = len(terrenos)
+        base_m3 = np.full(n, TARIFA_BASE_M3_DEFAULT, dtype=np.int64)
+        base_cent = np.full(n, self.motor.a_centavos(TARIFA_BASE_PRECIO_DEFAULT), dtype=np.int64)
+        exced_cent = np.full(n, self.motor.a_centavos(TARIFA_EXCEDENTE_PRECIO_DEFAULT), dtype=np.int64)
+
+        if not servicios:
+            return base_m3, base_cent, exced_cent
+
+        srv_terreno = np.array([s[0] for s in servicios], dtype=np.int64)
+        # Igual que '.first()' del repositorio: primer servicio (menor id) por terreno
+        srv_terreno, primeros = np.unique(srv_terreno, return_index=True)
+        srv_base_m3 = np.array([servicios[i][1] for i in primeros], dtype=np.int64)
+        srv_base_cent = np.array([self.motor.a_centavos(servicios[i][2]) for i in primeros], dtype=np.int64)
+        srv_exced_cent = np.array([self.motor.a_centavos(servicios[i][3]) for i in primeros], dtype=np.int64)
+
+        posicion = np.searchsorted(srv_terreno, terrenos)
+        posicion = np.clip(posicion, 0, len(srv_terreno) - 1)
+        encontrado = srv_terreno[posicion] == terrenos
+
+        base_m3[encontrado] = srv_base_m3[posicion[encontrado]]
+        base_cent[encontrado] = srv_base_cent[posicion[encontrado]]
+        exced_cent[encontrado] = srv_exced_cent[posicion[encontrado]]
+
+        return base_m3, base_cent, exced_cent
@@ -0,0 +1,106 @@
+import pytest
+from decimal import Decimal
+from datetime import date, datetime
+
+from django.db.models import F
+from django.utils import timezone
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel, PagoModel, CajaDiariaModel
+from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+
+
+@pytest.fixture
+def facturas():
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+    return socio, [
+        FacturaModel.objects.create(socio=socio, anio=2026, mes=mes, fecha_emision=date(2026, mes, 1),
+                                    fecha_vencimiento=date(2026, mes, 15), total=Decimal("10.00"))
+        for mes in (1, 2, 3)
+    ]
+
+
+def _caja():
+    return {
+        metodo: (total, cantidad, recibos)
+        for metodo, total, cantidad, recibos in CajaDiariaModel.objects.filter(fecha=timezone.localdate())
+        .values_list('metodo', 'total', 'cantidad', 'recibos')
+    }
+
+
+def _cobro(repo, socio, factura, *lineas):
+    return repo.registrar_cobro_multiple(socio.id, [{
+        "factura_id": factura.id, "monto": sum(Decimal(m) for _, m in lineas),
+        "detalles": [{"metodo": metodo, "monto": monto, "referencia": "B-1"} for metodo, monto in lineas],
+    }])
+
+
+@pytest.mark.django_db
+def test_caja_diaria_acumula_con_update_relativo(facturas):
+    """
+    Escenario: Dos cobros en ventanilla; entre ambos otra caja suma 100.00 en efectivo a la
+    misma fila del día. El segundo cobro suma sobre ese valor (col = col + delta), no lo pisa.
+    Cada recibo se cuenta una vez, en el método de su primera línea.
+    """
+    socio, (enero, febrero, _) = facturas
+    repo = DjangoPagoRepository()
+
+    _cobro(repo, socio, enero, ("EFECTIVO", "10.00"))
+    CajaDiariaModel.objects.filter(metodo="EFECTIVO").update(total=F('total') + 100, cantidad=F('cantidad') + 1)
+    _cobro(repo, socio, febrero, ("EFECTIVO", "4.00"), ("TRANSFERENCIA", "6.00"))
+
+    assert _caja() == {
+        "EFECTIVO": (Decimal("114.00"), 3, 2),
+        "TRANSFERENCIA": (Decimal("6.00"), 1, 0),
+    }
+
+
+@pytest.mark.django_db
+def test_caja_diaria_suma_al_aprobar_resta_al_rechazar_y_coincide_con_la_reconstruccion(facturas):
+    socio, (enero, febrero, marzo) = facturas
+    repo = DjangoPagoRepository()
+    _cobro(repo, socio, enero, ("EFECTIVO", "10.00"))
+
+    # Transferencia subida por el socio: no entra a la caja hasta que Tesorería la aprueba
+    aprobada = repo.reportar_transferencia(febrero.id, Decimal("10.00"), "777")["pago_id"]
+    assert "TRANSFERENCIA" not in _caja()
+    repo.aprobar_transferencia(aprobada)
+    repo.aprobar_transferencia(aprobada)  # Doble clic: no suma dos veces
+    assert _caja()["TRANSFERENCIA"] == (Decimal("10.00"), 1, 1)
+
+    # Una transferencia aprobada y luego anulada se descuenta del día
+    anulada = repo.reportar_transferencia(marzo.id, Decimal("10.00"), "778")["pago_id"]
+    repo.aprobar_transferencia(anulada)
+    repo.rechazar_transferencia(anulada)
+
+    incremental = _caja()
+    assert incremental == {
+        "EFECTIVO": (Decimal("10.00"), 1, 1),
+        "TRANSFERENCIA": (Decimal("10.00"), 1, 1),
+    }
+    repo.recalcular_caja_diaria(timezone.localdate(), timezone.localdate())
+    assert _caja() == incremental
+
+
+@pytest.mark.django_db
+def test_reconstruccion_usa_la_fecha_local_y_es_atomica(facturas, monkeypatch):
+    """
+    Escenario: Un cobro de las 23:30 del 31 de enero (ya 1 de febrero en UTC) se reconstruye
+    en el libro del 31. Si el INSERT falla, el DELETE se revierte: el rango no queda vacío.
+    """
+    socio, (enero, _, _) = facturas
+    repo = DjangoPagoRepository()
+    _cobro(repo, socio, enero, ("EFECTIVO", "10.00"))
+    PagoModel.objects.update(fecha_registro=timezone.make_aware(datetime(2026, 1, 31, 23, 30)))
+    CajaDiariaModel.objects.all().delete()
+
+    assert repo.recalcular_caja_diaria(date(2026, 1, 31), date(2026, 2, 1)) == 1
+    fila = (date(2026, 1, 31), "EFECTIVO", Decimal("10.00"))
+    assert list(CajaDiariaModel.objects.values_list('fecha', 'metodo', 'total')) == [fila]
+
+    def falla(*args, **kwargs):
+        raise RuntimeError("conexión perdida")
+    monkeypatch.setattr(CajaDiariaModel.objects, 'bulk_create', falla)
+    with pytest.raises(RuntimeError):
+        repo.recalcular_caja_diaria(date(2026, 1, 31), date(2026, 2, 1))
+    assert list(CajaDiariaModel.objects.values_list('fecha', 'metodo', 'total')) == [fila]
@@ -0,0 +1,64 @@
+import pytest
+from decimal import Decimal
+from datetime import timedelta
+
+from django.db.models import F
+from django.utils import timezone
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel, CarteraSocioModel
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+
+
+@pytest.fixture
+def socio():
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    return SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+
+
+def _factura(socio, dias, total):
+    emision = timezone.localdate() - timedelta(days=dias)
+    return FacturaModel.objects.create(socio=socio, anio=emision.year, mes=emision.month, fecha_emision=emision,
+                                       fecha_vencimiento=emision, total=Decimal(total))
+
+
+def _cartera(socio):
+    return CarteraSocioModel.objects.values_list(
+        'total_deuda', 'corriente', 'vencido_1_3', 'incobrable', 'facturas_pendientes'
+    ).get(socio=socio)
+
+
+@pytest.mark.django_db
+def test_ajustes_del_dia_suman_con_update_relativo(socio):
+    """
+    Escenario: Se emite una factura (la fila del socio aún no existe y se crea); otra
+    operación suma a la misma fila; luego se emite otra. El ajuste suma sobre el valor
+    vigente (col = col + delta), no lo pisa.
+    """
+    repo = DjangoCarteraRepository()
+    hoy = timezone.localdate()
+
+    repo.ajustar([(socio.id, hoy, Decimal("10.00"))])
+    CarteraSocioModel.objects.filter(socio=socio).update(
+        total_deuda=F('total_deuda') + 100, incobrable=F('incobrable') + 100, facturas_pendientes=F('facturas_pendientes') + 1
+    )
+    repo.ajustar([(socio.id, hoy, Decimal("5.00")), (socio.id, hoy - timedelta(days=45), Decimal("7.00"))])
+
+    assert _cartera(socio) == (Decimal("122.00"), Decimal("15.00"), Decimal("7.00"), Decimal("100.00"), 4)
+
+
+@pytest.mark.django_db
+def test_pago_descuenta_del_tramo_en_que_se_clasifico_la_factura(socio):
+    """
+    Escenario: Entre medianoche y la reconstrucción de las 00:30 el snapshot sigue con el corte
+    de ayer. Una factura de hace 31 días era corriente en ese corte; al pagarla debe salir de
+    'corriente' y no de 'vencido_1_3' (que quedaría negativo).
+    """
+    factura = _factura(socio, 31, "12.00")
+    _factura(socio, 200, "8.00")
+    DjangoCarteraRepository().reconstruir(timezone.localdate() - timedelta(days=1))
+    assert _cartera(socio) == (Decimal("20.00"), Decimal("12.00"), Decimal("0.00"), Decimal("8.00"), 2)
+
+    DjangoFacturaRepository().marcar_como_pagadas([factura.id])
+
+    assert _cartera(socio) == (Decimal("8.00"), Decimal("0.00"), Decimal("0.00"), Decimal("8.00"), 1)
@@ -0,0 +1,71 @@
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, TerrenoModel, MedidorModel, ServicioModel, LecturaModel
+from adapters.infrastructure.repositories.django_lectura_repository import DjangoLecturaRepository
+from adapters.infrastructure.repositories.django_socio_repository import DjangoSocioRepository
+from adapters.infrastructure.services import catastro_snapshot
+
+
+@pytest.fixture
+def cache_compartido(settings, tmp_path, monkeypatch):
+    """Cache visible para todos los procesos (como Redis) y sin snapshot previo en el proceso."""
+    settings.CACHES = {'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': str(tmp_path),
+    }}
+    monkeypatch.setattr(catastro_snapshot, '_snapshot', None)
+
+
+def _medidor_con_lectura(identificacion, codigo):
+    barrio, _ = BarrioModel.objects.get_or_create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion=identificacion, nombres='N', apellidos='A', barrio=barrio)
+    terreno = TerrenoModel.objects.create(socio=socio, barrio=barrio, direccion='D')
+    medidor = MedidorModel.objects.create(terreno=terreno, codigo=codigo)
+    servicio = ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='MEDIDO', valor_tarifa=Decimal('3.00'))
+    LecturaModel.objects.create(medidor=medidor, valor=Decimal('120'), lectura_anterior=Decimal('100'),
+                                consumo_del_mes=Decimal('20'), anio=2026, mes=3, fecha=date(2026, 3, 28))
+    return socio, servicio
+
+
+@pytest.mark.django_db
+def test_update_del_repositorio_de_socios_invalida_el_snapshot(cache_compartido, django_capture_on_commit_callbacks):
+    """save() de un socio existente usa QuerySet.update (sin post_save): igual debe subir la versión."""
+    with django_capture_on_commit_callbacks(execute=True):
+        socio, _ = _medidor_con_lectura('1700000001', 'M1')
+    antes = catastro_snapshot.obtener_catastro()
+    assert antes.socio(socio.id).apellidos == 'A'
+
+    repo = DjangoSocioRepository()
+    entidad = repo.get_by_id(socio.id)
+    entidad.apellidos = 'Andrade'
+    with django_capture_on_commit_callbacks(execute=True):
+        repo.save(entidad)
+
+    despues = catastro_snapshot.obtener_catastro()
+    assert despues.version > antes.version
+    assert despues.socio(socio.id).apellidos == 'Andrade'
+
+
+@pytest.mark.django_db
+def test_medidor_ausente_del_snapshot_se_resuelve_contra_la_bd(cache_compartido):
+    """
+    Escenario: El snapshot del proceso se cargó antes de que otro proceso confirmara
+    un medidor nuevo (la versión aún no cambió). Su lectura no debe desaparecer de la planilla.
+    """
+    catastro_snapshot.obtener_catastro()
+    socio, servicio = _medidor_con_lectura('1700000002', 'M2')  # on_commit sin ejecutar: snapshot vigente
+
+    filas = DjangoLecturaRepository().listar_pendientes_facturacion(None, 2026, 3)
+
+    assert [(f['socio_id'], f['servicio_id'], f['medidor_codigo'], f['tarifa_base_precio']) for f in filas] == [
+        (socio.id, servicio.id, 'M2', Decimal('3.00'))
+    ]
+
+
+@pytest.mark.django_db
+def test_con_cache_local_no_se_reutiliza_el_snapshot(settings, monkeypatch):
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    monkeypatch.setattr(catastro_snapshot, '_snapshot', None)
+
+    assert catastro_snapshot.obtener_catastro() is not catastro_snapshot.obtener_catastro()
@@ -0,0 +1,52 @@
+import pytest
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.utils import timezone
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel
+from adapters.infrastructure.repositories.django_factura_repository import DjangoFacturaRepository
+from adapters.infrastructure.services.dashboard_kpis import obtener_kpis
+
+
+@pytest.fixture
+def socio():
+    cache.clear()
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    return SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+
+
+def _factura(socio):
+    hoy = timezone.localdate()
+    return FacturaModel.objects.create(socio=socio, anio=hoy.year, mes=hoy.month, fecha_emision=hoy,
+                                       fecha_vencimiento=hoy, total=Decimal("10.00"))
+
+
+@pytest.mark.django_db
+def test_kpis_se_sirven_del_cache_hasta_que_se_confirma_una_escritura(socio, django_assert_num_queries,
+                                                                      django_capture_on_commit_callbacks):
+    assert obtener_kpis()["pendientes_cobro"] == 0
+    with django_assert_num_queries(0):
+        obtener_kpis()
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        _factura(socio)  # post_save
+        # Antes del commit el valor cacheado sigue vigente: nadie recalcula sin ver el cambio
+        assert obtener_kpis()["pendientes_cobro"] == 0
+    assert callbacks
+
+    kpis = obtener_kpis()
+    assert (kpis["pendientes_cobro"], kpis["facturas_emitidas_mes"]) == (1, 1)
+
+
+@pytest.mark.django_db
+def test_update_en_bloque_sin_senales_invalida_los_kpis(socio, django_capture_on_commit_callbacks):
+    factura = _factura(socio)
+    assert obtener_kpis()["pendientes_cobro"] == 1
+
+    # marcar_como_pagadas usa QuerySet.update(): no dispara post_save
+    with django_capture_on_commit_callbacks(execute=True):
+        DjangoFacturaRepository().marcar_como_pagadas([factura.id])
+
+    kpis = obtener_kpis()
+    assert (kpis["pendientes_cobro"], kpis["pendientes_sri"]) == (0, 1)
@@ -0,0 +1,45 @@
+import numpy as np
+
+from core.services.deteccion_anomalias_service import (
+    DeteccionAnomaliasService,
+    PICO_CONSUMO,
+    CONSUMO_CERO_CONTINUO,
+    LECTURA_REGRESIVA,
+)
+
+NAN = np.nan
+
+
+def test_marca_cada_tipo_de_anomalia_en_una_sola_pasada():
+    """
+    Escenario: Matriz medidores x meses (última columna = periodo analizado).
+    Cada medidor representa un caso; el resultado se obtiene sin recorrer filas.
+    """
+    consumos = np.array([
+        [20, 22, 19, 21, 20, 21],      # Normal
+        [20, 22, 19, 21, 20, 60],      # Fuga: pico sobre la mediana
+        [15, 14, 0, 0, 0, 0],          # Medidor detenido: 4 meses en cero
+        [18, 17, 19, 18, 18, -5],      # Lectura menor a la anterior
+        [NAN, NAN, NAN, NAN, 5, 90],   # Sin historia suficiente: no se marca pico
+        [10, 10, 10, 10, 10, 12],      # Estable (MAD = 0): 2 m³ extra no es pico
+    ], dtype=float)
+
+    resultado = DeteccionAnomaliasService().analizar(consumos)
+
+    assert resultado["anomalia"].tolist() == [
+        "", PICO_CONSUMO, CONSUMO_CERO_CONTINUO, LECTURA_REGRESIVA, "", ""
+    ]
+    assert resultado["mediana"][1] == 20
+    assert resultado["racha_ceros"][2] == 4
+
+
+def test_la_lectura_regresiva_tiene_prioridad_y_la_racha_debe_llegar_al_periodo():
+    consumos = np.array([
+        [0, 0, 0, 0, -3],   # Ceros previos + regresiva: se reporta la regresiva
+        [0, 0, 0, 0, 1],    # La racha terminó antes del periodo
+    ], dtype=float)
+
+    resultado = DeteccionAnomaliasService(meses_cero=3).analizar(consumos)
+
+    assert resultado["anomalia"].tolist() == [LECTURA_REGRESIVA, ""]
+    assert resultado["racha_ceros"].tolist() == [0, 0]
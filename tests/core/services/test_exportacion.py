@@ -0,0 +1,43 @@
+import io
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from openpyxl import load_workbook
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel
+from adapters.infrastructure.services import exportacion_service as exportacion
+
+
+@pytest.mark.django_db
+def test_filas_se_leen_por_bloques_de_clave_sin_saltos_ni_repeticiones(monkeypatch, django_assert_num_queries):
+    """
+    Escenario: 5 facturas en bloques de 2. Cada bloque es una consulta WHERE id > último
+    LIMIT 2 (mysqlclient no transmite un iterator(): carga todo el resultado).
+    """
+    monkeypatch.setattr(exportacion, "TAMANO_BLOQUE", 2)
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+    ids = [
+        FacturaModel.objects.create(socio=socio, anio=2026, mes=mes, fecha_emision=date(2026, mes, 1),
+                                    fecha_vencimiento=date(2026, mes, 15), total=Decimal("10.00")).id
+        for mes in (5, 4, 3, 2, 1)
+    ]
+
+    with django_assert_num_queries(3):
+        filas = list(exportacion.filas("facturas", anio=2026))
+
+    assert [fila[0] for fila in filas] == ids
+    assert len(filas[0]) == len(exportacion.encabezados("facturas"))
+
+
+def test_textos_con_formula_se_exportan_como_texto_en_csv_y_xlsx():
+    cabecera = ["nombre", "observacion", "monto"]
+    datos = [("=CMD|calc!A1", "-2+3", Decimal("-5.00")), ("@SUM(A1)", "normal", 1)]
+
+    csv = "".join(exportacion.generar_csv(cabecera, datos)).splitlines()
+    assert csv[1:] == ["'=CMD|calc!A1,'-2+3,-5.00", "'@SUM(A1),normal,1"]
+
+    hoja = load_workbook(io.BytesIO(b"".join(exportacion.generar_xlsx(cabecera, datos)))).active
+    assert [c.value for c in hoja[2]] == ["'=CMD|calc!A1", "'-2+3", -5]
+    assert hoja["A2"].data_type == "s"
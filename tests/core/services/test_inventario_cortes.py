@@ -0,0 +1,57 @@
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from django.db import connection
+
+from adapters.infrastructure.models import CatalogoRubroModel, ProductoMaterial, MovimientoInventarioModel, CorteStockModel
+from adapters.infrastructure.repositories.django_inventario_repository import DjangoInventarioRepository
+
+
+@pytest.fixture
+def productos():
+    rubro = CatalogoRubroModel.objects.create(nombre='Materiales')
+    return [
+        ProductoMaterial.objects.create(rubro=rubro, nombre=nombre, codigo=nombre, precio_unitario=Decimal("1.00"))
+        for nombre in ('Codo', 'Tubo')
+    ]
+
+
+def _cortes(fecha):
+    return dict(CorteStockModel.objects.filter(fecha=fecha).values_list('producto_id', 'stock'))
+
+
+@pytest.mark.django_db
+def test_regenerar_el_corte_del_dia_lo_sobrescribe(productos):
+    """
+    Escenario: Corte del 10 de marzo; luego llega una venta fechada ese día y se vuelve a
+    generar. Queda una fila por producto con el stock corregido, no un duplicado.
+    """
+    codo, tubo = productos
+    repo = DjangoInventarioRepository()
+    repo.registrar_movimiento(codo.id, 'ENTRADA', 10)
+    MovimientoInventarioModel.objects.update(fecha=date(2026, 3, 9))
+    repo.registrar_movimiento(codo.id, 'ENTRADA', 5)  # Hoy: posterior al corte
+
+    assert repo.generar_cortes_stock(date(2026, 3, 10)) == 2
+    assert _cortes(date(2026, 3, 10)) == {codo.id: 10, tubo.id: 0}
+
+    repo.registrar_movimiento(codo.id, 'VENTA', -3)
+    MovimientoInventarioModel.objects.filter(tipo='VENTA').update(fecha=date(2026, 3, 10))
+    repo.generar_cortes_stock(date(2026, 3, 10))
+
+    assert _cortes(date(2026, 3, 10)) == {codo.id: 7, tubo.id: 0}
+    assert {f["producto_id"]: f["stock"] for f in repo.stock_a_fecha(date(2026, 3, 10))} == {codo.id: 7, tubo.id: 0}
+
+
+@pytest.mark.django_db
+def test_upsert_del_corte_es_valido_en_un_motor_sin_columnas_de_conflicto(monkeypatch):
+    # MySQL: supports_update_conflicts_with_target = False; pasar unique_fields daba NotSupportedError
+    monkeypatch.setattr(type(connection.features), 'supports_update_conflicts_with_target', False)
+    destino = DjangoInventarioRepository._destino_upsert_corte()
+
+    assert destino == {}
+    CorteStockModel.objects.all()._check_bulk_create_options(
+        ignore_conflicts=False, update_conflicts=True,
+        update_fields=[CorteStockModel._meta.get_field('stock')], unique_fields=destino.get('unique_fields', [])
+    )
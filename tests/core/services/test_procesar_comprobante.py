@@ -0,0 +1,33 @@
+import pytest
+from unittest.mock import MagicMock
+from PIL import UnidentifiedImageError
+
+from adapters.infrastructure import tasks
+
+
+class _Reintento(Exception):
+    pass
+
+
+@pytest.fixture
+def reintento(monkeypatch):
+    retry = MagicMock(side_effect=_Reintento)
+    monkeypatch.setattr(tasks.procesar_comprobante_task, 'retry', retry)
+    return retry
+
+
+def test_archivo_que_no_es_imagen_falla_sin_reintentos(monkeypatch, reintento):
+    monkeypatch.setattr(tasks, 'optimizar_comprobante', MagicMock(side_effect=UnidentifiedImageError("no es imagen")))
+
+    with pytest.raises(UnidentifiedImageError):
+        tasks.procesar_comprobante_task(7)
+    reintento.assert_not_called()
+
+
+def test_storage_no_disponible_se_reintenta(monkeypatch, reintento):
+    error = OSError("storage no disponible")
+    monkeypatch.setattr(tasks, 'optimizar_comprobante', MagicMock(side_effect=error))
+
+    with pytest.raises(_Reintento):
+        tasks.procesar_comprobante_task(7)
+    reintento.assert_called_once_with(exc=error)
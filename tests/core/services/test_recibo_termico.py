@@ -0,0 +1,51 @@
+import re
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from adapters.infrastructure.services.recibo_termico_service import ReciboTermicoService, AVANZAR_Y_CORTAR
+
+
+@pytest.fixture
+def recibo():
+    return {
+        "numero": "REC-1A2B3C4D",
+        "fecha": datetime(2026, 3, 20, 9, 30),
+        "socio": "José Muñoz",
+        "identificacion": "1700000001",
+        "monto_total": Decimal("12.50"),
+        "observacion": None,
+        "validado": True,
+        "factura": {"id": 15, "periodo": "2026-03", "total": Decimal("12.50"), "pagado": Decimal("12.50"),
+                    "saldo": Decimal("0.00")},
+        "detalles": [
+            {"metodo": "EFECTIVO", "monto": Decimal("7.50"), "referencia": None},
+            {"metodo": "TRANSFERENCIA", "monto": Decimal("5.00"), "referencia": "B-889"},
+        ],
+    }
+
+
+@pytest.mark.parametrize("ancho", [32, 48])
+def test_texto_respeta_el_ancho_del_papel(recibo, ancho):
+    lineas = ReciboTermicoService(ancho=ancho).generar_texto(recibo).splitlines()
+
+    assert all(len(linea) <= ancho for linea in lineas)
+    assert f"{'TOTAL PAGADO:':<{ancho - 6}}$12.50" in lineas
+    assert "  Ref: B-889" in lineas
+
+
+def test_escpos_codifica_tildes_en_pc850_y_corta_el_papel(recibo):
+    salida = ReciboTermicoService(ancho=48).generar_escpos(recibo)
+
+    assert "José Muñoz".encode("cp850") in salida
+    assert salida.endswith(AVANZAR_Y_CORTAR)
+
+
+@pytest.mark.parametrize("ancho, papel_mm", [(32, 58), (48, 80)])
+def test_pdf_de_una_pagina_del_ancho_del_papel(recibo, ancho, papel_mm):
+    pdf = ReciboTermicoService(ancho=ancho).generar_pdf(recibo)
+
+    assert pdf.startswith(b"%PDF")
+    assert pdf.count(b"/Type /Page\n") == 1
+    ancho_pt = float(re.search(rb"/MediaBox \[ 0 0 ([\d.]+)", pdf).group(1))
+    assert ancho_pt == pytest.approx(papel_mm * 72 / 25.4, abs=0.01)
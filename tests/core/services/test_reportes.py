@@ -0,0 +1,84 @@
+import os
+import pytest
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+
+from adapters.infrastructure.models import ReporteGeneradoModel, ReporteCandadoModel
+from adapters.infrastructure.services import reportes_service as reportes
+
+
+@pytest.fixture(autouse=True)
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_solicitud_igual_reutiliza_el_trabajo_en_curso_o_vigente(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks() as encolados:
+        reporte, reutilizado = reportes.solicitar_reporte('facturas', 'csv', {'anio': 2026, 'mes': 3})
+        # Mismos filtros con otra representación: misma huella
+        repetido, repetido_reutilizado = reportes.solicitar_reporte('facturas', 'csv', {'anio': '2026', 'mes': '03'})
+
+    assert (reutilizado, repetido_reutilizado, repetido.id) == (False, True, reporte.id)
+    assert len(encolados) == 1  # Una sola tarea de Celery
+    assert list(ReporteCandadoModel.objects.values_list('huella', flat=True)) == [reporte.huella]
+
+    # Listo y vigente: se reutiliza; ya expirado: se genera otro
+    ReporteGeneradoModel.objects.filter(id=reporte.id).update(
+        estado=ReporteGeneradoModel.LISTO, expira_en=timezone.now() + timedelta(minutes=5)
+    )
+    assert reportes.solicitar_reporte('facturas', 'csv', {'anio': 2026, 'mes': 3})[0].id == reporte.id
+    ReporteGeneradoModel.objects.filter(id=reporte.id).update(expira_en=timezone.now() - timedelta(minutes=1))
+    nuevo, reutilizado = reportes.solicitar_reporte('facturas', 'csv', {'anio': 2026, 'mes': 3})
+    assert (reutilizado, nuevo.id != reporte.id) == (False, True)
+
+
+@pytest.mark.django_db
+def test_generar_toma_el_trabajo_una_sola_vez():
+    reporte = ReporteGeneradoModel.objects.create(
+        tipo='facturas', formato='csv', parametros={'anio': 2026}, huella='h' * 64
+    )
+
+    resultado = reportes.generar_reporte(str(reporte.id))
+    # Entrega repetida de la tarea (acks_late / reintento): el trabajo LISTO no se regenera
+    repetido = reportes.generar_reporte(str(reporte.id))
+
+    reporte.refresh_from_db()
+    assert (resultado["estado"], resultado["filas"]) == (ReporteGeneradoModel.LISTO, 0)
+    assert repetido == {"id": str(reporte.id), "omitido": True}
+    assert reporte.expira_en > reporte.fecha_fin
+    assert reporte.archivo.read().decode('utf-8').startswith("\ufeffid,anio,mes")
+
+
+@pytest.mark.django_db
+def test_purga_borra_reportes_terminados_y_trabajos_perdidos(settings):
+    settings.REPORTES_TTL_MINUTOS = 60
+    hace_dos_horas = timezone.now() - timedelta(hours=2)
+
+    def _reporte(huella, estado, expira_en=None, fecha_solicitud=hace_dos_horas):
+        reporte = ReporteGeneradoModel.objects.create(
+            tipo='facturas', formato='csv', huella=huella * 64, estado=estado,
+            fecha_solicitud=fecha_solicitud, expira_en=expira_en
+        )
+        ReporteCandadoModel.objects.create(huella=reporte.huella)
+        return reporte
+
+    vencido = _reporte('a', ReporteGeneradoModel.LISTO, expira_en=timezone.now() - timedelta(minutes=1))
+    vencido.archivo.save('vencido.csv', ContentFile(b'id'))
+    vigente = _reporte('b', ReporteGeneradoModel.LISTO, expira_en=timezone.now() + timedelta(minutes=5))
+    _reporte('c', ReporteGeneradoModel.ERROR)
+    # Trabajos largos todavía en el worker: no se borran aunque superen el TTL
+    pendiente = _reporte('d', ReporteGeneradoModel.PENDIENTE)
+    en_proceso = _reporte('e', ReporteGeneradoModel.EN_PROCESO)
+    # Más de 4 veces el TTL: el worker murió, se marca ERROR y se purga
+    _reporte('f', ReporteGeneradoModel.EN_PROCESO, fecha_solicitud=timezone.now() - timedelta(hours=5))
+    ruta = vencido.archivo.path
+
+    assert reportes.purgar_reportes_vencidos() == 3
+
+    assert set(ReporteGeneradoModel.objects.values_list('id', flat=True)) == {vigente.id, pendiente.id, en_proceso.id}
+    assert set(ReporteCandadoModel.objects.values_list('huella', flat=True)) == {'b' * 64, 'd' * 64, 'e' * 64}
+    assert not os.path.exists(ruta)
@@ -0,0 +1,66 @@
+
+import pytest
+from decimal import Decimal
+from datetime import date, datetime
+
+import numpy as np
+
+from core.domain.factura import Factura
+from core.services.tarifa_vectorizada_service import TarifaVectorizadaService
+
+
+def _total_dominio(consumo, base_m3, base_precio, excedente_precio) -> Decimal:
+    factura = Factura(
+        id=None,
+        socio_id=1,
+        medidor_id=1,
+        fecha_emision=date(2025, 1, 1),
+        fecha_vencimiento=date(2025, 1, 31),
+        fecha_registro=datetime(2025, 1, 1, 12, 0, 0)
+    )
+    factura.calcular_total_con_medidor(
+        consumo_m3=int(float(consumo)),
+        tarifa_base_m3=base_m3,
+        tarifa_base_precio=base_precio,
+        tarifa_excedente_precio=excedente_precio
+    )
+    return factura.total
+
+
+@pytest.mark.parametrize("base_m3, base_precio, excedente_precio", [
+    (15, Decimal("3.00"), Decimal("0.25")),
+    (12, Decimal("3.00"), Decimal("0.30")),
+    (120, Decimal("3.50"), Decimal("0.07")),
+])
+def test_resultado_identico_al_metodo_de_dominio(base_m3, base_precio, excedente_precio):
+    """
+    Escenario: El motor vectorizado debe coincidir centavo a centavo con
+    Factura.calcular_total_con_medidor (incluye decimales y consumos negativos).
+    """
+    consumos = [-3, 0, 1, 11.99, 12, 12.5, 15, 16, 47.75, 120, 121, 999]
+    motor = TarifaVectorizadaService()
+
+    resultado = motor.calcular(
+        consumos,
+        base_m3,
+        motor.a_centavos(base_precio),
+        motor.a_centavos(excedente_precio)
+    )
+
+    esperado = [int(_total_dominio(c, base_m3, base_precio, excedente_precio) * 100) for c in consumos]
+    assert resultado["total"].tolist() == esperado
+    assert (resultado["base"] + resultado["excedente"] == resultado["total"]).all()
+
+
+def test_tarifas_por_elemento():
+    """
+    Escenario: Cada lectura con la tarifa propia de su servicio (arreglos alineados).
+    """
+    motor = TarifaVectorizadaService()
+    resultado = motor.calcular(
+        np.array([10, 20, 20]),
+        np.array([15, 15, 10]),
+        np.array([300, 300, 500]),
+        np.array([25, 25, 10])
+    )
+    assert resultado["total"].tolist() == [300, 425, 600]
@@ -0,0 +1,110 @@
+import pytest
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date
+
+from core.shared.exceptions import ValidacionError
+from core.use_cases.cobranza.aplicar_recargos_mora_uc import AplicarRecargosMoraUseCase
+from core.use_cases.cobranza.generar_ordenes_corte_uc import GenerarOrdenesCorteUseCase
+from adapters.infrastructure.models import BarrioModel, SocioModel, TerrenoModel, ServicioModel, FacturaModel, OrdenTrabajoModel
+from adapters.infrastructure.repositories.django_cobranza_repository import DjangoCobranzaRepository
+
+CORTE = date(2026, 5, 10)
+
+
+def _servicio(identificacion, vencimientos):
+    """Servicio con una factura PENDIENTE por cada fecha de vencimiento (una por mes fiscal)."""
+    barrio, _ = BarrioModel.objects.get_or_create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion=identificacion, nombres='N', apellidos='A', barrio=barrio)
+    terreno = TerrenoModel.objects.create(socio=socio, barrio=barrio, direccion='D')
+    servicio = ServicioModel.objects.create(socio=socio, terreno=terreno, tipo='MEDIDO')
+    for vencimiento in vencimientos:
+        FacturaModel.objects.create(
+            socio=socio, servicio=servicio, anio=vencimiento.year, mes=vencimiento.month,
+            fecha_emision=vencimiento.replace(day=1), fecha_vencimiento=vencimiento, total=Decimal("3.00")
+        )
+    return servicio
+
+
+@pytest.mark.django_db
+def test_recargo_mora_solo_crea_las_referencias_del_mes_que_faltan():
+    """
+    Escenario: Dos servicios en mora; uno ya recibió su recargo este mes (re-ejecución).
+    Solo se crea el recargo faltante, con la referencia MORA-{servicio}-{anio}-{mes}.
+    """
+    repo = MagicMock()
+    repo.recalcular_meses_mora.return_value = 10
+    repo.listar_servicios_en_mora.return_value = [
+        {"id": 1, "socio_id": 11, "meses_mora": 2}, {"id": 2, "socio_id": 12, "meses_mora": 4},
+    ]
+    repo.obtener_rubro_recargo_mora.return_value = (7, Decimal("1.00"))
+    repo.referencias_existentes.return_value = {"MORA-1-2026-05"}
+    repo.crear_cuentas_por_cobrar.side_effect = len
+
+    reporte = AplicarRecargosMoraUseCase(repo).ejecutar(fecha_corte=CORTE)
+
+    repo.referencias_existentes.assert_called_once_with(7, ["MORA-1-2026-05", "MORA-2-2026-05"])
+    (nuevas,), _ = repo.crear_cuentas_por_cobrar.call_args
+    assert [(c["socio_id"], c["origen_referencia"], c["saldo_pendiente"]) for c in nuevas] == [
+        (12, "MORA-2-2026-05", Decimal("1.00"))
+    ]
+    assert nuevas[0]["fecha_vencimiento"] == date(2026, 5, 25)
+    assert (reporte["recargos_creados"], reporte["recargos_existentes"]) == (1, 1)
+
+
+@pytest.mark.django_db
+def test_recargo_mora_en_cero_desactiva_los_recargos():
+    repo = MagicMock()
+    repo.listar_servicios_en_mora.return_value = [{"id": 1, "socio_id": 11, "meses_mora": 2}]
+    repo.obtener_rubro_recargo_mora.return_value = (7, Decimal("0.00"))
+
+    reporte = AplicarRecargosMoraUseCase(repo).ejecutar(fecha_corte=CORTE)
+
+    repo.recalcular_meses_mora.assert_called_once_with(CORTE)
+    repo.crear_cuentas_por_cobrar.assert_not_called()
+    assert reporte["recargos_creados"] == 0
+
+
+@pytest.mark.django_db
+def test_meses_mora_cuenta_las_facturas_pendientes_vencidas_de_cada_servicio():
+    """
+    Escenario: Un servicio con 2 facturas vencidas y 1 por vencer; otro al día
+    (que tenía mora de un cálculo anterior). El UPDATE deja 2 y 0.
+    """
+    moroso = _servicio('1700000001', [date(2026, 3, 15), date(2026, 4, 15), date(2026, 5, 15)])
+    al_dia = _servicio('1700000002', [])
+    ServicioModel.objects.filter(id=al_dia.id).update(meses_mora=3)
+
+    procesados = DjangoCobranzaRepository().recalcular_meses_mora(CORTE)
+
+    assert procesados == 2
+    assert dict(ServicioModel.objects.values_list('id', 'meses_mora')) == {moroso.id: 2, al_dia.id: 0}
+
+
+@pytest.mark.django_db
+def test_ordenes_corte_se_vinculan_al_servicio_y_no_se_duplican():
+    """
+    Escenario: Umbral de 3 meses. Un servicio con 3 meses de mora y otro con 2.
+    Solo el primero recibe orden de CORTE, queda vinculada como orden activa
+    y una segunda ejecución no crea otra mientras siga PENDIENTE.
+    """
+    moroso = _servicio('1700000001', [date(2026, m, 15) for m in (1, 2, 3)])
+    _servicio('1700000002', [date(2026, m, 15) for m in (2, 3)])
+    repo = DjangoCobranzaRepository()
+    repo.recalcular_meses_mora(CORTE)
+
+    primera = GenerarOrdenesCorteUseCase(repo).ejecutar(meses_minimos=3)
+    segunda = GenerarOrdenesCorteUseCase(repo).ejecutar(meses_minimos=3)
+
+    assert primera["servicio_ids"] == [moroso.id] and primera["ordenes_creadas"] == 1
+    assert segunda["ordenes_creadas"] == 0
+    orden = OrdenTrabajoModel.objects.get()
+    assert (orden.servicio_id, orden.tipo, orden.estado) == (moroso.id, 'CORTE', 'PENDIENTE')
+    assert ServicioModel.objects.get(id=moroso.id).orden_trabajo_activa_id == orden.id
+    assert [o["servicio_id"] for o in repo.listar_ordenes_corte_pendientes()] == [moroso.id]
+
+
+@pytest.mark.django_db
+def test_ordenes_corte_rechazan_umbral_menor_a_un_mes():
+    with pytest.raises(ValidacionError):
+        GenerarOrdenesCorteUseCase(MagicMock()).ejecutar(meses_minimos=0)
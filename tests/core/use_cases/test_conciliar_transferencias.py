@@ -0,0 +1,58 @@
+import io
+import pytest
+from unittest.mock import MagicMock
+from decimal import Decimal
+
+from core.shared.exceptions import ValidacionError
+from core.use_cases.conciliar_transferencias_uc import ConciliarTransferenciasUseCase, normalizar_referencia
+from adapters.infrastructure.services.extracto_bancario_reader import leer_extracto
+
+
+def _mov(linea, referencia, monto):
+    return {"linea": linea, "referencia": referencia, "monto": Decimal(monto)}
+
+
+def test_normalizar_referencia_ignora_ceros_y_separadores():
+    assert normalizar_referencia("00-123 456") == normalizar_referencia("123456") == "123456"
+    assert normalizar_referencia("000") == normalizar_referencia(None) == ""
+
+
+def test_conciliacion_cruza_por_referencia_y_monto():
+    repo = MagicMock()
+    repo.listar_transferencias_por_validar.return_value = [
+        (1, "123456", Decimal("10.00")), (2, "789", Decimal("5.00")),
+    ]
+    repo.aprobar_transferencias.side_effect = len
+
+    resultado = ConciliarTransferenciasUseCase(repo).ejecutar([
+        _mov(2, "00-123 456", "10.00"), _mov(3, "789", "7.00"),
+    ])
+
+    repo.aprobar_transferencias.assert_called_once_with([1])
+    assert [c["pago_id"] for c in resultado["detalle_conciliados"]] == [1]
+    assert [m["linea"] for m in resultado["no_conciliados"]] == [3]
+    assert resultado["transferencias_sin_movimiento"] == 1
+
+
+def test_referencia_vacia_tras_normalizar_no_concilia():
+    """
+    Escenario: Un movimiento con referencia '000' y una transferencia subida sin referencia,
+    ambos por 5.00. Las dos normalizan a '': no son la misma transferencia.
+    """
+    repo = MagicMock()
+    repo.listar_transferencias_por_validar.return_value = [(1, None, Decimal("5.00"))]
+
+    resultado = ConciliarTransferenciasUseCase(repo).ejecutar([_mov(2, "000", "5.00")])
+
+    repo.aprobar_transferencias.assert_called_once_with([])
+    assert resultado["conciliados"] == 0
+    assert [m["linea"] for m in resultado["no_conciliados"]] == [2]
+    assert resultado["transferencias_sin_movimiento"] == 1
+
+
+@pytest.mark.parametrize("contenido", [b"no es un zip", b"PK\x03\x04 zip truncado"])
+def test_xlsx_danado_es_error_de_validacion(contenido):
+    # ValidacionError -> 400 en conciliar-extracto (antes BadZipFile llegaba como 500)
+    with pytest.raises(ValidacionError):
+        list(leer_extracto(io.BytesIO(contenido), "extracto.xlsx"))
+
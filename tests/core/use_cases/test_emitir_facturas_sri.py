@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date
+
+from core.domain.factura import Factura, EstadoFactura
+from core.shared.exceptions import ConflictoConcurrenciaError
+from core.use_cases.emitir_facturas_sri_uc import EmitirFacturasSRIUseCase
+
+
+def _factura(version=0, estado=EstadoFactura.PAGADA):
+    factura = Factura(
+        id=1, socio_id=10, medidor_id=None, fecha_emision=date(2026, 3, 1), fecha_vencimiento=date(2026, 3, 16),
+        total=Decimal("10.00"), estado=estado, sri_clave_acceso="C" * 49, version=version
+    )
+    factura.socio_obj = SimpleNamespace(email="socio@test.com", nombres="Juan", apellidos="Perez")
+    return factura
+
+
+def _use_case(factura_repo):
+    sri = MagicMock()
+    sri.enviar_factura.return_value = SimpleNamespace(
+        exito=True, xml_respuesta="<autorizado/>", autorizacion_id="AUT-1", estado="AUTORIZADO", mensaje_error=None
+    )
+    return EmitirFacturasSRIUseCase(factura_repo, sri, MagicMock()), sri
+
+
+def test_conflicto_de_version_tras_autorizar_relee_y_guarda_solo_el_estado_sri():
+    """
+    Escenario: Mientras se esperaba al SRI otra operación cambió la factura (versión 1).
+    La autorización no se pierde: se relee y se guardan los campos SRI sobre esa versión.
+    """
+    repo = MagicMock()
+    vigente = _factura(version=1)
+    vigente.mes = 4  # Cambio de la otra operación, que debe conservarse
+    repo.obtener_por_id.return_value = vigente
+    guardadas = []
+
+    def guardar(factura):
+        if factura.version == 0:
+            raise ConflictoConcurrenciaError("modificada")
+        guardadas.append(factura)
+    repo.guardar.side_effect = guardar
+    uc, sri = _use_case(repo)
+
+    resultado = uc.procesar(_factura(version=0))
+
+    assert resultado["estado"] == "AUTORIZADO" and resultado["enviado"]
+    assert guardadas == [vigente]
+    assert (vigente.estado_sri, vigente.sri_xml_autorizado, vigente.mes) == ("AUTORIZADO", "<autorizado/>", 4)
+    sri.enviar_factura.assert_called_once()  # No se vuelve a enviar al SRI
+
+
+def test_conflicto_persistente_se_reporta_como_conflicto_y_no_como_error_del_sri():
+    repo = MagicMock()
+    repo.obtener_por_id.side_effect = lambda _: _factura(version=0)
+    repo.guardar.side_effect = ConflictoConcurrenciaError("modificada")
+    uc, _ = _use_case(repo)
+
+    resultado = uc.procesar(_factura())
+
+    assert resultado["estado"] == "CONFLICTO_CONCURRENCIA"
+    assert resultado["enviado"]  # El SRI sí autorizó
+    assert repo.guardar.call_count == 3
@@ -0,0 +1,175 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date
+
+from core.domain.lectura import Lectura
+from core.use_cases.dtos import GenerarFacturaDesdeLecturaDTO
+from core.use_cases.generar_factura_uc import GenerarFacturaDesdeLecturaUseCase
+from core.use_cases.generar_facturacion_medida_uc import GenerarFacturacionMedidaUseCase
+
+EMISION = date(2026, 3, 1)
+VENCIMIENTO = date(2026, 3, 16)
+
+
+def _multa():
+    return SimpleNamespace(id=40, evento=SimpleNamespace(nombre="Minga Marzo", fecha=date(2026, 2, 20), valor_multa=Decimal("5.00")))
+
+
+def _guardadas(repo_metodo):
+    """Simula el repositorio: asigna id y retorna las facturas recibidas."""
+    facturas = []
+
+    def guardar(factura):
+        factura.id = 100 + len(facturas)
+        facturas.append(factura)
+        return factura
+    repo_metodo.side_effect = guardar
+    return facturas
+
+
+def _factura_individual():
+    lectura = Lectura(id=1, medidor_id=5, fecha=date(2026, 2, 28), valor=122.0, lectura_anterior=100.0, consumo_del_mes_m3=22.0)
+    factura_repo, lectura_repo, gobernanza_repo = MagicMock(), MagicMock(), MagicMock()
+    factura_repo.get_by_lectura_id.return_value = None
+    facturas = _guardadas(factura_repo.save)
+    lectura_repo.get_by_id.return_value = lectura
+    medidor_repo, terreno_repo, socio_repo, servicio_repo = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    medidor_repo.get_by_id.return_value = SimpleNamespace(id=5, terreno_id=7)
+    terreno_repo.get_by_id.return_value = SimpleNamespace(id=7, socio_id=1)
+    socio_repo.get_by_id.return_value = SimpleNamespace(id=1)
+    servicio_repo.get_active_by_terreno_and_type.return_value = SimpleNamespace(
+        id=9, tarifa_basica_m3=15, valor_tarifa=Decimal("3.00"), tarifa_excedente_precio=Decimal("0.25")
+    )
+    gobernanza_repo.obtener_multas_pendientes.return_value = [_multa()]
+
+    GenerarFacturaDesdeLecturaUseCase(
+        factura_repo, lectura_repo, medidor_repo, terreno_repo, socio_repo, servicio_repo, gobernanza_repo
+    ).execute(GenerarFacturaDesdeLecturaDTO(lectura_id=1, fecha_emision=EMISION, fecha_vencimiento=VENCIMIENTO))
+    return facturas[0]
+
+
+def _factura_masiva():
+    factura_repo, lectura_repo, gobernanza_repo = MagicMock(), MagicMock(), MagicMock()
+    lectura_repo.listar_pendientes_facturacion.return_value = [{
+        "id": 1, "fecha": date(2026, 2, 28), "valor": Decimal("122"), "lectura_anterior": Decimal("100"),
+        "consumo_del_mes": Decimal("22"), "medidor_id": 5, "servicio_id": 9, "tarifa_base_m3": 15,
+        "tarifa_base_precio": Decimal("3.00"), "tarifa_excedente_precio": Decimal("0.25"),
+        "socio_id": 1, "socio_identificacion": "1700000001", "barrio_id": 3,
+    }]
+    gobernanza_repo.obtener_multas_pendientes_por_socios.return_value = {1: [_multa()]}
+    gobernanza_repo.marcar_multas_como_facturadas.return_value = 1
+    gobernanza_repo.reservar_multas_pendientes.side_effect = set
+    factura_repo.obtener_servicios_facturados.return_value = set()
+    facturas = _guardadas(factura_repo.guardar)
+
+    GenerarFacturacionMedidaUseCase(factura_repo, lectura_repo, gobernanza_repo).ejecutar(
+        barrio_id=3, anio=2026, mes=3, fecha_emision=EMISION
+    )
+    gobernanza_repo.marcar_multas_como_facturadas.assert_called_once_with({40: facturas[0].id})
+    return facturas[0]
+
+
+@pytest.mark.django_db
+def test_facturacion_masiva_arma_la_misma_factura_que_la_individual():
+    """
+    Escenario: La misma lectura (22 m³) con una multa de minga pendiente,
+    facturada por la planilla del barrio y por el endpoint de una lectura.
+    Ambas deben tener los mismos detalles y quedar pendientes de envío al SRI.
+    """
+    individual = _factura_individual()
+    masiva = _factura_masiva()
+
+    def detalles(f):
+        return [(d.concepto, d.cantidad, d.precio_unitario, d.subtotal) for d in f.detalles]
+
+    assert detalles(masiva) == detalles(individual)
+    assert detalles(masiva)[-1][0] == "MULTA: Multa: Minga Marzo (2026-02-20)"
+    assert masiva.total == individual.total == Decimal("9.75")
+    assert masiva.estado_sri == individual.estado_sri == "PENDIENTE_ENVIO"
+    assert masiva.servicio_id == individual.servicio_id == 9
+
+
+class _GobernanzaCompartida:
+    """Dos particiones leen las mismas multas pendientes; la reserva ve lo ya vinculado."""
+    def __init__(self, multas):
+        self.multas = multas
+        self.vinculadas = {}
+
+    def obtener_multas_pendientes_por_socios(self, socio_ids):
+        return {1: list(self.multas)}  # Lectura tomada antes de que la otra partición confirme
+
+    def reservar_multas_pendientes(self, asistencia_ids):
+        return {i for i in asistencia_ids if i not in self.vinculadas}
+
+    def marcar_multas_como_facturadas(self, asignaciones):
+        nuevas = {k: v for k, v in asignaciones.items() if k not in self.vinculadas}
+        self.vinculadas.update(nuevas)
+        return len(nuevas)
+
+
+@pytest.mark.django_db
+def test_socio_con_terrenos_en_dos_barrios_paga_la_multa_una_sola_vez():
+    """
+    Escenario: El socio 1 tiene un terreno en el barrio 3 y otro en el barrio 4.
+    Cada barrio es una partición; ambas cargaron la misma multa pendiente.
+    Solo la primera partición que la reserva la incluye en su factura.
+    """
+    gobernanza = _GobernanzaCompartida([_multa()])
+    facturas, multas_aplicadas = [], []
+    for barrio_id, lectura_id in ((3, 1), (4, 2)):
+        factura_repo, lectura_repo = MagicMock(), MagicMock()
+        factura_repo.obtener_servicios_facturados.return_value = set()
+        guardadas = _guardadas(factura_repo.guardar)
+        lectura_repo.listar_pendientes_facturacion.return_value = [{
+            "id": lectura_id, "fecha": date(2026, 2, 28), "valor": Decimal("110"), "lectura_anterior": Decimal("100"),
+            "consumo_del_mes": Decimal("10"), "medidor_id": lectura_id, "servicio_id": 9 + lectura_id,
+            "tarifa_base_m3": 15, "tarifa_base_precio": Decimal("3.00"), "tarifa_excedente_precio": Decimal("0.25"),
+            "socio_id": 1, "socio_identificacion": "1700000001", "barrio_id": barrio_id,
+        }]
+        reporte = GenerarFacturacionMedidaUseCase(factura_repo, lectura_repo, gobernanza).ejecutar(
+            barrio_id=barrio_id, anio=2026, mes=3, fecha_emision=EMISION
+        )
+        facturas += guardadas
+        multas_aplicadas.append(reporte["multas_aplicadas"])
+
+    # 10 m³ -> base 3.00; solo la primera factura lleva la multa de 5.00
+    assert [f.total for f in facturas] == [Decimal("8.00"), Decimal("3.00")]
+    assert multas_aplicadas == [1, 0]
+    assert gobernanza.vinculadas == {40: facturas[0].id}
+
+
+@pytest.mark.django_db
+def test_multas_del_lote_se_reservan_una_sola_vez_en_orden_de_id():
+    """
+    Escenario: Un lote con tres socios, dos con multas. Se reservan todas en un solo
+    SELECT ... FOR UPDATE por lote (no uno por socio) y en orden de id, el mismo en
+    todas las particiones. Una multa que otra partición ya vinculó no se cobra.
+    """
+    def multa(multa_id):
+        return SimpleNamespace(id=multa_id, evento=SimpleNamespace(
+            nombre="Minga", fecha=date(2026, 2, 20), valor_multa=Decimal("5.00")
+        ))
+
+    def lectura(lectura_id, socio_id):
+        return {
+            "id": lectura_id, "fecha": date(2026, 2, 28), "valor": Decimal("110"), "lectura_anterior": Decimal("100"),
+            "consumo_del_mes": Decimal("10"), "medidor_id": lectura_id, "servicio_id": 10 + lectura_id,
+            "tarifa_base_m3": 15, "tarifa_base_precio": Decimal("3.00"), "tarifa_excedente_precio": Decimal("0.25"),
+            "socio_id": socio_id, "socio_identificacion": f"170000000{socio_id}", "barrio_id": 3,
+        }
+
+    factura_repo, lectura_repo, gobernanza_repo = MagicMock(), MagicMock(), MagicMock()
+    lectura_repo.listar_pendientes_facturacion.return_value = [lectura(1, 2), lectura(2, 1), lectura(3, 3)]
+    gobernanza_repo.obtener_multas_pendientes_por_socios.return_value = {2: [multa(41)], 1: [multa(40), multa(42)]}
+    gobernanza_repo.reservar_multas_pendientes.return_value = {40, 41}  # 42 ya vinculada en otra partición
+    factura_repo.obtener_servicios_facturados.return_value = set()
+    facturas = _guardadas(factura_repo.guardar)
+
+    GenerarFacturacionMedidaUseCase(factura_repo, lectura_repo, gobernanza_repo).ejecutar(
+        barrio_id=3, anio=2026, mes=3, fecha_emision=EMISION
+    )
+
+    gobernanza_repo.reservar_multas_pendientes.assert_called_once_with([40, 41, 42])
+    assert [f.total for f in facturas] == [Decimal("8.00"), Decimal("8.00"), Decimal("3.00")]
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date
+
+from core.use_cases.previsualizar_planilla_uc import PrevisualizarPlanillaUseCase
+
+
+def _fila(id, socio_id, consumo, base_m3=15, base_precio="3.00", excedente="0.25"):
+    return {
+        "id": id, "socio_id": socio_id, "fecha": date(2026, 3, 28), "medidor_codigo": f"M{id}",
+        "lectura_anterior": Decimal("100"), "valor": Decimal(100 + consumo), "consumo_del_mes": Decimal(consumo),
+        "tarifa_base_m3": base_m3, "tarifa_base_precio": Decimal(base_precio),
+        "tarifa_excedente_precio": Decimal(excedente),
+        "socio_nombres": f"N{socio_id}", "socio_apellidos": f"A{socio_id}", "socio_identificacion": f"17{socio_id}",
+    }
+
+
+def _multa(valor):
+    return SimpleNamespace(evento=SimpleNamespace(nombre="Minga", fecha=date(2026, 3, 1), valor_multa=Decimal(valor)))
+
+
+def test_planilla_agrupa_por_socio_y_cuenta_las_multas_una_sola_vez():
+    """
+    Escenario: Socio 1 con dos medidores y una multa pendiente; socio 2 sin multas.
+    La multa se suma una vez al total del socio (no una vez por medidor).
+    """
+    lectura_repo, gobernanza_repo = MagicMock(), MagicMock()
+    lectura_repo.listar_pendientes_facturacion.return_value = [
+        _fila(1, 1, 10), _fila(2, 1, 20), _fila(3, 2, 15),
+    ]
+    gobernanza_repo.obtener_multas_pendientes_por_socios.return_value = {1: [_multa("2.00")]}
+
+    planilla = list(PrevisualizarPlanillaUseCase(lectura_repo, gobernanza_repo).ejecutar(5, 2026, 3))
+
+    assert [p["socio_id"] for p in planilla] == [1, 2]
+    socio_1, socio_2 = planilla
+    # 10 m³ -> base 3.00 ; 20 m³ -> 3.00 + 5 x 0.25
+    assert [l["monto_agua"] for l in socio_1["lecturas"]] == [3.00, 4.25]
+    assert socio_1["monto_agua"] == 7.25
+    assert socio_1["multas_mingas"] == 2.00
+    assert socio_1["total_pagar"] == 9.25
+    assert len(socio_1["detalle_multas"]) == 1
+    assert socio_2["total_pagar"] == 3.00 and socio_2["detalle_multas"] == []
+
+    # Una sola consulta de multas para todos los socios del barrio
+    gobernanza_repo.obtener_multas_pendientes_por_socios.assert_called_once()
+    assert sorted(gobernanza_repo.obtener_multas_pendientes_por_socios.call_args.args[0]) == [1, 2]
@@ -62,12 +62,15 @@ def test_registrar_cobro_exito(use_case, mock_factura_repo, mock_pago_repo, mock
         detalles=[]
     )
     # Simulamos que tiene el objeto socio cargado (necesario para SRI)
-    factura_mock.socio_obj = Socio(id=10, nombres="Juan", apellidos="Perez", cedula="1700000000", email="juan@test.com")
+    factura_mock.socio_obj = Socio(id=10, identificacion="1700000001", tipo_identificacion="CEDULA", nombres="Juan", apellidos="Perez", email="juan@test.com")
     
     # Mocking Repos
     mock_factura_repo.obtener_por_id.return_value = factura_mock
-    mock_pago_repo.tiene_pagos_pendientes.return_value = False # IMPORTANTE: No hay bloqueos
-    mock_pago_repo.obtener_sumatoria_validada.return_value = Decimal("0.00")
+    mock_pago_repo.obtener_resumen_pagos.return_value = {
+        "monto_validado": Decimal("0.00"),
+        "monto_por_validar": Decimal("0.00"), # IMPORTANTE: No hay bloqueos
+        "cantidad_pagos": 0
+    }
     
     # Mocking SRI
     mock_sri_service.generar_clave_acceso.return_value = "1234567890123456789012345678901234567890123456789"
@@ -84,6 +87,7 @@ def test_registrar_cobro_exito(use_case, mock_factura_repo, mock_pago_repo, mock
     assert factura_mock.estado == EstadoFactura.PAGADA
     
     # Verificaciones
+    mock_pago_repo.obtener_resumen_pagos.assert_called_once_with(factura_id)  # Una sola lectura del resumen
     mock_pago_repo.registrar_pagos.assert_called_once()
     mock_sri_service.generar_clave_acceso.assert_called_once()
     mock_sri_service.enviar_factura.assert_called_once()
@@ -118,4 +122,47 @@ def test_registrar_cobro_candado_seguridad(use_case, mock_factura_repo):
         use_case.ejecutar(factura_id, [{"metodo": "EFECTIVO", "monto": 10.00}])
     
     # Verificamos que el mensaje mencione que ya está pagada (o similar)
-    assert "PAGADA" in str(excinfo.value) or "estado" in str(excinfo.value)
\ No newline at end of file
+    assert "PAGADA" in str(excinfo.value) or "estado" in str(excinfo.value)
+
+def test_registrar_cobro_resumen_con_transferencias_por_validar_bloquea(use_case, mock_factura_repo, mock_pago_repo):
+    """
+    Escenario: El resumen de la factura tiene una transferencia subida sin validar.
+    El candado se decide con el resumen (monto_por_validar), sin registrar nada.
+    """
+    mock_factura_repo.obtener_por_id.return_value = Factura(
+        id=5, socio_id=10, medidor_id=5, fecha_emision=date(2025, 1, 1), fecha_vencimiento=date(2025, 2, 1),
+        total=Decimal("10.00"), estado=EstadoFactura.PENDIENTE, detalles=[]
+    )
+    mock_pago_repo.obtener_resumen_pagos.return_value = {
+        "monto_validado": Decimal("0.00"), "monto_por_validar": Decimal("4.00"), "cantidad_pagos": 1
+    }
+
+    with pytest.raises(BusinessRuleException):
+        use_case.ejecutar(5, [{"metodo": "EFECTIVO", "monto": 10.00}])
+    mock_pago_repo.registrar_pagos.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_migracion_recalcula_resumen_de_pagos_existentes():
+    """Facturas con pagos anteriores a 0004 (resumen en cero) quedan con los montos reales."""
+    import importlib
+    from django.apps import apps
+    from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel, PagoModel
+
+    migracion = importlib.import_module('adapters.infrastructure.migrations.0015_factura_resumen_pagos_backfill')
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+    con_pagos, sin_pagos = (
+        FacturaModel.objects.create(socio=socio, anio=2025, mes=mes, fecha_emision=date(2025, mes, 1),
+                                    fecha_vencimiento=date(2025, mes, 15), total=Decimal("10.00"))
+        for mes in (1, 2)
+    )
+    PagoModel.objects.create(socio=socio, factura=con_pagos, monto_total=Decimal("6.00"), validado=True)
+    PagoModel.objects.create(socio=socio, factura=con_pagos, monto_total=Decimal("4.00"), validado=False)
+
+    migracion.recalcular_resumen_pagos(apps, None)
+
+    assert FacturaModel.objects.values('monto_validado', 'monto_por_validar', 'cantidad_pagos').get(id=con_pagos.id) == {
+        "monto_validado": Decimal("6.00"), "monto_por_validar": Decimal("4.00"), "cantidad_pagos": 2
+    }
+    assert FacturaModel.objects.get(id=sin_pagos.id).cantidad_pagos == 0
@@ -0,0 +1,115 @@
+import pytest
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date, datetime
+
+from core.domain.factura import Factura, EstadoFactura
+from core.shared.exceptions import BusinessRuleException
+from core.use_cases.registrar_cobro_multiple_uc import RegistrarCobroMultipleUseCase
+
+
+def _factura(id, mes, total):
+    return Factura(
+        id=id, socio_id=1, medidor_id=None, fecha_emision=date(2026, mes, 1),
+        fecha_vencimiento=date(2026, mes, 15), anio=2026, mes=mes,
+        fecha_registro=datetime(2026, mes, 1), estado=EstadoFactura.PENDIENTE, total=Decimal(total)
+    )
+
+
+@pytest.fixture
+def repos():
+    factura_repo, pago_repo, cola_sri = MagicMock(), MagicMock(), MagicMock()
+    factura_repo.obtener_pendientes_para_cobro.return_value = [
+        _factura(1, 1, "5.00"), _factura(2, 2, "7.50"), _factura(3, 3, "4.00")
+    ]
+    pago_repo.obtener_resumen_transferencias.return_value = {}
+    pago_repo.registrar_cobro_multiple.side_effect = lambda socio_id, asignaciones: [
+        f"REC-{a['factura_id']}" for a in asignaciones
+    ]
+    return factura_repo, pago_repo, cola_sri
+
+
+def test_cobro_multiple_aplica_fifo_y_encola_sri_en_lote(repos):
+    factura_repo, pago_repo, cola_sri = repos
+    # Transferencia ya validada por Tesorería sobre la factura de febrero
+    pago_repo.obtener_resumen_transferencias.return_value = {2: {"validado": Decimal("2.50"), "pendientes": 0}}
+    uc = RegistrarCobroMultipleUseCase(factura_repo, pago_repo, cola_sri)
+
+    resultado = uc.ejecutar(socio_id=1, lista_pagos=[
+        {"metodo": "EFECTIVO", "monto": Decimal("6.00")},
+        {"metodo": "TRANSFERENCIA", "monto": Decimal("5.00"), "referencia": "B-1"},
+    ])
+
+    assert [p["factura_id"] for p in resultado["facturas_pagadas"]] == [1, 2]
+    assert resultado["facturas_pendientes"] == 1
+    assert resultado["saldo_no_aplicado"] == Decimal("1.00")
+
+    # La transferencia se consume primero; el efectivo restante es el vuelto
+    _, asignaciones = pago_repo.registrar_cobro_multiple.call_args.args
+    assert asignaciones[0]["detalles"] == [{"metodo": "TRANSFERENCIA", "monto": Decimal("5.00"), "referencia": "B-1"}]
+    assert asignaciones[1]["monto"] == Decimal("5.00")
+    assert asignaciones[1]["detalles"] == [{"metodo": "EFECTIVO", "monto": Decimal("5.00")}]
+
+    factura_repo.marcar_como_pagadas.assert_called_once_with([1, 2], {1: 0, 2: 0})
+    cola_sri.encolar.assert_called_once_with([1, 2])
+
+
+def test_cobro_multiple_omite_facturas_con_transferencias_sin_validar(repos):
+    factura_repo, pago_repo, cola_sri = repos
+    pago_repo.obtener_resumen_transferencias.return_value = {1: {"validado": Decimal("0.00"), "pendientes": Decimal("3.00")}}
+    uc = RegistrarCobroMultipleUseCase(factura_repo, pago_repo, cola_sri)
+
+    resultado = uc.ejecutar(socio_id=1, lista_pagos=[{"metodo": "EFECTIVO", "monto": Decimal("7.50")}])
+
+    assert [p["factura_id"] for p in resultado["facturas_pagadas"]] == [2]
+    assert resultado["facturas_omitidas"][0]["factura_id"] == 1
+
+
+def test_cobro_multiple_monto_insuficiente(repos):
+    factura_repo, pago_repo, cola_sri = repos
+    uc = RegistrarCobroMultipleUseCase(factura_repo, pago_repo, cola_sri)
+
+    with pytest.raises(BusinessRuleException, match="Monto insuficiente"):
+        uc.ejecutar(socio_id=1, lista_pagos=[{"metodo": "EFECTIVO", "monto": Decimal("4.50")}])
+
+    pago_repo.registrar_cobro_multiple.assert_not_called()
+    cola_sri.encolar.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_cobro_multiple_vincula_lineas_sin_ids_devueltos_por_el_insert(monkeypatch):
+    """
+    Escenario: Base de datos que no devuelve los ids del INSERT en bloque (MySQL) y un
+    recibo anterior idéntico en socio, factura y monto. Cada recibo nuevo debe quedar con
+    sus propias líneas y su historial, en el orden de las asignaciones.
+    """
+    from django.db import connection
+    from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel, PagoModel, DetallePagoModel
+    from adapters.infrastructure.repositories.django_pago_repository import DjangoPagoRepository
+
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    socio = SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+    enero, febrero = (
+        FacturaModel.objects.create(socio=socio, anio=2026, mes=mes, fecha_emision=date(2026, mes, 1),
+                                    fecha_vencimiento=date(2026, mes, 15), total=Decimal(total))
+        for mes, total in ((1, "5.00"), (2, "7.50"))
+    )
+    anterior = PagoModel.objects.create(socio=socio, factura=enero, monto_total=Decimal("5.00"))
+    monkeypatch.setattr(type(connection.features), 'can_return_rows_from_bulk_insert', False)
+
+    comprobantes = DjangoPagoRepository().registrar_cobro_multiple(socio.id, [
+        {"factura_id": enero.id, "monto": Decimal("5.00"), "detalles": [{"metodo": "EFECTIVO", "monto": "5.00"}]},
+        {"factura_id": febrero.id, "monto": Decimal("7.50"), "detalles": [
+            {"metodo": "EFECTIVO", "monto": "2.50"}, {"metodo": "TRANSFERENCIA", "monto": "5.00", "referencia": "B-1"}
+        ]},
+    ])
+
+    pagos = [PagoModel.objects.get(numero_comprobante_interno=c) for c in comprobantes]
+    assert [p.factura_id for p in pagos] == [enero.id, febrero.id]
+    assert [sorted(p.detalles_metodos.values_list('monto', flat=True)) for p in pagos] == [
+        [Decimal("5.00")], [Decimal("2.50"), Decimal("5.00")]
+    ]
+    assert DetallePagoModel.objects.filter(pago__numero_comprobante_interno__in=comprobantes).count() == 3
+    assert [p.history.count() for p in pagos] == [1, 1]
+    assert anterior.numero_comprobante_interno not in comprobantes
+    assert not anterior.detalles_metodos.exists()
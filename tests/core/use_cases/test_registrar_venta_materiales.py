@@ -0,0 +1,34 @@
+# tests/core/use_cases/test_registrar_venta_materiales.py
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from core.use_cases.inventario.registrar_venta_materiales_uc import RegistrarVentaMaterialesUseCase
+from core.shared.exceptions import ValidacionError
+
+
+def test_venta_agrupa_lineas_del_mismo_material_en_un_solo_descuento():
+    repo = Mock()
+    repo.descontar_stock.return_value = [
+        {"producto_id": 1, "codigo": "T-1", "nombre": "Tubo", "cantidad": 3,
+         "precio_unitario": Decimal("2.5000"), "stock_resultante": 7},
+        {"producto_id": 2, "codigo": "L-1", "nombre": "Llave", "cantidad": 1,
+         "precio_unitario": Decimal("4.1250"), "stock_resultante": 0},
+    ]
+
+    resultado = RegistrarVentaMaterialesUseCase(repo).ejecutar(
+        [{"producto_id": 1, "cantidad": 2}, {"producto_id": 2, "cantidad": 1}, {"producto_id": 1, "cantidad": 1}],
+        referencia="REC-1"
+    )
+
+    repo.descontar_stock.assert_called_once_with({1: 3, 2: 1}, referencia="REC-1", usuario_id=None)
+    assert [l["subtotal"] for l in resultado["items"]] == [Decimal("7.50"), Decimal("4.13")]
+    assert resultado["subtotal"] == Decimal("11.63")
+
+
+def test_venta_rechaza_cantidades_no_positivas():
+    repo = Mock()
+    with pytest.raises(ValidacionError):
+        RegistrarVentaMaterialesUseCase(repo).ejecutar([{"producto_id": 1, "cantidad": 0}])
+    repo.descontar_stock.assert_not_called()
@@ -0,0 +1,47 @@
+import pytest
+from decimal import Decimal
+from datetime import date
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel
+from adapters.infrastructure.repositories.django_cartera_repository import DjangoCarteraRepository
+from core.use_cases.reporting.generar_reporte_cartera_uc import GenerarReporteCarteraUseCase
+
+CORTE = date(2026, 6, 30)
+
+
+def _socio(identificacion, barrio, *facturas):
+    socio = SocioModel.objects.create(identificacion=identificacion, nombres='N', apellidos=identificacion, barrio=barrio)
+    for fecha_emision, total, estado in facturas:
+        FacturaModel.objects.create(socio=socio, anio=fecha_emision.year, mes=fecha_emision.month,
+                                    fecha_emision=fecha_emision, fecha_vencimiento=fecha_emision,
+                                    total=Decimal(total), estado=estado)
+    return socio
+
+
+@pytest.mark.django_db
+def test_reporte_clasifica_por_antiguedad_y_ordena_por_deuda():
+    """
+    Escenario: Corte al 30 de junio. Límites: 30 días (31 de mayo) y 90 días (1 de abril).
+    Solo cuentan las facturas PENDIENTES; los socios salen de mayor a menor deuda.
+    """
+    centro, norte = BarrioModel.objects.create(nombre='Centro'), BarrioModel.objects.create(nombre='Norte')
+    moroso = _socio('1700000001', centro,
+                    (date(2026, 5, 31), "10.00", 'PENDIENTE'),   # 30 días: corriente
+                    (date(2026, 5, 30), "20.00", 'PENDIENTE'),   # 31 días: vencido
+                    (date(2026, 4, 1), "30.00", 'PENDIENTE'),    # 90 días: vencido
+                    (date(2026, 3, 31), "40.00", 'PENDIENTE'),   # 91 días: incobrable
+                    (date(2026, 6, 1), "99.00", 'PAGADA'))
+    al_dia = _socio('1700000002', norte, (date(2026, 6, 15), "5.00", 'PENDIENTE'))
+    _socio('1700000003', norte, (date(2026, 6, 15), "5.00", 'PAGADA'))
+
+    DjangoCarteraRepository().reconstruir(CORTE)
+    reporte = GenerarReporteCarteraUseCase().execute()
+
+    assert [(f["socio_id"], f["total_deuda"], f["corriente"], f["vencido_1_3"], f["incobrable"],
+             f["facturas_pendientes"]) for f in reporte] == [
+        (moroso.id, 100.0, 10.0, 50.0, 40.0, 4),
+        (al_dia.id, 5.0, 5.0, 0.0, 0.0, 1),
+    ]
+    assert [f["socio_id"] for f in GenerarReporteCarteraUseCase().execute(barrio_id=norte.id)] == [al_dia.id]
+    assert [f["socio_id"] for f in GenerarReporteCarteraUseCase().execute(limite=1, desplazamiento=1)] == [al_dia.id]
+    assert [f["socio_id"] for f in GenerarReporteCarteraUseCase().execute(deuda_minima=Decimal("6"))] == [moroso.id]
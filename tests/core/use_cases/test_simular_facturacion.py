@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from decimal import Decimal
+from datetime import date
+
+from core.use_cases.generar_factura_fija_uc import GenerarFacturaFijaUseCase
+from core.use_cases.generar_facturacion_medida_uc import GenerarFacturacionMedidaUseCase
+from core.use_cases.simular_facturacion_uc import SimularFacturacionUseCase
+
+CENTRO = SimpleNamespace(id=1, nombre="Centro")
+
+
+def _servicio_fijo(id, socio_id):
+    socio = SimpleNamespace(id=socio_id, identificacion=f"17{socio_id}", nombres="N", apellidos="A")
+    return SimpleNamespace(id=id, socio=socio, terreno=SimpleNamespace(barrio=CENTRO))
+
+
+def _lectura(id, servicio_id, consumo):
+    return {
+        "id": id, "fecha": date(2026, 3, 28), "valor": Decimal(100 + consumo), "lectura_anterior": Decimal("100"),
+        "consumo_del_mes": Decimal(consumo), "medidor_id": id, "servicio_id": servicio_id,
+        "tarifa_base_m3": 15 if servicio_id else None, "tarifa_base_precio": Decimal("3.00") if servicio_id else None,
+        "tarifa_excedente_precio": Decimal("0.25") if servicio_id else None,
+        "socio_id": 10 + id, "socio_identificacion": f"18{id}", "socio_nombres": "N", "socio_apellidos": "A",
+        "barrio_id": 1, "barrio_nombre": "Centro",
+    }
+
+
+def test_simulacion_consolida_ambos_motores_sin_escribir():
+    """
+    Escenario: Centro tiene 2 servicios fijos (uno ya facturado) y 3 lecturas:
+    una normal, una en cero y una sin Servicio MEDIDO (tarifa de respaldo).
+    """
+    factura_repo, servicio_repo, lectura_repo, gobernanza_repo = MagicMock(), MagicMock(), MagicMock(), MagicMock()
+    servicio_repo.obtener_servicios_fijos_activos.return_value = [_servicio_fijo(1, 1), _servicio_fijo(2, 2)]
+    lectura_repo.listar_pendientes_facturacion.return_value = [_lectura(1, 31, 20), _lectura(2, 32, 0), _lectura(3, None, 10)]
+    gobernanza_repo.obtener_multas_pendientes_por_socios.return_value = {}
+    factura_repo.obtener_servicios_facturados.side_effect = lambda ids, anio, mes: {2} & set(ids)
+
+    informe = SimularFacturacionUseCase(
+        GenerarFacturaFijaUseCase(factura_repo, servicio_repo),
+        GenerarFacturacionMedidaUseCase(factura_repo, lectura_repo, gobernanza_repo)
+    ).ejecutar(anio=2026, mes=3, fecha_emision=date(2026, 4, 1))
+
+    # 1 fija nueva (5.00) + 3 medidas (4.25 + 3.00 + 3.00); 1 fija omitida por duplicado
+    assert informe["resumen"] == {"nuevas": 4, "omitidas": 1, "anomalias": 2, "monto_total": 15.25}
+    assert informe["barrios"][0]["nuevas"] == 4
+    assert {f["lectura_id"]: f["anomalia"] for f in informe["filas"] if f["motor"] == "MEDIDA"} == {
+        1: None, 2: "CONSUMO_CERO", 3: "SIN_SERVICIO_MEDIDO"
+    }
+
+    # Ensayo: ninguna escritura
+    factura_repo.guardar.assert_not_called()
+    gobernanza_repo.marcar_multas_como_facturadas.assert_not_called()
+    lectura_repo.marcar_como_facturadas.assert_not_called()
@@ -0,0 +1,23 @@
+import pytest
+from decimal import Decimal
+
+from core.shared.exceptions import ValidacionError
+from core.use_cases.reporting.simular_tarifas_uc import SimularTarifasUseCase
+
+
+@pytest.mark.parametrize("precio", ["NaN", "Infinity", "-Infinity", "sNaN", "0.255"])
+def test_precio_no_finito_o_con_fraccion_de_centavo_es_error_de_validacion(precio):
+    # ValidacionError -> 400 en simulacion-tarifas (antes NaN/Infinity llegaban como 500)
+    with pytest.raises(ValidacionError):
+        SimularTarifasUseCase().execute(
+            tarifa_base_m3=12, tarifa_base_precio=Decimal("3.00"), tarifa_excedente_precio=Decimal(precio)
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("precio", ["0.25", "0.250", "3"])
+def test_precio_en_centavos_exactos_es_valido(precio):
+    resultado = SimularTarifasUseCase().execute(
+        tarifa_base_m3=12, tarifa_base_precio=Decimal(precio), tarifa_excedente_precio=Decimal("0.30")
+    )
+    assert resultado["parametros"]["tarifa_base_precio"] == float(precio)
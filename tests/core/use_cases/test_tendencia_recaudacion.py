@@ -0,0 +1,73 @@
+import pytest
+from decimal import Decimal
+from datetime import date, datetime
+
+from django.db.models import DateTimeField, Value
+from django.utils import timezone
+
+from adapters.infrastructure.models import BarrioModel, SocioModel, FacturaModel, PagoModel
+from core.use_cases.reporting import generar_tendencia_recaudacion_uc as tendencia
+from core.use_cases.reporting.generar_tendencia_recaudacion_uc import GenerarTendenciaRecaudacionUseCase
+
+
+@pytest.fixture
+def socio():
+    barrio = BarrioModel.objects.create(nombre='Centro')
+    return SocioModel.objects.create(identificacion='1700000001', nombres='N', apellidos='A', barrio=barrio)
+
+
+def _factura(socio, mes, total, estado='PAGADA'):
+    return FacturaModel.objects.create(socio=socio, anio=2026, mes=mes, fecha_emision=date(2026, mes, 1),
+                                       fecha_vencimiento=date(2026, mes, 15), total=Decimal(total), estado=estado)
+
+
+def _pago(socio, fecha_local, monto, validado=True):
+    pago = PagoModel.objects.create(socio=socio, numero_comprobante_interno=f"REC-{PagoModel.objects.count()}",
+                                    monto_total=Decimal(monto), validado=validado)
+    PagoModel.objects.filter(id=pago.id).update(fecha_registro=timezone.make_aware(fecha_local))
+
+
+@pytest.mark.django_db
+def test_tendencia_mensual_completa_periodos_y_calcula_tasa_de_cobro(socio):
+    """
+    Escenario: Facturación de enero y marzo; febrero sin movimiento. Un pago del 31 de enero
+    a las 23:30 (hora local, ya 1 de febrero en UTC) cuenta en enero.
+    """
+    _factura(socio, 1, "20.00")
+    _factura(socio, 3, "40.00", estado='PENDIENTE')
+    _pago(socio, datetime(2026, 1, 31, 23, 30), "15.00")
+    _pago(socio, datetime(2026, 3, 10, 9, 0), "10.00")
+    _pago(socio, datetime(2026, 3, 11, 9, 0), "99.00", validado=False)  # Por validar: no es recaudado
+
+    resultado = GenerarTendenciaRecaudacionUseCase().execute(fecha_inicio=date(2026, 1, 5), fecha_fin=date(2026, 3, 20))
+
+    assert resultado["rango"] == {"inicio": date(2026, 1, 1), "fin": date(2026, 3, 31)}
+    assert [(p["periodo"], p["facturado"], p["recaudado"], p["tasa_cobro"], p["deuda_nueva"])
+            for p in resultado["series"]] == [
+        ("2026-01", 20.0, 15.0, 0.75, 0.0),
+        ("2026-02", 0.0, 0.0, None, 0.0),
+        ("2026-03", 40.0, 10.0, 0.25, 40.0),
+    ]
+    assert [len(b["series"]) for b in resultado["barrios"]] == [3]
+
+
+@pytest.mark.django_db
+def test_tendencia_semanal_agrupa_por_semana_local(socio):
+    _pago(socio, datetime(2026, 3, 8, 23, 30), "5.00")   # Domingo: semana del lunes 2
+    _pago(socio, datetime(2026, 3, 9, 8, 0), "7.00")     # Lunes: semana del 9
+
+    series = GenerarTendenciaRecaudacionUseCase().execute(
+        granularidad="semana", fecha_inicio=date(2026, 3, 2), fecha_fin=date(2026, 3, 15)
+    )["series"]
+
+    assert [(p["periodo"], p["recaudado"]) for p in series] == [("2026-03-02", 5.0), ("2026-03-09", 7.0)]
+
+
+@pytest.mark.django_db
+def test_periodo_nulo_de_la_base_de_datos_falla_en_lugar_de_caer_en_el_mes_actual(socio, monkeypatch):
+    # MySQL sin tablas de zonas horarias: CONVERT_TZ con nombre de zona retorna NULL
+    monkeypatch.setattr(tendencia, "TruncMonth", lambda *args, **kwargs: Value(None, output_field=DateTimeField()))
+    _pago(socio, datetime(2026, 1, 10, 9, 0), "15.00")
+
+    with pytest.raises(RuntimeError):
+        GenerarTendenciaRecaudacionUseCase().execute(fecha_inicio=date(2026, 1, 1), fecha_fin=date(2026, 1, 31))